@@ -0,0 +1,782 @@
+"""
+Medições de desempenho dos módulos de ui/.
+Cada medição gera a própria entrada, compara com a abordagem anterior quando ela
+existe e só imprime os tempos; a equivalência dos resultados é verificada pelos
+testes (ui/test_*.py), não aqui.
+
+Uso (a partir de v.1.5):
+    python benchmarks/run_benchmarks.py incremental_translation 100000
+    python benchmarks/run_benchmarks.py --help
+"""
+
+import argparse
+import io
+import logging
+import os
+import random
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+# Diretório v.1.5: os módulos são importados como ui.<módulo>, como no collector.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _percentiles(samples):
+    """Retorna p50, p99 e o máximo de uma lista de durações, em milissegundos."""
+    samples = sorted(samples)
+    return (samples[len(samples) // 2] * 1000, samples[max(0, int(len(samples) * 0.99) - 1)] * 1000,
+            samples[-1] * 1000)
+
+
+def bench_app_logging(calls: int = 200000):
+    """
+    Compara o custo de uma chamada de log na thread de quem registra: o formato
+    anterior (f-string e FileHandler síncrono) e o atual (fila), com o nível ativo
+    e desativado.
+
+    Args:
+        calls: Chamadas medidas em cada caso
+    """
+    from ui.app_logging import LOG_FORMAT, get_logger, setup_logging, shutdown_logging
+
+    chunk = b"linha de saida do programa 0123456789\n" * 8
+
+    def measure(name, function):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        elapsed = time.perf_counter() - start
+        print(f"{name}: {elapsed / calls * 1e9:.0f} ns por chamada")
+
+    with tempfile.TemporaryDirectory() as directory:
+        old = logging.getLogger("benchmark.sync")
+        old.propagate = False
+        old.setLevel(logging.DEBUG)
+        old_handler = logging.FileHandler(os.path.join(directory, "sync.log"), encoding="utf-8")
+        old_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        old.addHandler(old_handler)
+        measure("Anterior (f-string, arquivo síncrono)", lambda: old.debug(f"RAW STDOUT: {chunk!r}"))
+        old.setLevel(logging.WARNING)
+        measure("Anterior, nível desativado (f-string ainda montada)", lambda: old.debug(f"RAW STDOUT: {chunk!r}"))
+        old_handler.close()
+
+        setup_logging(directory, {"benchmark": logging.DEBUG, "benchmark.off": logging.WARNING})
+        enabled = get_logger("benchmark")
+        disabled = get_logger("benchmark.off")
+        measure("Fila, nível desativado", lambda: disabled.debug("RAW %s: %r", "STDOUT", chunk))
+        measure("Fila, nível ativo", lambda: enabled.debug("RAW %s: %r", "STDOUT", chunk))
+        start = time.perf_counter()
+        shutdown_logging()
+        print(f"Esvaziamento da fila pela thread de fundo: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+def bench_binary_ast_compiler(repeat: int = 200):
+    """
+    Compara a compilação direta com a tradução para texto seguida de compile().
+
+    Args:
+        repeat: Quantidade de compilações medidas
+    """
+    from ui.binary_ast_compiler import DEFAULT_FILENAME, BinaryAstCompiler
+    from ui.binary_syntax_parser import BinarySyntaxParser
+
+    source = "\n".join([
+        "def media(valores):",
+        "    total = 0",
+        "    for valor in valores:",
+        "        total += valor",
+        "    return total / len(valores) if valores else 0",
+        "",
+        "dados = [3, 5, 8, 13]",
+        "print('media:', media(dados), {k: v * 2 for k, v in enumerate(dados) if v > 4})",
+    ] * 10)
+    parser = BinarySyntaxParser()
+    binary = parser.parse_python_to_binary(source)
+    compiler = BinaryAstCompiler(parser.binary_keywords)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        compiler.compile(binary)
+    direct = (time.perf_counter() - start) / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        python_code = parser.parse_binary_to_python(binary)
+        try:
+            compile(python_code, DEFAULT_FILENAME, "exec")
+        except SyntaxError:
+            pass
+    text = (time.perf_counter() - start) / repeat
+
+    print(f"{len(binary.splitlines())} linhas: AST direto {direct * 1000:.2f} ms, "
+          f"texto + compile {text * 1000:.2f} ms")
+
+
+def bench_binary_daemon(requests: int = 2000):
+    """
+    Mede a latência de ida e volta de translate em uma conexão persistente com o daemon.
+
+    Args:
+        requests: Quantidade de pedidos
+    """
+    from ui.binary_daemon import BinaryDaemon, BinaryDaemonClient
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Daemon próprio da medição, em um socket Unix temporário (ou em uma porta livre)
+        address = os.path.join(directory, "daemon.sock") if hasattr(socket, "AF_UNIX") else "127.0.0.1:0"
+        daemon = BinaryDaemon(address)
+        daemon.start()
+        if not hasattr(socket, "AF_UNIX"):
+            address = "%s:%d" % daemon.server_address
+        server = threading.Thread(target=daemon.serve_forever, daemon=True)
+        server.start()
+        try:
+            with BinaryDaemonClient(address) as client:
+                code = client.encode("for i in range(10):\n    print(i * 2)\n", dialect="parser")
+                client.translate(code, dialect="parser")
+                samples = []
+                for _ in range(requests):
+                    start = time.perf_counter()
+                    client.translate(code, dialect="parser")
+                    samples.append(time.perf_counter() - start)
+        finally:
+            daemon.shutdown()
+            server.join()
+    p50, p99, _worst = _percentiles(samples)
+    print(f"translate: p50 {p50:.3f} ms, p99 {p99:.3f} ms ({requests} pedidos)")
+
+
+def bench_binary_language_server(lines: int = 100000, edits: int = 200):
+    """
+    Mede a latência de uma edição (didChange + diagnósticos) e de um hover em um documento grande.
+
+    Args:
+        lines: Quantidade de linhas do documento
+        edits: Quantidade de edições medidas
+    """
+    from ui.binary_language_server import BinaryLanguageServer
+    from ui.binary_syntax_parser import BinarySyntaxParser
+
+    table = BinarySyntaxParser().text_to_binary
+    random.seed(0)
+    words = ["10100011", "00101000", "01100001", "00101001", "10010010", "1010101"]
+    source = []
+    for number in range(lines):
+        if number % 10 == 0:
+            source.append(f"{table['BINFUNC']} 01100110 {table['BINSTART']}")
+        elif number % 10 == 9:
+            source.append(table["BINEND"])
+        else:
+            source.append(" ".join(random.choice(words) for _ in range(8)))
+
+    server = BinaryLanguageServer(writer=io.BytesIO(), dialect="parser")
+    server.handle({"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}})
+    uri = "file:///benchmark.bin"
+    start = time.perf_counter()
+    server.handle({"jsonrpc": "2.0", "method": "textDocument/didOpen",
+                   "params": {"textDocument": {"uri": uri, "version": 1, "text": "\n".join(source)}}})
+    print(f"didOpen de {lines} linhas: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    def measure(name, build):
+        samples = []
+        for version in range(edits):
+            message = build(random.randrange(1, lines - 1), version)
+            start = time.perf_counter()
+            server.handle(message)
+            samples.append(time.perf_counter() - start)
+            server.writer.seek(0)
+            server.writer.truncate()
+        p50, _p99, worst = _percentiles(samples)
+        print(f"{name}: p50 {p50:.2f} ms, máx {worst:.2f} ms")
+
+    def keystroke(line, version):
+        position = {"line": line, "character": 0}
+        return {"jsonrpc": "2.0", "method": "textDocument/didChange",
+                "params": {"textDocument": {"uri": uri, "version": version + 2},
+                           "contentChanges": [{"range": {"start": position, "end": position}, "text": "0"}]}}
+
+    def hover(line, _version):
+        return {"jsonrpc": "2.0", "id": 2, "method": "textDocument/hover",
+                "params": {"textDocument": {"uri": uri}, "position": {"line": line, "character": 3}}}
+
+    measure("Edição (didChange + diagnósticos)", keystroke)
+    measure("Hover", hover)
+    start = time.perf_counter()
+    server.handle({"jsonrpc": "2.0", "id": 3, "method": "textDocument/documentSymbol",
+                   "params": {"textDocument": {"uri": uri}}})
+    print(f"documentSymbol: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+def bench_binary_syntax_parser(size_mb: int = 32, workers: int = 0):
+    """
+    Compara a tradução em um processo com a tradução em paralelo.
+
+    Args:
+        size_mb: Tamanho aproximado do código binário de teste, em MB
+        workers: Quantidade de processos (0: os.cpu_count())
+    """
+    from ui import binary_syntax_parser
+    from ui.binary_syntax_parser import BinarySyntaxParser
+
+    parser = BinarySyntaxParser()
+    # Entrada: o código de binary_syntax_parser.py codificado e repetido
+    with open(binary_syntax_parser.__file__, encoding="utf-8") as file:
+        binary = parser.parse_python_to_binary(file.read())
+    binary = "\n".join([binary] * max(1, int(size_mb * 1024 * 1024 // len(binary))))
+    size = len(binary) / (1024 * 1024)
+
+    start = time.perf_counter()
+    parser.parse_binary_to_python(binary)
+    serial_time = time.perf_counter() - start
+    start = time.perf_counter()
+    parser.parse_binary_to_python_parallel(binary, workers or None)
+    parallel_time = time.perf_counter() - start
+
+    workers = workers or os.cpu_count() or 1
+    print(f"{size:.1f} MB, {workers} processo(s)")
+    print(f"  um processo: {serial_time:.2f} s ({size / serial_time:.1f} MB/s)")
+    print(f"  em paralelo: {parallel_time:.2f} s ({size / parallel_time:.1f} MB/s, "
+          f"{serial_time / parallel_time:.2f}x)")
+
+
+def bench_binary_table_decoder(size_mb: float = 50):
+    """
+    Compara o decodificador por tabela com a tradução caractere a caractere.
+
+    Args:
+        size_mb: Tamanho aproximado da entrada em megabytes
+    """
+    from ui.binary_interpreter_fixed import BinaryInterpreterFixed
+    from ui.binary_table_decoder import np
+
+    interpreter = BinaryInterpreterFixed()
+    tokens = list(interpreter.binary_to_text) + ["11111111"]
+
+    def legacy_decode(binary_code):
+        # Caminho original: normalização, tokenização e consulta token a token
+        translated = []
+        for token in interpreter._tokenize_binary(interpreter._normalize_binary(binary_code)):
+            if token in interpreter.binary_to_text:
+                translated.append(interpreter.binary_to_text[token])
+            elif interpreter.binary_pattern.match(token):
+                translated.append(f"<{token}>")
+            else:
+                translated.append(token)
+        return ''.join(translated)
+
+    random.seed(0)
+    lines = []
+    size = 0
+    while size < size_mb * 1024 * 1024:
+        line = ' '.join(random.choice(tokens) for _ in range(12))
+        lines.append(line)
+        size += len(line) + 1
+    canonical = '\n'.join(lines)
+    commented = '\n'.join(
+        line + '  // comentario' if index % 10 == 0 else line
+        for index, line in enumerate(lines)
+    )
+
+    print(f"NumPy: {'sim' if np is not None else 'não'}")
+    for name, source in (("canônico", canonical), ("com comentários", commented)):
+        start = time.perf_counter()
+        legacy_decode(source)
+        old_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        interpreter.decoder.decode(source)
+        new_time = time.perf_counter() - start
+
+        megabytes = len(source) / 1e6
+        print(f"[{name}] {megabytes:.1f} MB")
+        print(f"  Caractere a caractere: {old_time:.3f} s ({megabytes / old_time:.1f} MB/s)")
+        print(f"  Tabela:                {new_time:.3f} s ({megabytes / new_time:.1f} MB/s)")
+        print(f"  Aceleração: {old_time / new_time:.1f}x")
+
+
+def bench_binary_text_encoder(size_mb: float = 10):
+    """
+    Compara o codificador com a conversão original por substituições.
+
+    Args:
+        size_mb: Tamanho aproximado da entrada em megabytes
+    """
+    from ui.binary_interpreter_enhanced_v2 import BinaryInterpreterEnhancedV2
+
+    interpreter = BinaryInterpreterEnhancedV2()
+    text_to_binary = interpreter.text_to_binary
+
+    def legacy_encode(text):
+        # Caminho original: substituições sobre o texto inteiro e consulta token a token
+        text = text.replace("print()", " print() ")
+        text = re.sub(r'print\(', 'print ( ', text)
+        text = re.sub(r'input\(', 'input ( ', text)
+        for symbol in ['(', ')', ',', '+', '-', '*', '/', '=', '<', '>', ':', ';']:
+            text = text.replace(symbol, f' {symbol} ')
+        binary_tokens = []
+        for token in ' '.join(text.split()).split():
+            if token in text_to_binary:
+                binary_tokens.append(text_to_binary[token])
+            else:
+                for char in token:
+                    binary_tokens.append(text_to_binary.get(char, f"<{char}>"))
+        return ' '.join(binary_tokens)
+
+    sample = '''def calcular_media(valores, peso=1):
+    total = 0
+    for valor in valores:
+        if valor >= 10 and not valor == 42:
+            total += valor ** 2
+        else:
+            total -= valor // 3
+    contador **= 2
+    mascara >>= 1
+    print("Resultado final:", total / len(valores))
+    return total
+'''
+    text = sample * int(size_mb * 1024 * 1024 // len(sample) + 1)
+    megabytes = len(text) / 1e6
+
+    start = time.perf_counter()
+    legacy_encode(text)
+    old_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    interpreter.encoder.encode(text)
+    new_time = time.perf_counter() - start
+
+    print(f"Entrada: {megabytes:.1f} MB de Python")
+    print(f"  Substituições:        {old_time:.3f} s ({megabytes / old_time:.1f} MB/s)")
+    print(f"  Pedaços (regex):      {new_time:.3f} s ({megabytes / new_time:.1f} MB/s, "
+          f"{old_time / new_time:.1f}x)")
+
+
+def bench_binary_token_index(size_mb: int = 20, screen_lines: int = 60):
+    """
+    Mede o custo da primeira tela e do documento inteiro em um arquivo grande.
+
+    Args:
+        size_mb: Tamanho aproximado do documento em MB
+        screen_lines: Linhas visíveis na primeira tela
+    """
+    from ui.binary_syntax_parser import BinarySyntaxParser
+    from ui.binary_token_index import BinaryTokenIndex
+
+    random.seed(0)
+    keywords = BinarySyntaxParser().binary_keywords
+    words = list(keywords) + ["10101010", '"01100001 01100010"', "// comentário"]
+    line = " ".join(random.choice(words) for _ in range(8))
+    lines = [" ".join(random.choice(words) for _ in range(8)) for _ in range(1000)]
+    count = size_mb * 1024 * 1024 // (len(line) + 1)
+    lines = (lines * (count // len(lines) + 1))[:count]
+
+    index = BinaryTokenIndex(keywords)
+    start = time.perf_counter()
+    index.reset(len(lines))
+    for number in range(screen_lines):
+        index.scan(number, lines[number])
+    print(f"Primeira tela ({screen_lines} de {len(lines)} linhas): {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    start = time.perf_counter()
+    for number in range(len(lines)):
+        if index.get(number) is None:
+            index.scan(number, lines[number])
+    elapsed = time.perf_counter() - start
+    print(f"Documento inteiro em segundo plano: {elapsed:.2f} s ({size_mb / elapsed:.1f} MB/s)")
+
+
+def bench_binary_validator(lines: int = 200000, edits: int = 200):
+    """
+    Compara a validação completa com a revalidação de uma linha editada.
+
+    Args:
+        lines: Quantidade de linhas do documento
+        edits: Quantidade de edições medidas
+    """
+    from ui.binary_syntax_parser import BinarySyntaxParser
+    from ui.binary_validator import BINEND, BINSTART, IncrementalValidator
+
+    random.seed(0)
+    tokens = ["10100011", "00101000", "01100001", "00101001", "10010010", "1010101"]
+    source = []
+    for number in range(lines):
+        if number % 10 == 0:
+            source.append("10010100 01100001 " + BINSTART)
+        elif number % 10 == 9:
+            source.append(BINEND)
+        else:
+            source.append(" ".join(random.choice(tokens) for _ in range(8)))
+
+    validator = IncrementalValidator(BinarySyntaxParser().binary_keywords)
+    start = time.perf_counter()
+    validator.set_lines(source)
+    diagnostics = validator.diagnostics()
+    print(f"Validação completa de {lines} linhas: {(time.perf_counter() - start) * 1000:.1f} ms "
+          f"({len(diagnostics)} diagnósticos)")
+
+    # Digitação comum (sem BINSTART/BINEND) e edições que mudam o balanceamento
+    for name, extra in (("sem mudança de blocos", []), ("com mudança de blocos", [BINSTART])):
+        samples = []
+        for _ in range(edits):
+            index = random.randrange(lines)
+            while index % 10 in (0, 9):
+                index = random.randrange(lines)
+            new_line = " ".join([random.choice(tokens) for _ in range(8)] + extra)
+            start = time.perf_counter()
+            validator.replace_lines(index, 1, [new_line])
+            validator.diagnostics()
+            samples.append(time.perf_counter() - start)
+            validator.replace_lines(index, 1, [source[index]])
+        p50, _p99, worst = _percentiles(samples)
+        print(f"Revalidação após edição {name}: p50 {p50:.2f} ms, máx {worst:.2f} ms")
+
+
+def bench_dialect_detector(repeat: int = 2000):
+    """
+    Mede a detecção em códigos gerados por cada dialeto.
+
+    Args:
+        repeat: Quantidade de detecções por código
+    """
+    from ui.binary_stream import create_engine
+    from ui.dialect_detector import DialectDetector
+
+    source = (
+        "def soma(a, b):\n"
+        "    if a != b:\n"
+        "        return a + b\n"
+        "    return a * 2\n"
+        "\n"
+        "for i in range(10):\n"
+        "    print(soma(i, 3))\n"
+    ) * 40
+
+    detector = DialectDetector()
+    samples = {
+        "fixed": create_engine("fixed").converter_para_binario(source),
+        "enhanced": create_engine("enhanced").converter_para_binario(source),
+        "parser": create_engine("parser").parse_python_to_binary(source),
+    }
+    for name, code in samples.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            dialect = detector.detect(code)
+        elapsed = (time.perf_counter() - start) / repeat
+        print(f"{name:>9} -> {dialect:<9} {elapsed * 1e6:.0f} µs por detecção")
+
+
+def bench_incremental_translation(lines: int = 100000, edits: int = 500):
+    """
+    Mede o tempo de uma edição (uma tecla) em um documento grande.
+
+    Args:
+        lines: Quantidade de linhas do documento
+        edits: Quantidade de edições medidas
+    """
+    from ui.incremental_translation import IncrementalTranslation
+
+    random.seed(0)
+    tokens = ["10100011", "00101000", "01100001", "00101001", "10010010", "11010000", "11010001"]
+    text = "\n".join(" ".join(random.choice(tokens) for _ in range(8)) for _ in range(lines))
+
+    translation = IncrementalTranslation()
+    start = time.perf_counter()
+    translation.set_text(text)
+    print(f"Carga inicial de {lines} linhas: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    samples = []
+    for _ in range(edits):
+        index = random.randrange(lines)
+        # Alterna entre edições que mudam e que não mudam o saldo de BINSTART/BINEND
+        new_line = " ".join(random.choice(tokens) for _ in range(8))
+        start = time.perf_counter()
+        translation.replace_lines(index, 1, [new_line])
+        # A pré-visualização só desenha as linhas visíveis
+        translation.python_lines(index, index + 60)
+        samples.append(time.perf_counter() - start)
+
+    p50, p99, worst = _percentiles(samples)
+    print(f"Edição: p50 {p50:.2f} ms, p99 {p99:.2f} ms, máx {worst:.2f} ms")
+
+
+def bench_interpreter_pool(runs: int = 200):
+    """
+    Compara a latência do conjunto com a criação de um processo por execução.
+
+    Args:
+        runs: Quantidade de execuções em cada abordagem
+    """
+    from ui.interpreter_pool import InterpreterPool
+
+    source = "total = 0\nfor i in range(1000):\n    total += i\nprint(total)\n"
+
+    def spawn_run():
+        # Abordagem anterior: arquivo temporário e um novo interpretador por execução
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as temp_file:
+            temp_file.write(source)
+            temp_path = temp_file.name
+        try:
+            process = subprocess.Popen([sys.executable, temp_path], stdout=subprocess.PIPE,
+                                       stderr=subprocess.PIPE, text=True)
+            process.communicate(timeout=10)
+        finally:
+            os.unlink(temp_path)
+
+    pool = InterpreterPool()
+    code = compile(source, "<binario>", "exec")
+    pool.run(code)
+
+    for name, function in (("Processo por execução", spawn_run), ("Conjunto pré-iniciado", lambda: pool.run(code))):
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            function()
+            samples.append(time.perf_counter() - start)
+        p50, p99, _worst = _percentiles(samples)
+        print(f"{name}: p50 {p50:.2f} ms, p99 {p99:.2f} ms ({runs} execuções)")
+
+    pool.shutdown()
+
+
+def bench_large_file_index(size_mb: int = 200):
+    """
+    Mede a construção do índice, a leitura de uma janela e a busca em um arquivo grande.
+
+    Args:
+        size_mb: Tamanho do arquivo gerado em MB
+    """
+    from ui.large_file_index import LargeFileIndex, np
+
+    random.seed(0)
+    words = [format(value, "08b") for value in range(32, 127)]
+    sample = "\n".join(" ".join(random.choice(words) for _ in range(random.randrange(1, 16)))
+                       for _ in range(10000)) + "\n"
+    repeat = size_mb * 1024 * 1024 // len(sample) + 1
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "grande.bin")
+        with open(path, "w", encoding="utf-8") as file:
+            for _ in range(repeat):
+                file.write(sample)
+            file.write("01011010 01011010 01011010")
+
+        with LargeFileIndex(path) as index:
+            start = time.perf_counter()
+            index.build()
+            elapsed = time.perf_counter() - start
+            print(f"Índice de {index.line_count} linhas ({index.size / 1e6:.0f} MB): {elapsed:.2f} s "
+                  f"({'NumPy' if np is not None else 'bytes.split'})")
+
+            start = time.perf_counter()
+            index.lines(index.line_count // 2, index.line_count // 2 + 60)
+            print(f"Janela de 60 linhas no meio do arquivo: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+            start = time.perf_counter()
+            found = index.search("01011010 01011010 01011010")
+            print(f"Busca até a última linha: {(time.perf_counter() - start) * 1000:.1f} ms -> {found}")
+
+
+def bench_output_ring_buffer(size_mb: int = 200, chunk_size: int = 65536):
+    """
+    Mede a vazão do buffer com saída de muitas linhas curtas, retirando o texto a cada quadro.
+
+    Args:
+        size_mb: Quantidade de saída simulada em MB
+        chunk_size: Tamanho de cada bloco lido do processo
+    """
+    from ui.output_ring_buffer import FRAME_INTERVAL, OutputRingBuffer
+
+    line = b"linha de saida do programa 0123456789\n"
+    chunk = line * (chunk_size // len(line))
+    chunks = int(size_mb * 1024 * 1024 // len(chunk))
+
+    buffer = OutputRingBuffer()
+    frame = FRAME_INTERVAL / 1000
+    frames = 0
+    replaced = 0
+    start = last_frame = time.perf_counter()
+    for _ in range(chunks):
+        buffer.feed(chunk)
+        now = time.perf_counter()
+        if now - last_frame >= frame:
+            replace, _text = buffer.take()
+            frames += 1
+            replaced += replace
+            last_frame = now
+    buffer.take()
+    elapsed = time.perf_counter() - start
+    size = chunks * len(chunk) / (1024 * 1024)
+    print(f"{size:.0f} MB em {elapsed:.2f} s ({size / elapsed:.0f} MB/s), "
+          f"{frames} quadros ({replaced} com substituição)")
+
+
+def bench_packed_binary(size_mb: int = 20):
+    """
+    Compara tamanho e tempo de carga do texto e do formato compactado.
+
+    Args:
+        size_mb: Tamanho aproximado do texto em MB
+    """
+    from ui.packed_binary import PACKED_EXTENSION, PackedBinaryFile, read_binary_source, write_packed
+
+    random.seed(0)
+    words = [format(value, "08b") for value in range(32, 127)]
+    lines = []
+    size = 0
+    while size < size_mb * 1024 * 1024:
+        line = " ".join(random.choice(words) for _ in range(random.randrange(1, 16)))
+        if random.random() < 0.05:
+            line += " // comentário"
+        lines.append(line)
+        size += len(line) + 1
+    text = "\n".join(lines)
+
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, "programa.bin")
+        packed_path = os.path.join(directory, "programa" + PACKED_EXTENSION)
+        with open(text_path, "w", encoding="utf-8", newline="") as file:
+            file.write(text)
+
+        start = time.perf_counter()
+        write_packed(packed_path, text.split("\n"))
+        pack_time = time.perf_counter() - start
+
+        text_size = os.path.getsize(text_path)
+        packed_size = os.path.getsize(packed_path)
+        print(f"Texto: {text_size / 1e6:.1f} MB, compactado: {packed_size / 1e6:.1f} MB "
+              f"({text_size / packed_size:.1f}x menor), compactação em {pack_time:.2f} s")
+
+        start = time.perf_counter()
+        with PackedBinaryFile(packed_path) as packed:
+            token_bytes = bytes(packed.tokens())
+        print(f"Tokens via mmap: {(time.perf_counter() - start) * 1000:.1f} ms ({len(token_bytes)} tokens)")
+
+        start = time.perf_counter()
+        read_binary_source(packed_path)
+        print(f"Texto reconstruído: {time.perf_counter() - start:.2f} s")
+
+
+def bench_pty_session(size_mb: int = 64):
+    """
+    Mede a latência da primeira linha de um programa que não força a saída (print sem
+    flush seguido de uma pausa) e a vazão de uma saída contínua com controle de fluxo,
+    confirmando os bytes em quadros de 16 ms como a interface.
+
+    Args:
+        size_mb: Quantidade de saída do teste de vazão em MB
+    """
+    from ui.pty_session import DEFAULT_HIGH_WATER, PtySession
+
+    received = threading.Event()
+    start = time.perf_counter()
+    session = PtySession([sys.executable, "-c", "import time; print('pronto'); time.sleep(2)"],
+                         on_output=lambda data: received.set())
+    session.start()
+    if received.wait(1.5):
+        print(f"Primeira linha sem flush: {(time.perf_counter() - start) * 1000:.1f} ms")
+    else:
+        print("Primeira linha sem flush: não chegou antes do fim do programa")
+    session.terminate()
+
+    size = int(size_mb * 1024 * 1024)
+    total = [0]
+    finished = threading.Event()
+
+    def on_output(data):
+        total[0] += len(data)
+
+    session = PtySession(["sh", "-c", f"yes | head -c {size}"], on_output=on_output,
+                         on_exit=lambda code: finished.set())
+    start = time.perf_counter()
+    session.start()
+    acknowledged = 0
+    while not finished.wait(0.016):
+        session.acknowledge(total[0] - acknowledged)
+        acknowledged = total[0]
+    elapsed = time.perf_counter() - start
+    print(f"{total[0] / (1024 * 1024):.0f} MB em {elapsed:.2f} s "
+          f"({total[0] / (1024 * 1024) / elapsed:.0f} MB/s, no máximo {DEFAULT_HIGH_WATER // 1024} KB pendentes)")
+
+
+def bench_python_token_encoder(repeat: int = 20):
+    """
+    Mede a codificação dos módulos de ui/ repetidos várias vezes.
+
+    Args:
+        repeat: Quantidade de cópias do código-fonte
+    """
+    from ui.binary_syntax_parser import BinarySyntaxParser
+
+    directory = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ui")
+    sources = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".py"):
+            with open(os.path.join(directory, name), encoding="utf-8") as file:
+                sources.append(file.read())
+    text = "\n".join(sources) * repeat
+
+    encoder = BinarySyntaxParser().python_encoder
+    start = time.perf_counter()
+    lines = 0
+    for _ in encoder.iter_lines(text.splitlines()):
+        lines += 1
+    elapsed = time.perf_counter() - start
+    print(f"{len(text) / 1e6:.1f} MB ({lines} linhas) em {elapsed:.2f} s ({len(text) / 1e6 / elapsed:.1f} MB/s)")
+
+
+# Medição de cada módulo, pelo nome do módulo
+BENCHMARKS = {
+    "app_logging": bench_app_logging,
+    "binary_ast_compiler": bench_binary_ast_compiler,
+    "binary_daemon": bench_binary_daemon,
+    "binary_language_server": bench_binary_language_server,
+    "binary_syntax_parser": bench_binary_syntax_parser,
+    "binary_table_decoder": bench_binary_table_decoder,
+    "binary_text_encoder": bench_binary_text_encoder,
+    "binary_token_index": bench_binary_token_index,
+    "binary_validator": bench_binary_validator,
+    "dialect_detector": bench_dialect_detector,
+    "incremental_translation": bench_incremental_translation,
+    "interpreter_pool": bench_interpreter_pool,
+    "large_file_index": bench_large_file_index,
+    "output_ring_buffer": bench_output_ring_buffer,
+    "packed_binary": bench_packed_binary,
+    "pty_session": bench_pty_session,
+    "python_token_encoder": bench_python_token_encoder,
+}
+
+
+def _number(text: str):
+    """Converte um parâmetro da linha de comando em int ou float."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def main(argv=None) -> int:
+    """
+    Ponto de entrada da linha de comando.
+
+    Args:
+        argv: Argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        Código de saída
+    """
+    parser = argparse.ArgumentParser(description="Medições de desempenho do The Collector Binarie")
+    parser.add_argument("name", choices=sorted(BENCHMARKS), help="Módulo medido")
+    parser.add_argument("values", nargs="*", type=_number,
+                        help="Parâmetros da medição, na ordem da função (tamanho, repetições, ...)")
+    args = parser.parse_args(argv)
+    BENCHMARKS[args.name](*args.values)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
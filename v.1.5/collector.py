@@ -0,0 +1,206 @@
+"""
+Linha de comando sem interface gráfica para o The Collector Binarie.
+Traduz (binário -> texto) ou codifica (texto -> binário) todos os arquivos de um
+diretório usando um conjunto de processos do tamanho da quantidade de CPUs.
+Nunca importa o PyQt5, podendo ser usado em pipelines e servidores.
+
+Uso:
+    python -m collector translate DIR [-o SAIDA] [-e fixed|parser] [-j N]
+    python -m collector encode DIR [-o SAIDA] [-e fixed|parser] [-j N]
+"""
+
+import argparse
+import fnmatch
+import multiprocessing
+import os
+import sys
+import time
+
+from ui.binary_stream import DEFAULT_CHUNK_SIZE, ENGINES, create_engine, iter_encode, iter_translate
+
+# Padrão de entrada e extensão de saída de cada comando
+DEFAULT_PATTERNS = {"translate": "*.bin", "encode": "*.py"}
+DEFAULT_SUFFIXES = {"translate": ".py", "encode": ".bin"}
+
+# Estado de cada processo do conjunto (o interpretador é criado uma única vez por processo)
+_worker_engine = None
+_worker_stream = None
+_worker_chunk_size = DEFAULT_CHUNK_SIZE
+
+
+def _init_worker(command, engine_name, chunk_size):
+    """
+    Inicializa um processo do conjunto.
+
+    Args:
+        command: "translate" ou "encode"
+        engine_name: Nome do interpretador
+        chunk_size: Quantidade de caracteres lidos por vez
+    """
+    global _worker_engine, _worker_stream, _worker_chunk_size
+    _worker_engine = create_engine(engine_name)
+    _worker_stream = iter_translate if command == "translate" else iter_encode
+    _worker_chunk_size = chunk_size
+
+
+def _convert_file(job):
+    """
+    Converte um arquivo no processo atual.
+
+    Args:
+        job: Tupla (caminho de entrada, caminho de saída)
+
+    Returns:
+        Tupla (caminho de entrada, bytes lidos, bytes escritos, mensagem de erro ou None)
+    """
+    source_path, target_path = job
+    try:
+        os.makedirs(os.path.dirname(target_path) or ".", exist_ok=True)
+        written = 0
+        with open(source_path, "r", encoding="utf-8") as source, \
+                open(target_path, "w", encoding="utf-8") as target:
+            for piece in _worker_stream(source, _worker_chunk_size, _worker_engine):
+                target.write(piece)
+                written += len(piece)
+        return source_path, os.path.getsize(source_path), written, None
+    except Exception as e:
+        return source_path, 0, 0, f"{type(e).__name__}: {e}"
+
+
+def collect_jobs(root, pattern, suffix, output_dir=None):
+    """
+    Lista os arquivos a converter.
+
+    Args:
+        root: Diretório (ou arquivo) de entrada
+        pattern: Padrão de nome dos arquivos de entrada (ex.: "*.bin")
+        suffix: Extensão dos arquivos gerados
+        output_dir: Diretório de saída (None grava ao lado da entrada)
+
+    Returns:
+        Lista de tuplas (caminho de entrada, caminho de saída)
+    """
+    if os.path.isfile(root):
+        paths = [root]
+        base = os.path.dirname(root)
+    else:
+        paths = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if fnmatch.fnmatch(filename, pattern):
+                    paths.append(os.path.join(dirpath, filename))
+        base = root
+
+    jobs = []
+    for path in paths:
+        target = os.path.splitext(path)[0] + suffix
+        if output_dir:
+            target = os.path.join(output_dir, os.path.relpath(target, base))
+        if os.path.abspath(target) != os.path.abspath(path):
+            jobs.append((path, target))
+    return jobs
+
+
+def run_batch(command, jobs, engine="fixed", workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Converte os arquivos distribuindo-os entre processos.
+
+    Args:
+        command: "translate" ou "encode"
+        jobs: Lista de tuplas (caminho de entrada, caminho de saída)
+        engine: Nome do interpretador
+        workers: Quantidade de processos (padrão: número de CPUs)
+        chunk_size: Quantidade de caracteres lidos por vez
+
+    Returns:
+        Dicionário com arquivos, bytes, tempo e erros
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+    # Lotes maiores reduzem a comunicação entre processos em árvores com muitos arquivos pequenos
+    batch = max(1, min(256, len(jobs) // (workers * 8)))
+
+    stats = {"files": 0, "bytes_in": 0, "bytes_out": 0, "errors": [], "workers": workers}
+    start = time.perf_counter()
+
+    if workers == 1:
+        _init_worker(command, engine, chunk_size)
+        results = map(_convert_file, jobs)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers, _init_worker, (command, engine, chunk_size))
+        results = pool.imap_unordered(_convert_file, jobs, batch)
+
+    try:
+        for path, bytes_in, bytes_out, error in results:
+            if error:
+                stats["errors"].append((path, error))
+                continue
+            stats["files"] += 1
+            stats["bytes_in"] += bytes_in
+            stats["bytes_out"] += bytes_out
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    stats["elapsed"] = time.perf_counter() - start
+    return stats
+
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando.
+
+    Args:
+        argv: Argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        Código de saída (1 se algum arquivo falhou)
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m collector",
+        description="Tradução e codificação em lote do The Collector Binarie (sem interface gráfica)"
+    )
+    parser.add_argument("command", choices=("translate", "encode"),
+                        help="translate: binário -> texto; encode: texto -> binário")
+    parser.add_argument("path", help="Diretório (percorrido recursivamente) ou arquivo de entrada")
+    parser.add_argument("-o", "--output", help="Diretório de saída (padrão: ao lado da entrada)")
+    parser.add_argument("-e", "--engine", choices=ENGINES, default="fixed",
+                        help="Interpretador usado na conversão")
+    parser.add_argument("-p", "--pattern", help="Padrão dos arquivos de entrada")
+    parser.add_argument("-s", "--suffix", help="Extensão dos arquivos gerados")
+    parser.add_argument("-j", "--jobs", type=int, help="Quantidade de processos (padrão: CPUs)")
+    parser.add_argument("-c", "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Caracteres lidos por bloco em cada arquivo")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.path):
+        print(f"Caminho não encontrado: {args.path}", file=sys.stderr)
+        return 2
+
+    pattern = args.pattern or DEFAULT_PATTERNS[args.command]
+    suffix = args.suffix or DEFAULT_SUFFIXES[args.command]
+    jobs = collect_jobs(args.path, pattern, suffix, args.output)
+    if not jobs:
+        print(f"Nenhum arquivo '{pattern}' encontrado em {args.path}", file=sys.stderr)
+        return 0
+
+    stats = run_batch(args.command, jobs, args.engine, args.jobs, args.chunk_size)
+
+    for path, error in stats["errors"]:
+        print(f"Erro em {path}: {error}", file=sys.stderr)
+
+    elapsed = max(stats["elapsed"], 1e-9)
+    megabytes = stats["bytes_in"] / 1e6
+    print(
+        f"{stats['files']} arquivo(s) convertido(s), {len(stats['errors'])} erro(s) "
+        f"em {elapsed:.2f} s com {stats['workers']} processo(s): "
+        f"{stats['files'] / elapsed:.1f} arquivos/s, {megabytes / elapsed:.1f} MB/s"
+    )
+    return 1 if stats["errors"] else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -5,6 +5,7 @@ Versão final sem diagnósticos.
 
 import os
 import sys
+import multiprocessing
 import tempfile
 import traceback
 import configparser
@@ -29,6 +30,15 @@ try:
     from ui.theme_manager import ThemeManager
     from ui.about_dialog import AboutDialog
     from ui.binary_code_executor_fixed import BinaryCodeExecutorFixed
+    from ui.python_preview_pane import PythonPreviewPane
+    from ui.packed_binary import PACKED_EXTENSION, is_packed_file, read_binary_source, write_packed
+    from ui.large_file_view import LargeFileView, LARGE_FILE_THRESHOLD
+    from ui.dialect_detector import DialectRouter
+    from ui.execution_service import ExecutionService
+    from ui.sandbox_runner import STOP_EXITED
+    from ui.fixture_runner import collect_fixtures
+    from ui.fixture_results_dialog import FixtureResultsDialog
+    from ui.app_logging import setup_logging
 except ImportError as e:
     error_details = traceback.format_exc()
     print(f"Não foi possível importar um módulo necessário: {e}\nDetalhes: {error_details}")
@@ -80,6 +90,11 @@ class MainAppWindowFixed(QMainWindow):
 
         self.binary_interpreter = BinaryInterpreterFixed()
         self.code_executor = BinaryCodeExecutorFixed(self.binary_interpreter)
+        # Dialeto detectado por arquivo; em caso de empate vale o interpretador padrão
+        self.dialect_router = DialectRouter(engines={"fixed": self.binary_interpreter}, preferred="fixed")
+        # Tradução e execução fora da thread da interface, em fila
+        self.execution_service = ExecutionService(self.code_executor.sandbox, self.code_executor.cache, parent=self)
+        self.execution_service.job_finished.connect(self._on_execution_finished)
         self.theme_manager = ThemeManager()
         self.terminal = None # Inicializa como None
 
@@ -159,7 +174,17 @@ class MainAppWindowFixed(QMainWindow):
         """)
         self.tabs.setElideMode(Qt.ElideRight)
         self.tabs.setUsesScrollButtons(True)
-        editor_layout.addWidget(self.tabs)
+        self.tabs.currentChanged.connect(self._update_python_preview)
+
+        # Pré-visualização Python ao lado do editor (oculta por padrão)
+        self.editor_splitter = QSplitter(Qt.Horizontal)
+        self.editor_splitter.addWidget(self.tabs)
+        self.python_preview = PythonPreviewPane()
+        self.python_preview.hide()
+        self.editor_splitter.addWidget(self.python_preview)
+        self.editor_splitter.setStretchFactor(0, 3)
+        self.editor_splitter.setStretchFactor(1, 2)
+        editor_layout.addWidget(self.editor_splitter)
         self.central_stack.addWidget(self.editor_widget)
         self.three_panel_layout.set_center_panel_widget(self.central_stack)
 
@@ -185,6 +210,9 @@ class MainAppWindowFixed(QMainWindow):
             QPushButton:hover { background-color: #2d2d5a; }
             QPushButton#runButton { background-color: #00aa00; color: #fff; border-radius: 10px; font-size: 16px; }
             QPushButton#runButton:hover { background-color: #00cc00; }
+            QPushButton#stopButton { background-color: #aa2222; color: #fff; border-radius: 10px; font-size: 16px; }
+            QPushButton#stopButton:hover { background-color: #cc3333; }
+            QPushButton#stopButton:disabled { background-color: #44475a; color: #8b8b8b; }
             QPushButton#terminalButton { background-color: #23272e; border-radius: 10px; font-size: 16px; }
             QPushButton#terminalButton:hover { background-color: #2d2d5a; }
             QPushButton#aiButton { background-color: #bd93f9; color: #23272e; border-radius: 10px; font-size: 16px; }
@@ -221,6 +249,11 @@ class MainAppWindowFixed(QMainWindow):
         self.run_button.clicked.connect(self._run_code)
         menu_layout.addWidget(self.run_button)
 
+        self.stop_button = self._create_action_button("■ Stop", "stopButton")
+        self.stop_button.setEnabled(False)
+        self.stop_button.clicked.connect(self._stop_code)
+        menu_layout.addWidget(self.stop_button)
+
         self.terminal_button = self._create_action_button("⌨ Terminal", "terminalButton")
         self.terminal_button.clicked.connect(self._show_terminal)
         menu_layout.addWidget(self.terminal_button)
@@ -245,6 +278,8 @@ class MainAppWindowFixed(QMainWindow):
     def _populate_traducao_menu(self):
         text_to_binary_action = QAction("Texto → Binário", self); text_to_binary_action.triggered.connect(self._text_to_binary); self.traducao_menu.addAction(text_to_binary_action)
         binary_to_text_action = QAction("Binário → Texto", self); binary_to_text_action.triggered.connect(self._binary_to_text); self.traducao_menu.addAction(binary_to_text_action)
+        self.preview_action = QAction("Pré-visualização Python", self); self.preview_action.setCheckable(True); self.preview_action.toggled.connect(self._toggle_python_preview); self.traducao_menu.addAction(self.preview_action)
+        fixtures_action = QAction("Testar com Casos (.in/.out)...", self); fixtures_action.triggered.connect(self._run_fixtures); self.traducao_menu.addAction(fixtures_action)
 
     def _populate_config_menu(self):
         theme_menu = QMenu("Tema", self)
@@ -341,6 +376,8 @@ class MainAppWindowFixed(QMainWindow):
         # Tradução
         self.traducao_menu.actions()[0].setText("Text → Binary")
         self.traducao_menu.actions()[1].setText("Binary → Text")
+        self.traducao_menu.actions()[2].setText("Python Preview")
+        self.traducao_menu.actions()[3].setText("Test with Cases (.in/.out)...")
         # Configurações
         self.config_menu.actions()[0].menu().setTitle("Theme")
         self.config_menu.actions()[0].menu().actions()[0].setText("Dark Blue")
@@ -359,6 +396,8 @@ class MainAppWindowFixed(QMainWindow):
         # Tradução
         self.traducao_menu.actions()[0].setText("Texto → Binário")
         self.traducao_menu.actions()[1].setText("Binário → Texto")
+        self.traducao_menu.actions()[2].setText("Pré-visualização Python")
+        self.traducao_menu.actions()[3].setText("Testar com Casos (.in/.out)...")
         # Configurações
         self.config_menu.actions()[0].menu().setTitle("Tema")
         self.config_menu.actions()[0].menu().actions()[0].setText("Dark Blue")
@@ -376,12 +415,16 @@ class MainAppWindowFixed(QMainWindow):
         self.status_bar.showMessage("Novo arquivo criado")
 
     def _open_file_dialog(self):
-        filename, _ = QFileDialog.getOpenFileName(self, "Abrir Arquivo", "", "Todos os Arquivos (*)")
+        filename, _ = QFileDialog.getOpenFileName(self, "Abrir Arquivo", "", f"Todos os Arquivos (*);;Binário compactado (*{PACKED_EXTENSION})")
         if filename: self._open_file(filename)
 
     def _open_file(self, filename):
         try:
-            with open(filename, 'r', encoding='utf-8') as file: content = file.read()
+            # Arquivos no formato compactado (.binp) são convertidos para texto de forma transparente
+            packed = is_packed_file(filename)
+            if not packed and os.path.getsize(filename) >= LARGE_FILE_THRESHOLD:
+                self._open_large_file(filename); return
+            content = read_binary_source(filename)
             self.central_stack.setCurrentWidget(self.editor_widget)
             editor = CodeEditor()
             editor.setStyleSheet("""
@@ -402,10 +445,22 @@ class MainAppWindowFixed(QMainWindow):
             index = self.tabs.addTab(editor, title)
             self.tabs.setCurrentIndex(index)
             editor.setProperty("filepath", filename)
+            editor.setProperty("packed", packed)
             editor.setFocus()
             self.status_bar.showMessage(f"Arquivo aberto: {filename}")
         except Exception as e: QMessageBox.critical(self, "Erro", f"Erro ao abrir o arquivo:\n{str(e)}")
 
+    def _open_large_file(self, filename):
+        # Arquivos grandes são mapeados em memória e exibidos somente leitura, sem QTextDocument
+        self.central_stack.setCurrentWidget(self.editor_widget)
+        view = LargeFileView(filename)
+        view.index_ready.connect(lambda: self.status_bar.showMessage(f"Arquivo indexado: {filename} ({view.line_count()} linhas) - Ctrl+G: ir para linha, Ctrl+F: pesquisar"))
+        index = self.tabs.addTab(view, f"{os.path.basename(filename)} (somente leitura)")
+        self.tabs.setCurrentIndex(index)
+        view.setProperty("filepath", filename)
+        view.setFocus()
+        self.status_bar.showMessage(f"Indexando arquivo grande: {filename}")
+
     def _open_workspace(self):
         if hasattr(self, 'file_explorer') and hasattr(self.file_explorer, '_open_workspace'): self.file_explorer._open_workspace()
         else: QMessageBox.warning(self, "Aviso", "Explorador de arquivos não inicializado corretamente.")
@@ -416,11 +471,16 @@ class MainAppWindowFixed(QMainWindow):
         if not isinstance(current_editor, CodeEditor): self.status_bar.showMessage("A aba atual não é um editor."); return False
         filepath = current_editor.property("filepath")
         if as_new or not filepath:
-            filename, _ = QFileDialog.getSaveFileName(self, "Salvar Arquivo Como", filepath or "", "Todos os Arquivos (*)")
+            filename, _ = QFileDialog.getSaveFileName(self, "Salvar Arquivo Como", filepath or "", f"Todos os Arquivos (*);;Binário compactado (*{PACKED_EXTENSION})")
             if not filename: return False
             filepath = filename
         try:
-            with open(filepath, 'w', encoding='utf-8') as file: file.write(current_editor.toPlainText())
+            # Mantém o formato compactado de arquivos abertos nele ou salvos com a extensão .binp
+            packed = filepath.endswith(PACKED_EXTENSION) or (filepath == current_editor.property("filepath") and bool(current_editor.property("packed")))
+            if packed: write_packed(filepath, current_editor.toPlainText().split("\n"))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as file: file.write(current_editor.toPlainText())
+            current_editor.setProperty("packed", packed)
             title = os.path.basename(filepath)
             self.tabs.setTabText(self.tabs.currentIndex(), title)
             current_editor.setProperty("filepath", filepath)
@@ -431,6 +491,7 @@ class MainAppWindowFixed(QMainWindow):
         widget_to_close = self.tabs.widget(index)
         # TODO: Adicionar verificação de alterações não salvas
         self.tabs.removeTab(index)
+        if hasattr(widget_to_close, "close_file"): widget_to_close.close_file()
         if self.tabs.count() == 0: self.central_stack.setCurrentWidget(self.welcome_screen)
         self.status_bar.showMessage("Aba fechada")
 
@@ -454,12 +515,25 @@ class MainAppWindowFixed(QMainWindow):
         cursor = current_editor.textCursor(); binary = cursor.selectedText() if cursor.hasSelection() else current_editor.toPlainText()
         if not binary: self.status_bar.showMessage("Nada para traduzir."); return
         try:
-            text = self.binary_interpreter.traduzir_binario(binary)
+            dialect = self.dialect_router.dialect_for(binary, current_editor.property("filepath"))
+            text = self.code_executor.cache.translate(self.dialect_router.engine(dialect), binary)
             self._new_file(); new_editor = self.tabs.currentWidget(); new_editor.setPlainText(text)
             self.tabs.setTabText(self.tabs.currentIndex(), "Traduzido para Texto")
-            self.status_bar.showMessage("Binário traduzido para texto.")
+            self.status_bar.showMessage(f"Binário traduzido para texto (dialeto: {dialect}).")
         except Exception as e: QMessageBox.critical(self, "Erro de Tradução", f"Erro ao traduzir binário:\n{str(e)}")
 
+    def _toggle_python_preview(self, checked):
+        self.python_preview.setVisible(checked)
+        self._update_python_preview()
+
+    def _update_python_preview(self, index=None):
+        # A pré-visualização acompanha o editor da aba atual
+        current_editor = self.tabs.currentWidget()
+        if not self.python_preview.isVisible() or not isinstance(current_editor, CodeEditor):
+            current_editor = None
+        if current_editor is not self.python_preview.editor:
+            self.python_preview.set_editor(current_editor)
+
     def _run_code(self):
         if self.tabs.count() == 0:
             QMessageBox.warning(self, "Aviso", "Nenhuma aba aberta para executar.")
@@ -475,12 +549,62 @@ class MainAppWindowFixed(QMainWindow):
             return
 
         try:
-            # Chama o executor interativo, que já exibe o resultado em um QDialog estilizado
-            self.code_executor.execute_binary_code(binary_code, parent=self)
-            self.status_bar.showMessage("Execução concluída.")
+            # A execução entra na fila do serviço; o terminal acompanha a saída à medida que chega
+            dialect, engine = self.dialect_router.engine_for(binary_code, current_editor.property("filepath"))
+            busy = self.execution_service.is_busy()
+            self.code_executor.start_binary_code(binary_code, self.execution_service, parent=self, interpreter=engine)
+            self.stop_button.setEnabled(True)
+            if busy:
+                self.status_bar.showMessage(f"Execução na fila (dialeto: {dialect}).")
+            else:
+                self.status_bar.showMessage(f"Executando (dialeto: {dialect})...")
         except Exception as e:
             QMessageBox.critical(self, "Erro", f"Erro ao executar o código:\n{str(e)}")
 
+    def _run_fixtures(self):
+        if self.tabs.count() == 0: return
+        current_editor = self.tabs.currentWidget()
+        if not isinstance(current_editor, CodeEditor): return
+        binary_code = current_editor.toPlainText()
+        if not binary_code.strip():
+            QMessageBox.warning(self, "Aviso", "O editor está vazio. Nada para testar.")
+            return
+        directory = QFileDialog.getExistingDirectory(self, "Pasta com os casos de teste (.in/.out)")
+        if not directory: return
+        fixtures = collect_fixtures(directory)
+        if not fixtures:
+            QMessageBox.information(self, "Casos de Teste", "Nenhum arquivo .in encontrado na pasta escolhida.")
+            return
+        try:
+            # O programa é compilado uma única vez; os casos rodam em paralelo no diálogo
+            dialect, engine = self.dialect_router.engine_for(binary_code, current_editor.property("filepath"))
+            program = self.code_executor.cache.compile_binary(engine, binary_code)
+        except SyntaxError as e:
+            QMessageBox.critical(self, "Erro de Sintaxe", f"Linha {e.lineno}, coluna {e.offset}: {e.msg}")
+            return
+        except Exception as e:
+            QMessageBox.critical(self, "Erro de Tradução", f"Erro ao traduzir binário:\n{str(e)}")
+            return
+        dialog = FixtureResultsDialog(program, fixtures, f"Casos de Teste — {os.path.basename(directory)}", parent=self)
+        dialog.show()
+        dialog.start()
+        self.status_bar.showMessage(f"Testando {len(fixtures)} caso(s) (dialeto: {dialect})...")
+
+    def _stop_code(self):
+        # Interrompe a execução atual; as da fila continuam
+        self.execution_service.stop()
+        self.status_bar.showMessage("Execução interrompida.")
+
+    def _on_execution_finished(self, job_id, result):
+        pending = self.execution_service.pending_count()
+        self.stop_button.setEnabled(self.execution_service.is_busy())
+        if pending:
+            self.status_bar.showMessage(f"Execução concluída; {pending} na fila.")
+        elif result.stop_reason == STOP_EXITED:
+            self.status_bar.showMessage("Execução concluída.")
+        else:
+            self.status_bar.showMessage(result.stop_message() or "Execução interrompida.")
+
     def _show_binary_ai(self):
         from ui.binary_ai_dialog import BinaryAIDialog
         dialog = BinaryAIDialog(self.binary_interpreter, parent=self)
@@ -552,9 +676,13 @@ class MainAppWindowFixed(QMainWindow):
 
         if self.terminal:
             self.terminal.close()
+        self.execution_service.shutdown()
         event.accept()
 
 if __name__ == "__main__":
+    # No executável empacotado, os processos de tradução em paralelo não abrem outra janela
+    multiprocessing.freeze_support()
+    setup_logging()
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
 
@@ -0,0 +1,179 @@
+"""
+Módulo de configuração do logging da aplicação.
+Todos os registros passam por uma fila (QueueHandler) e são formatados e
+gravados por uma thread de fundo (QueueListener) em arquivos rotativos no
+diretório ~/.the_collector_binarie/logs. Quem registra só paga o teste de nível
+e a entrada na fila: a mensagem (com os argumentos no estilo %) é montada na
+thread de fundo, e um nível desativado não monta nada. Cada subsistema
+("terminal", "terminal.output", "execution", ...) tem o seu nível, definido
+em setup_logging ou na variável de ambiente COLLECTOR_BINARIE_LOG
+("terminal=DEBUG,execution=INFO").
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from typing import Dict, Optional, Union
+
+# Logger pai de todos os subsistemas
+ROOT_LOGGER = "binarie"
+
+# Variável de ambiente com os níveis por subsistema
+LEVELS_ENV = "COLLECTOR_BINARIE_LOG"
+
+# Níveis padrão por subsistema (os demais herdam o do logger pai)
+DEFAULT_LEVELS = {
+    "": logging.INFO,
+    "terminal.input": logging.WARNING,
+    "terminal.output": logging.WARNING,
+    "execution.output": logging.WARNING,
+}
+
+# Rotação dos arquivos de log
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+_listener = None
+_lock = threading.Lock()
+
+
+def default_log_dir() -> str:
+    """Retorna o diretório padrão dos arquivos de log."""
+    return os.path.join(os.path.expanduser("~"), ".the_collector_binarie", "logs")
+
+
+def get_logger(subsystem: str = "") -> logging.Logger:
+    """
+    Retorna o logger de um subsistema.
+
+    Args:
+        subsystem: Nome do subsistema ("terminal", "execution", ...; vazio para o pai)
+
+    Returns:
+        Logger "binarie.<subsistema>"
+    """
+    return logging.getLogger(f"{ROOT_LOGGER}.{subsystem}" if subsystem else ROOT_LOGGER)
+
+
+def set_level(subsystem: str, level: Union[int, str]):
+    """
+    Define o nível de um subsistema.
+
+    Args:
+        subsystem: Nome do subsistema (vazio para o pai)
+        level: Nível (logging.DEBUG, "DEBUG", ...)
+    """
+    if isinstance(level, str):
+        value = logging.getLevelName(level.strip().upper())
+        if not isinstance(value, int):
+            raise ValueError(f"Nível de log desconhecido: {level}")
+        level = value
+    get_logger(subsystem).setLevel(level)
+
+
+def parse_levels(text: str) -> Dict[str, str]:
+    """
+    Interpreta níveis no formato "subsistema=NÍVEL,..." (um nível sem subsistema vale para o pai).
+
+    Args:
+        text: Texto com os níveis
+
+    Returns:
+        Dicionário subsistema -> nível
+    """
+    levels = {}
+    for item in text.split(","):
+        if not item.strip():
+            continue
+        name, separator, level = item.rpartition("=")
+        levels[name.strip() if separator else ""] = level.strip()
+    return levels
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler que não formata o registro na thread de quem registrou.
+    A fila é local ao processo, então o registro vai intacto (mensagem e
+    argumentos) e é formatado pelo handler de arquivo, na thread de fundo.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging(log_dir: Optional[str] = None, levels: Optional[Dict[str, Union[int, str]]] = None,
+                  filename: str = "binarie.log", max_bytes: int = DEFAULT_MAX_BYTES,
+                  backup_count: int = DEFAULT_BACKUP_COUNT) -> Optional[str]:
+    """
+    Configura o logging da aplicação (só a primeira chamada tem efeito sobre os arquivos;
+    os níveis são aplicados em todas).
+
+    Args:
+        log_dir: Diretório dos arquivos (padrão: ~/.the_collector_binarie/logs)
+        levels: Níveis por subsistema, aplicados sobre DEFAULT_LEVELS e antes da variável de ambiente
+        filename: Nome do arquivo de log
+        max_bytes: Tamanho de cada arquivo antes da rotação
+        backup_count: Quantidade de arquivos antigos mantidos
+
+    Returns:
+        Caminho do arquivo de log, ou None se não foi possível criá-lo
+    """
+    global _listener
+    combined = dict(DEFAULT_LEVELS)
+    combined.update(levels or {})
+    combined.update(parse_levels(os.environ.get(LEVELS_ENV, "")))
+    for subsystem, level in combined.items():
+        try:
+            set_level(subsystem, level)
+        except ValueError as e:
+            print(f"Aviso: {e}", file=sys.stderr)
+
+    with _lock:
+        if _listener is not None:
+            return _listener.handlers[0].baseFilename
+
+        log_dir = log_dir or default_log_dir()
+        try:
+            os.makedirs(log_dir, exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(
+                os.path.join(log_dir, filename), maxBytes=max_bytes, backupCount=backup_count,
+                encoding="utf-8", delay=True
+            )
+        except OSError as e:
+            print(f"Aviso: não foi possível criar o log em {log_dir}: {e}", file=sys.stderr)
+            return None
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+        log_queue = queue.SimpleQueue()
+        root = get_logger()
+        root.addHandler(DeferredQueueHandler(log_queue))
+        # Os registros da aplicação não são repetidos pelos handlers do logger raiz
+        root.propagate = False
+
+        _listener = logging.handlers.QueueListener(log_queue, handler)
+        _listener.start()
+        atexit.register(shutdown_logging)
+        return handler.baseFilename
+
+
+def shutdown_logging():
+    """Grava os registros pendentes e encerra a thread de fundo."""
+    global _listener
+    with _lock:
+        listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    root = get_logger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, DeferredQueueHandler):
+            root.removeHandler(handler)
+    root.propagate = True
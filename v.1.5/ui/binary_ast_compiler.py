@@ -0,0 +1,1791 @@
+"""
+Módulo de compilação direta de código binário para ast.Module.
+Trabalha sobre o dialeto do BinarySyntaxParser (uma linha binária por linha de
+código, BINSTART no lugar do ":" que abre um bloco e BINEND fechando o bloco)
+sem gerar o texto Python intermediário: as palavras de 8 bits são agrupadas em
+tokens Python (nomes, números, strings e operadores escritos caractere a
+caractere voltam a ser um token só) e um analisador descendente recursivo monta
+a árvore. Cada nó recebe a linha e a coluna da palavra binária de onde veio, de
+modo que erros de sintaxe e tracebacks apontam para a posição exata no arquivo
+binário. O texto Python continua disponível por ast.unparse, sob demanda.
+"""
+
+import ast
+import re
+import sys
+import keyword
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Nome de arquivo usado na compilação
+DEFAULT_FILENAME = "<binario>"
+
+# Tipos de token produzidos a partir das palavras binárias
+NAME = "NAME"
+NUMBER = "NUMBER"
+STRING = "STRING"
+OP = "OP"
+NEWLINE = "NEWLINE"
+INDENT = "INDENT"
+DEDENT = "DEDENT"
+ENDMARKER = "ENDMARKER"
+# Linha com erro, na tradução para texto (modo tolerante do léxico)
+ERROR = "ERROR"
+# Tokens de estrutura das linhas lógicas e dos blocos
+_LAYOUT = (NEWLINE, INDENT, DEDENT)
+
+# Operadores do Python, do mais longo ao mais curto (correspondência mais longa)
+OPERATORS = sorted({
+    "**=", "//=", ">>=", "<<=", "...", "->", ":=",
+    "**", "//", ">>", "<<", "<=", ">=", "==", "!=", "+=", "-=", "*=", "/=", "%=", "&=", "|=", "^=", "@=",
+    "+", "-", "*", "/", "%", "@", "&", "|", "^", "~", "<", ">", "(", ")", "[", "]", "{", "}",
+    ",", ":", ".", ";", "=",
+}, key=len, reverse=True)
+_OPERATOR_SET = frozenset(OPERATORS)
+
+# Primeiro caractere de uso privado usado para as palavras da tabela com mais de um caractere
+_PLACEHOLDER_BASE = 0xE000
+_PLACEHOLDERS = re.compile("[\ue000-\uf8ff]")
+
+# Token Python no texto decodificado de uma linha (um caractere por palavra binária)
+_TOKEN_PATTERN = re.compile(r"""
+    (?P<space>[ \t\f\r\n\\]+)
+  | (?P<comment>\#.*)
+  | (?P<string>(?:[rRbBuUfF]{1,2})?(?:'\'\'(?:\\.|[^\\])*?'\'\'|"\"\"(?:\\.|[^\\])*?"\"\"
+                                    |'(?:\\.|[^\\'\n])*'|"(?:\\.|[^\\"\n])*"))
+  | (?P<number>0[xX][0-9a-fA-F_]+|0[oO][0-7_]+|0[bB][01_]+
+               |(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d[\d_]*)?[jJ]?)
+  | (?P<name>[^\W\d]\w*)
+  | (?P<op>""" + "|".join(re.escape(operator) for operator in OPERATORS) + r""")
+  | (?P<word>[\ue000-\uf8ff])
+""", re.VERBOSE | re.DOTALL)
+
+# Comentário de editor: "//" no início de uma palavra vai até o fim da linha e não faz parte do código
+EDITOR_COMMENT = "//"
+
+# Palavras seguintes a cada comando lidas como operandos (nome ou valor), nunca como comandos
+COMMAND_OPERANDS = {"BINVAR": 2, "BINFUNC": 1, "BINLOOP": 1, "BININPUT": 1}
+
+# Mensagem de um comando sem todos os operandos
+INCOMPLETE_MESSAGE = "{command} incompleto"
+
+# Comandos especiais do dialeto
+_BLOCK_START = "BINSTART"
+_BLOCK_END = "BINEND"
+_COMMENT = "BINCOMMENT"
+
+# Tokens que não podem terminar uma linha lógica: a linha seguinte continua a mesma
+# instrução (o codificador não grava a barra de continuação, que o tokenize descarta)
+_CONTINUATION_OPERATORS = _OPERATOR_SET - {")", "]", "}", ",", "...", ";"}
+_CONTINUATION_KEYWORDS = frozenset({
+    "and", "or", "not", "in", "is", "if", "elif", "while", "for", "with", "as", "import", "from",
+    "del", "assert", "global", "nonlocal", "lambda", "await", "def", "class",
+})
+# Tokens que não podem iniciar uma instrução: a linha anterior continua nesta
+_LEADING_CONTINUATION = frozenset({
+    "or", "and", "in", "is", "as", ".", "=", ",", ")", "]", "}", "/", "//", "%", "**", "==", "!=",
+    "<", ">", "<=", ">=", "&", "|", "^", "<<", ">>", "->",
+})
+# Instruções em que uma vírgula no fim da linha também indica continuação
+_COMMA_CONTINUATION = frozenset({"with", "import", "from", "global", "nonlocal", "assert"})
+
+# Abertura e fechamento de parênteses, colchetes e chaves
+_BRACKETS = {"(": ")", "[": "]", "{": "}"}
+
+# Operadores binários, de comparação, unários e de atribuição aumentada
+_BIN_OPS = {
+    "+": ast.Add, "-": ast.Sub, "*": ast.Mult, "/": ast.Div, "//": ast.FloorDiv, "%": ast.Mod,
+    "@": ast.MatMult, "**": ast.Pow, "<<": ast.LShift, ">>": ast.RShift, "&": ast.BitAnd,
+    "|": ast.BitOr, "^": ast.BitXor,
+}
+_COMPARE_OPS = {
+    "<": ast.Lt, ">": ast.Gt, "==": ast.Eq, ">=": ast.GtE, "<=": ast.LtE, "!=": ast.NotEq,
+    "in": ast.In, "is": ast.Is,
+}
+_UNARY_OPS = {"+": ast.UAdd, "-": ast.USub, "~": ast.Invert}
+_AUG_ASSIGN = {op + "=": node for op, node in _BIN_OPS.items()}
+
+# Níveis de precedência dos operadores binários (do menos ao mais forte)
+_BINARY_LEVELS = (("|",), ("^",), ("&",), ("<<", ">>"), ("+", "-"), ("*", "/", "//", "%", "@"))
+_BINARY_PRECEDENCE = {op: level for level, ops in enumerate(_BINARY_LEVELS) for op in ops}
+
+# Comentário de editor ou palavra separada por espaços
+_WORD = re.compile(r"//.*|\S+")
+
+# Quebra de linha dentro de uma string, com as barras invertidas que a precedem
+_STRING_NEWLINE = re.compile(r"(\\*)\n")
+
+
+def _string_prefix(literal: str) -> str:
+    """Prefixo de uma string literal, em minúsculas ("", "r", "f", "rb", ...)."""
+    return literal[:len(literal) - len(literal.lstrip("rRbBuUfF"))].lower()
+
+
+def split_words(line: str) -> List[Tuple[int, str]]:
+    """
+    Divide uma linha binária em palavras, até um comentário de editor (//).
+
+    Args:
+        line: Linha em formato binário
+
+    Returns:
+        Lista de (coluna, palavra)
+    """
+    words = []
+    for match in _WORD.finditer(line):
+        word = match.group()
+        if word.startswith(EDITOR_COMMENT):
+            break
+        words.append((match.start(), word))
+    return words
+
+
+class Token:
+    """
+    Token Python com a posição da palavra binária de origem.
+    Linhas começam em 1 e colunas em 0, como nos nós do ast.
+    """
+
+    __slots__ = ("kind", "value", "line", "col", "end_line", "end_col")
+
+    def __init__(self, kind: str, value: str, line: int, col: int, end_line: int, end_col: int):
+        self.kind = kind
+        self.value = value
+        self.line = line
+        self.col = col
+        self.end_line = end_line
+        self.end_col = end_col
+
+    def __repr__(self):
+        return f"Token({self.kind}, {self.value!r}, {self.line}:{self.col})"
+
+
+class BinaryAstCompiler:
+    """
+    Compilador de código binário para ast.Module e objetos de código.
+    """
+
+    def __init__(self, binary_to_text: Dict[str, str]):
+        """
+        Inicializa o compilador.
+
+        Args:
+            binary_to_text: Tabela binário -> texto do dialeto (BinarySyntaxParser.binary_keywords)
+        """
+        self.binary_to_text = binary_to_text
+        self._alphabet = _Alphabet(binary_to_text)
+
+    def tokenize(self, binary_code: str, filename: str = DEFAULT_FILENAME) -> List[Token]:
+        """
+        Agrupa as palavras binárias em tokens Python.
+
+        Args:
+            binary_code: Código binário
+            filename: Nome de arquivo usado nas mensagens de erro
+
+        Returns:
+            Lista de tokens, terminada por ENDMARKER
+
+        Raises:
+            SyntaxError: Palavra inválida, string sem fim ou BINEND sem bloco aberto
+        """
+        return _Lexer(self._alphabet, filename, binary_code.splitlines()).tokenize()
+
+    def parse(self, binary_code: str, filename: str = DEFAULT_FILENAME) -> ast.Module:
+        """
+        Constrói a árvore sintática do código binário.
+
+        Args:
+            binary_code: Código binário
+            filename: Nome de arquivo usado nas mensagens de erro
+
+        Returns:
+            ast.Module com linhas e colunas do arquivo binário
+
+        Raises:
+            SyntaxError: Com a linha e a coluna da palavra binária que causou o erro
+        """
+        tokens = self.tokenize(binary_code, filename)
+        return _Parser(tokens, binary_code.splitlines(), filename).parse_module()
+
+    def compile(self, binary_code: str, filename: str = DEFAULT_FILENAME):
+        """
+        Compila o código binário para um objeto de código, sem texto Python intermediário.
+
+        Args:
+            binary_code: Código binário
+            filename: Nome de arquivo registrado no objeto de código
+
+        Returns:
+            Objeto de código pronto para exec
+
+        Raises:
+            SyntaxError: Com a linha e a coluna da palavra binária que causou o erro
+        """
+        return compile(self.parse(binary_code, filename), filename, "exec")
+
+    def to_python(self, binary_code: str) -> str:
+        """
+        Gera o código Python equivalente (ast.unparse), para exibição.
+
+        Args:
+            binary_code: Código binário
+
+        Returns:
+            Código Python
+        """
+        return ast.unparse(self.parse(binary_code))
+
+    def command_words(self, words: List[str]) -> List[Tuple[int, str]]:
+        """
+        Localiza as palavras lidas como comandos do dialeto pela regra do léxico (usada
+        também pelo validador e pelo servidor LSP).
+
+        Args:
+            words: Palavras de uma linha (split_words)
+
+        Returns:
+            Lista de (índice da palavra, comando)
+        """
+        return self._alphabet.command_words(words)
+
+    def translator(self, state: Optional[tuple] = None, first_line: int = 1) -> "BinaryTextTranslator":
+        """
+        Cria um tradutor linha a linha para texto Python.
+
+        Args:
+            state: Estado de partida (BinaryTextTranslator.state), ou None para o início do código
+            first_line: Número da primeira linha a traduzir
+
+        Returns:
+            BinaryTextTranslator
+        """
+        return BinaryTextTranslator(self._alphabet, state, first_line)
+
+    def iter_python_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Traduz as linhas binárias para texto Python, uma linha por vez.
+
+        Args:
+            lines: Linhas em formato binário
+
+        Yields:
+            Texto Python de cada linha binária
+        """
+        translator = self.translator()
+        iterator = iter(lines)
+        line = next(iterator, None)
+        while line is not None:
+            following = next(iterator, None)
+            yield translator.translate_line(line, following)
+            line = following
+
+
+class BinaryTextTranslator:
+    """
+    Tradução de código binário para texto Python com o mesmo léxico do compilador:
+    os tokens, os blocos (BINSTART/BINEND) e a continuação das linhas lógicas são os
+    da árvore de BinaryAstCompiler.parse, e o texto compilado por compile() dá o
+    mesmo programa.
+
+    Cada linha binária gera uma linha Python (duas quando um BINSTART é seguido de
+    código na mesma linha). Uma linha lógica que continua na linha seguinte fora de
+    parênteses termina com "\\"; uma linha com erro vira "[ERRO: ...]", que nunca é
+    Python válido. O estado entre as linhas (state) permite retomar a tradução em
+    qualquer linha, para a tradução incremental e em paralelo.
+    """
+
+    def __init__(self, alphabet: "_Alphabet", state: Optional[tuple] = None, first_line: int = 1):
+        self._lexer = _Lexer(alphabet, DEFAULT_FILENAME, lenient=True)
+        if state is not None:
+            self._lexer.restore(state)
+        self.number = first_line - 1
+
+    @staticmethod
+    def block_state(depth: int) -> tuple:
+        """Estado no início de uma linha lógica, fora de parênteses, com depth blocos abertos."""
+        return depth, (), None
+
+    def state(self) -> tuple:
+        """Estado antes da próxima linha (comparável e serializável)."""
+        return self._lexer.state()
+
+    def translate_line(self, line: str, next_line: Optional[str] = None,
+                       offsets: Optional[List[Tuple[int, int]]] = None) -> str:
+        """
+        Traduz a próxima linha binária.
+
+        Args:
+            line: Linha em formato binário
+            next_line: Linha seguinte (None no fim do código)
+            offsets: Se informada, recebe um par (coluna no texto gerado, coluna na linha
+                binária) por token
+
+        Returns:
+            Texto Python da linha, sem a quebra de linha final
+        """
+        lexer = self._lexer
+        self.number += 1
+        # Linha lógica aberta fora de parênteses: a linha Python anterior terminou com "\"
+        continued = lexer._in_line() and not lexer.brackets
+        depth = lexer.depth
+        lexer.feed(self.number, line, next_line)
+
+        parts = []
+        done = 0
+        current = None
+        for token in lexer.tokens:
+            kind = token.kind
+            if kind == INDENT:
+                depth += 1
+            elif kind == DEDENT:
+                depth -= 1
+            elif kind == NEWLINE:
+                if current is not None:
+                    parts.append(current)
+                    done += len(current) + 1
+                    current = None
+                elif continued:
+                    # Fim da linha lógica continuada sem código nesta linha
+                    parts.append("")
+                    done += 1
+                continued = False
+            else:
+                value = _single_line(token.value) if kind == STRING else token.value
+                current = "    " * depth if current is None else current + " "
+                if offsets is not None:
+                    offsets.append((done + len(current), token.col))
+                current += value
+        lexer.tokens.clear()
+
+        comment = lexer.comment
+        if current is not None:
+            if lexer._in_line() and not lexer.brackets:
+                # Nada pode seguir a barra de continuação, nem um comentário
+                current += " \\"
+                comment = None
+            parts.append(current)
+        elif continued:
+            parts.append("\\")
+            comment = None
+        elif not parts:
+            parts.append("    " * depth if comment else "")
+        if comment:
+            parts[-1] += "  " + comment if parts[-1].strip() else comment
+        return "\n".join(parts)
+
+
+def _single_line(literal: str) -> str:
+    """Escreve uma string de várias linhas em uma linha só (quebras viram \\n)."""
+    if "\n" not in literal or "r" in _string_prefix(literal):
+        return literal
+    return _STRING_NEWLINE.sub(_escape_newline, literal)
+
+
+def _escape_newline(match) -> str:
+    slashes = match.group(1)
+    # Com um número ímpar de barras, a última continua a string sem quebra de linha
+    return slashes[:-1] if len(slashes) % 2 else slashes + "\\n"
+
+class _Alphabet:
+    """
+    Tabelas de decodificação do léxico: cada palavra binária vira um único caractere,
+    e as palavras da tabela com mais de um caractere (nomes, operadores e comandos)
+    viram caracteres de uso privado, de modo que uma linha decodificada tem um
+    caractere por palavra e pode ser dividida em tokens por uma expressão regular.
+    """
+
+    def __init__(self, binary_to_text: Dict[str, str]):
+        self.chars: Dict[str, str] = {}
+        self.words: Dict[str, str] = {}
+        self.bits: Dict[str, str] = {}
+        self.commands = set()
+        # Palavras binárias dos comandos (linhas sem nenhuma delas não têm comandos)
+        self.command_bits = set()
+        for binary, text in binary_to_text.items():
+            if len(text) == 1:
+                self.chars[binary] = text
+                continue
+            placeholder = chr(_PLACEHOLDER_BASE + len(self.words))
+            self.chars[binary] = placeholder
+            self.words[placeholder] = text
+            self.bits[placeholder] = binary
+            if text.startswith("BIN") and text.isupper():
+                self.commands.add(placeholder)
+                self.command_bits.add(binary)
+
+    def decode_word(self, word: str) -> Optional[str]:
+        """
+        Decodifica uma palavra (caractere da tabela ou, fora dela, o valor do caractere
+        gravado pelo codificador).
+
+        Returns:
+            Caractere, ou None se a palavra não for válida
+        """
+        char = self.chars.get(word)
+        if char is None and not word.strip("01") and len(word) >= 8:
+            value = int(word, 2)
+            if value <= sys.maxunicode:
+                char = chr(value)
+        return char
+
+    def command_words(self, words: List[str]) -> List[Tuple[int, str]]:
+        """
+        Localiza os comandos de uma linha como o léxico: fora de strings e comentários e
+        sem contar os operandos (COMMAND_OPERANDS). Palavras inválidas ocupam uma posição.
+
+        Args:
+            words: Palavras da linha
+
+        Returns:
+            Lista de (índice da palavra, comando)
+        """
+        if self.command_bits.isdisjoint(words):
+            return []
+        text = "".join([self.decode_word(word) or "\0" for word in words])
+        found = []
+        i = 0
+        while i < len(text):
+            if text[i] in self.commands:
+                command = self.words[text[i]]
+                found.append((i, command))
+                if command == _COMMENT:
+                    break
+                i += 1 + COMMAND_OPERANDS.get(command, 0)
+                continue
+            match = _TOKEN_PATTERN.match(text, i)
+            if match is None:
+                i += 1
+            elif match.lastgroup == "comment":
+                break
+            else:
+                i = match.end()
+        return found
+
+
+class _Lexer:
+    """
+    Analisador léxico: palavras binárias -> tokens Python.
+    Processa uma linha física por vez (feed); o estado entre as linhas (blocos e
+    parênteses abertos e a linha lógica em andamento) pode ser exportado e
+    restaurado (state/restore). No modo tolerante, uma linha com erro vira um token
+    ERROR e o estado volta ao de antes da linha.
+    """
+
+    def __init__(self, alphabet: _Alphabet, filename: str, lines: Optional[List[str]] = None,
+                 lenient: bool = False):
+        self.alphabet = alphabet
+        self.filename = filename
+        # Linhas do código, para o texto das mensagens de erro (None: só a linha atual)
+        self.lines = lines
+        self.lenient = lenient
+        self.tokens: List[Token] = []
+        # Blocos abertos por BINSTART e parênteses/colchetes/chaves abertos
+        self.depth = 0
+        self.brackets: List[Token] = []
+        # Último token emitido e valor do primeiro token da linha lógica em andamento
+        self.last: Optional[Token] = None
+        self.first_value: Optional[str] = None
+        # Comentário da linha atual, em texto Python (com o "#")
+        self.comment: Optional[str] = None
+        # Linha seguinte já decodificada ao decidir o fim da linha atual: (linha, decodificação)
+        self._lookahead = None
+
+        # Linha em análise: texto decodificado (um caractere por palavra), palavras e colunas
+        self.number = 0
+        self.line = ""
+        self.text = ""
+        self.words: List[str] = []
+        self.starts = range(0)
+
+    def error(self, message: str, line: int, col: int, end_col: Optional[int] = None):
+        if self.lines is not None:
+            text = self.lines[line - 1] if 0 < line <= len(self.lines) else ""
+        else:
+            text = self.line if line == self.number else ""
+        end = (end_col if end_col is not None else col + 8) + 1
+        return SyntaxError(message, (self.filename, line, col + 1, text, line, end))
+
+    def unit_error(self, message: str, index: int):
+        """Erro na palavra de índice index da linha atual."""
+        return self.error(message, self.number, self.starts[index], self.end(index))
+
+    def end(self, index: int) -> int:
+        """Coluna logo depois da palavra de índice index."""
+        return self.starts[index] + len(self.words[index])
+
+    def tokenize(self) -> List[Token]:
+        lines = self.lines
+        for number, line in enumerate(lines, 1):
+            self.feed(number, line, lines[number] if number < len(lines) else None)
+
+        last = len(lines) or 1
+        end_col = len(lines[-1]) if lines else 0
+        if self.brackets:
+            opener = self.brackets[-1]
+            raise self.error(f"'{opener.value}' não foi fechado", opener.line, opener.col, opener.end_col)
+        self._end_line(last, end_col)
+        for _ in range(self.depth):
+            self._push(Token(DEDENT, "", last, end_col, last, end_col))
+        self._push(Token(ENDMARKER, "", last + 1, 0, last + 1, 0))
+        return self.tokens
+
+    def state(self) -> tuple:
+        """
+        Estado entre duas linhas, sem posições: (profundidade dos blocos, parênteses
+        abertos, linha lógica em andamento ou None). Dois estados iguais traduzem as
+        linhas seguintes da mesma forma.
+        """
+        line = (self.last.kind, self.last.value, self.first_value) if self._in_line() else None
+        return self.depth, tuple(token.value for token in self.brackets), line
+
+    def restore(self, state: tuple):
+        """Retoma a análise a partir de um estado exportado por state()."""
+        self.depth, brackets, line = state
+        self.brackets = [Token(OP, value, 0, 0, 0, 0) for value in brackets]
+        if line is None:
+            self.last = self.first_value = None
+        else:
+            kind, value, self.first_value = line
+            self.last = Token(kind, value, 0, 0, 0, 0)
+
+    def feed(self, number: int, line: str, next_line: Optional[str] = None):
+        """
+        Processa uma linha física.
+
+        Args:
+            number: Número da linha (a partir de 1)
+            line: Linha em formato binário
+            next_line: Linha seguinte (None no fim do código); uma linha que começa por
+                um operador continua a linha lógica anterior
+        """
+        if not self.lenient:
+            self._tokenize_line(number, line, next_line)
+            return
+
+        saved = self.depth, list(self.brackets), self.last, self.first_value, len(self.tokens)
+        try:
+            self._tokenize_line(number, line, next_line)
+        except SyntaxError as error:
+            self.depth, self.brackets, self.last, self.first_value, count = saved
+            del self.tokens[count:]
+            self.comment = None
+            col = (error.offset or 1) - 1 if error.lineno == number else 0
+            self._emit(ERROR, f"[ERRO: {error.msg}]", number, col, col)
+            self._end_line(number, len(line.rstrip()))
+
+    def _decode(self, number: int, line: str):
+        """
+        Decodifica as palavras de uma linha.
+
+        Returns:
+            (texto com um caractere por palavra, palavras, colunas das palavras)
+        """
+        words = line.split()
+        chars = self.alphabet.chars
+        try:
+            text = "".join([chars[word] for word in words])
+            if len(line) == 9 * len(words) - 1 or not words:
+                # Formato do codificador: palavras de 8 bits separadas por um espaço
+                return text, words, range(0, len(line), 9)
+        except KeyError:
+            pass
+
+        split = split_words(line)
+        starts = [column for column, _word in split]
+        words = [word for _column, word in split]
+        decoded = []
+        for column, word in split:
+            # Caracteres sem código próprio são gravados pelo codificador com o valor do caractere
+            char = self.alphabet.decode_word(word)
+            if char is None:
+                raise self.error(f"Palavra binária inválida: '{word}'", number, column, column + len(word))
+            decoded.append(char)
+        return "".join(decoded), words, starts
+
+    def _push(self, token: Token):
+        if token.kind not in _LAYOUT and not self._in_line():
+            self.first_value = token.value
+        self.tokens.append(token)
+        self.last = token
+
+    def _emit(self, kind: str, value: str, line: int, col: int, end_col: int):
+        self._push(Token(kind, value, line, col, line, end_col))
+
+    def _emit_span(self, kind: str, value: str, first: int, last: int):
+        """Emite um token formado pelas palavras first..last (inclusive) da linha atual."""
+        self._emit_token(kind, value, self.number, self.starts[first], self.end(last))
+
+    def _in_line(self) -> bool:
+        """Indica se há tokens na linha lógica atual."""
+        return self.last is not None and self.last.kind not in _LAYOUT
+
+    def _continues(self) -> bool:
+        """Indica se a linha lógica atual continua na próxima linha física."""
+        last = self.last
+        if last.kind == OP:
+            if last.value == ",":
+                return self.first_value in _COMMA_CONTINUATION
+            return last.value in _CONTINUATION_OPERATORS
+        return last.kind == NAME and last.value in _CONTINUATION_KEYWORDS
+
+    def _leads(self, next_line: Optional[str]) -> bool:
+        """Indica se a linha seguinte começa por um token que continua a linha lógica atual."""
+        if next_line is None:
+            return False
+        try:
+            decoded = self._decode(self.number + 1, next_line)
+        except SyntaxError:
+            # O erro é informado quando a linha for processada
+            return False
+        self._lookahead = (next_line, decoded)
+        first = _TOKEN_PATTERN.match(decoded[0])
+        return first is not None and self.alphabet.words.get(first.group(), first.group()) in _LEADING_CONTINUATION
+
+    def _end_line(self, line: int, col: int, physical: bool = False, next_line: Optional[str] = None):
+        """
+        Encerra a linha lógica, se houver tokens nela.
+
+        Args:
+            line: Linha binária
+            col: Coluna do fim da linha
+            physical: Se True, é só o fim da linha física (a linha lógica pode continuar)
+            next_line: Linha física seguinte, consultada no fim de uma linha física
+        """
+        if not self._in_line() or self.brackets:
+            return
+        if physical and (self._continues() or self._leads(next_line)):
+            return
+        self._emit(NEWLINE, "", line, col, col)
+
+    def _tokenize_line(self, number: int, line: str, next_line: Optional[str]):
+        self.number = number
+        self.line = line
+        self.comment = None
+        lookahead, self._lookahead = self._lookahead, None
+        if lookahead is not None and lookahead[0] == line:
+            self.text, self.words, self.starts = lookahead[1]
+        else:
+            self.text, self.words, self.starts = self._decode(number, line)
+        text = self.text
+
+        # BINEND depois de algum token fecha o bloco só no fim da linha
+        closing = []
+        # Blocos abertos nesta linha (INDENT emitido depois do NEWLINE)
+        opening = []
+        seen_token = False
+        commands = self.alphabet.commands
+        i = 0
+        while i < len(text):
+            if text[i] in commands:
+                command = self.alphabet.words[text[i]]
+                i = self._command(command, i, closing, opening, seen_token)
+                if command != _BLOCK_END:
+                    seen_token = True
+                continue
+            if opening:
+                # Código depois do BINSTART na mesma linha: primeira linha do bloco
+                self._open_blocks(opening)
+                opening = []
+            seen_token = True
+            i = self._scan(i)
+
+        end_col = len(line.rstrip())
+        if opening:
+            self._end_line(number, end_col)
+            for col, end in opening:
+                self.depth += 1
+                self._push(Token(INDENT, "", number, col, number, end))
+        elif not text.endswith("\\"):
+            # Com BINEND no fim da linha a linha lógica termina aqui
+            self._end_line(number, end_col, physical=True, next_line=None if closing else next_line)
+        for col, end in closing:
+            self._dedent(col, end)
+
+    def _open_blocks(self, opening: List[Tuple[int, int]]):
+        """Abre os blocos pendentes antes de mais código na mesma linha."""
+        col = opening[0][0]
+        self._emit(NEWLINE, "", self.number, col, col)
+        for col, end in opening:
+            self.depth += 1
+            self._push(Token(INDENT, "", self.number, col, self.number, end))
+
+    def _dedent(self, col: int, end_col: int):
+        if self.depth == 0:
+            raise self.error("BINEND sem bloco aberto", self.number, col, end_col)
+        self.depth -= 1
+        self._emit(DEDENT, "", self.number, col, end_col)
+
+    def _plain(self, text: str) -> str:
+        """Texto de strings e comentários: as palavras da tabela voltam ao caractere do código."""
+        if not _PLACEHOLDERS.search(text):
+            return text
+        # Dentro de strings e comentários o codificador só grava caracteres: as palavras da
+        # tabela são códigos de caracteres que coincidem com os de palavras da tabela
+        bits = self.alphabet.bits
+        return _PLACEHOLDERS.sub(lambda found: chr(int(bits[found.group()], 2)), text)
+
+    def _command(self, command: str, i: int, closing: List, opening: List, seen_token: bool) -> int:
+        """
+        Traduz um comando especial.
+
+        Returns:
+            Índice da próxima palavra
+        """
+        text = self.text
+        col, end = self.starts[i], self.end(i)
+
+        def operand(offset):
+            index = i + offset
+            if index >= len(text):
+                raise self.unit_error(INCOMPLETE_MESSAGE.format(command=command), i)
+            return index
+
+        def name_token(index):
+            value = self.alphabet.words.get(text[index], text[index])
+            if not value.isidentifier() and not (value.isdigit() and command == "BINLOOP"):
+                raise self.unit_error(f"{command}: '{value}' não é um nome válido", index)
+            return (NUMBER if value.isdigit() else NAME), value
+
+        if command == _BLOCK_START:
+            if opening:
+                self._open_blocks(opening)
+                opening.clear()
+            self._emit_token(OP, ":", self.number, col, end)
+            opening.append((col, end))
+            return i + 1
+        if command == _BLOCK_END:
+            if not seen_token and not opening:
+                self._end_line(self.number, col)
+                self._dedent(col, end)
+            else:
+                closing.append((col, end))
+            return i + 1
+        if command == _COMMENT:
+            self.comment = "# " + self._plain(text[i + 1:])
+            return len(text)
+
+        if opening:
+            self._open_blocks(opening)
+            opening.clear()
+
+        if command == "BINVAR":
+            target = operand(1)
+            kind, value = name_token(target)
+            equals = operand(2)
+            self._emit_span(kind, value, target, target)
+            self._emit_span(OP, "=", equals, equals)
+            return i + 3
+        if command == "BINFUNC":
+            target = operand(1)
+            kind, value = name_token(target)
+            target_end = self.end(target)
+            self._emit_token(NAME, "def", self.number, col, end)
+            self._emit_span(kind, value, target, target)
+            self._emit_token(OP, "(", self.number, target_end, target_end)
+            self._emit_token(OP, ")", self.number, target_end, target_end)
+            return i + 2
+        if command == "BINLOOP":
+            count = operand(1)
+            kind, value = name_token(count)
+            for word in ("for", "_", "in", "range"):
+                self._emit_token(NAME, word, self.number, col, end)
+            self._emit_token(OP, "(", self.number, self.starts[count], self.starts[count])
+            self._emit_span(kind, value, count, count)
+            self._emit_token(OP, ")", self.number, self.end(count), self.end(count))
+            return i + 2
+        if command == "BININPUT":
+            target = operand(1)
+            kind, value = name_token(target)
+            self._emit_span(kind, value, target, target)
+            for kind, value in ((OP, "="), (NAME, "input"), (OP, "("), (OP, ")")):
+                self._emit_token(kind, value, self.number, col, end)
+            return i + 2
+        if command == "BINPRINT":
+            # O restante da linha (até o próximo comando) são os argumentos de print(...)
+            self._emit_token(NAME, "print", self.number, col, end)
+            self._emit_token(OP, "(", self.number, col, end)
+            j = i + 1
+            while j < len(text) and text[j] not in self.alphabet.commands:
+                j = self._scan(j)
+            last = self.end(j - 1)
+            self._emit_token(OP, ")", self.number, last, last)
+            return j
+
+        simple = {"BINIF": "if", "BINELSE": "else", "BINBREAK": "break", "BINCONT": "continue",
+                  "BINRET": "return"}
+        if command in simple:
+            self._emit_token(NAME, simple[command], self.number, col, end)
+            return i + 1
+        raise self.unit_error(f"Comando desconhecido: {command}", i)
+
+    def _scan(self, i: int) -> int:
+        """
+        Lê o token que começa na palavra i da linha atual (palavras comuns, não comandos).
+
+        Returns:
+            Índice da próxima palavra
+        """
+        text = self.text
+        match = _TOKEN_PATTERN.match(text, i)
+        if match is None:
+            if text[i] in "\"'":
+                raise self.unit_error("String literal sem fim", i)
+            raise self.unit_error(f"Caractere inválido no código: {text[i]!r}", i)
+
+        kind = match.lastgroup
+        end = match.end()
+        if kind == "space":
+            return end
+        if kind == "comment":
+            self.comment = self._plain(match.group())
+            return len(text)
+        value = match.group()
+        if kind == "word":
+            value = self.alphabet.words[value]
+            kind = OP if value in _OPERATOR_SET else NAME
+            if kind == NAME and not value.isidentifier():
+                raise self.unit_error(f"Palavra '{value}' não é um token Python", i)
+        elif kind == "string":
+            value = self._plain(value)
+            kind = STRING
+        else:
+            kind = {"name": NAME, "number": NUMBER, "op": OP}[kind]
+        self._emit_span(kind, value, i, end - 1)
+        return end
+
+    def _emit_token(self, kind: str, value: str, number: int, col: int, end_col: int):
+        """Emite um token, acompanhando parênteses, colchetes e chaves."""
+        self._emit(kind, value, number, col, end_col)
+        if kind != OP:
+            return
+        if value in _BRACKETS:
+            self.brackets.append(self.tokens[-1])
+        elif value in (")", "]", "}"):
+            if not self.brackets or _BRACKETS[self.brackets[-1].value] != value:
+                raise self.error(f"'{value}' sem abertura correspondente", number, col, end_col)
+            self.brackets.pop()
+
+
+class _Parser:
+    """
+    Analisador descendente recursivo: tokens -> ast.Module.
+    """
+
+    def __init__(self, tokens: List[Token], lines: List[str], filename: str):
+        self.tokens = tokens
+        self.lines = lines
+        self.filename = filename
+        self.pos = 0
+        self.prev = tokens[0]
+
+    # Utilitários
+
+    @property
+    def token(self) -> Token:
+        return self.tokens[self.pos]
+
+    def peek(self, offset: int = 1) -> Token:
+        return self.tokens[min(self.pos + offset, len(self.tokens) - 1)]
+
+    def at(self, value: str, kind: Optional[str] = None) -> bool:
+        token = self.tokens[self.pos]
+        return token.value == value and (token.kind == kind if kind else token.kind in (OP, NAME))
+
+    def at_kind(self, kind: str) -> bool:
+        return self.tokens[self.pos].kind == kind
+
+    def advance(self) -> Token:
+        token = self.tokens[self.pos]
+        self.prev = token
+        self.pos += 1
+        return token
+
+    def accept(self, value: str) -> Optional[Token]:
+        if self.at(value):
+            return self.advance()
+        return None
+
+    def expect(self, value: str) -> Token:
+        if not self.at(value):
+            raise self.error(f"esperado '{value}'")
+        return self.advance()
+
+    def expect_kind(self, kind: str, description: str) -> Token:
+        if not self.at_kind(kind):
+            raise self.error(f"esperado {description}")
+        return self.advance()
+
+    def expect_name(self) -> Token:
+        token = self.token
+        if token.kind != NAME or keyword.iskeyword(token.value):
+            raise self.error("esperado um nome")
+        return self.advance()
+
+    def error(self, message: str, token: Optional[Token] = None) -> SyntaxError:
+        token = token or self.token
+        if token.kind == NEWLINE:
+            found = "fim da linha"
+        elif token.kind == ENDMARKER:
+            found = "fim do código"
+        elif token.kind == INDENT:
+            found = "bloco inesperado"
+        elif token.kind == DEDENT:
+            found = "fim de bloco"
+        else:
+            found = f"'{token.value}'"
+        text = self.lines[token.line - 1] if 0 < token.line <= len(self.lines) else ""
+        return SyntaxError(f"{message} (encontrado {found})",
+                           (self.filename, token.line, token.col + 1, text, token.end_line, token.end_col + 1))
+
+    def start(self) -> Tuple[int, int]:
+        token = self.tokens[self.pos]
+        return token.line, token.col
+
+    def loc(self, start) -> Dict[str, int]:
+        """Posição de um nó que vai de start até o último token consumido."""
+        if isinstance(start, ast.AST):
+            start = (start.lineno, start.col_offset)
+        return {"lineno": start[0], "col_offset": start[1],
+                "end_lineno": self.prev.end_line, "end_col_offset": self.prev.end_col}
+
+    @staticmethod
+    def span(node: ast.AST, first, last) -> ast.AST:
+        """Define a posição de node entre dois nós ou tokens."""
+        node.lineno = first.lineno if isinstance(first, ast.AST) else first.line
+        node.col_offset = first.col_offset if isinstance(first, ast.AST) else first.col
+        node.end_lineno = last.end_lineno if isinstance(last, ast.AST) else last.end_line
+        node.end_col_offset = last.end_col_offset if isinstance(last, ast.AST) else last.end_col
+        return node
+
+    # Módulo e blocos
+
+    def parse_module(self) -> ast.Module:
+        body = []
+        while not self.at_kind(ENDMARKER):
+            if self.at_kind(NEWLINE):
+                self.advance()
+                continue
+            if self.at_kind(INDENT):
+                raise self.error("bloco sem cabeçalho (BINSTART sem ':' de abertura)")
+            body.extend(self.statement())
+        return ast.Module(body=body, type_ignores=[])
+
+    def block(self) -> List[ast.stmt]:
+        """Corpo de uma instrução composta, depois do ':'."""
+        if not self.at_kind(NEWLINE):
+            return self.simple_statements()
+        self.advance()
+        if not self.at_kind(INDENT):
+            raise self.error("esperado um bloco (BINSTART)")
+        self.advance()
+        body = []
+        while not self.at_kind(DEDENT) and not self.at_kind(ENDMARKER):
+            if self.at_kind(NEWLINE):
+                self.advance()
+                continue
+            if self.at_kind(INDENT):
+                raise self.error("bloco inesperado")
+            body.extend(self.statement())
+        if self.at_kind(DEDENT):
+            self.advance()
+        if not body:
+            raise self.error("bloco vazio")
+        return body
+
+    def statement(self) -> List[ast.stmt]:
+        token = self.token
+        if token.kind == NAME:
+            handler = {
+                "if": self.if_statement, "while": self.while_statement, "for": self.for_statement,
+                "try": self.try_statement, "with": self.with_statement, "def": self.function_def,
+                "class": self.class_def,
+            }.get(token.value)
+            if handler is not None:
+                return [handler()]
+            if token.value == "async":
+                raise self.error("'async' não é suportado pelo compilador binário")
+        elif token.kind == OP and token.value == "@":
+            return [self.decorated()]
+        return self.simple_statements()
+
+    def simple_statements(self) -> List[ast.stmt]:
+        statements = [self.simple_statement()]
+        while self.accept(";"):
+            if self.at_kind(NEWLINE) or self.at_kind(ENDMARKER):
+                break
+            statements.append(self.simple_statement())
+        if self.at_kind(NEWLINE):
+            self.advance()
+        elif not self.at_kind(ENDMARKER) and not self.at_kind(DEDENT):
+            raise self.error("sintaxe inválida")
+        return statements
+
+    # Instruções simples
+
+    def simple_statement(self) -> ast.stmt:
+        token = self.token
+        start = self.start()
+        if token.kind == NAME:
+            value = token.value
+            if value in ("pass", "break", "continue"):
+                self.advance()
+                node = {"pass": ast.Pass, "break": ast.Break, "continue": ast.Continue}[value]
+                return node(**self.loc(start))
+            if value == "return":
+                self.advance()
+                result = None if self.at_statement_end() else self.star_expressions()
+                return ast.Return(value=result, **self.loc(start))
+            if value == "raise":
+                self.advance()
+                exc = cause = None
+                if not self.at_statement_end():
+                    exc = self.expression()
+                    if self.accept("from"):
+                        cause = self.expression()
+                return ast.Raise(exc=exc, cause=cause, **self.loc(start))
+            if value in ("global", "nonlocal"):
+                self.advance()
+                names = [self.expect_name().value]
+                while self.accept(","):
+                    names.append(self.expect_name().value)
+                node = ast.Global if value == "global" else ast.Nonlocal
+                return node(names=names, **self.loc(start))
+            if value == "del":
+                self.advance()
+                targets = self.target_list(ast.Del)
+                return ast.Delete(targets=targets, **self.loc(start))
+            if value == "assert":
+                self.advance()
+                test = self.expression()
+                msg = self.expression() if self.accept(",") else None
+                return ast.Assert(test=test, msg=msg, **self.loc(start))
+            if value == "import":
+                return self.import_statement()
+            if value == "from":
+                return self.from_import()
+        return self.expression_statement()
+
+    def at_statement_end(self) -> bool:
+        return self.token.kind in (NEWLINE, ENDMARKER, DEDENT) or self.at(";")
+
+    def expression_statement(self) -> ast.stmt:
+        start = self.start()
+        first = self.yield_expression() if self.at("yield") else self.star_expressions()
+
+        if self.at(":") and not self.at_kind(NEWLINE):
+            # Anotação de variável
+            self.advance()
+            annotation = self.expression()
+            value = None
+            if self.accept("="):
+                value = self.yield_expression() if self.at("yield") else self.star_expressions()
+            simple = int(isinstance(first, ast.Name))
+            self.store(first, single=True)
+            return ast.AnnAssign(target=first, annotation=annotation, value=value, simple=simple,
+                                 **self.loc(start))
+
+        if self.token.kind == OP and self.token.value in _AUG_ASSIGN:
+            op = _AUG_ASSIGN[self.advance().value]()
+            if not isinstance(first, (ast.Name, ast.Attribute, ast.Subscript)):
+                raise self.error("destino inválido para atribuição aumentada", self.prev)
+            self.store(first)
+            value = self.yield_expression() if self.at("yield") else self.star_expressions()
+            return ast.AugAssign(target=first, op=op, value=value, **self.loc(start))
+
+        if self.at("="):
+            targets = [first]
+            while self.accept("="):
+                targets.append(self.yield_expression() if self.at("yield") else self.star_expressions())
+            value = targets.pop()
+            for target in targets:
+                self.store(target)
+            return ast.Assign(targets=targets, value=value, **self.loc(start))
+
+        return ast.Expr(value=first, **self.loc(start))
+
+    def dotted_name(self) -> str:
+        parts = [self.expect_name().value]
+        while self.accept("."):
+            parts.append(self.expect_name().value)
+        return ".".join(parts)
+
+    def import_statement(self) -> ast.stmt:
+        start = self.start()
+        self.advance()
+        names = []
+        while True:
+            alias_start = self.start()
+            name = self.dotted_name()
+            asname = self.expect_name().value if self.accept("as") else None
+            names.append(ast.alias(name=name, asname=asname, **self.loc(alias_start)))
+            if not self.accept(","):
+                break
+        return ast.Import(names=names, **self.loc(start))
+
+    def from_import(self) -> ast.stmt:
+        start = self.start()
+        self.advance()
+        level = 0
+        while self.at(".") or self.at("..."):
+            level += len(self.advance().value)
+        module = None if self.at("import") else self.dotted_name()
+        self.expect("import")
+        names = []
+        if self.at("*"):
+            star = self.advance()
+            names.append(self.span(ast.alias(name="*", asname=None), star, star))
+        else:
+            parenthesized = self.accept("(")
+            while True:
+                alias_start = self.start()
+                name = self.expect_name().value
+                asname = self.expect_name().value if self.accept("as") else None
+                names.append(ast.alias(name=name, asname=asname, **self.loc(alias_start)))
+                if not self.accept(","):
+                    break
+                if parenthesized and self.at(")"):
+                    break
+            if parenthesized:
+                self.expect(")")
+        return ast.ImportFrom(module=module, names=names, level=level, **self.loc(start))
+
+    # Instruções compostas
+
+    def if_statement(self) -> ast.stmt:
+        start = self.start()
+        self.advance()
+        test = self.named_expression()
+        self.expect(":")
+        body = self.block()
+        orelse = []
+        if self.at("elif"):
+            orelse = [self.if_statement()]
+        elif self.at("else"):
+            self.advance()
+            self.expect(":")
+            orelse = self.block()
+        node = ast.If(test=test, body=body, orelse=orelse, **self.loc(start))
+        return self.end_at_last(node)
+
+    def while_statement(self) -> ast.stmt:
+        start = self.start()
+        self.advance()
+        test = self.named_expression()
+        self.expect(":")
+        body = self.block()
+        orelse = self.else_block()
+        return self.end_at_last(ast.While(test=test, body=body, orelse=orelse, **self.loc(start)))
+
+    def for_statement(self) -> ast.stmt:
+        start = self.start()
+        self.advance()
+        target = self.target_expression()
+        self.expect("in")
+        iterable = self.star_expressions()
+        self.expect(":")
+        body = self.block()
+        orelse = self.else_block()
+        node = ast.For(target=target, iter=iterable, body=body, orelse=orelse, type_comment=None,
+                       **self.loc(start))
+        return self.end_at_last(node)
+
+    def else_block(self) -> List[ast.stmt]:
+        if self.at("else"):
+            self.advance()
+            self.expect(":")
+            return self.block()
+        return []
+
+    def try_statement(self) -> ast.stmt:
+        start = self.start()
+        self.advance()
+        self.expect(":")
+        body = self.block()
+        handlers = []
+        while self.at("except"):
+            handler_start = self.start()
+            self.advance()
+            if self.at("*"):
+                raise self.error("'except*' não é suportado pelo compilador binário")
+            exc_type = name = None
+            if not self.at(":"):
+                exc_type = self.expression()
+                if self.accept(","):
+                    elts = [exc_type, self.expression()]
+                    while self.accept(","):
+                        elts.append(self.expression())
+                    exc_type = self.span(ast.Tuple(elts=elts, ctx=ast.Load()), elts[0], elts[-1])
+                if self.accept("as"):
+                    name = self.expect_name().value
+            self.expect(":")
+            handler_body = self.block()
+            handler = ast.ExceptHandler(type=exc_type, name=name, body=handler_body, **self.loc(handler_start))
+            handlers.append(self.end_at_last(handler))
+        orelse = self.else_block() if handlers else []
+        finalbody = []
+        if self.accept("finally"):
+            self.expect(":")
+            finalbody = self.block()
+        if not handlers and not finalbody:
+            raise self.error("esperado 'except' ou 'finally'")
+        node = ast.Try(body=body, handlers=handlers, orelse=orelse, finalbody=finalbody, **self.loc(start))
+        return self.end_at_last(node)
+
+    def with_statement(self) -> ast.stmt:
+        start = self.start()
+        self.advance()
+        items = []
+        while True:
+            context = self.expression()
+            variable = None
+            if self.accept("as"):
+                variable = self.star_or(self.bitwise_or)
+                self.store(variable)
+            items.append(ast.withitem(context_expr=context, optional_vars=variable))
+            if not self.accept(","):
+                break
+        self.expect(":")
+        body = self.block()
+        return self.end_at_last(ast.With(items=items, body=body, type_comment=None, **self.loc(start)))
+
+    def decorated(self) -> ast.stmt:
+        decorators = []
+        while self.accept("@"):
+            decorators.append(self.named_expression())
+            self.expect_kind(NEWLINE, "fim da linha depois do decorador")
+        if self.at("def"):
+            node = self.function_def()
+        elif self.at("class"):
+            node = self.class_def()
+        else:
+            raise self.error("esperado 'def' ou 'class' depois do decorador")
+        node.decorator_list = decorators
+        return node
+
+    def function_def(self) -> ast.stmt:
+        start = self.start()
+        self.advance()
+        name = self.expect_name().value
+        self.expect("(")
+        arguments = self.parameters(")", annotations=True)
+        self.expect(")")
+        returns = self.expression() if self.accept("->") else None
+        self.expect(":")
+        body = self.block()
+        node = ast.FunctionDef(name=name, args=arguments, body=body, decorator_list=[], returns=returns,
+                               type_comment=None, **self.loc(start))
+        return self.end_at_last(node)
+
+    def class_def(self) -> ast.stmt:
+        start = self.start()
+        self.advance()
+        name = self.expect_name().value
+        bases, keywords = [], []
+        if self.accept("("):
+            bases, keywords = self.call_arguments()
+            self.expect(")")
+        self.expect(":")
+        body = self.block()
+        node = ast.ClassDef(name=name, bases=bases, keywords=keywords, body=body, decorator_list=[],
+                            **self.loc(start))
+        return self.end_at_last(node)
+
+    def end_at_last(self, node: ast.stmt) -> ast.stmt:
+        """Uma instrução composta termina onde termina a última instrução do seu corpo."""
+        last = None
+        for field in ("finalbody", "orelse", "handlers", "body"):
+            statements = getattr(node, field, None)
+            if statements:
+                last = statements[-1]
+                break
+        if last is not None:
+            node.end_lineno = last.end_lineno
+            node.end_col_offset = last.end_col_offset
+        return node
+
+    def parameters(self, closing: str, annotations: bool) -> ast.arguments:
+        """Lista de parâmetros de def (annotations=True) ou lambda."""
+        posonly, args, defaults = [], [], []
+        vararg = kwarg = None
+        kwonly, kw_defaults = [], []
+        keyword_only = False
+
+        def parameter():
+            token = self.expect_name()
+            annotation = None
+            if annotations and self.accept(":"):
+                annotation = self.expression()
+            return ast.arg(arg=token.value, annotation=annotation, type_comment=None, **self.loc(token_start(token)))
+
+        def token_start(token):
+            return token.line, token.col
+
+        while not self.at(closing):
+            if self.accept("/"):
+                if posonly or not args:
+                    raise self.error("'/' deve vir depois de algum parâmetro", self.prev)
+                posonly, args = args, []
+            elif self.accept("*"):
+                if keyword_only:
+                    raise self.error("'*' repetido na lista de parâmetros", self.prev)
+                keyword_only = True
+                if not self.at(",") and not self.at(closing):
+                    vararg = parameter()
+            elif self.accept("**"):
+                kwarg = parameter()
+                self.accept(",")
+                break
+            else:
+                param = parameter()
+                default = self.expression() if self.accept("=") else None
+                if keyword_only:
+                    kwonly.append(param)
+                    kw_defaults.append(default)
+                else:
+                    if default is None and defaults:
+                        raise self.error("parâmetro sem valor padrão depois de parâmetro com valor padrão",
+                                         self.prev)
+                    args.append(param)
+                    if default is not None:
+                        defaults.append(default)
+            if not self.accept(","):
+                break
+        return ast.arguments(posonlyargs=posonly, args=args, vararg=vararg, kwonlyargs=kwonly,
+                             kw_defaults=kw_defaults, kwarg=kwarg, defaults=defaults)
+
+    # Alvos de atribuição
+
+    def store(self, node: ast.AST, single: bool = False, ctx=ast.Store):
+        """Marca node como destino de atribuição (ou de del)."""
+        if isinstance(node, (ast.Name, ast.Attribute, ast.Subscript)):
+            node.ctx = ctx()
+        elif isinstance(node, (ast.Tuple, ast.List)) and not single:
+            node.ctx = ctx()
+            for element in node.elts:
+                self.store(element, ctx=ctx)
+        elif isinstance(node, ast.Starred) and ctx is ast.Store:
+            node.ctx = ctx()
+            self.store(node.value, ctx=ctx)
+        else:
+            description = type(node).__name__
+            raise SyntaxError(f"não é possível atribuir a {description}",
+                              (self.filename, node.lineno, node.col_offset + 1,
+                               self.lines[node.lineno - 1] if 0 < node.lineno <= len(self.lines) else "",
+                               node.end_lineno, node.end_col_offset + 1))
+
+    def target_expression(self) -> ast.expr:
+        """Alvo de for e de with ... as (sem comparações, para não consumir o 'in')."""
+        start = self.start()
+        elements = [self.star_or(self.bitwise_or)]
+        trailing = False
+        while self.at(","):
+            self.advance()
+            if self.at("in") or self.at("=") or self.at(":") or self.at(")"):
+                trailing = True
+                break
+            elements.append(self.star_or(self.bitwise_or))
+        node = elements[0] if len(elements) == 1 and not trailing else ast.Tuple(
+            elts=elements, ctx=ast.Store(), **self.loc(start))
+        self.store(node)
+        return node
+
+    def target_list(self, ctx) -> List[ast.expr]:
+        targets = [self.bitwise_or()]
+        while self.accept(","):
+            if self.at_statement_end():
+                break
+            targets.append(self.bitwise_or())
+        for target in targets:
+            self.store(target, ctx=ctx)
+        return targets
+
+    # Expressões
+
+    def star_expressions(self) -> ast.expr:
+        """Uma ou mais expressões separadas por vírgula (tupla sem parênteses)."""
+        start = self.start()
+        first = self.star_or(self.expression)
+        if not self.at(","):
+            return first
+        elements = [first]
+        while self.accept(","):
+            if self.at_statement_end() or self.at("=") or self.token.value in _AUG_ASSIGN or self.at(":") \
+                    or self.at(")"):
+                break
+            elements.append(self.star_or(self.expression))
+        return ast.Tuple(elts=elements, ctx=ast.Load(), **self.loc(start))
+
+    def star_or(self, parse):
+        if self.at("*"):
+            start = self.start()
+            self.advance()
+            value = self.bitwise_or()
+            return ast.Starred(value=value, ctx=ast.Load(), **self.loc(start))
+        return parse()
+
+    def yield_expression(self) -> ast.expr:
+        start = self.start()
+        self.advance()
+        if self.accept("from"):
+            return ast.YieldFrom(value=self.expression(), **self.loc(start))
+        value = None if self.at_statement_end() or self.at(")") or self.at("=") else self.star_expressions()
+        return ast.Yield(value=value, **self.loc(start))
+
+    def named_expression(self) -> ast.expr:
+        if self.token.kind == NAME and self.peek().value == ":=" and self.peek().kind == OP:
+            start = self.start()
+            target = ast.Name(id=self.expect_name().value, ctx=ast.Store(), **self.loc(self.start_of(self.prev)))
+            self.advance()
+            value = self.expression()
+            return ast.NamedExpr(target=target, value=value, **self.loc(start))
+        return self.expression()
+
+    @staticmethod
+    def start_of(token: Token) -> Tuple[int, int]:
+        return token.line, token.col
+
+    def expression(self) -> ast.expr:
+        if self.at("lambda"):
+            return self.lambda_expression()
+        start = self.start()
+        body = self.disjunction()
+        if self.at("if") and self.token.kind == NAME:
+            self.advance()
+            test = self.disjunction()
+            self.expect("else")
+            orelse = self.expression()
+            return ast.IfExp(test=test, body=body, orelse=orelse, **self.loc(start))
+        return body
+
+    def lambda_expression(self) -> ast.expr:
+        start = self.start()
+        self.advance()
+        arguments = self.parameters(":", annotations=False)
+        self.expect(":")
+        body = self.expression()
+        return ast.Lambda(args=arguments, body=body, **self.loc(start))
+
+    def disjunction(self) -> ast.expr:
+        return self.bool_chain("or", ast.Or, self.conjunction)
+
+    def conjunction(self) -> ast.expr:
+        return self.bool_chain("and", ast.And, self.inversion)
+
+    def bool_chain(self, word: str, op, parse) -> ast.expr:
+        start = self.start()
+        values = [parse()]
+        while self.at(word) and self.token.kind == NAME:
+            self.advance()
+            values.append(parse())
+        if len(values) == 1:
+            return values[0]
+        return ast.BoolOp(op=op(), values=values, **self.loc(start))
+
+    def inversion(self) -> ast.expr:
+        if self.at("not") and self.token.kind == NAME:
+            start = self.start()
+            self.advance()
+            return ast.UnaryOp(op=ast.Not(), operand=self.inversion(), **self.loc(start))
+        return self.comparison()
+
+    def comparison(self) -> ast.expr:
+        start = self.start()
+        left = self.bitwise_or()
+        ops, comparators = [], []
+        while True:
+            token = self.token
+            if token.kind == OP and token.value in _COMPARE_OPS:
+                self.advance()
+                ops.append(_COMPARE_OPS[token.value]())
+            elif token.kind == NAME and token.value == "in":
+                self.advance()
+                ops.append(ast.In())
+            elif token.kind == NAME and token.value == "not" and self.peek().value == "in":
+                self.advance()
+                self.advance()
+                ops.append(ast.NotIn())
+            elif token.kind == NAME and token.value == "is":
+                self.advance()
+                ops.append(ast.IsNot() if self.accept("not") else ast.Is())
+            else:
+                break
+            comparators.append(self.bitwise_or())
+        if not ops:
+            return left
+        return ast.Compare(left=left, ops=ops, comparators=comparators, **self.loc(start))
+
+    def bitwise_or(self) -> ast.expr:
+        return self.binary(0)
+
+    def binary(self, min_level: int) -> ast.expr:
+        """Operadores binários por precedência (níveis de _BINARY_LEVELS a partir de min_level)."""
+        start = self.start()
+        left = self.factor()
+        while True:
+            token = self.tokens[self.pos]
+            level = _BINARY_PRECEDENCE.get(token.value, -1) if token.kind == OP else -1
+            if level < min_level:
+                return left
+            self.advance()
+            right = self.binary(level + 1)
+            left = ast.BinOp(left=left, op=_BIN_OPS[token.value](), right=right, **self.loc(start))
+
+    def factor(self) -> ast.expr:
+        token = self.token
+        if token.kind == OP and token.value in _UNARY_OPS:
+            start = self.start()
+            self.advance()
+            return ast.UnaryOp(op=_UNARY_OPS[token.value](), operand=self.factor(), **self.loc(start))
+        return self.power()
+
+    def power(self) -> ast.expr:
+        start = self.start()
+        if self.at("await"):
+            self.advance()
+            base = ast.Await(value=self.primary(), **self.loc(start))
+        else:
+            base = self.primary()
+        if self.at("**"):
+            self.advance()
+            return ast.BinOp(left=base, op=ast.Pow(), right=self.factor(), **self.loc(start))
+        return base
+
+    def primary(self) -> ast.expr:
+        start = self.start()
+        node = self.atom()
+        while self.token.kind == OP:
+            value = self.token.value
+            if value == ".":
+                self.advance()
+                name = self.token
+                if name.kind != NAME:
+                    raise self.error("esperado um nome de atributo")
+                self.advance()
+                node = ast.Attribute(value=node, attr=name.value, ctx=ast.Load(), **self.loc(start))
+            elif value == "(":
+                self.advance()
+                args, keywords = self.call_arguments()
+                self.expect(")")
+                node = ast.Call(func=node, args=args, keywords=keywords, **self.loc(start))
+            elif value == "[":
+                self.advance()
+                index = self.slices()
+                self.expect("]")
+                node = ast.Subscript(value=node, slice=index, ctx=ast.Load(), **self.loc(start))
+            else:
+                break
+        return node
+
+    def call_arguments(self) -> Tuple[List[ast.expr], List[ast.keyword]]:
+        args, keywords = [], []
+        while not self.at(")"):
+            start = self.start()
+            if self.accept("*"):
+                value = self.expression()
+                args.append(ast.Starred(value=value, ctx=ast.Load(), **self.loc(start)))
+            elif self.accept("**"):
+                keywords.append(ast.keyword(arg=None, value=self.expression(), **self.loc(start)))
+            elif self.token.kind == NAME and self.peek().kind == OP and self.peek().value == "=":
+                name = self.advance().value
+                self.advance()
+                keywords.append(ast.keyword(arg=name, value=self.expression(), **self.loc(start)))
+            else:
+                value = self.named_expression()
+                if self.at("for") and not args and not keywords:
+                    value = self.comprehension(ast.GeneratorExp, value, start)
+                elif keywords and not isinstance(value, ast.Starred):
+                    raise self.error("argumento posicional depois de argumento nomeado", self.prev)
+                args.append(value)
+            if not self.accept(","):
+                break
+        return args, keywords
+
+    def slices(self) -> ast.expr:
+        start = self.start()
+        first = self.slice_item()
+        if not self.at(","):
+            return first
+        elements = [first]
+        while self.accept(","):
+            if self.at("]"):
+                break
+            elements.append(self.slice_item())
+        return ast.Tuple(elts=elements, ctx=ast.Load(), **self.loc(start))
+
+    def slice_item(self) -> ast.expr:
+        start = self.start()
+        lower = upper = step = None
+        if not self.at(":"):
+            lower = self.star_or(self.named_expression)
+            if not self.at(":"):
+                return lower
+        self.advance()
+        if not self.at(":") and not self.at("]") and not self.at(","):
+            upper = self.expression()
+        if self.accept(":"):
+            if not self.at("]") and not self.at(","):
+                step = self.expression()
+        return ast.Slice(lower=lower, upper=upper, step=step, **self.loc(start))
+
+    def atom(self) -> ast.expr:
+        token = self.token
+        start = self.start()
+        if token.kind == NAME:
+            if token.value in ("True", "False", "None"):
+                self.advance()
+                value = {"True": True, "False": False, "None": None}[token.value]
+                return ast.Constant(value=value, **self.loc(start))
+            if keyword.iskeyword(token.value):
+                raise self.error("sintaxe inválida")
+            self.advance()
+            return ast.Name(id=token.value, ctx=ast.Load(), **self.loc(start))
+        if token.kind == NUMBER:
+            self.advance()
+            try:
+                value = ast.literal_eval(token.value)
+            except (ValueError, SyntaxError):
+                raise self.error("número inválido", token)
+            return ast.Constant(value=value, **self.loc(start))
+        if token.kind == STRING:
+            return self.strings()
+        if token.kind == OP:
+            if token.value == "(":
+                return self.parenthesized()
+            if token.value == "[":
+                return self.list_display()
+            if token.value == "{":
+                return self.dict_or_set()
+            if token.value == "...":
+                self.advance()
+                return ast.Constant(value=Ellipsis, **self.loc(start))
+        raise self.error("sintaxe inválida")
+
+    def strings(self) -> ast.expr:
+        """Uma ou mais strings literais seguidas (concatenadas)."""
+        first = self.token
+        literals = []
+        while self.at_kind(STRING):
+            literals.append(self.advance().value)
+        last = self.prev
+        try:
+            if not any("f" in _string_prefix(literal) for literal in literals):
+                values = [ast.literal_eval(literal) for literal in literals]
+                if len({type(value) for value in values}) > 1:
+                    raise SyntaxError("não é possível misturar bytes e str")
+                node = ast.Constant(value=values[0][:0].join(values))
+            else:
+                # f-strings: só o literal é analisado, e as partes recebem a posição do literal
+                node = ast.parse("(" + " ".join(literals) + ")", mode="eval").body
+                for child in ast.walk(node):
+                    if "lineno" in child._attributes:
+                        self.span(child, first, last)
+        except (ValueError, SyntaxError) as e:
+            raise self.error(f"string literal inválida: {getattr(e, 'msg', e)}", first)
+        return self.span(node, first, last)
+
+    def parenthesized(self) -> ast.expr:
+        opening = self.advance()
+        if self.at(")"):
+            self.advance()
+            return self.span(ast.Tuple(elts=[], ctx=ast.Load()), opening, self.prev)
+        if self.at("yield"):
+            node = self.yield_expression()
+            self.expect(")")
+            return node
+        first = self.star_or(self.named_expression)
+        if self.at("for"):
+            node = self.comprehension(ast.GeneratorExp, first, self.start_of(opening))
+            self.expect(")")
+            return self.span(node, opening, self.prev)
+        if not self.at(","):
+            self.expect(")")
+            return first
+        elements = [first]
+        while self.accept(","):
+            if self.at(")"):
+                break
+            elements.append(self.star_or(self.named_expression))
+        self.expect(")")
+        return self.span(ast.Tuple(elts=elements, ctx=ast.Load()), opening, self.prev)
+
+    def list_display(self) -> ast.expr:
+        opening = self.advance()
+        elements = []
+        if not self.at("]"):
+            first = self.star_or(self.named_expression)
+            if self.at("for"):
+                node = self.comprehension(ast.ListComp, first, self.start_of(opening))
+                self.expect("]")
+                return self.span(node, opening, self.prev)
+            elements.append(first)
+            while self.accept(","):
+                if self.at("]"):
+                    break
+                elements.append(self.star_or(self.named_expression))
+        self.expect("]")
+        return self.span(ast.List(elts=elements, ctx=ast.Load()), opening, self.prev)
+
+    def dict_or_set(self) -> ast.expr:
+        opening = self.advance()
+        if self.at("}"):
+            self.advance()
+            return self.span(ast.Dict(keys=[], values=[]), opening, self.prev)
+
+        if self.accept("**"):
+            first_key, first_value = None, self.bitwise_or()
+        else:
+            first_key = self.star_or(self.named_expression)
+            first_value = None
+            if self.accept(":"):
+                first_value = self.expression()
+
+        if first_value is None:
+            # Conjunto
+            if self.at("for"):
+                node = self.comprehension(ast.SetComp, first_key, self.start_of(opening))
+                self.expect("}")
+                return self.span(node, opening, self.prev)
+            elements = [first_key]
+            while self.accept(","):
+                if self.at("}"):
+                    break
+                elements.append(self.star_or(self.named_expression))
+            self.expect("}")
+            return self.span(ast.Set(elts=elements), opening, self.prev)
+
+        if first_key is not None and self.at("for"):
+            generators = self.comprehension_clauses()
+            self.expect("}")
+            node = ast.DictComp(key=first_key, value=first_value, generators=generators)
+            return self.span(node, opening, self.prev)
+        keys, values = [first_key], [first_value]
+        while self.accept(","):
+            if self.at("}"):
+                break
+            if self.accept("**"):
+                keys.append(None)
+                values.append(self.bitwise_or())
+            else:
+                keys.append(self.expression())
+                self.expect(":")
+                values.append(self.expression())
+        self.expect("}")
+        return self.span(ast.Dict(keys=keys, values=values), opening, self.prev)
+
+    def comprehension(self, node_type, element: ast.expr, start) -> ast.expr:
+        generators = self.comprehension_clauses()
+        return node_type(elt=element, generators=generators, **self.loc(start))
+
+    def comprehension_clauses(self) -> List[ast.comprehension]:
+        generators = []
+        while self.at("for"):
+            self.advance()
+            target = self.target_expression()
+            self.expect("in")
+            iterable = self.disjunction()
+            conditions = []
+            while self.at("if") and self.token.kind == NAME:
+                self.advance()
+                conditions.append(self.disjunction())
+            generators.append(ast.comprehension(target=target, iter=iterable, ifs=conditions, is_async=0))
+        return generators
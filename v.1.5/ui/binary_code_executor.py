@@ -10,6 +10,11 @@ import tempfile
 import io
 from contextlib import redirect_stdout, redirect_stderr
 
+try:
+    from ui.source_map import DEFAULT_FILENAME
+except ImportError:
+    from source_map import DEFAULT_FILENAME
+
 class BinaryCodeExecutor:
     """
     Executor de código binário com suporte a execução real e interativa.
@@ -23,26 +28,51 @@ class BinaryCodeExecutor:
             interpreter: Instância do interpretador binário
         """
         self.interpreter = interpreter
+        # Posição no código binário (linha, coluna, mensagem) do erro da última execução
+        self.last_error = None
     
-    def execute_binary_code(self, binary_code):
+    def execute_binary_code(self, binary_code, interpreter=None):
         """
         Executa código binário traduzindo para Python e executando.
         
         Args:
             binary_code: Código binário a ser executado
+            interpreter: Interpretador usado no lugar do padrão (por exemplo, o do dialeto detectado)
             
         Returns:
             Resultado da execução
         """
+        interpreter = interpreter or self.interpreter
+        self.last_error = None
         try:
             # Traduz o código binário para Python
-            python_code = self.interpreter.traduzir_binario(binary_code)
+            python_code = interpreter.traduzir_binario(binary_code)
             
             # Executa o código Python
-            return self._execute_python_code(python_code)
+            output = self._execute_python_code(python_code)
+            return self._map_errors(interpreter, binary_code, output)
         except Exception as e:
             return f"Erro ao executar código binário: {str(e)}"
     
+    def _map_errors(self, interpreter, binary_code, output):
+        """
+        Reescreve os tracebacks da saída com as posições do código binário.
+        O mapa de origem só é calculado quando há um traceback do código traduzido.
+        
+        Args:
+            interpreter: Interpretador que traduziu o código
+            binary_code: Código binário executado
+            output: Saída da execução
+            
+        Returns:
+            Saída com os quadros do código traduzido apontando para o binário
+        """
+        if f'File "{DEFAULT_FILENAME}"' not in output or not hasattr(interpreter, "traduzir_binario_com_mapa"):
+            return output
+        _, source_map = interpreter.traduzir_binario_com_mapa(binary_code)
+        self.last_error = source_map.locate_traceback(output)
+        return source_map.rewrite_traceback(output)
+    
     def _execute_python_code(self, python_code):
         """
         Executa código Python de forma segura.
@@ -106,6 +136,9 @@ class BinaryCodeExecutor:
             # Captura a saída
             stdout, stderr = process.communicate(timeout=10)  # Timeout de 10 segundos
             
+            # O arquivo temporário aparece nos tracebacks com o nome do código traduzido
+            stderr = stderr.replace(f'File "{temp_path}"', f'File "{DEFAULT_FILENAME}"')
+            
             # Remove o arquivo temporário
             try:
                 os.unlink(temp_path)
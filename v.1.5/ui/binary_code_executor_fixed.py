@@ -3,39 +3,146 @@ Módulo para execução de código binário de forma robusta com suporte a entra
 Esta versão corrige problemas na execução de comandos input() e print().
 """
 
-import os
 import sys
-import subprocess
-import tempfile
-import io
-import time
-import threading
-import queue
+import traceback
 from contextlib import redirect_stdout, redirect_stderr
-from PyQt5.QtWidgets import QInputDialog, QDialog, QVBoxLayout, QPlainTextEdit, QPushButton, QLabel, QApplication
+from PyQt5.QtWidgets import (
+    QInputDialog, QDialog, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton, QLabel,
+    QProgressBar, QApplication
+)
+from PyQt5.QtGui import QTextCursor
 from PyQt5.QtCore import Qt
 
+try:
+    from ui.translation_cache import get_default_cache
+    from ui.sandbox_runner import STOP_EXITED, get_default_runner
+    from ui.execution_service import (
+        STAGE_QUEUED, STAGE_TRANSLATING, STAGE_PREPARING, STAGE_RUNNING
+    )
+except ImportError:
+    from translation_cache import get_default_cache
+    from sandbox_runner import STOP_EXITED, get_default_runner
+    from execution_service import (
+        STAGE_QUEUED, STAGE_TRANSLATING, STAGE_PREPARING, STAGE_RUNNING
+    )
+
+# Estilos do terminal de execução
+_OUTPUT_STYLE = """
+    QPlainTextEdit {
+        background-color: #181a20;
+        color: #e6e6e6;
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 16px;
+        border-radius: 10px;
+        padding: 14px;
+        border: 1px solid #282a36;
+    }
+"""
+_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #bd93f9;
+        color: #23272e;
+        border-radius: 7px;
+        padding: 10px 20px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #a882e6;
+    }
+    QPushButton:disabled {
+        background-color: #44475a;
+        color: #8b8b8b;
+    }
+"""
+_DIALOG_STYLE = """
+    QDialog {
+        background-color: #23272e;
+    }
+    QLabel {
+        color: #fff;
+        font-size: 17px;
+    }
+    QProgressBar {
+        background-color: #44475a;
+        color: #f8f8f2;
+        border: none;
+        border-radius: 4px;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        background-color: #bd93f9;
+        border-radius: 4px;
+    }
+"""
+
+# Texto exibido para cada etapa da execução
+_STAGE_TEXTS = {
+    STAGE_QUEUED: "Na fila",
+    STAGE_TRANSLATING: "Traduzindo...",
+    STAGE_PREPARING: "Aguardando entradas...",
+    STAGE_RUNNING: "Executando...",
+}
+
 class BinaryCodeExecutorFixed:
     """
     Executor de código binário com suporte a execução real e interativa.
     """
     
-    def __init__(self, interpreter):
+    def __init__(self, interpreter, cache=None, sandbox=None):
         self.interpreter = interpreter
+        # Cache de traduções e de código compilado (reexecuções sem alterações)
+        self.cache = cache if cache is not None else get_default_cache()
+        # Execução isolada com limites de CPU, memória, arquivos, processos e saída
+        self.sandbox = sandbox if sandbox is not None else get_default_runner()
     
-    def execute_binary_code(self, binary_code, parent=None):
+    def execute_binary_code(self, binary_code, parent=None, interpreter=None):
         """
         Executa código binário traduzindo para Python e executando.
         Se houver input(), solicita ao usuário os valores.
         Exibe a saída simulando um terminal, mostrando os valores digitados.
+        O interpretador informado (por exemplo, o do dialeto detectado) substitui o padrão.
         """
         try:
-            python_code = self.interpreter.traduzir_binario(binary_code)
+            python_code = self.cache.translate(interpreter or self.interpreter, binary_code)
             python_code, terminal_lines = self._handle_inputs_terminal(python_code, parent)
             return self._show_result_dialog_terminal(self._execute_python_code(python_code), terminal_lines, parent)
         except Exception as e:
             return self._show_result_dialog_terminal(f"Erro ao executar código binário: {str(e)}", [], parent)
 
+    def start_binary_code(self, binary_code, service, parent=None, interpreter=None):
+        """
+        Enfileira a execução no ExecutionService e mostra a saída à medida que chega.
+        A tradução e a execução rodam fora da thread da interface; os valores de
+        input() são pedidos antes da execução, como em execute_binary_code.
+
+        Args:
+            binary_code: Código binário
+            service: ExecutionService que atende o pedido
+            parent: Janela pai do terminal
+            interpreter: Interpretador usado no lugar do padrão
+
+        Returns:
+            LiveTerminalDialog que acompanha a execução
+        """
+        interpreter = interpreter or self.interpreter
+        terminal_lines = []
+
+        def prepare(python_code):
+            python_code, lines = self._handle_inputs_terminal(python_code, parent)
+            terminal_lines.extend(lines)
+            return python_code
+
+        job_id = service.submit(binary_code,
+                                translate=lambda code: self.cache.translate(interpreter, code),
+                                prepare=prepare)
+        dialog = LiveTerminalDialog(
+            service, job_id,
+            lambda result: self._format_terminal_output(self._result_output(result), terminal_lines),
+            parent
+        )
+        dialog.show()
+        return dialog
+
     def _handle_inputs_terminal(self, python_code, parent=None):
         """
         Detecta chamadas a input() e solicita ao usuário os valores.
@@ -80,42 +187,13 @@ class BinaryCodeExecutorFixed:
         output_area = QPlainTextEdit()
         output_area.setReadOnly(True)
         output_area.setPlainText(self._format_terminal_output(output, terminal_lines))
-        output_area.setStyleSheet("""
-            QPlainTextEdit {
-                background-color: #181a20;
-                color: #e6e6e6;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 16px;
-                border-radius: 10px;
-                padding: 14px;
-                border: 1px solid #282a36;
-            }
-        """)
+        output_area.setStyleSheet(_OUTPUT_STYLE)
         layout.addWidget(output_area)
         btn = QPushButton("Fechar")
         btn.clicked.connect(dialog.accept)
-        btn.setStyleSheet("""
-            QPushButton {
-                background-color: #bd93f9;
-                color: #23272e;
-                border-radius: 7px;
-                padding: 10px 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #a882e6;
-            }
-        """)
+        btn.setStyleSheet(_BUTTON_STYLE)
         layout.addWidget(btn, alignment=Qt.AlignRight)
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #23272e;
-            }
-            QLabel {
-                color: #fff;
-                font-size: 17px;
-            }
-        """)
+        dialog.setStyleSheet(_DIALOG_STYLE)
         dialog.exec_()
         return output
 
@@ -140,30 +218,143 @@ class BinaryCodeExecutorFixed:
     def _execute_python_code(self, python_code):
         """
         Executa código Python de forma segura.
+        O código é compilado (ou obtido do cache) aqui e enviado a um
+        processo isolado, com limites de recursos e saída limitada em bytes.
         """
         try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as temp_file:
-                temp_file.write(python_code)
-                temp_path = temp_file.name
-            process = subprocess.Popen(
-                [sys.executable, temp_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                universal_newlines=True
-            )
-            stdout, stderr = process.communicate(timeout=10)
-            output = stdout
-            if stderr:
-                output += f"\n--- Erros ---\n{stderr}"
-            return output
-        except subprocess.TimeoutExpired:
-            process.kill()
-            return "Erro: A execução do código excedeu o tempo limite."
+            code = self.cache.compile(python_code)
+        except SyntaxError as e:
+            return "\n--- Erros ---\n" + "".join(traceback.format_exception_only(type(e), e))
+
+        try:
+            return self._result_output(self.sandbox.run(code, timeout=10))
         except Exception as e:
             return f"Erro ao executar o código: {str(e)}"
-        finally:
+
+    def _result_output(self, result):
+        """
+        Retorna a saída de uma execução, com o motivo da parada quando não terminou normalmente.
+        """
+        output = result.combined_output()
+        message = result.stop_message() if result.stop_reason != STOP_EXITED else ""
+        if message:
+            output += f"\nErro: {message}"
+        return output
+
+
+class LiveTerminalDialog(QDialog):
+    """
+    Terminal de execução que acompanha um pedido do ExecutionService: mostra a
+    saída à medida que chega, a etapa e o tempo decorrido, e permite parar.
+    """
+
+    def __init__(self, service, job_id, format_result, parent=None):
+        """
+        Args:
+            service: ExecutionService que atende o pedido
+            job_id: Identificador do pedido
+            format_result: Função que formata o SandboxResult final para exibição
+            parent: Janela pai
+        """
+        super().__init__(parent)
+        self.service = service
+        self.job_id = job_id
+        self.format_result = format_result
+        self.finished_run = False
+
+        self.setWindowTitle("Terminal de Execução")
+        self.setMinimumSize(700, 440)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("<b>Terminal:</b>"))
+
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+        self.progress_bar = QProgressBar()
+        layout.addWidget(self.progress_bar)
+
+        self.output_area = QPlainTextEdit()
+        self.output_area.setReadOnly(True)
+        self.output_area.setStyleSheet(_OUTPUT_STYLE)
+        layout.addWidget(self.output_area)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        self.stop_button = QPushButton("Parar")
+        self.stop_button.setStyleSheet(_BUTTON_STYLE)
+        self.stop_button.clicked.connect(lambda: self.service.stop(self.job_id))
+        buttons.addWidget(self.stop_button)
+        close_button = QPushButton("Fechar")
+        close_button.setStyleSheet(_BUTTON_STYLE)
+        close_button.clicked.connect(self.close)
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
+        self.setStyleSheet(_DIALOG_STYLE)
+
+        service.stage_changed.connect(self._on_stage)
+        service.progress_changed.connect(self._on_progress)
+        service.output_received.connect(self._on_output)
+        service.job_finished.connect(self._on_finished)
+
+        position = service.position(job_id)
+        if position > 0:
+            self._set_stage(STAGE_QUEUED, f"Na fila (posição {position})")
+        else:
+            self._set_stage(STAGE_TRANSLATING)
+
+    def _set_stage(self, stage, text=None):
+        """Mostra a etapa atual; o tempo só é medido durante a execução."""
+        self.status_label.setText(text or _STAGE_TEXTS.get(stage, ""))
+        if stage != STAGE_RUNNING:
+            # Sem medida de progresso nas etapas anteriores à execução
+            self.progress_bar.setRange(0, 0)
+
+    def _on_stage(self, job_id, stage):
+        if job_id == self.job_id:
+            self._set_stage(stage)
+
+    def _on_progress(self, job_id, elapsed, timeout):
+        if job_id != self.job_id:
+            return
+        if timeout > 0:
+            self.progress_bar.setRange(0, 1000)
+            self.progress_bar.setValue(min(1000, int(elapsed / timeout * 1000)))
+            self.progress_bar.setFormat(f"{elapsed:.1f} s / {timeout:.0f} s")
+        else:
+            self.progress_bar.setRange(0, 0)
+        self.status_label.setText(f"Executando... {elapsed:.1f} s")
+
+    def _on_output(self, job_id, name, text):
+        if job_id != self.job_id:
+            return
+        self.output_area.moveCursor(QTextCursor.End)
+        self.output_area.insertPlainText(text)
+
+    def _on_finished(self, job_id, result):
+        if job_id != self.job_id:
+            return
+        self.finished_run = True
+        self._disconnect()
+        self.output_area.setPlainText(self.format_result(result))
+        message = result.stop_message() if result.stop_reason != STOP_EXITED else ""
+        self.status_label.setText(message or f"Concluído em {result.duration:.2f} s")
+        self.progress_bar.setVisible(False)
+        self.stop_button.setEnabled(False)
+
+    def _disconnect(self):
+        """Deixa de acompanhar o serviço."""
+        for signal, slot in ((self.service.stage_changed, self._on_stage),
+                             (self.service.progress_changed, self._on_progress),
+                             (self.service.output_received, self._on_output),
+                             (self.service.job_finished, self._on_finished)):
             try:
-                os.unlink(temp_path)
-            except:
+                signal.disconnect(slot)
+            except (TypeError, RuntimeError):
                 pass
+
+    def closeEvent(self, event):
+        # Fechar o terminal interrompe a execução (ou retira o pedido da fila)
+        if not self.finished_run:
+            self._disconnect()
+            self.service.stop(self.job_id)
+        super().closeEvent(event)
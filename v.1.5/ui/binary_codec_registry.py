@@ -0,0 +1,454 @@
+"""
+Módulo de registro compartilhado dos codecs binários.
+Cada dialeto (tabela de tradução de um interpretador, do realce de sintaxe ou
+do guia de referência) é construído uma única vez por processo na forma de
+arranjos compactos e imutáveis: byte -> id do token, id -> texto, id -> binário
+e uma trie reversa (texto -> id) para a correspondência mais longa. Todos os
+componentes usam o mesmo registro em vez de reconstruir dicionários próprios.
+
+Opcionalmente, o registro é gravado em disco (marshal) e carregado na
+inicialização sem reconstruir as tabelas: basta apontar a variável de
+ambiente COLLECTOR_BINARIE_CODEC_CACHE para o arquivo desejado.
+
+Uso pela linha de comando:
+    python binary_codec_registry.py                   # resumo dos dialetos
+    python binary_codec_registry.py fixed parser      # divergências entre dois dialetos
+"""
+
+import os
+import sys
+import time
+import hashlib
+import marshal
+import tempfile
+import threading
+from array import array
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+# Variável de ambiente com o caminho do registro persistido (opcional)
+CODEC_CACHE_ENV = "COLLECTOR_BINARIE_CODEC_CACHE"
+
+# Versão do formato gravado em disco
+CODEC_FORMAT_VERSION = 1
+
+# Arquivo com as tabelas de origem (a assinatura do cache depende dele)
+_TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "binary_dialect_tables.py")
+
+# Valor de byte_to_id para bytes sem token no dialeto
+NO_TOKEN = -1
+
+
+class BinaryDialect:
+    """
+    Dialeto binário imutável em arranjos compactos.
+    """
+
+    def __init__(self, name: str, binaries: Tuple[str, ...], texts: Tuple[str, ...],
+                 categories: Tuple[Tuple[str, Tuple[int, ...]], ...] = (), trie: Optional[tuple] = None):
+        """
+        Inicializa o dialeto a partir dos pares (binário, texto) já numerados.
+
+        Args:
+            name: Nome do dialeto no registro
+            binaries: id do token -> código binário
+            texts: id do token -> texto
+            categories: Categorias (nome, ids) usadas pelo guia de referência
+            trie: Trie reversa já construída (carregada do disco), ou None
+        """
+        self.name = name
+        self.binaries = binaries
+        self.texts = texts
+        self.categories = categories
+
+        # Visões somente leitura no formato dos dicionários usados pelos interpretadores
+        # (em códigos ou textos repetidos prevalece o último, como nos dicionários originais)
+        self.binary_to_text: Mapping[str, str] = MappingProxyType(dict(zip(binaries, texts)))
+        self.text_to_binary: Mapping[str, str] = MappingProxyType(dict(zip(texts, binaries)))
+
+        # Impressão digital da tabela (chaves de cache por dialeto)
+        self.fingerprint = hashlib.sha256(
+            repr(sorted(self.binary_to_text.items())).encode("utf-8", "surrogatepass")
+        ).digest()
+
+        # Byte (valor de 8 bits) -> id do token, NO_TOKEN quando não existe
+        self.byte_to_id = array("h", [NO_TOKEN]) * 256
+        for token_id, binary in enumerate(binaries):
+            if len(binary) == 8:
+                self.byte_to_id[int(binary, 2)] = token_id
+
+        if trie is None:
+            trie = self._build_trie(texts)
+        # Trie reversa: caracteres dos filhos de cada nó, filhos e id do token do nó
+        self._trie_chars, self._trie_children, ids = trie
+        self._trie_ids = array("h", ids)
+
+        self._decoder = None
+        self._text_encoder = None
+
+    @staticmethod
+    def _build_trie(texts: Tuple[str, ...]) -> tuple:
+        """
+        Constrói a trie reversa texto -> id do token.
+
+        Args:
+            texts: id do token -> texto
+
+        Returns:
+            Tupla (caracteres por nó, filhos por nó, bytes com o id do token por nó)
+        """
+        chars = [""]
+        children = [[]]
+        ids = array("h", [NO_TOKEN])
+        for token_id, text in enumerate(texts):
+            node = 0
+            for char in text:
+                position = chars[node].find(char)
+                if position < 0:
+                    chars.append("")
+                    children.append([])
+                    ids.append(NO_TOKEN)
+                    position = len(chars[node])
+                    chars[node] += char
+                    children[node].append(len(chars) - 1)
+                node = children[node][position]
+            ids[node] = token_id
+        return tuple(chars), tuple(map(tuple, children)), ids.tobytes()
+
+    @classmethod
+    def from_table(cls, name: str, binary_to_text: Dict[str, str], fill_ascii: bool = False) -> "BinaryDialect":
+        """
+        Constrói um dialeto a partir de uma tabela binário -> texto.
+
+        Args:
+            name: Nome do dialeto
+            binary_to_text: Tabela de tradução
+            fill_ascii: Se True, acrescenta os caracteres ASCII imprimíveis ainda
+                        sem código, com o próprio valor do caractere
+
+        Returns:
+            Dialeto construído
+        """
+        table = dict(binary_to_text)
+        if fill_ascii:
+            texts = set(table.values())
+            for value in range(32, 127):
+                char = chr(value)
+                binary = format(value, '08b')
+                if char not in texts and binary not in table:
+                    table[binary] = char
+        return cls(name, tuple(table), tuple(table.values()))
+
+    @classmethod
+    def from_categories(cls, name: str, categories: Dict[str, Dict[str, str]]) -> "BinaryDialect":
+        """
+        Constrói um dialeto a partir de categorias texto -> binário.
+
+        Args:
+            name: Nome do dialeto
+            categories: Dicionário categoria -> (texto -> binário)
+
+        Returns:
+            Dialeto construído
+        """
+        binaries, texts, groups = [], [], []
+        for category, entries in categories.items():
+            ids = []
+            for text, binary in entries.items():
+                ids.append(len(binaries))
+                binaries.append(binary)
+                texts.append(text)
+            groups.append((category, tuple(ids)))
+        return cls(name, tuple(binaries), tuple(texts), tuple(groups))
+
+    def text_of_byte(self, value: int) -> Optional[str]:
+        """
+        Retorna o texto do token de um byte.
+
+        Args:
+            value: Valor de 0 a 255
+
+        Returns:
+            Texto do token ou None se o byte não tiver significado no dialeto
+        """
+        token_id = self.byte_to_id[value]
+        return self.texts[token_id] if token_id != NO_TOKEN else None
+
+    def longest_match(self, text: str, start: int = 0) -> Tuple[Optional[str], int]:
+        """
+        Procura na trie reversa o token mais longo que começa em uma posição do texto.
+
+        Args:
+            text: Texto de origem
+            start: Posição inicial
+
+        Returns:
+            Tupla (binário, tamanho); (None, 0) quando nenhum token corresponde
+        """
+        chars, children, ids = self._trie_chars, self._trie_children, self._trie_ids
+        node = 0
+        best_id, best_length = NO_TOKEN, 0
+        for position in range(start, len(text)):
+            index = chars[node].find(text[position])
+            if index < 0:
+                break
+            node = children[node][index]
+            if ids[node] != NO_TOKEN:
+                best_id, best_length = ids[node], position - start + 1
+        if best_id == NO_TOKEN:
+            return None, 0
+        return self.binaries[best_id], best_length
+
+    def reference_data(self) -> Dict[str, Dict[str, str]]:
+        """
+        Reconstrói as categorias texto -> binário do guia de referência.
+
+        Returns:
+            Dicionário categoria -> (texto -> binário)
+        """
+        return {category: {self.texts[token_id]: self.binaries[token_id] for token_id in ids}
+                for category, ids in self.categories}
+
+    def decoder(self):
+        """
+        Retorna o decodificador por tabela do dialeto, criado uma única vez.
+
+        Returns:
+            BinaryTableDecoder compartilhado
+        """
+        if self._decoder is None:
+            try:
+                from ui.binary_table_decoder import BinaryTableDecoder
+            except ImportError:
+                from binary_table_decoder import BinaryTableDecoder
+            self._decoder = BinaryTableDecoder(self.binary_to_text)
+        return self._decoder
+
+    def text_encoder(self):
+        """
+        Retorna o codificador por trie do dialeto, criado uma única vez.
+
+        Returns:
+            BinaryTextEncoder compartilhado
+        """
+        if self._text_encoder is None:
+            try:
+                from ui.binary_text_encoder import BinaryTextEncoder
+            except ImportError:
+                from binary_text_encoder import BinaryTextEncoder
+            self._text_encoder = BinaryTextEncoder(self.text_to_binary)
+        return self._text_encoder
+
+    def to_state(self) -> tuple:
+        """Retorna os arranjos do dialeto em tipos aceitos pelo marshal."""
+        trie = (self._trie_chars, self._trie_children, self._trie_ids.tobytes())
+        return self.name, self.binaries, self.texts, self.categories, trie
+
+
+class CodecRegistry:
+    """
+    Registro dos dialetos binários disponíveis no processo.
+    """
+
+    def __init__(self, dialects: Dict[str, BinaryDialect]):
+        """
+        Inicializa o registro.
+
+        Args:
+            dialects: Dicionário nome -> dialeto
+        """
+        self._dialects = MappingProxyType(dict(dialects))
+
+    @classmethod
+    def build(cls) -> "CodecRegistry":
+        """
+        Constrói todos os dialetos a partir das tabelas de origem.
+
+        Returns:
+            Registro construído
+        """
+        try:
+            from ui import binary_dialect_tables as tables
+        except ImportError:
+            import binary_dialect_tables as tables
+
+        return cls({
+            "fixed": BinaryDialect.from_table("fixed", tables.FIXED_TABLE),
+            "enhanced": BinaryDialect.from_table("enhanced", tables.ENHANCED_TABLE),
+            "parser": BinaryDialect.from_table("parser", tables.PARSER_TABLE, fill_ascii=True),
+            "binario": BinaryDialect.from_table("binario", tables.BINARIO_TABLE),
+            "highlighter": BinaryDialect.from_table("highlighter", tables.HIGHLIGHTER_TABLE),
+            "reference": BinaryDialect.from_categories("reference", tables.REFERENCE_TABLE),
+        })
+
+    def get(self, name: str) -> BinaryDialect:
+        """
+        Retorna um dialeto pelo nome.
+
+        Args:
+            name: Nome do dialeto
+
+        Returns:
+            Dialeto registrado
+
+        Raises:
+            ValueError: Se o dialeto não existir
+        """
+        try:
+            return self._dialects[name]
+        except KeyError:
+            raise ValueError(f"Dialeto desconhecido: {name}") from None
+
+    def names(self) -> List[str]:
+        """Retorna os nomes dos dialetos registrados."""
+        return list(self._dialects)
+
+    def conflicts(self, first: str, second: str) -> List[Tuple[str, str, str]]:
+        """
+        Lista os códigos com significados diferentes em dois dialetos.
+
+        Args:
+            first: Nome do primeiro dialeto
+            second: Nome do segundo dialeto
+
+        Returns:
+            Lista de tuplas (binário, texto no primeiro, texto no segundo)
+        """
+        a, b = self.get(first).binary_to_text, self.get(second).binary_to_text
+        return [(binary, text, b[binary]) for binary, text in a.items()
+                if binary in b and b[binary] != text]
+
+    def save(self, path: str):
+        """
+        Grava o registro em disco de forma atômica.
+
+        Args:
+            path: Caminho do arquivo
+        """
+        data = marshal.dumps((CODEC_FORMAT_VERSION, _tables_signature(),
+                              [dialect.to_state() for dialect in self._dialects.values()]))
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> Optional["CodecRegistry"]:
+        """
+        Carrega um registro gravado com save.
+
+        Args:
+            path: Caminho do arquivo
+
+        Returns:
+            Registro carregado, ou None se o arquivo não existir, estiver
+            corrompido ou tiver sido gerado a partir de outras tabelas
+        """
+        try:
+            with open(path, "rb") as file:
+                version, signature, states = marshal.loads(file.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if version != CODEC_FORMAT_VERSION or signature != _tables_signature():
+            return None
+        return cls({state[0]: BinaryDialect(*state) for state in states})
+
+
+def _tables_signature() -> tuple:
+    """Identifica a versão do arquivo de tabelas sem importá-lo."""
+    try:
+        stat = os.stat(_TABLES_PATH)
+    except OSError:
+        return ()
+    return stat.st_size, stat.st_mtime_ns
+
+
+_registry: Optional[CodecRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> CodecRegistry:
+    """
+    Retorna o registro compartilhado, construído (ou carregado) uma única vez.
+
+    Returns:
+        Registro de codecs do processo
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                cache_path = os.environ.get(CODEC_CACHE_ENV)
+                registry = CodecRegistry.load(cache_path) if cache_path else None
+                if registry is None:
+                    registry = CodecRegistry.build()
+                    if cache_path:
+                        try:
+                            registry.save(cache_path)
+                        except OSError:
+                            # Sem permissão de escrita: segue com o registro em memória
+                            pass
+                _registry = registry
+    return _registry
+
+
+def get_dialect(name: str) -> BinaryDialect:
+    """
+    Atalho para get_registry().get(name).
+
+    Args:
+        name: Nome do dialeto
+
+    Returns:
+        Dialeto compartilhado
+    """
+    return get_registry().get(name)
+
+
+def main(argv=None):
+    """
+    Mostra um resumo dos dialetos ou as divergências entre dois deles.
+
+    Args:
+        argv: Argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        Código de saída
+    """
+    argv = sys.argv[1:] if argv is None else argv
+
+    start = time.perf_counter()
+    registry = CodecRegistry.build()
+    built = time.perf_counter() - start
+
+    if len(argv) == 2:
+        for binary, first, second in registry.conflicts(*argv):
+            print(f"{binary}: {first!r} ({argv[0]}) != {second!r} ({argv[1]})")
+        return 0
+
+    for name in registry.names():
+        dialect = registry.get(name)
+        print(f"{name}: {len(dialect.binaries)} tokens, {len(dialect._trie_ids)} nós na trie")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "codecs.bin")
+        registry.save(path)
+        start = time.perf_counter()
+        CodecRegistry.load(path)
+        loaded = time.perf_counter() - start
+    print(f"Construção: {built * 1000:.2f} ms; carga do disco: {loaded * 1000:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
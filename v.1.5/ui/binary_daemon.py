@@ -0,0 +1,692 @@
+"""
+Módulo do daemon local de tradução e execução.
+Um processo de longa duração mantém carregados os interpretadores de cada
+dialeto, o cache de traduções e o executor isolado, e atende pedidos JSON-RPC 2.0
+(um objeto JSON por linha) em um socket Unix ou em uma porta TCP local. O
+socket Unix só é acessível ao próprio usuário; na porta TCP, que qualquer
+processo local (inclusive um navegador) alcança, cada pedido precisa levar no
+campo "auth" o segredo que o daemon grava, com permissão 0600, em
+~/.the_collector_binarie/daemon-<porta>.token. Uma linha que não seja um pedido
+JSON-RPC válido encerra a conexão. Os
+métodos translate, encode, validate e run rodam em um conjunto de threads de
+tamanho configurável; quando há pedidos demais em andamento, o daemon responde
+imediatamente com o erro SERVER_BUSY em vez de acumular a fila (contrapressão).
+O cliente (BinaryDaemonClient) mantém a conexão aberta e só usa a biblioteca
+padrão, de modo que CI e editores não pagam a importação do Qt nem a construção
+das tabelas a cada pedido.
+
+Uso pela linha de comando:
+    python binary_daemon.py serve --workers 4
+    python binary_daemon.py translate programa.bin --dialect parser
+    python binary_daemon.py run programa.bin < entrada.txt
+    python binary_daemon.py stop
+"""
+
+import argparse
+import hmac
+import inspect
+import ipaddress
+import json
+import os
+import secrets
+import socket
+import socketserver
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+# Endereço TCP usado onde não há sockets Unix
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Threads que atendem os pedidos e limite de pedidos em andamento
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_PENDING = 64
+
+# Tamanho máximo de uma mensagem (uma linha JSON)
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+# Códigos de erro JSON-RPC (os negativos até -32600 são os da especificação)
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+SERVER_BUSY = -32000
+SYNTAX_ERROR = -32001
+UNAUTHORIZED = -32002
+
+# Métodos atendidos pelo conjunto de threads e métodos de controle, atendidos na hora
+METHODS = ("translate", "encode", "validate", "run")
+CONTROL_METHODS = ("ping", "stats", "shutdown")
+
+
+def default_address() -> str:
+    """Retorna o endereço padrão do daemon (socket Unix no diretório do usuário ou TCP local)."""
+    if hasattr(socket, "AF_UNIX"):
+        return os.path.join(os.path.expanduser("~"), ".the_collector_binarie", "daemon.sock")
+    return f"{DEFAULT_HOST}:{DEFAULT_PORT}"
+
+
+def token_path(port: int) -> str:
+    """
+    Retorna o arquivo com o segredo do daemon que escuta em uma porta TCP.
+
+    Args:
+        port: Porta efetiva do daemon
+
+    Returns:
+        Caminho do arquivo
+    """
+    return os.path.join(os.path.expanduser("~"), ".the_collector_binarie", f"daemon-{port}.token")
+
+
+def _private_directory(path: str):
+    """
+    Cria o diretório, ou restringe um já existente, para acesso só do usuário.
+
+    makedirs não altera a permissão de um diretório que já existe (outros módulos
+    criam ~/.the_collector_binarie com a permissão padrão).
+
+    Args:
+        path: Diretório
+
+    Raises:
+        PermissionError: Se o diretório pertencer a outro usuário ou continuar acessível a outros
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if os.name != "posix":
+        return
+    os.chmod(path, 0o700)
+    status = os.lstat(path)
+    if status.st_uid != os.getuid() or status.st_mode & 0o077:
+        raise PermissionError(f"O diretório {path} não é de acesso exclusivo do usuário")
+
+
+def _write_token(path: str, token: str):
+    """Grava o segredo em um arquivo legível só pelo usuário."""
+    _private_directory(os.path.dirname(path))
+    descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(descriptor, "w", encoding="ascii") as stream:
+        stream.write(token)
+    # O arquivo pode já existir com outra permissão
+    os.chmod(path, 0o600)
+
+
+def parse_address(address: str) -> Tuple[int, object]:
+    """
+    Interpreta um endereço do daemon.
+
+    Args:
+        address: "host:porta" para TCP ou o caminho de um socket Unix
+
+    Returns:
+        Tupla (família do socket, endereço no formato de socket.connect)
+    """
+    host, separator, port = address.rpartition(":")
+    if separator and port.isdigit() and "/" not in address and os.sep not in address:
+        return socket.AF_INET, (host or DEFAULT_HOST, int(port))
+    if not hasattr(socket, "AF_UNIX"):
+        raise ValueError(f"Sockets Unix não são suportados nesta plataforma: {address}")
+    return socket.AF_UNIX, address
+
+
+class DaemonError(Exception):
+    """
+    Erro devolvido pelo daemon (objeto "error" da resposta JSON-RPC).
+    """
+
+    def __init__(self, code: int, message: str, data=None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+    @property
+    def busy(self) -> bool:
+        """True se o daemon recusou o pedido por excesso de pedidos em andamento."""
+        return self.code == SERVER_BUSY
+
+
+def _response(request_id, result) -> Dict:
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def _error(request_id, code: int, message: str, data=None) -> Dict:
+    error = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": "2.0", "id": request_id, "error": error}
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    """
+    Lê os pedidos de uma conexão, um por linha. As respostas são escritas quando
+    cada pedido termina, na ordem em que terminam (o "id" identifica o pedido).
+    """
+
+    def setup(self):
+        super().setup()
+        if self.server.address_family != getattr(socket, "AF_UNIX", None):
+            # Sem o algoritmo de Nagle, respostas pequenas não esperam o próximo pacote
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        daemon = self.server.binary_daemon
+        write_lock = threading.Lock()
+
+        def send(response):
+            data = json.dumps(response, ensure_ascii=False).encode("utf-8", "surrogatepass") + b"\n"
+            with write_lock:
+                try:
+                    self.wfile.write(data)
+                except (OSError, ValueError):
+                    # O cliente já fechou a conexão
+                    pass
+
+        while True:
+            try:
+                line = self.rfile.readline(MAX_MESSAGE_BYTES + 1)
+            except (ConnectionResetError, TimeoutError):
+                break
+            if not line:
+                break
+            if len(line) > MAX_MESSAGE_BYTES:
+                send(_error(None, INVALID_REQUEST, "Mensagem maior que o limite do daemon"))
+                break
+            if line.strip() and not daemon.dispatch(line, send, self.server.token):
+                # Quem não fala JSON-RPC (ou não tem o segredo) não recebe mais respostas
+                break
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+    class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+else:
+    _UnixServer = None
+
+
+class BinaryDaemon:
+    """
+    Servidor JSON-RPC com os interpretadores, o cache de traduções e o executor isolado.
+    """
+
+    def __init__(self, address: Optional[str] = None, workers: int = DEFAULT_WORKERS,
+                 max_pending: int = DEFAULT_MAX_PENDING, cache=None, runner=None):
+        """
+        Inicializa o daemon (os serviços são carregados em start).
+
+        Args:
+            address: Endereço de escuta (padrão: default_address())
+            workers: Threads que atendem os pedidos
+            max_pending: Pedidos em andamento (na fila ou em execução) antes de recusar novos
+            cache: TranslationCache usado (padrão: o cache compartilhado em disco)
+            runner: SandboxRunner usado em run (padrão: o executor compartilhado)
+        """
+        self.address = address or default_address()
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self.cache = cache
+        self.runner = runner
+        self.memory = None
+
+        self.stats = {"requests": 0, "rejected": 0, "errors": 0}
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._executor = None
+        self._server = None
+        self._token_file = None
+
+        self._methods = {name: getattr(self, f"rpc_{name}") for name in METHODS + CONTROL_METHODS}
+        self._signatures = {name: inspect.signature(method) for name, method in self._methods.items()}
+
+    def start(self):
+        """Carrega os serviços, aquece os interpretadores e abre o socket de escuta."""
+        try:
+            from ui.dialect_detector import DialectMemory
+            from ui.sandbox_runner import get_default_runner
+            from ui.translation_cache import get_default_cache
+        except ImportError:
+            from dialect_detector import DialectMemory
+            from sandbox_runner import get_default_runner
+            from translation_cache import get_default_cache
+
+        self.cache = self.cache or get_default_cache()
+        self.runner = self.runner or get_default_runner()
+        self.memory = DialectMemory()
+
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="binary-daemon",
+                                            initializer=self._router)
+        # Cada thread cria e aquece os seus interpretadores antes do primeiro pedido
+        for future in [self._executor.submit(self._router) for _ in range(self.workers)]:
+            future.result()
+
+        family, target = parse_address(self.address)
+        if family == socket.AF_INET:
+            if not ipaddress.ip_address(socket.gethostbyname(target[0])).is_loopback:
+                raise ValueError("O daemon aceita apenas conexões locais (127.0.0.1 ou ::1)")
+            self._server = _TCPServer(target, _ConnectionHandler)
+            # Qualquer processo local alcança a porta: só quem lê o arquivo do usuário envia pedidos
+            self._server.token = secrets.token_hex(32)
+            self._token_file = token_path(self._server.server_address[1])
+            try:
+                _write_token(self._token_file, self._server.token)
+            except OSError:
+                self._server.server_close()
+                raise
+        else:
+            self._remove_stale_socket(target)
+            # Só o próprio usuário pode enviar código para execução: o socket já é criado
+            # com permissão 0600, sem intervalo entre o bind e o chmod
+            previous = os.umask(0o177)
+            try:
+                self._server = _UnixServer(target, _ConnectionHandler)
+            finally:
+                os.umask(previous)
+            os.chmod(target, 0o600)
+            self._server.token = None
+        self._server.binary_daemon = self
+
+    def serve_forever(self):
+        """Atende conexões até shutdown."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._executor.shutdown(wait=True)
+            family, target = parse_address(self.address)
+            stale = self._token_file if family == socket.AF_INET else target
+            if stale:
+                try:
+                    os.unlink(stale)
+                except OSError:
+                    pass
+
+    def shutdown(self):
+        """Interrompe serve_forever (pode ser chamado de qualquer thread, exceto a do servidor)."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    @property
+    def server_address(self):
+        """Endereço efetivo de escuta (com a porta escolhida, se a porta pedida for 0)."""
+        return self._server.server_address if self._server is not None else None
+
+    def dispatch(self, line: bytes, send, token: Optional[str] = None) -> bool:
+        """
+        Atende uma mensagem recebida.
+
+        Args:
+            line: Pedido JSON-RPC codificado em UTF-8
+            send: Função chamada com a resposta (não é chamada para notificações)
+            token: Segredo exigido no campo "auth" do pedido (None se a conexão não exige)
+
+        Returns:
+            False se a mensagem não é um pedido JSON-RPC válido ou não tem o segredo
+            (a conexão deve ser encerrada)
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            send(_error(None, PARSE_ERROR, f"JSON inválido: {e}"))
+            return False
+
+        if (not isinstance(request, dict) or request.get("jsonrpc") != "2.0"
+                or not isinstance(request.get("method"), str)):
+            send(_error(None, INVALID_REQUEST, "O pedido deve ser um objeto JSON-RPC 2.0 com \"method\""))
+            return False
+
+        if token is not None:
+            auth = request.get("auth")
+            if not isinstance(auth, str) or not hmac.compare_digest(auth.encode("utf-8", "replace"),
+                                                                     token.encode("ascii")):
+                send(_error(request.get("id"), UNAUTHORIZED, "Segredo do daemon ausente ou inválido"))
+                return False
+
+        request_id = request.get("id")
+        notification = "id" not in request
+        reply = (lambda response: None) if notification else send
+        name = request["method"]
+        params = request.get("params") or {}
+
+        method = self._methods.get(name)
+        if method is None:
+            reply(_error(request_id, METHOD_NOT_FOUND, f"Método desconhecido: {name}"))
+            return True
+        if not isinstance(params, dict):
+            reply(_error(request_id, INVALID_PARAMS, "Os parâmetros devem ser passados por nome"))
+            return True
+        try:
+            self._signatures[name].bind(**params)
+        except TypeError as e:
+            reply(_error(request_id, INVALID_PARAMS, str(e)))
+            return True
+
+        if name in CONTROL_METHODS:
+            reply(self._call(request_id, method, params))
+            return True
+
+        with self._lock:
+            self.stats["requests"] += 1
+            if self._pending >= self.max_pending:
+                self.stats["rejected"] += 1
+                busy = True
+            else:
+                self._pending += 1
+                busy = False
+        if busy:
+            reply(_error(request_id, SERVER_BUSY, "Daemon ocupado, tente novamente",
+                         {"max_pending": self.max_pending}))
+            return True
+
+        def run():
+            try:
+                reply(self._call(request_id, method, params))
+            finally:
+                with self._lock:
+                    self._pending -= 1
+
+        self._executor.submit(run)
+        return True
+
+    def _call(self, request_id, method, params: Dict) -> Dict:
+        """Executa um método e monta a resposta (ou o erro) correspondente."""
+        try:
+            return _response(request_id, method(**params))
+        except SyntaxError as e:
+            return _error(request_id, SYNTAX_ERROR, str(e),
+                          {"message": e.msg, "line": e.lineno, "column": e.offset, "text": e.text})
+        except (ValueError, TypeError) as e:
+            return _error(request_id, INVALID_PARAMS, str(e))
+        except Exception as e:
+            with self._lock:
+                self.stats["errors"] += 1
+            return _error(request_id, INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+
+    def _router(self):
+        """
+        Retorna o DialectRouter da thread atual. Os interpretadores guardam estado
+        durante a tradução, então cada thread tem os seus (as tabelas dos dialetos
+        são compartilhadas pelo processo).
+        """
+        router = getattr(self._local, "router", None)
+        if router is None:
+            try:
+                from ui.binary_stream import ENGINES
+                from ui.dialect_detector import DialectRouter
+            except ImportError:
+                from binary_stream import ENGINES
+                from dialect_detector import DialectRouter
+
+            router = self._local.router = DialectRouter(memory=self.memory)
+            for dialect in ENGINES:
+                engine = router.engine(dialect)
+                engine.traduzir_binario("01100001")
+        return router
+
+    @staticmethod
+    def _remove_stale_socket(path: str):
+        """Remove o socket deixado por um daemon encerrado; recusa se outro daemon estiver ativo."""
+        _private_directory(os.path.dirname(os.path.abspath(path)))
+        if not os.path.exists(path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)
+            return
+        finally:
+            probe.close()
+        raise OSError(f"Já existe um daemon ativo em {path}")
+
+    # Métodos JSON-RPC
+
+    def rpc_translate(self, code: str, dialect: Optional[str] = None,
+                      filepath: Optional[str] = None) -> Dict:
+        """Traduz código binário (dialeto informado, guardado para o arquivo ou detectado)."""
+        dialect, engine = self._router().engine_for(code, filepath, dialect)
+        return {"dialect": dialect, "python": self.cache.translate(engine, code)}
+
+    def rpc_encode(self, text: str, dialect: str = "fixed") -> Dict:
+        """Converte texto em código binário no dialeto informado."""
+        dialect = dialect or "fixed"
+        _, engine = self._router().engine_for(text, None, dialect)
+        encode = getattr(engine, "parse_python_to_binary", None) or engine.converter_para_binario
+        return {"dialect": dialect, "binary": encode(text)}
+
+    def rpc_validate(self, code: str, dialect: Optional[str] = None,
+                     filepath: Optional[str] = None) -> Dict:
+        """Valida código binário com as regras do dialeto."""
+        router = self._router()
+        dialect, _ = router.engine_for(code, filepath, dialect)
+        valid, message = router.validate(code, filepath, dialect)
+        return {"dialect": dialect, "valid": valid, "message": message}
+
+    def rpc_run(self, code: str, dialect: Optional[str] = None, filepath: Optional[str] = None,
+                stdin: str = "", timeout: Optional[float] = 10.0) -> Dict:
+        """Compila (com o cache) e executa código binário no executor isolado."""
+        dialect, engine = self._router().engine_for(code, filepath, dialect)
+        compiled = self.cache.compile_binary(engine, code)
+        result = self.runner.run(compiled, stdin=stdin, timeout=timeout)
+        return {
+            "dialect": dialect,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+            "returncode": result.returncode,
+            "stop_reason": result.stop_reason,
+            "stop_message": result.stop_message(),
+            "truncated": result.truncated,
+            "duration": result.duration,
+        }
+
+    def rpc_ping(self) -> Dict:
+        """Confirma que o daemon está ativo."""
+        return {"pid": os.getpid()}
+
+    def rpc_stats(self) -> Dict:
+        """Contadores do daemon e do cache de traduções."""
+        with self._lock:
+            daemon = dict(self.stats, pending=self._pending)
+        daemon.update(workers=self.workers, max_pending=self.max_pending)
+        return {"daemon": daemon, "cache": self.cache.get_stats()}
+
+    def rpc_shutdown(self) -> bool:
+        """Encerra o daemon depois de responder."""
+        threading.Thread(target=self.shutdown, daemon=True).start()
+        return True
+
+
+class BinaryDaemonClient:
+    """
+    Cliente do daemon: uma conexão persistente e um pedido por vez.
+    """
+
+    def __init__(self, address: Optional[str] = None, timeout: Optional[float] = None,
+                 token: Optional[str] = None):
+        """
+        Conecta ao daemon.
+
+        Args:
+            address: Endereço do daemon (padrão: default_address())
+            timeout: Tempo limite de cada operação no socket, em segundos
+            token: Segredo de um daemon TCP (padrão: lido de token_path(porta))
+
+        Raises:
+            OSError: Se não houver daemon no endereço ou o segredo não puder ser lido
+        """
+        family, target = parse_address(address or default_address())
+        self._token = None
+        if family == socket.AF_INET:
+            if token is None:
+                with open(token_path(target[1]), "r", encoding="ascii") as stream:
+                    token = stream.read().strip()
+            self._token = token
+        self._socket = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            self._socket.settimeout(timeout)
+            self._socket.connect(target)
+            if family == socket.AF_INET:
+                self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            self._socket.close()
+            raise
+        self._reader = self._socket.makefile("rb")
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def call(self, method: str, **params):
+        """
+        Envia um pedido e espera a resposta.
+
+        Args:
+            method: Nome do método
+            **params: Parâmetros do método
+
+        Returns:
+            Resultado do método
+
+        Raises:
+            SyntaxError: Se o código não compilar (run)
+            DaemonError: Para os demais erros devolvidos pelo daemon
+            ConnectionError: Se o daemon fechar a conexão
+        """
+        with self._lock:
+            self._next_id += 1
+            request = {"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params}
+            if self._token is not None:
+                request["auth"] = self._token
+            self._socket.sendall(json.dumps(request, ensure_ascii=False).encode("utf-8", "surrogatepass") + b"\n")
+            line = self._reader.readline()
+        if not line:
+            raise ConnectionError("O daemon encerrou a conexão")
+
+        response = json.loads(line)
+        error = response.get("error")
+        if error is None:
+            return response.get("result")
+        data = error.get("data")
+        if error.get("code") == SYNTAX_ERROR and isinstance(data, dict):
+            raise SyntaxError(data.get("message"), ("<binario>", data.get("line"), data.get("column"),
+                                                    data.get("text")))
+        raise DaemonError(error.get("code", INTERNAL_ERROR), error.get("message", ""), data)
+
+    def translate(self, code: str, dialect: Optional[str] = None, filepath: Optional[str] = None) -> str:
+        """Traduz código binário e retorna o código Python."""
+        return self.call("translate", code=code, dialect=dialect, filepath=filepath)["python"]
+
+    def encode(self, text: str, dialect: str = "fixed") -> str:
+        """Converte texto em código binário."""
+        return self.call("encode", text=text, dialect=dialect)["binary"]
+
+    def validate(self, code: str, dialect: Optional[str] = None,
+                 filepath: Optional[str] = None) -> Tuple[bool, str]:
+        """Valida código binário e retorna (válido, mensagem de erro)."""
+        result = self.call("validate", code=code, dialect=dialect, filepath=filepath)
+        return result["valid"], result["message"]
+
+    def run(self, code: str, dialect: Optional[str] = None, filepath: Optional[str] = None,
+            stdin: str = "", timeout: Optional[float] = 10.0) -> Dict:
+        """Executa código binário e retorna saídas, código de saída e motivo da parada."""
+        return self.call("run", code=code, dialect=dialect, filepath=filepath, stdin=stdin, timeout=timeout)
+
+    def close(self):
+        """Fecha a conexão."""
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando.
+
+    Args:
+        argv: Argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        Código de saída
+    """
+    parser = argparse.ArgumentParser(description="Daemon de tradução e execução do The Collector Binarie")
+    parser.add_argument("command", choices=("serve",) + METHODS + ("stats", "stop"))
+    parser.add_argument("input", nargs="?", default="-", help="Arquivo de entrada ('-' para stdin)")
+    parser.add_argument("-a", "--address", default=None,
+                        help="Socket Unix ou host:porta (padrão: ~/.the_collector_binarie/daemon.sock)")
+    parser.add_argument("-d", "--dialect", default=None, help="Dialeto (padrão: detectado)")
+    parser.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Threads que atendem os pedidos (serve)")
+    parser.add_argument("-p", "--max-pending", type=int, default=DEFAULT_MAX_PENDING,
+                        help="Pedidos em andamento antes de recusar novos (serve)")
+    parser.add_argument("-t", "--timeout", type=float, default=10.0, help="Tempo limite de run, em segundos")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        daemon = BinaryDaemon(args.address, args.workers, args.max_pending)
+        daemon.start()
+        print(f"Daemon ouvindo em {daemon.server_address} ({daemon.workers} threads)", file=sys.stderr)
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    try:
+        client = BinaryDaemonClient(args.address)
+    except OSError as e:
+        print(f"Não foi possível conectar ao daemon: {e}", file=sys.stderr)
+        return 2
+
+    with client:
+        if args.command == "stats":
+            print(json.dumps(client.call("stats"), indent=2))
+            return 0
+        if args.command == "stop":
+            client.call("shutdown")
+            return 0
+
+        if args.command == "run" and args.input == "-":
+            parser.error("run lê a entrada do programa de stdin: informe o arquivo do código")
+        source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+        with source:
+            content = source.read()
+        filepath = None if args.input == "-" else os.path.abspath(args.input)
+
+        try:
+            if args.command == "translate":
+                sys.stdout.write(client.translate(content, args.dialect, filepath))
+            elif args.command == "encode":
+                sys.stdout.write(client.encode(content, args.dialect or "fixed"))
+            elif args.command == "validate":
+                valid, message = client.validate(content, args.dialect, filepath)
+                if not valid:
+                    print(message, file=sys.stderr)
+                    return 1
+            else:
+                result = client.run(content, args.dialect, filepath, sys.stdin.read(), args.timeout)
+                sys.stdout.write(result["stdout"])
+                sys.stderr.write(result["stderr"])
+                if result["stop_message"]:
+                    print(result["stop_message"], file=sys.stderr)
+                return result["returncode"] if isinstance(result["returncode"], int) else 1
+        except SyntaxError as e:
+            print(f"Erro de sintaxe na linha {e.lineno}, coluna {e.offset}: {e.msg}", file=sys.stderr)
+            return 1
+        except DaemonError as e:
+            print(f"Erro do daemon ({e.code}): {e}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
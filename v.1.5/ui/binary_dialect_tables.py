@@ -0,0 +1,727 @@
+"""
+Tabelas de tradução dos dialetos binários.
+Cada interpretador, o realce de sintaxe e o guia de referência usam um dialeto
+próprio; as tabelas ficam reunidas aqui e são lidas apenas pelo registro de
+codecs (binary_codec_registry), que constrói uma única vez por processo as
+estruturas compartilhadas por todos os componentes.
+"""
+
+# Dialeto dos interpretadores BinaryInterpreterFixed e BinaryInterpreterV2
+FIXED_TABLE = {
+    # Numerais
+    "00110000": "0",
+    "00110001": "1",
+    "00110010": "2",
+    "00110011": "3",
+    "00110100": "4",
+    "00110101": "5",
+    "00110110": "6",
+    "00110111": "7",
+    "00111000": "8",
+    "00111001": "9",
+
+    # Letras maiúsculas
+    "01000001": "A",
+    "01000010": "B",
+    "01000011": "C",
+    "01000100": "D",
+    "01000101": "E",
+    "01000110": "F",
+    "01000111": "G",
+    "01001000": "H",
+    "01001001": "I",
+    "01001010": "J",
+    "01001011": "K",
+    "01001100": "L",
+    "01001101": "M",
+    "01001110": "N",
+    "01001111": "O",
+    "01010000": "P",
+    "01010001": "Q",
+    "01010010": "R",
+    "01010011": "S",
+    "01010100": "T",
+    "01010101": "U",
+    "01010110": "V",
+    "01010111": "W",
+    "01011000": "X",
+    "01011001": "Y",
+    "01011010": "Z",
+
+    # Letras minúsculas
+    "01100001": "a",
+    "01100010": "b",
+    "01100011": "c",
+    "01100100": "d",
+    "01100101": "e",
+    "01100110": "f",
+    "01100111": "g",
+    "01101000": "h",
+    "01101001": "i",
+    "01101010": "j",
+    "01101011": "k",
+    "01101100": "l",
+    "01101101": "m",
+    "01101110": "n",
+    "01101111": "o",
+    "01110000": "p",
+    "01110001": "q",
+    "01110010": "r",
+    "01110011": "s",
+    "01110100": "t",
+    "01110101": "u",
+    "01110110": "v",
+    "01110111": "w",
+    "01111000": "x",
+    "01111001": "y",
+    "01111010": "z",
+
+    # Comandos e símbolos
+    "01111011": "var",
+    "01111100": "print",
+    "01111111": "\"",
+    "01111110": "input",
+    "10000000": "int",
+    "10000001": "float",
+    "10000010": "str",
+    "10000011": "if",
+    "10000100": "else",
+    "10000101": "while",
+    "10000110": "for",
+    "10000111": "def",
+    "10001000": "return",
+    "10001001": "=",
+    "10001010": "+",
+    "10001011": "-",
+    "10001100": "*",
+    "10001101": "/",
+    "10001110": "==",
+    "00101000": "(",
+    "00101001": ")",
+    "10010001": ":",
+    "10010010": "print()",  # print() completo
+    "00100000": " ",
+    "10010011": "_",
+    "10010100": "{",
+    "10010101": "}",
+    "10010110": "[",
+    "10010111": "]",
+    "10011000": "'",
+    "10011001": ",",
+    "10011010": ".",
+    "10011011": ";",
+    "10011100": "\\",
+    "10011101": "%",
+    "10011110": "!",
+    "10011111": "<",
+    "10100000": ">",
+    "10100001": "&",
+    "10100010": "|",
+    "00001010": "\n",  # Nova linha
+    "00001101": "\r",  # Retorno de carro
+    "00001001": "\t",  # Tab
+}
+
+# Dialeto do BinaryInterpreterEnhancedV2 (amplia o FIXED_TABLE com operadores compostos)
+ENHANCED_TABLE = {
+    # Numerais
+    "00110000": "0",
+    "00110001": "1",
+    "00110010": "2",
+    "00110011": "3",
+    "00110100": "4",
+    "00110101": "5",
+    "00110110": "6",
+    "00110111": "7",
+    "00111000": "8",
+    "00111001": "9",
+
+    # Letras maiúsculas
+    "01000001": "A",
+    "01000010": "B",
+    "01000011": "C",
+    "01000100": "D",
+    "01000101": "E",
+    "01000110": "F",
+    "01000111": "G",
+    "01001000": "H",
+    "01001001": "I",
+    "01001010": "J",
+    "01001011": "K",
+    "01001100": "L",
+    "01001101": "M",
+    "01001110": "N",
+    "01001111": "O",
+    "01010000": "P",
+    "01010001": "Q",
+    "01010010": "R",
+    "01010011": "S",
+    "01010100": "T",
+    "01010101": "U",
+    "01010110": "V",
+    "01010111": "W",
+    "01011000": "X",
+    "01011001": "Y",
+    "01011010": "Z",
+
+    # Letras minúsculas
+    "01100001": "a",
+    "01100010": "b",
+    "01100011": "c",
+    "01100100": "d",
+    "01100101": "e",
+    "01100110": "f",
+    "01100111": "g",
+    "01101000": "h",
+    "01101001": "i",
+    "01101010": "j",
+    "01101011": "k",
+    "01101100": "l",
+    "01101101": "m",
+    "01101110": "n",
+    "01101111": "o",
+    "01110000": "p",
+    "01110001": "q",
+    "01110010": "r",
+    "01110011": "s",
+    "01110100": "t",
+    "01110101": "u",
+    "01110110": "v",
+    "01110111": "w",
+    "01111000": "x",
+    "01111001": "y",
+    "01111010": "z",
+
+    # Comandos e palavras-chave Python
+    "01111011": "var",
+    "01111100": "print",
+    "01111111": "\"",
+    "01111110": "input",
+    "10000000": "int",
+    "10000001": "float",
+    "10000010": "str",
+    "10000011": "if",
+    "10000100": "else",
+    "10000101": "while",
+    "10000110": "for",
+    "10000111": "def",
+    "10001000": "return",
+    "10001001": "=",
+    "10001010": "+",
+    "10001011": "-",
+    "10001100": "*",
+    "10001101": "/",
+    "10001110": "==",
+    "10001111": "!=",
+    "10010000": "<=",
+    "10010001": ":",
+    "10010010": "print()",  # print() completo
+    "00100000": " ",
+    "10010011": "_",
+    "10010100": "{",
+    "10010101": "}",
+    "10010110": "[",
+    "10010111": "]",
+    "10011000": "'",
+    "10011001": ",",
+    "10011010": ".",
+    "10011011": ";",
+    "10011100": "\\",
+    "10011101": "%",
+    "10011110": "!",
+    "10011111": "<",
+    "10100000": ">",
+    "10100001": "&",
+    "10100010": "|",
+    "10100011": ">=",
+    "10100100": "and",
+    "10100101": "or",
+    "10100110": "not",
+    "10100111": "True",
+    "10101000": "False",
+    "10101001": "None",
+    "10101010": "in",
+    "10101011": "is",
+    "10101100": "class",
+    "10101101": "import",
+    "10101110": "from",
+    "10101111": "as",
+    "10110000": "try",
+    "10110001": "except",
+    "10110010": "finally",
+    "10110011": "raise",
+    "10110100": "with",
+    "10110101": "pass",
+    "10110110": "continue",
+    "10110111": "break",
+    "10111000": "global",
+    "10111001": "nonlocal",
+    "10111010": "lambda",
+    "10111011": "yield",
+    "10111100": "assert",
+    "10111101": "del",
+    "10111110": "elif",
+    "10111111": "async",
+    "11000000": "await",
+    "11000001": "**",  # Exponenciação
+    "11000010": "//",  # Divisão inteira
+    "11000011": "+=",
+    "11000100": "-=",
+    "11000101": "*=",
+    "11000110": "/=",
+    "11000111": "%=",
+    "11001000": "**=",
+    "11001001": "//=",
+    "11001010": "&=",
+    "11001011": "|=",
+    "11001100": "^=",
+    "11001101": ">>=",
+    "11001110": "<<=",
+    "11001111": "^",  # XOR
+    "11010000": "~",  # NOT bit a bit
+    "11010001": "<<",  # Shift left
+    "11010010": ">>",  # Shift right
+    "00001010": "\n",  # Nova linha
+    "00001101": "\r",  # Retorno de carro
+    "00001001": "\t",  # Tab
+}
+
+# Palavras-chave do BinarySyntaxParser (os caracteres ASCII restantes são
+# acrescentados pelo registro de codecs)
+PARSER_TABLE = {
+    # Dígitos
+    "00110000": "0", "00110001": "1", "00110010": "2", "00110011": "3",
+    "00110100": "4", "00110101": "5", "00110110": "6", "00110111": "7",
+    "00111000": "8", "00111001": "9",
+
+    # Letras maiúsculas
+    "01000001": "A", "01000010": "B", "01000011": "C", "01000100": "D",
+    "01000101": "E", "01000110": "F", "01000111": "G", "01001000": "H",
+    "01001001": "I", "01001010": "J", "01001011": "K", "01001100": "L",
+    "01001101": "M", "01001110": "N", "01001111": "O", "01010000": "P",
+    "01010001": "Q", "01010010": "R", "01010011": "S", "01010100": "T",
+    "01010101": "U", "01010110": "V", "01010111": "W", "01011000": "X",
+    "01011001": "Y", "01011010": "Z",
+
+    # Letras minúsculas
+    "01100001": "a", "01100010": "b", "01100011": "c", "01100100": "d",
+    "01100101": "e", "01100110": "f", "01100111": "g", "01101000": "h",
+    "01101001": "i", "01101010": "j", "01101011": "k", "01101100": "l",
+    "01101101": "m", "01101110": "n", "01101111": "o", "01110000": "p",
+    "01110001": "q", "01110010": "r", "01110011": "s", "01110100": "t",
+    "01110101": "u", "01110110": "v", "01110111": "w", "01111000": "x",
+    "01111001": "y", "01111010": "z",
+
+    # Caracteres especiais
+    "00100000": " ",     # Espaço
+    "00100001": "!",     # Ponto de exclamação
+    "00100010": "\"",    # Aspas duplas
+    "00100011": "#",     # Hashtag
+    "00100100": "$",     # Cifrão
+    "00100101": "%",     # Porcentagem
+    "00100110": "&",     # E comercial
+    "00100111": "'",     # Aspas simples
+    "00101000": "(",     # Parêntese aberto
+    "00101001": ")",     # Parêntese fechado
+    "00101010": "*",     # Asterisco
+    "00101011": "+",     # Mais
+    "00101100": ",",     # Vírgula
+    "00101101": "-",     # Hífen
+    "00101110": ".",     # Ponto
+    "00101111": "/",     # Barra
+    "00111010": ":",     # Dois pontos
+    "00111011": ";",     # Ponto e vírgula
+    "00111100": "<",     # Menor que
+    "00111101": "=",     # Igual
+    "00111110": ">",     # Maior que
+    "00111111": "?",     # Ponto de interrogação
+    "01000000": "@",     # Arroba
+    "01011011": "[",     # Colchete aberto
+    "01011100": "\\",    # Barra invertida
+    "01011101": "]",     # Colchete fechado
+    "01011110": "^",     # Circunflexo
+    "01011111": "_",     # Sublinhado
+    "01100000": "`",     # Crase
+    "01111011": "{",     # Chave aberta
+    "01111100": "|",     # Barra vertical
+    "01111101": "}",     # Chave fechada
+    "01111110": "~",     # Til
+
+    # Palavras-chave Python (expandidas)
+    "10000000": "and",
+    "10000001": "as",
+    "10000010": "assert",
+    "10000011": "async",
+    "10000100": "await",
+    "10000101": "break",
+    "10000110": "class",
+    "10000111": "continue",
+    "10001000": "def",
+    "10001001": "del",
+    "10001010": "elif",
+    "10001011": "else",
+    "10001100": "except",
+    "10001101": "False",
+    "10001110": "finally",
+    "10001111": "for",
+    "10010000": "from",
+    "10010001": "global",
+    "10010010": "if",
+    "10010011": "import",
+    "10010100": "in",
+    "10010101": "is",
+    "10010110": "lambda",
+    "10010111": "None",
+    "10011000": "nonlocal",
+    "10011001": "not",
+    "10011010": "or",
+    "10011011": "pass",
+    "10011100": "raise",
+    "10011101": "return",
+    "10011110": "True",
+    "10011111": "try",
+    "10100000": "while",
+    "10100001": "with",
+    "10100010": "yield",
+
+    # Funções comuns
+    "10100011": "print",
+    "10100100": "input",
+    "10100101": "len",
+    "10100110": "range",
+    "10100111": "int",
+    "10101000": "str",
+    "10101001": "float",
+    "10101010": "list",
+    "10101011": "dict",
+    "10101100": "set",
+    "10101101": "tuple",
+    "10101110": "sum",
+    "10101111": "min",
+    "10110000": "max",
+    "10110001": "sorted",
+    "10110010": "open",
+    "10110011": "read",
+    "10110100": "write",
+    "10110101": "append",
+    "10110110": "extend",
+    "10110111": "pop",
+    "10111000": "remove",
+    "10111001": "join",
+    "10111010": "split",
+    "10111011": "strip",
+    "10111100": "replace",
+    "10111101": "format",
+    "10111110": "enumerate",
+    "10111111": "zip",
+    "11000000": "map",
+    "11000001": "filter",
+    "11000010": "lambda",
+
+    # Operadores compostos
+    "11000011": "==",    # Igual a
+    "11000100": "!=",    # Diferente de
+    "11000101": "<=",    # Menor ou igual a
+    "11000110": ">=",    # Maior ou igual a
+    "11000111": "+=",    # Incremento
+    "11001000": "-=",    # Decremento
+    "11001001": "*=",    # Multiplicação e atribuição
+    "11001010": "/=",    # Divisão e atribuição
+    "11001011": "//",    # Divisão inteira
+    "11001100": "**",    # Potência
+    "11001101": "%=",    # Módulo e atribuição
+    "11001110": "//=",   # Divisão inteira e atribuição
+    "11001111": "**=",   # Potência e atribuição
+
+    # Comandos especiais da linguagem binária
+    "11010000": "BINSTART",  # Início de bloco binário
+    "11010001": "BINEND",    # Fim de bloco binário
+    "11010010": "BINVAR",    # Declaração de variável
+    "11010011": "BINFUNC",   # Declaração de função
+    "11010100": "BINIF",     # Estrutura condicional
+    "11010101": "BINELSE",   # Estrutura condicional (else)
+    "11010110": "BINLOOP",   # Estrutura de repetição
+    "11010111": "BINBREAK",  # Interromper loop
+    "11011000": "BINCONT",   # Continuar loop
+    "11011001": "BINRET",    # Retorno de função
+    "11011010": "BINPRINT",  # Impressão formatada
+    "11011011": "BININPUT",  # Entrada formatada
+    "11011100": "BINCOMMENT" # Comentário
+}
+
+# Dialeto do BinarioInterpreter
+BINARIO_TABLE = {
+    # Dígitos
+    "00110000": "0", "00110001": "1", "00110010": "2", "00110011": "3",
+    "00110100": "4", "00110101": "5", "00110110": "6", "00110111": "7",
+    "00111000": "8", "00111001": "9",
+
+    # Letras maiúsculas
+    "01000001": "A", "01000010": "B", "01000011": "C", "01000100": "D",
+    "01000101": "E", "01000110": "F", "01000111": "G", "01001000": "H",
+    "01001001": "I", "01001010": "J", "01001011": "K", "01001100": "L",
+    "01001101": "M", "01001110": "N", "01001111": "O", "01010000": "P",
+    "01010001": "Q", "01010010": "R", "01010011": "S", "01010100": "T",
+    "01010101": "U", "01010110": "V", "01010111": "W", "01011000": "X",
+    "01011001": "Y", "01011010": "Z",
+
+    # Letras minúsculas
+    "01100001": "a", "01100010": "b", "01100011": "c", "01100100": "d",
+    "01100101": "e", "01100110": "f", "01100111": "g", "01101000": "h",
+    "01101001": "i", "01101010": "j", "01101011": "k", "01101100": "l",
+    "01101101": "m", "01101110": "n", "01101111": "o", "01110000": "p",
+    "01110001": "q", "01110010": "r", "01110011": "s", "01110100": "t",
+    "01110101": "u", "01110110": "v", "01110111": "w", "01111000": "x",
+    "01111001": "y", "01111010": "z",
+
+    # Palavras-chave
+    "01111011": "var", "01111100": "print", "01111111": "\"", "01111110": "input",
+    "10000000": "int", "10000001": "float", "10000010": "str", "10000011": "if",
+    "10000100": "else", "10000101": "while", "10000110": "for", "10000111": "def",
+    "10001000": "return", "10001001": "=", "10001010": "+", "10001011": "-",
+    "10001100": "*", "10001101": "/", "10001110": "==", "00101000": "(",
+    "00101001": ")", "10010001": ":", "00100000": "espaco",
+    "10010011": "_",    # Underline (_)
+    "10010100": "{",    # Chave aberta ({)
+    "10010101": "}",    # Chave fechada (})
+    "10010110": "[",    # Colchete aberto ([)
+    "10010111": "]",    # Colchete fechado (])
+    "10011000": "'",    # Aspas simples (')
+    "10011001": ",",    # Vírgula (,)
+    "10011010": ".",    # Ponto final (.)
+    "10011011": ";",    # Ponto e vírgula (;)
+    "10011100": "\\",   # Barra invertida (\)
+    "10011101": "%",    # Módulo (%)
+    "10011110": "!",    # Exclamação (!)
+    "10011111": "<",    # Menor que (<)
+    "10100000": ">",    # Maior que (>)
+    "10100001": "&",    # Operador lógico (AND)
+    "10100010": "|",    # Operador lógico (OR)
+}
+
+# Palavras reconhecidas pelo BinarySyntaxHighlighter
+HIGHLIGHTER_TABLE = {
+    # Dígitos
+    "00110000": "0",
+    "00110001": "1",
+    "00110010": "2",
+    "00110011": "3",
+    "00110100": "4",
+    "00110101": "5",
+    "00110110": "6",
+    "00110111": "7",
+    "00111000": "8",
+    "00111001": "9",
+
+    # Letras maiúsculas
+    "01000001": "A",
+    "01000010": "B",
+    "01000011": "C",
+    "01000100": "D",
+    "01000101": "E",
+    "01000110": "F",
+    "01000111": "G",
+    "01001000": "H",
+    "01001001": "I",
+    "01001010": "J",
+    "01001011": "K",
+    "01001100": "L",
+    "01001101": "M",
+    "01001110": "N",
+    "01001111": "O",
+    "01010000": "P",
+    "01010001": "Q",
+    "01010010": "R",
+    "01010011": "S",
+    "01010100": "T",
+    "01010101": "U",
+    "01010110": "V",
+    "01010111": "W",
+    "01011000": "X",
+    "01011001": "Y",
+    "01011010": "Z",
+
+    # Letras minúsculas
+    "01100001": "a",
+    "01100010": "b",
+    "01100011": "c",
+    "01100100": "d",
+    "01100101": "e",
+    "01100110": "f",
+    "01100111": "g",
+    "01101000": "h",
+    "01101001": "i",
+    "01101010": "j",
+    "01101011": "k",
+    "01101100": "l",
+    "01101101": "m",
+    "01101110": "n",
+    "01101111": "o",
+    "01110000": "p",
+    "01110001": "q",
+    "01110010": "r",
+    "01110011": "s",
+    "01110100": "t",
+    "01110101": "u",
+    "01110110": "v",
+    "01110111": "w",
+    "01111000": "x",
+    "01111001": "y",
+    "01111010": "z",
+
+    # Palavras-chave
+    "01111011": "var",
+    "01111100": "print",
+    "01111111": "\"",
+    "01111110": "input",
+    "10000000": "int",
+    "10000001": "float",
+    "10000010": "str",
+    "10000011": "if",
+    "10000100": "else",
+    "10000101": "while",
+    "10000110": "for",
+    "10000111": "def",
+    "10001000": "return",
+    "10001001": "=",
+    "10001010": "+",
+    "10001011": "-",
+    "10001100": "*",
+    "10001101": "/",
+    "10001110": "==",
+    "10001111": "(",
+    "10010000": ")",
+    "10010001": ":",
+    "10010010": "print()",
+    "00100000": "espaco",
+    "10010011": "_",    # Underline (_)
+    "10010100": "{",    # Chave aberta ({)
+    "10010101": "}",    # Chave fechada (})
+    "10010110": "[",    # Colchete aberto ([)
+    "10010111": "]",    # Colchete fechado (])
+    "10011000": "'",    # Aspas simples (')
+    "10011001": ",",    # Vírgula (,)
+    "10011010": ".",    # Ponto final (.)
+    "10011011": ";",    # Ponto e vírgula (;)
+    "10011100": "\\",   # Barra invertida (\)
+    "10011101": "%",    # Módulo (%)
+    "10011110": "!",    # Exclamação (!)
+    "10011111": "<",    # Menor que (<)
+    "10100000": ">",    # Maior que (>)
+    "10100001": "&",    # Operador lógico (AND)
+    "10100010": "|"    # Operador lógico (OR)
+}
+
+# Guia de referência (BinaryReferenceGuide): categoria -> texto -> binário
+REFERENCE_TABLE = {
+    "Numerais ↓": {
+        "0": "00110000",
+        "1": "00110001",
+        "2": "00110010",
+        "3": "00110011",
+        "4": "00110100",
+        "5": "00110101",
+        "6": "00110110",
+        "7": "00110111",
+        "8": "00111000",
+        "9": "00111001"
+    },
+    "Letras Maiúsculas ↓": {
+        "A": "01000001",
+        "B": "01000010",
+        "C": "01000011",
+        "D": "01000100",
+        "E": "01000101",
+        "F": "01000110",
+        "G": "01000111",
+        "H": "01001000",
+        "I": "01001001",
+        "J": "01001010",
+        "K": "01001011",
+        "L": "01001100",
+        "M": "01001101",
+        "N": "01001110",
+        "O": "01001111",
+        "P": "01010000",
+        "Q": "01010001",
+        "R": "01010010",
+        "S": "01010011",
+        "T": "01010100",
+        "U": "01010101",
+        "V": "01010110",
+        "W": "01010111",
+        "X": "01011000",
+        "Y": "01011001",
+        "Z": "01011010"
+    },
+    "Letras Minúsculas ↓": {
+        "a": "01100001",
+        "b": "01100010",
+        "c": "01100011",
+        "d": "01100100",
+        "e": "01100101",
+        "f": "01100110",
+        "g": "01100111",
+        "h": "01101000",
+        "i": "01101001",
+        "j": "01101010",
+        "k": "01101011",
+        "l": "01101100",
+        "m": "01101101",
+        "n": "01101110",
+        "o": "01101111",
+        "p": "01110000",
+        "q": "01110001",
+        "r": "01110010",
+        "s": "01110011",
+        "t": "01110100",
+        "u": "01110101",
+        "v": "01110110",
+        "w": "01110111",
+        "x": "01111000",
+        "y": "01111001",
+        "z": "01111010"
+    },
+    "Comandos ↓": {
+        "var": "01111011",
+        "print": "01111100",
+        "\"": "01111111",
+        "input": "01111110",
+        "int": "10000000",
+        "float": "10000001",
+        "str": "10000010",
+        "if": "10000011",
+        "else": "10000100",
+        "while": "10000101",
+        "for": "10000110",
+        "def": "10000111",
+        "return": "10001000",
+        "=": "10001001",
+        "+": "10001010",
+        "-": "10001011",
+        "*": "10001100",
+        "/": "10001101",
+        "==": "10001110",
+        "(": "00101000",
+        ")": "00101001",
+        ":": "10010001",
+        "print()": "10010010",
+        "espaço": "00100000",
+        "_": "10010011",
+        "{": "10010100",
+        "}": "10010101",
+        "[": "10010110",
+        "]": "10010111",
+        "'": "10011000",
+        ",": "10011001",
+        ".": "10011010",
+        ";": "10011011",
+        "\\": "10011100",
+        "%": "10011101",
+        "!": "10011110",
+        "<": "10011111",
+        ">": "10100000",
+        "&": "10100001",
+        "|": "10100010"
+    }
+}
@@ -5,13 +5,157 @@ Esta versão amplia a biblioteca de códigos binários e corrige a tradução pa
 
 import re
 import sys
-import subprocess
-import tempfile
-import os
 import traceback
 from io import StringIO
 from contextlib import redirect_stdout, redirect_stderr
 
+try:
+    from ui.binary_codec_registry import get_dialect
+    from ui.binary_stream import DEFAULT_CHUNK_SIZE, iter_binary_segments, iter_text_segments
+    from ui.interpreter_pool import INTERACTIVE_TIMEOUT, get_default_pool
+    from ui.source_map import SourceMap
+except ImportError:
+    from binary_codec_registry import get_dialect
+    from binary_stream import DEFAULT_CHUNK_SIZE, iter_binary_segments, iter_text_segments
+    from interpreter_pool import INTERACTIVE_TIMEOUT, get_default_pool
+    from source_map import SourceMap
+
+
+class PythonCodeFormatter:
+    """
+    Formatador incremental de tokens traduzidos para código Python.
+    Guarda entre as chamadas o nível de indentação, o último trecho gerado
+    (que ainda pode receber espaço ou quebra de linha) e um token de antecipação,
+    permitindo formatar a saída em blocos sem acumular o código inteiro.
+    """
+
+    # Palavras-chave seguidas de espaço
+    BLOCK_KEYWORDS = {"if", "else", "elif", "for", "while", "def", "class", "try", "except", "finally", "with"}
+
+    # Palavras-chave que reduzem a indentação no início da linha
+    DEDENT_KEYWORDS = {"else", "elif", "except", "finally"}
+
+    def __init__(self, tokens_requiring_space, tokens_no_space_after, tokens_no_space_before):
+        """
+        Inicializa o formatador.
+
+        Args:
+            tokens_requiring_space: Tokens com espaço antes e depois
+            tokens_no_space_after: Tokens sem espaço depois
+            tokens_no_space_before: Tokens sem espaço antes
+        """
+        self.tokens_requiring_space = tokens_requiring_space
+        self.tokens_no_space_after = tokens_no_space_after
+        self.tokens_no_space_before = tokens_no_space_before
+        self.indent_str = "    "  # 4 espaços por nível de indentação
+        self.indent_level = 0
+        self._last = None
+        self._pending = None
+        # Se for uma lista, recebe a posição no código gerado de cada token formatado
+        self.offsets = None
+        self._written = 0
+
+    def feed(self, tokens):
+        """
+        Formata mais uma sequência de tokens.
+
+        Args:
+            tokens: Lista de tokens traduzidos
+
+        Returns:
+            Código Python já definitivo (o último trecho fica retido)
+        """
+        output = []
+        for token in tokens:
+            if self._pending is not None:
+                self._format_token(self._pending, token, output)
+            self._pending = token
+        return ''.join(output)
+
+    def finish(self):
+        """
+        Encerra a formatação.
+
+        Returns:
+            Código Python restante
+        """
+        output = []
+        if self._pending is not None:
+            self._format_token(self._pending, None, output)
+            self._pending = None
+        if self._last is not None:
+            output.append(self._last)
+            self._last = None
+        return ''.join(output)
+
+    def _format_token(self, token, next_token, output):
+        """
+        Formata um token.
+
+        Args:
+            token: Token a formatar
+            next_token: Token seguinte (None se for o último)
+            output: Lista que recebe os trechos definitivos
+        """
+        last = self._last
+        first_part = len(output)
+
+        # Adiciona indentação no início da linha
+        if last is None or last.endswith('\n'):
+            if last is not None:
+                output.append(last)
+            last = self.indent_str * self.indent_level
+
+        # Verifica se é uma palavra-chave que inicia um bloco
+        if token in self.BLOCK_KEYWORDS:
+            output.append(last)
+            last = token + " "
+
+        # Verifica se é um token que requer espaço antes e depois
+        elif token in self.tokens_requiring_space:
+            if not last.endswith(' '):
+                last += " "
+            output.append(last)
+            last = token + " "
+
+        # Verifica se é um token que não deve ter espaço após
+        elif token in self.tokens_no_space_after:
+            output.append(last)
+            last = token
+
+        # Verifica se é um token que não deve ter espaço antes
+        elif token in self.tokens_no_space_before:
+            if last.endswith(' '):
+                last = last[:-1]
+            output.append(last)
+            last = token
+
+            # Adiciona espaço após vírgula
+            if token == ",":
+                last += " "
+
+        # Quebra de linha e caso padrão
+        else:
+            output.append(last)
+            last = token
+
+        # O token começa o trecho ainda retido, logo após o que já foi entregue
+        if self.offsets is not None:
+            self._written += sum(len(part) for part in output[first_part:])
+            self.offsets.append(self._written)
+
+        # Ajusta o nível de indentação
+        if token == ":" and next_token is not None:
+            # Aumenta a indentação após ':'
+            self.indent_level += 1
+            last += "\n"
+        elif token == "\n" and next_token in self.DEDENT_KEYWORDS:
+            # O próximo token reduz a indentação
+            self.indent_level = max(0, self.indent_level - 1)
+
+        self._last = last
+
+
 class BinaryInterpreterEnhancedV2:
     """
     Interpretador aprimorado para código binário com suporte a interatividade,
@@ -20,172 +164,18 @@ class BinaryInterpreterEnhancedV2:
     
     def __init__(self):
         """Inicializa o interpretador binário."""
-        # Dicionário de tradução binário -> texto
-        self.binary_to_text = {
-            # Numerais
-            "00110000": "0",
-            "00110001": "1",
-            "00110010": "2",
-            "00110011": "3",
-            "00110100": "4",
-            "00110101": "5",
-            "00110110": "6",
-            "00110111": "7",
-            "00111000": "8",
-            "00111001": "9",
-            
-            # Letras maiúsculas
-            "01000001": "A",
-            "01000010": "B",
-            "01000011": "C",
-            "01000100": "D",
-            "01000101": "E",
-            "01000110": "F",
-            "01000111": "G",
-            "01001000": "H",
-            "01001001": "I",
-            "01001010": "J",
-            "01001011": "K",
-            "01001100": "L",
-            "01001101": "M",
-            "01001110": "N",
-            "01001111": "O",
-            "01010000": "P",
-            "01010001": "Q",
-            "01010010": "R",
-            "01010011": "S",
-            "01010100": "T",
-            "01010101": "U",
-            "01010110": "V",
-            "01010111": "W",
-            "01011000": "X",
-            "01011001": "Y",
-            "01011010": "Z",
-            
-            # Letras minúsculas
-            "01100001": "a",
-            "01100010": "b",
-            "01100011": "c",
-            "01100100": "d",
-            "01100101": "e",
-            "01100110": "f",
-            "01100111": "g",
-            "01101000": "h",
-            "01101001": "i",
-            "01101010": "j",
-            "01101011": "k",
-            "01101100": "l",
-            "01101101": "m",
-            "01101110": "n",
-            "01101111": "o",
-            "01110000": "p",
-            "01110001": "q",
-            "01110010": "r",
-            "01110011": "s",
-            "01110100": "t",
-            "01110101": "u",
-            "01110110": "v",
-            "01110111": "w",
-            "01111000": "x",
-            "01111001": "y",
-            "01111010": "z",
-            
-            # Comandos e palavras-chave Python
-            "01111011": "var",
-            "01111100": "print",
-            "01111111": "\"",
-            "01111110": "input",
-            "10000000": "int",
-            "10000001": "float",
-            "10000010": "str",
-            "10000011": "if",
-            "10000100": "else",
-            "10000101": "while",
-            "10000110": "for",
-            "10000111": "def",
-            "10001000": "return",
-            "10001001": "=",
-            "10001010": "+",
-            "10001011": "-",
-            "10001100": "*",
-            "10001101": "/",
-            "10001110": "==",
-            "10001111": "!=",
-            "10010000": "<=",
-            "10010001": ":",
-            "10010010": "print()",  # print() completo
-            "00100000": " ",
-            "10010011": "_",
-            "10010100": "{",
-            "10010101": "}",
-            "10010110": "[",
-            "10010111": "]",
-            "10011000": "'",
-            "10011001": ",",
-            "10011010": ".",
-            "10011011": ";",
-            "10011100": "\\",
-            "10011101": "%",
-            "10011110": "!",
-            "10011111": "<",
-            "10100000": ">",
-            "10100001": "&",
-            "10100010": "|",
-            "10100011": ">=",
-            "10100100": "and",
-            "10100101": "or",
-            "10100110": "not",
-            "10100111": "True",
-            "10101000": "False",
-            "10101001": "None",
-            "10101010": "in",
-            "10101011": "is",
-            "10101100": "class",
-            "10101101": "import",
-            "10101110": "from",
-            "10101111": "as",
-            "10110000": "try",
-            "10110001": "except",
-            "10110010": "finally",
-            "10110011": "raise",
-            "10110100": "with",
-            "10110101": "pass",
-            "10110110": "continue",
-            "10110111": "break",
-            "10111000": "global",
-            "10111001": "nonlocal",
-            "10111010": "lambda",
-            "10111011": "yield",
-            "10111100": "assert",
-            "10111101": "del",
-            "10111110": "elif",
-            "10111111": "async",
-            "11000000": "await",
-            "11000001": "**",  # Exponenciação
-            "11000010": "//",  # Divisão inteira
-            "11000011": "+=",
-            "11000100": "-=",
-            "11000101": "*=",
-            "11000110": "/=",
-            "11000111": "%=",
-            "11001000": "**=",
-            "11001001": "//=",
-            "11001010": "&=",
-            "11001011": "|=",
-            "11001100": "^=",
-            "11001101": ">>=",
-            "11001110": "<<=",
-            "11001111": "^",  # XOR
-            "11010000": "~",  # NOT bit a bit
-            "11010001": "<<",  # Shift left
-            "11010010": ">>",  # Shift right
-            "00001010": "\n",  # Nova linha
-            "00001101": "\r",  # Retorno de carro
-            "00001001": "\t",  # Tab
-        }
+        # Dialeto compartilhado (tabelas construídas uma única vez por processo)
+        self.codec = get_dialect("enhanced")
         
-        # Dicionário inverso texto -> binário
-        self.text_to_binary = {v: k for k, v in self.binary_to_text.items()}
+        # Dicionários de tradução binário -> texto e texto -> binário (somente leitura)
+        self.binary_to_text = self.codec.binary_to_text
+        self.text_to_binary = self.codec.text_to_binary
+        
+        # Decodificador por tabela (256 entradas) compartilhado pelo dialeto
+        self.decoder = self.codec.decoder()
+
+        # Codificador por trie (correspondência mais longa) compartilhado pelo dialeto
+        self.encoder = self.codec.text_encoder()
         
         # Tokens que precisam de espaço antes e depois na tradução
         self.tokens_requiring_space = {
@@ -224,99 +214,70 @@ class BinaryInterpreterEnhancedV2:
         Returns:
             Texto Python válido
         """
-        # Normaliza o código binário
-        binary_code = self._normalize_binary(binary_code)
-        
-        # Divide o código em tokens de 8 bits
-        tokens = self._tokenize_binary(binary_code)
-        
-        # Traduz cada token
-        translated_tokens = []
-        for token in tokens:
-            if token in self.binary_to_text:
-                translated_tokens.append(self.binary_to_text[token])
-            elif self.binary_pattern.match(token):
-                # Token binário válido, mas não reconhecido
-                translated_tokens.append(f"<{token}>")
-            else:
-                # Não é um token binário válido
-                translated_tokens.append(token)
+        # Normaliza, divide em tokens de 8 bits e traduz em bloco pela tabela
+        translated_tokens = self.decoder.decode_tokens(binary_code)
         
         # Formata o código Python para garantir espaçamento correto
         return self._format_python_code(translated_tokens)
-    
+
+    def traduzir_binario_com_mapa(self, binary_code):
+        """
+        Traduz código binário para texto Python junto com o mapa de origem da tradução.
+
+        Args:
+            binary_code: Código binário a ser traduzido
+
+        Returns:
+            Tupla (texto Python, SourceMap entre o texto e o código binário)
+        """
+        tokens, offsets = self.decoder.decode_tokens_with_offsets(binary_code)
+        formatter = self._create_formatter()
+        formatter.offsets = []
+        python_code = formatter.feed(tokens) + formatter.finish()
+        return python_code, SourceMap(python_code, binary_code, formatter.offsets, offsets)
+
+    def traduzir_binario_stream(self, fileobj, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Traduz código binário para texto Python em fluxo, bloco a bloco.
+        A indentação e o último trecho formatado são mantidos entre os blocos.
+
+        Args:
+            fileobj: Arquivo de texto contendo código binário
+            chunk_size: Quantidade de caracteres lidos por vez
+
+        Yields:
+            Trechos consecutivos do código Python formatado
+        """
+        formatter = self._create_formatter()
+        for segment in iter_binary_segments(fileobj, chunk_size):
+            text = formatter.feed(self.decoder.decode_tokens(segment))
+            if text:
+                yield text
+
+        text = formatter.finish()
+        if text:
+            yield text
+
+    def _create_formatter(self):
+        """Cria um formatador incremental com as regras de espaçamento do interpretador."""
+        return PythonCodeFormatter(
+            self.tokens_requiring_space,
+            self.tokens_no_space_after,
+            self.tokens_no_space_before
+        )
+
     def _format_python_code(self, tokens):
         """
         Formata tokens traduzidos para código Python válido.
-        
+
         Args:
             tokens: Lista de tokens traduzidos
-            
+
         Returns:
             Código Python formatado
         """
-        formatted_code = []
-        indent_level = 0
-        indent_str = "    "  # 4 espaços por nível de indentação
-        
-        i = 0
-        while i < len(tokens):
-            token = tokens[i]
-            
-            # Adiciona indentação no início da linha
-            if i == 0 or formatted_code[-1].endswith('\n'):
-                formatted_code.append(indent_str * indent_level)
-            
-            # Verifica se é uma palavra-chave que inicia um bloco
-            if token in ["if", "else", "elif", "for", "while", "def", "class", "try", "except", "finally", "with"]:
-                # Adiciona espaço após a palavra-chave
-                formatted_code.append(token + " ")
-            
-            # Verifica se é um token que requer espaço antes e depois
-            elif token in self.tokens_requiring_space:
-                # Verifica se já tem espaço antes
-                if not formatted_code[-1].endswith(' '):
-                    formatted_code[-1] += " "
-                formatted_code.append(token + " ")
-            
-            # Verifica se é um token que não deve ter espaço após
-            elif token in self.tokens_no_space_after:
-                formatted_code.append(token)
-            
-            # Verifica se é um token que não deve ter espaço antes
-            elif token in self.tokens_no_space_before:
-                # Remove espaço antes se existir
-                if formatted_code[-1].endswith(' '):
-                    formatted_code[-1] = formatted_code[-1][:-1]
-                formatted_code.append(token)
-                
-                # Adiciona espaço após vírgula
-                if token == ",":
-                    formatted_code[-1] += " "
-            
-            # Verifica se é uma quebra de linha
-            elif token == "\n":
-                formatted_code.append(token)
-            
-            # Caso padrão
-            else:
-                formatted_code.append(token)
-            
-            # Ajusta o nível de indentação
-            if token == ":" and i < len(tokens) - 1:
-                # Aumenta a indentação após ':'
-                indent_level += 1
-                formatted_code[-1] += "\n"
-            elif token == "\n" and i < len(tokens) - 1:
-                # Verifica se o próximo token é uma palavra-chave que reduz a indentação
-                next_token = tokens[i+1]
-                if next_token in ["else", "elif", "except", "finally"]:
-                    indent_level = max(0, indent_level - 1)
-            
-            i += 1
-        
-        # Junta todos os tokens formatados
-        return ''.join(formatted_code)
+        formatter = self._create_formatter()
+        return formatter.feed(tokens) + formatter.finish()
     
     def converter_para_binario(self, text):
         """
@@ -328,44 +289,27 @@ class BinaryInterpreterEnhancedV2:
         Returns:
             Código binário
         """
-        # Tratamento especial para print() e input()
-        # Substitui print() pelo token específico
-        text = text.replace("print()", " print() ")
-        
-        # Trata print com argumentos: print("texto") -> print ( "texto" )
-        # Isso garante que cada parte seja tokenizada separadamente
-        text = re.sub(r'print\(', 'print ( ', text)
-        
-        # Trata input com argumentos: input("texto") -> input ( "texto" )
-        text = re.sub(r'input\(', 'input ( ', text)
-        
-        # Garante espaços ao redor de parênteses e outros símbolos
-        for symbol in ['(', ')', ',', '+', '-', '*', '/', '=', '<', '>', ':', ';']:
-            text = text.replace(symbol, f' {symbol} ')
-        
-        # Normaliza espaços
-        text = ' '.join(text.split())
-        
-        # Converte cada token para binário
-        tokens = text.split()
-        binary_tokens = []
-        
-        for token in tokens:
-            # Verifica se é um token especial
-            if token == "print()":
-                binary_tokens.append(self.text_to_binary["print()"])
-            elif token in self.text_to_binary:
-                binary_tokens.append(self.text_to_binary[token])
-            else:
-                # Para tokens não reconhecidos, converte caractere por caractere
-                for char in token:
-                    if char in self.text_to_binary:
-                        binary_tokens.append(self.text_to_binary[char])
-                    else:
-                        # Caractere não reconhecido
-                        binary_tokens.append(f"<{char}>")
-        
-        return ' '.join(binary_tokens)
+        # Uma única passada: palavras-chave e operadores pela correspondência mais longa
+        # ("**=", ">>=", "print()"), strings literais inteiras e o resto caractere a caractere
+        return self.encoder.encode(text)
+
+    def converter_para_binario_stream(self, fileobj, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Converte texto para código binário em fluxo, bloco a bloco.
+
+        Args:
+            fileobj: Arquivo de texto
+            chunk_size: Quantidade de caracteres lidos por vez
+
+        Yields:
+            Trechos consecutivos do código binário
+        """
+        separator = ""
+        for segment in iter_text_segments(fileobj, chunk_size):
+            binary = self.converter_para_binario(segment)
+            if binary:
+                yield separator + binary
+                separator = " "
     
     def validar_codigo_binario(self, binary_code):
         """
@@ -469,5 +413,137 @@ class BinaryInterpreterEnhancedV2:
                 current_token += char
                 if len(current_token) == 8:
                     tokens.append(current_token)
+                    current_token = ""
+            elif char in ' \n':
+                # Finaliza o token atual se necessário
+                if current_token:
+                    tokens.append(current_token)
+                    current_token = ""
                 
-(Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
+                # Adiciona quebra de linha como token especial
+                if char == '\n':
+                    tokens.append("00001010")  # \n em binário
+        
+        # Adiciona o último token se houver
+        if current_token:
+            tokens.append(current_token)
+        
+        return tokens
+    
+    def _execute_python_code(self, python_code, interactive=True):
+        """
+        Executa código Python de forma segura.
+        
+        Args:
+            python_code: Código Python a ser executado
+            interactive: Se True, permite interatividade (input/output)
+            
+        Returns:
+            Resultado da execução
+        """
+        if interactive:
+            # Execução interativa (permite input/output)
+            return self._execute_interactive(python_code)
+        else:
+            # Execução não interativa (captura saída)
+            return self._execute_non_interactive(python_code)
+    
+    def _execute_interactive(self, python_code):
+        """
+        Executa código Python de forma interativa.
+        
+        Args:
+            python_code: Código Python a ser executado
+            
+        Returns:
+            Resultado da execução
+        """
+        try:
+            # Executa o código em um interpretador pré-iniciado (sem arquivo temporário)
+            result = get_default_pool().run(python_code, timeout=INTERACTIVE_TIMEOUT)
+            
+            # Combina stdout e stderr
+            output = result.combined_output()
+            if result.timed_out:
+                output += f"\nErro: A execução excedeu o tempo limite de {INTERACTIVE_TIMEOUT:.0f} segundos."
+            elif result.crashed:
+                output += f"\nErro: O processo de execução terminou inesperadamente (código {result.returncode})."
+            
+            return output
+        
+        except SyntaxError as e:
+            return "\n--- Erros ---\n" + "".join(traceback.format_exception_only(type(e), e))
+        
+        except Exception as e:
+            return f"Erro ao executar o código: {str(e)}"
+    
+    def _execute_non_interactive(self, python_code):
+        """
+        Executa código Python de forma não interativa.
+        
+        Args:
+            python_code: Código Python a ser executado
+            
+        Returns:
+            Resultado da execução
+        """
+        # Captura stdout e stderr
+        stdout_buffer = StringIO()
+        stderr_buffer = StringIO()
+        
+        try:
+            # Redireciona stdout e stderr
+            with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
+                # Executa o código
+                exec(python_code, {'__builtins__': __builtins__}, {})
+            
+            # Obtém a saída
+            stdout = stdout_buffer.getvalue()
+            stderr = stderr_buffer.getvalue()
+            
+            # Combina stdout e stderr
+            output = stdout
+            if stderr:
+                output += f"\n--- Erros ---\n{stderr}"
+            
+            return output
+        
+        except Exception as e:
+            # Captura o traceback
+            tb = traceback.format_exc()
+            return f"Erro ao executar o código:\n{tb}"
+        
+        finally:
+            # Fecha os buffers
+            stdout_buffer.close()
+            stderr_buffer.close()
+    
+    def get_binary_commands(self):
+        """
+        Obtém a lista de comandos binários disponíveis.
+        
+        Returns:
+            Dicionário com comandos binários
+        """
+        # Agrupa os comandos por categoria
+        commands = {
+            "Numerais": {},
+            "Letras Maiúsculas": {},
+            "Letras Minúsculas": {},
+            "Comandos": {},
+            "Símbolos": {}
+        }
+        
+        for binary, text in self.binary_to_text.items():
+            if text.isdigit():
+                commands["Numerais"][text] = binary
+            elif text.isupper() and text.isalpha():
+                commands["Letras Maiúsculas"][text] = binary
+            elif text.islower() and text.isalpha():
+                commands["Letras Minúsculas"][text] = binary
+            elif len(text) > 1:
+                commands["Comandos"][text] = binary
+            else:
+                commands["Símbolos"][text] = binary
+        
+        return commands
@@ -5,13 +5,21 @@ Esta versão corrige problemas na tradução de comandos como print() e input().
 
 import re
 import sys
-import subprocess
-import tempfile
-import os
 import traceback
 from io import StringIO
 from contextlib import redirect_stdout, redirect_stderr
 
+try:
+    from ui.binary_codec_registry import get_dialect
+    from ui.binary_stream import DEFAULT_CHUNK_SIZE, iter_binary_segments, iter_text_segments
+    from ui.interpreter_pool import INTERACTIVE_TIMEOUT, get_default_pool
+    from ui.source_map import SourceMap
+except ImportError:
+    from binary_codec_registry import get_dialect
+    from binary_stream import DEFAULT_CHUNK_SIZE, iter_binary_segments, iter_text_segments
+    from interpreter_pool import INTERACTIVE_TIMEOUT, get_default_pool
+    from source_map import SourceMap
+
 class BinaryInterpreterFixed:
     """
     Interpretador aprimorado para código binário com suporte a interatividade
@@ -20,124 +28,15 @@ class BinaryInterpreterFixed:
     
     def __init__(self):
         """Inicializa o interpretador binário."""
-        # Dicionário de tradução binário -> texto
-        self.binary_to_text = {
-            # Numerais
-            "00110000": "0",
-            "00110001": "1",
-            "00110010": "2",
-            "00110011": "3",
-            "00110100": "4",
-            "00110101": "5",
-            "00110110": "6",
-            "00110111": "7",
-            "00111000": "8",
-            "00111001": "9",
-            
-            # Letras maiúsculas
-            "01000001": "A",
-            "01000010": "B",
-            "01000011": "C",
-            "01000100": "D",
-            "01000101": "E",
-            "01000110": "F",
-            "01000111": "G",
-            "01001000": "H",
-            "01001001": "I",
-            "01001010": "J",
-            "01001011": "K",
-            "01001100": "L",
-            "01001101": "M",
-            "01001110": "N",
-            "01001111": "O",
-            "01010000": "P",
-            "01010001": "Q",
-            "01010010": "R",
-            "01010011": "S",
-            "01010100": "T",
-            "01010101": "U",
-            "01010110": "V",
-            "01010111": "W",
-            "01011000": "X",
-            "01011001": "Y",
-            "01011010": "Z",
-            
-            # Letras minúsculas
-            "01100001": "a",
-            "01100010": "b",
-            "01100011": "c",
-            "01100100": "d",
-            "01100101": "e",
-            "01100110": "f",
-            "01100111": "g",
-            "01101000": "h",
-            "01101001": "i",
-            "01101010": "j",
-            "01101011": "k",
-            "01101100": "l",
-            "01101101": "m",
-            "01101110": "n",
-            "01101111": "o",
-            "01110000": "p",
-            "01110001": "q",
-            "01110010": "r",
-            "01110011": "s",
-            "01110100": "t",
-            "01110101": "u",
-            "01110110": "v",
-            "01110111": "w",
-            "01111000": "x",
-            "01111001": "y",
-            "01111010": "z",
-            
-            # Comandos e símbolos
-            "01111011": "var",
-            "01111100": "print",
-            "01111111": "\"",
-            "01111110": "input",
-            "10000000": "int",
-            "10000001": "float",
-            "10000010": "str",
-            "10000011": "if",
-            "10000100": "else",
-            "10000101": "while",
-            "10000110": "for",
-            "10000111": "def",
-            "10001000": "return",
-            "10001001": "=",
-            "10001010": "+",
-            "10001011": "-",
-            "10001100": "*",
-            "10001101": "/",
-            "10001110": "==",
-            "00101000": "(",
-            "00101001": ")",
-            "10010001": ":",
-            "10010010": "print()",  # print() completo
-            "00100000": " ",
-            "10010011": "_",
-            "10010100": "{",
-            "10010101": "}",
-            "10010110": "[",
-            "10010111": "]",
-            "10011000": "'",
-            "10011001": ",",
-            "10011010": ".",
-            "10011011": ";",
-            "10011100": "\\",
-            "10011101": "%",
-            "10011110": "!",
-            "10011111": "<",
-            "10100000": ">",
-            "10100001": "&",
-            "10100010": "|",
-            "00001010": "\n",  # Nova linha
-            "00001101": "\r",  # Retorno de carro
-            "00001001": "\t",  # Tab
-        }
+        # Dialeto compartilhado (tabelas construídas uma única vez por processo)
+        self.codec = get_dialect("fixed")
+        
+        # Dicionários de tradução binário -> texto e texto -> binário (somente leitura)
+        self.binary_to_text = self.codec.binary_to_text
+        self.text_to_binary = self.codec.text_to_binary
         
-        # Dicionário inverso texto -> binário
-        self.text_to_binary = {v: k for k, v in self.binary_to_text.items()}
+        # Decodificador por tabela (256 entradas) compartilhado pelo dialeto
+        self.decoder = self.codec.decoder()
         
         # Expressões regulares para validação
         self.binary_pattern = re.compile(r'^[01]{8}$')
@@ -153,26 +52,57 @@ class BinaryInterpreterFixed:
         Returns:
             Texto traduzido
         """
-        # Normaliza o código binário
-        binary_code = self._normalize_binary(binary_code)
-        
-        # Divide o código em tokens de 8 bits
-        tokens = self._tokenize_binary(binary_code)
-        
-        # Traduz cada token
-        translated = []
-        for token in tokens:
-            if token in self.binary_to_text:
-                translated.append(self.binary_to_text[token])
-            elif self.binary_pattern.match(token):
-                # Token binário válido, mas não reconhecido
-                translated.append(f"<{token}>")
-            else:
-                # Não é um token binário válido
-                translated.append(token)
-        
-        return ''.join(translated)
-    
+        # Normaliza, divide em tokens de 8 bits e traduz em bloco pela tabela
+        return self.decoder.decode(binary_code)
+
+    def traduzir_binario_com_mapa(self, binary_code):
+        """
+        Traduz código binário para texto junto com o mapa de origem da tradução.
+
+        Args:
+            binary_code: Código binário a ser traduzido
+
+        Returns:
+            Tupla (texto traduzido, SourceMap entre o texto e o código binário)
+        """
+        tokens, offsets = self.decoder.decode_tokens_with_offsets(binary_code)
+        source_map = SourceMap.from_tokens(tokens, offsets, binary_code)
+        return source_map.python_code, source_map
+
+    def traduzir_binario_stream(self, fileobj, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Traduz código binário para texto em fluxo, bloco a bloco.
+
+        Args:
+            fileobj: Arquivo de texto contendo código binário
+            chunk_size: Quantidade de caracteres lidos por vez
+
+        Yields:
+            Trechos consecutivos do texto traduzido
+        """
+        for segment in iter_binary_segments(fileobj, chunk_size):
+            text = self.decoder.decode(segment)
+            if text:
+                yield text
+
+    def converter_para_binario_stream(self, fileobj, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Converte texto para código binário em fluxo, bloco a bloco.
+
+        Args:
+            fileobj: Arquivo de texto
+            chunk_size: Quantidade de caracteres lidos por vez
+
+        Yields:
+            Trechos consecutivos do código binário
+        """
+        separator = ""
+        for segment in iter_text_segments(fileobj, chunk_size):
+            binary = self.converter_para_binario(segment)
+            if binary:
+                yield separator + binary
+                separator = " "
+
     def converter_para_binario(self, text):
         """
         Converte texto para código binário.
@@ -369,42 +299,24 @@ class BinaryInterpreterFixed:
         Returns:
             Resultado da execução
         """
-        # Cria um arquivo temporário com o código
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as temp_file:
-            temp_file.write(python_code)
-            temp_path = temp_file.name
-        
         try:
-            # Executa o código em um processo separado
-            process = subprocess.Popen(
-                [sys.executable, temp_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                stdin=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            # Captura a saída
-            stdout, stderr = process.communicate()
+            # Executa o código em um interpretador pré-iniciado (sem arquivo temporário)
+            result = get_default_pool().run(python_code, timeout=INTERACTIVE_TIMEOUT)
             
             # Combina stdout e stderr
-            output = stdout
-            if stderr:
-                output += f"\n--- Erros ---\n{stderr}"
+            output = result.combined_output()
+            if result.timed_out:
+                output += f"\nErro: A execução excedeu o tempo limite de {INTERACTIVE_TIMEOUT:.0f} segundos."
+            elif result.crashed:
+                output += f"\nErro: O processo de execução terminou inesperadamente (código {result.returncode})."
             
             return output
         
+        except SyntaxError as e:
+            return "\n--- Erros ---\n" + "".join(traceback.format_exception_only(type(e), e))
+        
         except Exception as e:
             return f"Erro ao executar o código: {str(e)}"
-        
-        finally:
-            # Remove o arquivo temporário
-            try:
-                os.unlink(temp_path)
-            except:
-                pass
     
     def _execute_non_interactive(self, python_code):
         """
@@ -13,6 +13,13 @@ import traceback
 from io import StringIO
 from contextlib import redirect_stdout, redirect_stderr
 
+try:
+    from ui.binary_codec_registry import get_dialect
+    from ui.source_map import SourceMap
+except ImportError:
+    from binary_codec_registry import get_dialect
+    from source_map import SourceMap
+
 class BinaryInterpreterV2:
     """
     Interpretador aprimorado para código binário com suporte a interatividade
@@ -21,140 +28,12 @@ class BinaryInterpreterV2:
     
     def __init__(self):
         """Inicializa o interpretador binário."""
-        # Dicionário de tradução binário -> texto
-        self.binary_to_text = {
-            # Numerais
-            "00110000": "0",
-            "00110001": "1",
-            "00110010": "2",
-            "00110011": "3",
-            "00110100": "4",
-            "00110101": "5",
-            "00110110": "6",
-            "00110111": "7",
-            "00111000": "8",
-            "00111001": "9",
-            
-            # Letras maiúsculas
-            "01000001": "A",
-            "01000010": "B",
-            "01000011": "C",
-            "01000100": "D",
-            "01000101": "E",
-            "01000110": "F",
-            "01000111": "G",
-            "01001000": "H",
-            "01001001": "I",
-            "01001010": "J",
-            "01001011": "K",
-            "01001100": "L",
-            "01001101": "M",
-            "01001110": "N",
-            "01001111": "O",
-            "01010000": "P",
-            "01010001": "Q",
-            "01010010": "R",
-            "01010011": "S",
-            "01010100": "T",
-            "01010101": "U",
-            "01010110": "V",
-            "01010111": "W",
-            "01011000": "X",
-            "01011001": "Y",
-            "01011010": "Z",
-            
-            # Letras minúsculas
-            "01100001": "a",
-            "01100010": "b",
-            "01100011": "c",
-            "01100100": "d",
-            "01100101": "e",
-            "01100110": "f",
-            "01100111": "g",
-            "01101000": "h",
-            "01101001": "i",
-            "01101010": "j",
-            "01101011": "k",
-            "01101100": "l",
-            "01101101": "m",
-            "01101110": "n",
-            "01101111": "o",
-            "01110000": "p",
-            "01110001": "q",
-            "01110010": "r",
-            "01110011": "s",
-            "01110100": "t",
-            "01110101": "u",
-            "01110110": "v",
-            "01110111": "w",
-            "01111000": "x",
-            "01111001": "y",
-            "01111010": "z",
-            
-            # Comandos e símbolos
-            "01111011": "var",
-            "01111100": "print",
-            "01111111": "\"",
-            "01111110": "input",
-            "10000000": "int",
-            "10000001": "float",
-            "10000010": "str",
-            "10000011": "if",
-            "10000100": "else",
-            "10000101": "while",
-            "10000110": "for",
-            "10000111": "def",
-            "10001000": "return",
-            "10001001": "=",
-            "10001010": "+",
-            "10001011": "-",
-            "10001100": "*",
-            "10001101": "/",
-            "10001110": "==",
-            "00101000": "(",
-            "00101001": ")",
-            "10010001": ":",
-            "10010010": "print()",
-            "00100000": " ",
-            "10010011": "_",
-            "10010100": "{",
-            "10010101": "}",
-            "10010110": "[",
-            "10010111": "]",
-            "10011000": "'",
-            "10011001": ",",
-            "10011010": ".",
-            "10011011": ";",
-            "10011100": "\\",
-            "10011101": "%",
-            "10011110": "!",
-            "10011111": "<",
-            "10100000": ">",
-            "10100001": "&",
-            "10100010": "|",
-            "00001010": "\n",  # Nova linha
-            "00001101": "\r",  # Retorno de carro
-            "00001001": "\t",  # Tab
-        }
+        # Dialeto compartilhado (tabelas construídas uma única vez por processo)
+        self.codec = get_dialect("fixed")
         
-        # Dicionário inverso texto -> binário
-        self.text_to_binary = {v: k for k, v in self.binary_to_text.items()}
-        
-        # Adiciona mapeamentos para palavras-chave compostas
-        self.text_to_binary.update({
-            "print()": "10010010",
-            "var": "01111011",
-            "int": "10000000",
-            "float": "10000001",
-            "str": "10000010",
-            "if": "10000011",
-            "else": "10000100",
-            "while": "10000101",
-            "for": "10000110",
-            "def": "10000111",
-            "return": "10001000",
-            "==": "10001110",
-        })
+        # Dicionários de tradução binário -> texto e texto -> binário (somente leitura)
+        self.binary_to_text = self.codec.binary_to_text
+        self.text_to_binary = self.codec.text_to_binary
         
         # Comandos especiais que precisam de tratamento específico
         self.special_commands = {
@@ -194,6 +73,21 @@ class BinaryInterpreterV2:
                 translated.append(token)
         
         return ''.join(translated)
+
+    def traduzir_binario_com_mapa(self, binary_code):
+        """
+        Traduz código binário para texto junto com o mapa de origem da tradução.
+
+        Args:
+            binary_code: Código binário a ser traduzido
+
+        Returns:
+            Tupla (texto traduzido, SourceMap entre o texto e o código binário)
+        """
+        # O decodificador por tabela do dialeto produz os mesmos tokens que o laço acima
+        tokens, offsets = self.codec.decoder().decode_tokens_with_offsets(binary_code)
+        source_map = SourceMap.from_tokens(tokens, offsets, binary_code)
+        return source_map.python_code, source_map
     
     def converter_para_binario(self, text):
         """
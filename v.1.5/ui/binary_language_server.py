@@ -0,0 +1,545 @@
+"""
+Módulo do servidor LSP (Language Server Protocol) do código binário.
+Leva para outros editores o que o editor da aplicação oferece: significado do
+token sob o cursor (hover), diagnósticos, complemento de tokens e os símbolos
+do documento (funções e variáveis declaradas com BINFUNC/BINVAR).
+A sincronização é incremental: cada alteração recebida substitui só as linhas
+que tocou no texto, no índice de tokens (BinaryTokenIndex, calculado sob
+demanda) e no validador (IncrementalValidator), de modo que o custo de uma
+edição não depende do tamanho do arquivo. Não depende do Qt.
+
+Uso (o editor inicia o servidor e conversa por stdin/stdout):
+    python binary_language_server.py
+"""
+
+import ast
+import json
+import re
+import sys
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+from urllib.request import url2pathname
+
+try:
+    from ui.app_logging import get_logger
+    from ui.binary_ast_compiler import COMMAND_OPERANDS, BinaryAstCompiler, split_words
+    from ui.binary_codec_registry import get_dialect
+    from ui.binary_daemon import INTERNAL_ERROR, INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND, PARSE_ERROR
+    from ui.binary_token_index import (
+        BinaryTokenIndex, TOKEN_COMMENT, TOKEN_CONTROL, TOKEN_FUNCTION, TOKEN_STRING
+    )
+    from ui.binary_validator import IncrementalValidator, MAX_DIAGNOSTICS
+    from ui.dialect_detector import DialectRouter
+except ImportError:
+    from app_logging import get_logger
+    from binary_ast_compiler import COMMAND_OPERANDS, BinaryAstCompiler, split_words
+    from binary_codec_registry import get_dialect
+    from binary_daemon import INTERNAL_ERROR, INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND, PARSE_ERROR
+    from binary_token_index import (
+        BinaryTokenIndex, TOKEN_COMMENT, TOKEN_CONTROL, TOKEN_FUNCTION, TOKEN_STRING
+    )
+    from binary_validator import IncrementalValidator, MAX_DIAGNOSTICS
+    from dialect_detector import DialectRouter
+
+# stdout é o canal do protocolo: o log vai para os handlers do app_logging (ou stderr)
+logger = get_logger("lsp")
+
+# Códigos do LSP
+SERVER_NOT_INITIALIZED = -32002
+SYNC_INCREMENTAL = 2
+SEVERITY_ERROR = 1
+SEVERITY_WARNING = 2
+SYMBOL_FUNCTION = 12
+SYMBOL_VARIABLE = 13
+COMPLETION_KEYWORD = 14
+COMPLETION_VALUE = 12
+
+# Gravidade LSP de cada gravidade do validador
+_SEVERITIES = {"error": SEVERITY_ERROR, "warning": SEVERITY_WARNING}
+
+# Comandos que declaram nomes (o primeiro operando é o nome)
+_DECLARATIONS = ("BINFUNC", "BINVAR")
+
+# Dígitos binários já digitados antes do cursor
+_PARTIAL_WORD = re.compile(r'[01]*$')
+
+# Nome usado nos diagnósticos
+DIAGNOSTIC_SOURCE = "binario"
+
+
+def uri_to_path(uri: str) -> Optional[str]:
+    """Converte uma URI file:// em caminho local (None para outros esquemas)."""
+    parsed = urlparse(uri)
+    if parsed.scheme != "file":
+        return None
+    return url2pathname(unquote(parsed.path))
+
+
+def _utf16_to_index(line: str, character: int) -> int:
+    """Converte uma coluna em unidades UTF-16 (LSP) em índice da string."""
+    if line.isascii():
+        return min(character, len(line))
+    units = 0
+    for index, char in enumerate(line):
+        if units >= character:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+
+def _index_to_utf16(line: str, index: int) -> int:
+    """Converte um índice da string em coluna em unidades UTF-16 (LSP)."""
+    if line.isascii():
+        return index
+    return index + sum(1 for char in line[:index] if ord(char) > 0xFFFF)
+
+
+def declared_names(line: str, compiler: BinaryAstCompiler) -> Tuple[Tuple[int, str, int, str], ...]:
+    """
+    Encontra as declarações de uma linha, com os comandos e operandos localizados
+    como no tradutor (BinaryAstCompiler.command_words).
+
+    Args:
+        line: Linha em formato binário
+        compiler: Compilador do dialeto do documento
+
+    Returns:
+        Tupla de (coluna do comando, comando, coluna do nome, palavra do nome)
+    """
+    words = split_words(line)
+    names = []
+    for index, command in compiler.command_words([word for _column, word in words]):
+        if command in _DECLARATIONS and index + COMMAND_OPERANDS[command] < len(words):
+            column = words[index][0]
+            name_column, name_word = words[index + 1]
+            names.append((column, command, name_column, name_word))
+    return tuple(names)
+
+
+class BinaryDocument:
+    """
+    Documento aberto no editor: linhas, índice de tokens, validador e declarações.
+    """
+
+    def __init__(self, uri: str, text: str, version: int, dialect: str):
+        """
+        Args:
+            uri: URI do documento
+            text: Conteúdo inicial
+            version: Versão informada pelo editor
+            dialect: Dialeto usado para os significados e a validação
+        """
+        self.uri = uri
+        self.version = version
+        self.dialect = dialect
+        self.keywords = get_dialect(dialect).binary_to_text
+        self.tokens = BinaryTokenIndex(self.keywords)
+        self.validator = IncrementalValidator(self.keywords)
+        self.compiler = self.validator.compiler
+        # Diagnósticos do código traduzido (calculados ao abrir e salvar; descartados ao editar)
+        self.translation_diagnostics: List[Dict] = []
+        self.set_text(text)
+
+    def set_text(self, text: str):
+        """Substitui todo o conteúdo."""
+        self.lines = text.split("\n")
+        self.tokens.reset(len(self.lines))
+        self.validator.set_lines(self.lines)
+        self._declarations: List[Optional[tuple]] = [None] * len(self.lines)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    def apply_change(self, change: Dict):
+        """
+        Aplica uma alteração do didChange (com "range", ou o texto inteiro sem ele).
+
+        Args:
+            change: Objeto TextDocumentContentChangeEvent
+        """
+        self.translation_diagnostics = []
+        if "range" not in change:
+            self.set_text(change["text"])
+            return
+
+        start, end = change["range"]["start"], change["range"]["end"]
+        first = min(start["line"], len(self.lines) - 1)
+        last = min(end["line"], len(self.lines) - 1)
+        head = self.lines[first]
+        tail = self.lines[last]
+        prefix = head[:_utf16_to_index(head, start["character"])] if start["line"] <= first else head
+        suffix = tail[_utf16_to_index(tail, end["character"]):] if end["line"] <= last else ""
+        new_lines = (prefix + change["text"] + suffix).split("\n")
+
+        removed = last - first + 1
+        self.lines[first:last + 1] = new_lines
+        self.tokens.replace_lines(first, removed, len(new_lines))
+        self.validator.replace_lines(first, removed, new_lines)
+        self._declarations[first:last + 1] = [None] * len(new_lines)
+
+    def line_tokens(self, line: int) -> Tuple[int, ...]:
+        """Tokens da linha (tupla plana início, comprimento, tipo), calculados na primeira consulta."""
+        tokens = self.tokens.get(line)
+        if tokens is None:
+            tokens = self.tokens.scan(line, self.lines[line])
+        return tokens
+
+    def token_at(self, line: int, character: int) -> Optional[Tuple[int, int, int]]:
+        """
+        Encontra o token em uma posição.
+
+        Args:
+            line: Linha (a partir de 0)
+            character: Coluna em unidades UTF-16
+
+        Returns:
+            Tupla (início, comprimento, tipo) ou None
+        """
+        if not 0 <= line < len(self.lines):
+            return None
+        text = self.lines[line]
+        column = _utf16_to_index(text, character)
+        tokens = self.line_tokens(line)
+        starts = tokens[0::3]
+        index = bisect_right(starts, column) - 1
+        if index < 0:
+            return None
+        start, length, kind = tokens[3 * index:3 * index + 3]
+        # O cursor logo depois do token ainda o seleciona, como no editor
+        if column > start + length:
+            return None
+        return start, length, kind
+
+    def declarations(self) -> List[Tuple[int, Tuple[int, str, int, str]]]:
+        """Declarações (BINFUNC/BINVAR) do documento, com o índice da linha."""
+        result = []
+        cache = self._declarations
+        for number, names in enumerate(cache):
+            if names is None:
+                names = cache[number] = declared_names(self.lines[number], self.compiler)
+            for name in names:
+                result.append((number, name))
+        return result
+
+    def range(self, line: int, start: int, end: int) -> Dict:
+        """Intervalo LSP de um trecho de uma linha (colunas como índices da string)."""
+        text = self.lines[line] if 0 <= line < len(self.lines) else ""
+        return {
+            "start": {"line": line, "character": _index_to_utf16(text, start)},
+            "end": {"line": line, "character": _index_to_utf16(text, end)},
+        }
+
+
+class BinaryLanguageServer:
+    """
+    Servidor LSP sobre um par de fluxos binários (stdin/stdout por padrão).
+    """
+
+    def __init__(self, reader=None, writer=None, router: Optional[DialectRouter] = None,
+                 dialect: Optional[str] = None):
+        """
+        Args:
+            reader: Fluxo de entrada (padrão: sys.stdin.buffer)
+            writer: Fluxo de saída (padrão: sys.stdout.buffer)
+            router: Roteador de dialetos (padrão: um DialectRouter com a memória do usuário)
+            dialect: Dialeto fixo para todos os documentos (padrão: o do arquivo ou o detectado;
+                pode vir também em initializationOptions.dialect)
+        """
+        self.reader = reader or sys.stdin.buffer
+        self.writer = writer or sys.stdout.buffer
+        self.router = router or DialectRouter()
+        self.dialect = dialect
+        self.documents: Dict[str, BinaryDocument] = {}
+        self.initialized = False
+        self.shutdown_requested = False
+        self._requests = {
+            "initialize": self.initialize,
+            "shutdown": self.shutdown,
+            "textDocument/hover": self.hover,
+            "textDocument/completion": self.completion,
+            "textDocument/documentSymbol": self.document_symbol,
+        }
+        self._notifications = {
+            "textDocument/didOpen": self.did_open,
+            "textDocument/didChange": self.did_change,
+            "textDocument/didSave": self.did_save,
+            "textDocument/didClose": self.did_close,
+        }
+
+    def serve(self) -> int:
+        """
+        Atende mensagens até "exit" ou o fim da entrada.
+
+        Returns:
+            Código de saída (0 se "shutdown" foi pedido antes de "exit")
+        """
+        while True:
+            message = self._read_message()
+            if message is None:
+                break
+            if message.get("method") == "exit":
+                break
+            self.handle(message)
+        return 0 if self.shutdown_requested else 1
+
+    def handle(self, message):
+        """
+        Atende uma mensagem já decodificada.
+
+        Args:
+            message: Pedido ou notificação JSON-RPC
+        """
+        if not isinstance(message, dict) or not isinstance(message.get("method"), str):
+            self._send_error(None, INVALID_REQUEST, "Mensagem inválida")
+            return
+        method = message["method"]
+        params = message.get("params") or {}
+
+        if "id" not in message:
+            handler = self._notifications.get(method)
+            # Notificações desconhecidas ($/cancelRequest, initialized, ...) são ignoradas
+            if handler is not None and self.initialized:
+                try:
+                    handler(params)
+                except Exception:
+                    # Notificações não têm resposta: uma mensagem malformada não derruba o servidor
+                    logger.exception("Erro na notificação %s", method)
+            return
+
+        request_id = message["id"]
+        handler = self._requests.get(method)
+        if handler is None:
+            self._send_error(request_id, METHOD_NOT_FOUND, f"Método não suportado: {method}")
+            return
+        if not self.initialized and method != "initialize":
+            self._send_error(request_id, SERVER_NOT_INITIALIZED, "O servidor ainda não foi inicializado")
+            return
+        try:
+            result = handler(params)
+        except (KeyError, TypeError, ValueError) as e:
+            self._send_error(request_id, INVALID_PARAMS, f"Parâmetros inválidos: {e}")
+            return
+        except Exception as e:
+            logger.exception("Erro no pedido %s", method)
+            self._send_error(request_id, INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+            return
+        self._send({"jsonrpc": "2.0", "id": request_id, "result": result})
+
+    # Ciclo de vida
+
+    def initialize(self, params: Dict) -> Dict:
+        options = params.get("initializationOptions") or {}
+        self.dialect = options.get("dialect") or self.dialect
+        self.initialized = True
+        return {
+            "capabilities": {
+                "textDocumentSync": {"openClose": True, "change": SYNC_INCREMENTAL, "save": {"includeText": False}},
+                "hoverProvider": True,
+                "completionProvider": {"triggerCharacters": ["0", "1"]},
+                "documentSymbolProvider": True,
+            },
+            "serverInfo": {"name": "binary-language-server"},
+        }
+
+    def shutdown(self, params) -> None:
+        self.shutdown_requested = True
+        return None
+
+    # Sincronização
+
+    def did_open(self, params: Dict):
+        item = params["textDocument"]
+        text = item["text"]
+        dialect = self.dialect or self.router.dialect_for(text, uri_to_path(item["uri"]))
+        document = BinaryDocument(item["uri"], text, item.get("version", 0), dialect)
+        self.documents[document.uri] = document
+        self._check_translation(document)
+        self._publish(document)
+
+    def did_change(self, params: Dict):
+        document = self.documents.get(params["textDocument"]["uri"])
+        if document is None:
+            return
+        for change in params.get("contentChanges", ()):
+            document.apply_change(change)
+        document.version = params["textDocument"].get("version", document.version)
+        self._publish(document)
+
+    def did_save(self, params: Dict):
+        document = self.documents.get(params["textDocument"]["uri"])
+        if document is not None:
+            self._check_translation(document)
+            self._publish(document)
+
+    def did_close(self, params: Dict):
+        uri = params["textDocument"]["uri"]
+        if self.documents.pop(uri, None) is not None:
+            self._send_notification("textDocument/publishDiagnostics", {"uri": uri, "diagnostics": []})
+
+    # Recursos
+
+    def hover(self, params: Dict) -> Optional[Dict]:
+        document, line, character = self._position(params)
+        token = document.token_at(line, character) if document else None
+        if token is None or token[2] in (TOKEN_COMMENT, TOKEN_STRING):
+            return None
+        start, length, _kind = token
+        word = document.lines[line][start:start + length]
+        meaning = document.keywords.get(word, "Comando desconhecido")
+        return {
+            "contents": {"kind": "plaintext", "value": f"{word} → {meaning}"},
+            "range": document.range(line, start, start + length),
+        }
+
+    def completion(self, params: Dict) -> Dict:
+        document, line, character = self._position(params)
+        if document is None or not 0 <= line < len(document.lines):
+            return {"isIncomplete": False, "items": []}
+        text = document.lines[line]
+        column = _utf16_to_index(text, character)
+        prefix = _PARTIAL_WORD.search(text, 0, column).group()
+        if len(prefix) >= 8:
+            prefix = ""
+        edit_range = document.range(line, column - len(prefix), column)
+
+        items = []
+        for word, meaning in sorted(document.keywords.items()):
+            if not word.startswith(prefix):
+                continue
+            kind = document.tokens.kind(word)
+            items.append({
+                "label": word,
+                "detail": meaning,
+                "kind": COMPLETION_KEYWORD if kind in (TOKEN_CONTROL, TOKEN_FUNCTION) else COMPLETION_VALUE,
+                "textEdit": {"range": edit_range, "newText": word},
+            })
+        return {"isIncomplete": False, "items": items}
+
+    def document_symbol(self, params: Dict) -> List[Dict]:
+        document = self.documents.get(params["textDocument"]["uri"])
+        if document is None:
+            return []
+        symbols = []
+        for number, (command_column, command, name_column, name_word) in document.declarations():
+            name = document.keywords.get(name_word, f"[{name_word}]")
+            function = command == "BINFUNC"
+            symbols.append({
+                "name": name,
+                "detail": command,
+                "kind": SYMBOL_FUNCTION if function else SYMBOL_VARIABLE,
+                "range": document.range(number, command_column, len(document.lines[number].rstrip())),
+                "selectionRange": document.range(number, name_column, name_column + len(name_word)),
+            })
+        return symbols
+
+    # Diagnósticos
+
+    def diagnostics(self, document: BinaryDocument) -> List[Dict]:
+        """Diagnósticos atuais do documento no formato LSP."""
+        result = []
+        for diagnostic in document.validator.diagnostics(MAX_DIAGNOSTICS):
+            line = diagnostic.line - 1
+            result.append({
+                "range": document.range(line, diagnostic.column, diagnostic.column + diagnostic.length),
+                "severity": _SEVERITIES.get(diagnostic.severity, SEVERITY_ERROR),
+                "code": diagnostic.code,
+                "source": DIAGNOSTIC_SOURCE,
+                "message": diagnostic.message,
+            })
+        return result + document.translation_diagnostics
+
+    def _check_translation(self, document: BinaryDocument):
+        """
+        Traduz o documento e localiza, pelo mapa de origem, o erro de sintaxe do código
+        traduzido. A tradução percorre o arquivo inteiro, por isso só é feita ao abrir e
+        ao salvar, e apenas quando a validação não encontra erros.
+        """
+        document.translation_diagnostics = []
+        if document.validator.diagnostics(1):
+            return
+        try:
+            python_code, source_map = self.router.translate_with_map(document.text, dialect=document.dialect)
+        except Exception:
+            return
+        if source_map is None:
+            return
+        try:
+            ast.parse(python_code)
+        except SyntaxError as e:
+            mapped = source_map.map_syntax_error(e)
+            line = mapped.lineno - 1
+            column = max(0, mapped.offset - 1)
+            document.translation_diagnostics = [{
+                "range": document.range(line, column, column + 8),
+                "severity": SEVERITY_ERROR,
+                "code": "translated-syntax",
+                "source": DIAGNOSTIC_SOURCE,
+                "message": f"Erro de sintaxe no código traduzido: {mapped.msg}",
+            }]
+
+    def _publish(self, document: BinaryDocument):
+        self._send_notification("textDocument/publishDiagnostics", {
+            "uri": document.uri,
+            "version": document.version,
+            "diagnostics": self.diagnostics(document),
+        })
+
+    def _position(self, params: Dict) -> Tuple[Optional[BinaryDocument], int, int]:
+        position = params["position"]
+        return self.documents.get(params["textDocument"]["uri"]), position["line"], position["character"]
+
+    # Transporte (cabeçalho Content-Length seguido do corpo JSON)
+
+    def _read_message(self):
+        """Lê a próxima mensagem (None no fim da entrada)."""
+        while True:
+            length = None
+            while True:
+                header = self.reader.readline()
+                if not header:
+                    return None
+                header = header.strip()
+                if not header:
+                    break
+                name, _, value = header.decode("ascii", "replace").partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value.strip())
+            if length is None:
+                continue
+            body = self.reader.read(length)
+            try:
+                return json.loads(body.decode("utf-8"))
+            except ValueError as e:
+                self._send_error(None, PARSE_ERROR, f"JSON inválido: {e}")
+
+    def _send(self, message: Dict):
+        body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+        self.writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+        self.writer.flush()
+
+    def _send_notification(self, method: str, params: Dict):
+        self._send({"jsonrpc": "2.0", "method": method, "params": params})
+
+    def _send_error(self, request_id, code: int, message: str):
+        self._send({"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}})
+
+
+def main(argv=None) -> int:
+    """
+    Ponto de entrada: atende o editor por stdin/stdout.
+
+    Args:
+        argv: Argumentos (padrão: sys.argv[1:]); "--dialect NOME" fixa o dialeto
+
+    Returns:
+        Código de saída
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    dialect = argv[argv.index("--dialect") + 1] if "--dialect" in argv[:-1] else None
+    return BinaryLanguageServer(dialect=dialect).serve()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,11 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, pyqtSignal, QSize
 from PyQt5.QtGui import QFont, QColor, QIcon
 
+try:
+    from ui.binary_codec_registry import get_dialect
+except ImportError:
+    from binary_codec_registry import get_dialect
+
 class BinaryReferenceGuide(QWidget):
     """
     Painel de guia de referência para códigos binários.
@@ -123,118 +128,7 @@ class BinaryReferenceGuide(QWidget):
         Returns:
             Dicionário com categorias e códigos binários
         """
-        return {
-            "Numerais ↓": {
-                "0": "00110000",
-                "1": "00110001",
-                "2": "00110010",
-                "3": "00110011",
-                "4": "00110100",
-                "5": "00110101",
-                "6": "00110110",
-                "7": "00110111",
-                "8": "00111000",
-                "9": "00111001"
-            },
-            "Letras Maiúsculas ↓": {
-                "A": "01000001",
-                "B": "01000010",
-                "C": "01000011",
-                "D": "01000100",
-                "E": "01000101",
-                "F": "01000110",
-                "G": "01000111",
-                "H": "01001000",
-                "I": "01001001",
-                "J": "01001010",
-                "K": "01001011",
-                "L": "01001100",
-                "M": "01001101",
-                "N": "01001110",
-                "O": "01001111",
-                "P": "01010000",
-                "Q": "01010001",
-                "R": "01010010",
-                "S": "01010011",
-                "T": "01010100",
-                "U": "01010101",
-                "V": "01010110",
-                "W": "01010111",
-                "X": "01011000",
-                "Y": "01011001",
-                "Z": "01011010"
-            },
-            "Letras Minúsculas ↓": {
-                "a": "01100001",
-                "b": "01100010",
-                "c": "01100011",
-                "d": "01100100",
-                "e": "01100101",
-                "f": "01100110",
-                "g": "01100111",
-                "h": "01101000",
-                "i": "01101001",
-                "j": "01101010",
-                "k": "01101011",
-                "l": "01101100",
-                "m": "01101101",
-                "n": "01101110",
-                "o": "01101111",
-                "p": "01110000",
-                "q": "01110001",
-                "r": "01110010",
-                "s": "01110011",
-                "t": "01110100",
-                "u": "01110101",
-                "v": "01110110",
-                "w": "01110111",
-                "x": "01111000",
-                "y": "01111001",
-                "z": "01111010"
-            },
-            "Comandos ↓": {
-                "var": "01111011",
-                "print": "01111100",
-                "\"": "01111111",
-                "input": "01111110",
-                "int": "10000000",
-                "float": "10000001",
-                "str": "10000010",
-                "if": "10000011",
-                "else": "10000100",
-                "while": "10000101",
-                "for": "10000110",
-                "def": "10000111",
-                "return": "10001000",
-                "=": "10001001",
-                "+": "10001010",
-                "-": "10001011",
-                "*": "10001100",
-                "/": "10001101",
-                "==": "10001110",
-                "(": "00101000",
-                ")": "00101001",
-                ":": "10010001",
-                "print()": "10010010",
-                "espaço": "00100000",
-                "_": "10010011",
-                "{": "10010100",
-                "}": "10010101",
-                "[": "10010110",
-                "]": "10010111",
-                "'": "10011000",
-                ",": "10011001",
-                ".": "10011010",
-                ";": "10011011",
-                "\\": "10011100",
-                "%": "10011101",
-                "!": "10011110",
-                "<": "10011111",
-                ">": "10100000",
-                "&": "10100001",
-                "|": "10100010"
-            }
-        }
+        return get_dialect("reference").reference_data()
     
     def _populate_reference_tree(self):
         """Preenche a árvore de referência com os dados."""
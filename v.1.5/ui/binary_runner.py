@@ -1,7 +1,10 @@
-import subprocess
-import tempfile
 import ast
 
+try:
+    from ui.interpreter_pool import INTERACTIVE_TIMEOUT, get_default_pool
+except ImportError:
+    from interpreter_pool import INTERACTIVE_TIMEOUT, get_default_pool
+
 class BinariosInterpreter:
     def interpretar(self, binario_texto):
         try:
@@ -41,11 +44,13 @@ class BinariosInterpreter:
         try:
             # Validação de segurança para evitar código malicioso
             ast.parse(codigo_str)
-
-            with tempfile.NamedTemporaryFile(mode='w+', suffix='.py', delete=False) as tmp_file:
-                tmp_file.write(codigo_str)
-                tmp_file.flush()
-                resultado = subprocess.check_output(['python', tmp_file.name], stderr=subprocess.STDOUT, text=True)
-            return resultado
-        except (subprocess.CalledProcessError, SyntaxError) as e:
+        except SyntaxError as e:
             return f"Erro ao executar código: {str(e)}"
+
+        # Em um interpretador pré-iniciado, sem arquivo temporário nem um processo novo por execução
+        resultado = get_default_pool().run(codigo_str, timeout=INTERACTIVE_TIMEOUT, merge_stderr=True)
+        if resultado.timed_out:
+            return "Erro ao executar código: tempo limite excedido"
+        if resultado.returncode != 0:
+            return f"Erro ao executar código: {resultado.stdout}"
+        return resultado.stdout
@@ -4,8 +4,6 @@ Este módulo estende o interpretador binário para permitir a execução de coma
 em formato binário e integração com o terminal interativo.
 """
 
-import subprocess
-import tempfile
 import ast
 import sys
 import io
@@ -13,6 +11,8 @@ from contextlib import redirect_stdout, redirect_stderr
 from typing import Dict, List, Tuple, Optional
 
 from binary_syntax_parser import BinarySyntaxParser
+from interpreter_pool import get_default_pool
+from translation_cache import get_default_cache
 
 class BinaryRunner:
     def __init__(self):
@@ -21,7 +21,18 @@ class BinaryRunner:
         self.last_execution_result = ""
         self.execution_history = []
         self.max_history_size = 50
+        # Interpretadores pré-iniciados para a execução em processo separado (na primeira execução)
+        self._pool = None
+        # Objetos de código compilados direto do binário
+        self.cache = get_default_cache()
         
+    @property
+    def pool(self):
+        """Conjunto de interpretadores compartilhado, iniciado só quando a primeira execução o pede."""
+        if self._pool is None:
+            self._pool = get_default_pool()
+        return self._pool
+
     def interpretar(self, binario_texto: str) -> str:
         """
         Interpreta código binário e converte para Python.
@@ -38,6 +49,53 @@ class BinaryRunner:
         except Exception as e:
             return f"Erro na conversão: {str(e)}"
     
+    def compilar(self, binario_texto: str):
+        """
+        Compila código binário direto para um objeto de código, sem texto Python
+        intermediário (a compilação fica no cache).
+
+        Args:
+            binario_texto: String contendo código em formato binário
+
+        Returns:
+            Objeto de código
+
+        Raises:
+            SyntaxError: Com a linha e a coluna do erro no código binário
+        """
+        return self.cache.compile_binary(self.parser, binario_texto)
+
+    def interpretar_ast(self, binario_texto: str) -> str:
+        """
+        Converte código binário para Python a partir da árvore sintática (ast.unparse).
+
+        Args:
+            binario_texto: String contendo código em formato binário
+
+        Returns:
+            String contendo código Python equivalente
+
+        Raises:
+            SyntaxError: Com a linha e a coluna do erro no código binário
+        """
+        return self.parser.unparse_binary(binario_texto)
+
+    def validar_binario(self, binario_texto: str) -> Tuple[bool, str]:
+        """
+        Valida a sintaxe do código binário, com a posição do erro no próprio binário.
+
+        Args:
+            binario_texto: String contendo código em formato binário
+
+        Returns:
+            Tupla (é_válido, mensagem_de_erro)
+        """
+        try:
+            self.parser.parse_binary_to_ast(binario_texto)
+            return True, ""
+        except SyntaxError as e:
+            return False, f"Erro de sintaxe na linha {e.lineno}, coluna {e.offset}: {e.msg}"
+
     def validar_codigo(self, codigo_python: str) -> Tuple[bool, str]:
         """
         Valida a sintaxe do código Python.
@@ -76,16 +134,13 @@ class BinaryRunner:
         
         try:
             if use_subprocess:
-                # Execução em processo separado (mais seguro)
-                with tempfile.NamedTemporaryFile(mode='w+', suffix='.py', delete=False) as tmp_file:
-                    tmp_file.write(codigo_python)
-                    tmp_file.flush()
-                    resultado = subprocess.check_output(
-                        ['python3', tmp_file.name], 
-                        stderr=subprocess.STDOUT, 
-                        text=True,
-                        timeout=5  # Timeout de 5 segundos para evitar execuções infinitas
-                    )
+                # Execução em processo separado (mais seguro), em um interpretador pré-iniciado
+                result = self.pool.run(
+                    codigo_python,
+                    timeout=5,  # Timeout de 5 segundos para evitar execuções infinitas
+                    merge_stderr=True
+                )
+                return self.resultado_execucao(codigo_python, result)
             else:
                 # Execução no mesmo processo (menos seguro, mas permite interatividade)
                 old_stdout = sys.stdout
@@ -109,22 +164,38 @@ class BinaryRunner:
             self.add_to_history(codigo_python, resultado)
             return resultado
         
-        except subprocess.TimeoutExpired:
-            error_msg = "Erro: Tempo limite de execução excedido (5 segundos)"
-            self.last_execution_result = error_msg
-            self.add_to_history(codigo_python, error_msg)
-            return error_msg
-        except subprocess.CalledProcessError as e:
-            error_msg = f"Erro ao executar código: {e.output}"
-            self.last_execution_result = error_msg
-            self.add_to_history(codigo_python, error_msg)
-            return error_msg
         except Exception as e:
             error_msg = f"Erro ao executar código: {str(e)}"
             self.last_execution_result = error_msg
             self.add_to_history(codigo_python, error_msg)
             return error_msg
     
+    def resultado_execucao(self, codigo: str, result) -> str:
+        """
+        Formata o resultado de uma execução em processo separado e o registra no histórico.
+        
+        Args:
+            codigo: Código executado
+            result: ExecutionResult (ou SandboxResult) da execução
+            
+        Returns:
+            String contendo a saída ou a mensagem de erro
+        """
+        if result.timed_out:
+            resultado = "Erro: Tempo limite de execução excedido (5 segundos)"
+        elif result.returncode != 0:
+            resultado = f"Erro ao executar código: {result.stdout}{result.stderr}"
+            # Limite atingido no processo isolado (saída, memória, CPU...) ou interrupção
+            stop_message = result.stop_message() if hasattr(result, "stop_message") else ""
+            if stop_message:
+                resultado += f"\n{stop_message}"
+        else:
+            resultado = result.stdout
+        
+        self.last_execution_result = resultado
+        self.add_to_history(codigo, resultado)
+        return resultado
+    
     def executar_binario(self, codigo_binario: str) -> str:
         """
         Interpreta e executa código binário diretamente.
@@ -0,0 +1,396 @@
+"""
+Módulo de tradução em fluxo (streaming) para arquivos binários grandes.
+Lê a entrada em blocos de tamanho fixo e produz a saída aos poucos, mantendo
+entre os blocos apenas o estado necessário (grupo de bits incompleto, comentário
+aberto, linha parcial e nível de indentação), de modo que o uso de memória não
+depende do tamanho do arquivo.
+
+Uso pela linha de comando:
+    python binary_stream.py translate programa.bin -o programa.py
+    python binary_stream.py encode programa.py --engine parser
+    python binary_stream.py translate programa.bin --engine parser [-j N]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from functools import partial
+
+# Tamanho padrão de cada bloco lido (em caracteres)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Strings literais de uma linha, reconhecidas como no BinaryTextEncoder
+_LINE_STRING = (
+    r'"(?!")[^"\\\n]*(?:\\.[^"\\\n]*)*"|""(?=[^"])|'
+    r"'(?!')[^'\\\n]*(?:\\.[^'\\\n]*)*'|''(?=[^'])"
+)
+
+# Prefixo do texto cuja divisão em strings literais já é definitiva. A varredura
+# para em toda string de três aspas (o fechamento é procurado à parte, só no
+# texto novo) e em uma aspa que ainda depende do texto seguinte: linha
+# incompleta ou aspas no fim do bloco, que podem abrir três aspas
+_SETTLED_TEXT_PATTERN = re.compile(
+    r'(?:[^"\']+|' + _LINE_STRING +
+    r'|"(?!")(?=[^"\\\n]*(?:\\.[^"\\\n]*)*\\?\n)'
+    r"|'(?!')(?=[^'\\\n]*(?:\\.[^'\\\n]*)*\\?\n)"
+    r")*+"
+)
+
+# Espaços fora de strings (usados como corte só quando o bloco não tem quebra de linha)
+_BLANK_PATTERN = re.compile(_LINE_STRING + r"|(?P<blank>[ \t])")
+
+# Espaço em branco que separa grupos de bits (a normalização troca todos por espaço)
+_BLANK_CHAR_PATTERN = re.compile(r"\s")
+
+# Caracteres descartados pela normalização dentro de um grupo
+_NON_BIT_PATTERN = re.compile(r"[^01]")
+
+# Interpretadores disponíveis para tradução em fluxo
+ENGINES = ("fixed", "enhanced", "parser", "binario")
+
+
+def _split_pending(pending):
+    """
+    Divide um resto de bloco que atingiu o tamanho de um bloco sem espaço nem quebra de linha.
+
+    O texto até o último espaço em branco já pode ser produzido. Do último grupo
+    sai a maior quantidade de bits múltipla de 8 (os grupos longos são lidos a
+    cada 8 bits), sem os caracteres que a normalização descartaria; o último
+    caractere fica no resto, pois pode ser a primeira "/" de um comentário.
+
+    Args:
+        pending: Resto do bloco, sem quebra de linha nem comentário
+
+    Returns:
+        Tupla (texto que pode ser produzido, novo resto)
+    """
+    start = 0
+    for match in _BLANK_CHAR_PATTERN.finditer(pending):
+        start = match.end()
+    if start == len(pending):
+        return pending, ""
+    bits = _NON_BIT_PATTERN.sub("", pending[start:-1])
+    full = len(bits) - len(bits) % 8
+    return pending[:start] + bits[:full], bits[full:] + pending[-1]
+
+
+def iter_binary_segments(fileobj, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Lê código binário em blocos e produz trechos decodificáveis de forma independente.
+
+    Cada trecho termina em um separador (espaço ou quebra de linha) ou logo antes
+    de um comentário, de modo que nenhum grupo de bits nem nenhum "//" fique
+    dividido entre dois trechos. O texto dos comentários é descartado durante a
+    leitura, sem ser acumulado, e uma sequência sem separador maior que um bloco
+    é cortada em um múltiplo de 8 bits, de modo que o resto guardado entre os
+    blocos nunca passa de chunk_size caracteres.
+
+    Args:
+        fileobj: Arquivo de texto (ou objeto com read) contendo código binário
+        chunk_size: Quantidade de caracteres lidos por vez
+
+    Yields:
+        Trechos de código binário
+    """
+    pending = ""
+    in_comment = False
+
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            break
+
+        if in_comment:
+            # O comentário só termina na próxima quebra de linha
+            newline = chunk.find("\n")
+            if newline < 0:
+                continue
+            chunk = chunk[newline:]
+            in_comment = False
+
+        buffer = pending + chunk
+        cut = buffer.rfind("\n") + 1
+        head, rest = buffer[:cut], buffer[cut:]
+
+        comment = rest.find("//")
+        if comment >= 0:
+            # Os grupos antes do comentário já estão completos
+            head += rest[:comment]
+            pending = ""
+            in_comment = True
+        else:
+            # Guarda o último grupo (e uma eventual "/" final) para o próximo bloco
+            space = rest.rfind(" ")
+            head += rest[:space + 1]
+            pending = rest[space + 1:]
+            if len(pending) >= chunk_size:
+                flushed, pending = _split_pending(pending)
+                head += flushed
+
+        if head:
+            yield head
+
+    if pending:
+        yield pending
+
+
+def iter_text_segments(fileobj, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Lê texto em blocos e produz trechos que terminam em espaço em branco
+    (em uma quebra de linha, sempre que o bloco tiver uma).
+
+    Os cortes nunca caem dentro de uma string literal (inclusive as de três
+    aspas, que podem ocupar várias linhas), reconhecida como no
+    BinaryTextEncoder: codificar os trechos separadamente dá o mesmo
+    resultado que codificar o texto inteiro.
+
+    Args:
+        fileobj: Arquivo de texto (ou objeto com read)
+        chunk_size: Quantidade de caracteres lidos por vez
+
+    Yields:
+        Trechos de texto sem palavras nem strings divididas
+    """
+    pending = ""
+    # Posição em pending até onde o texto já foi classificado
+    scanned = 0
+    # Posição a partir da qual procurar o fechamento de uma string de três aspas pendente
+    resume = 0
+    # Últimos cortes possíveis (fora de strings) em pending: após quebra de linha e após espaço
+    newline_cut = blank_cut = 0
+
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            break
+
+        buffer = pending + chunk
+        while True:
+            # Trecho sem strings de três aspas: as quebras de linha estão fora de strings
+            start = scanned
+            scanned = _SETTLED_TEXT_PATTERN.match(buffer, scanned).end()
+            newline = buffer.rfind("\n", start, scanned)
+            if newline >= 0:
+                newline_cut = newline + 1
+            elif not newline_cut:
+                for match in _BLANK_PATTERN.finditer(buffer, start, scanned):
+                    if match.lastgroup == "blank":
+                        blank_cut = match.end()
+
+            delimiter = buffer[scanned:scanned + 3]
+            if delimiter != '"""' and delimiter != "'''":
+                break
+            # String de três aspas aberta: procura o fechamento só no texto ainda não visto
+            end = buffer.find(delimiter, max(scanned + 3, resume))
+            if end < 0:
+                resume = max(scanned + 3, len(buffer) - 2)
+                break
+            scanned = end + 3
+
+        cut = newline_cut or blank_cut
+        if cut:
+            yield buffer[:cut]
+            pending = buffer[cut:]
+            scanned -= cut
+            resume = max(0, resume - cut)
+            newline_cut = blank_cut = 0
+        else:
+            pending = buffer
+
+    # No fim do texto não há mais aspas pendentes: o restante segue inteiro
+    if pending:
+        yield pending
+
+
+def iter_line_batches(fileobj, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Lê texto em blocos e produz as linhas de text.strip().splitlines() em lotes.
+
+    Linhas em branco no início e no fim do arquivo são descartadas, como faz
+    strip(); as do meio só são liberadas quando aparece a próxima linha com conteúdo.
+
+    Args:
+        fileobj: Arquivo de texto (ou objeto com read)
+        chunk_size: Quantidade de caracteres lidos por vez
+
+    Yields:
+        Listas de linhas (sem o terminador), uma por bloco lido
+    """
+    pending = ""
+    blank_lines = 0
+    started = False
+
+    while True:
+        chunk = fileobj.read(chunk_size)
+        final = not chunk
+
+        buffer = pending + chunk
+        lines = buffer.splitlines(True)
+        pending = ""
+        if not final and lines:
+            # A última linha pode estar incompleta ou ser um \r seguido de \n no próximo bloco
+            last = lines[-1]
+            if last.endswith("\r") or last.splitlines()[0] == last:
+                pending = lines.pop()
+
+        batch = []
+        for line in lines:
+            line = line.splitlines()[0] if line.strip() else ""
+            if not line:
+                if started:
+                    blank_lines += 1
+                continue
+            if blank_lines:
+                batch.extend([""] * blank_lines)
+                blank_lines = 0
+            started = True
+            batch.append(line)
+
+        if batch:
+            yield batch
+        if final:
+            break
+
+
+def create_engine(name):
+    """
+    Cria o interpretador correspondente ao nome informado.
+
+    Args:
+        name: Um dos nomes em ENGINES
+
+    Returns:
+        Instância do interpretador
+    """
+    if name == "fixed":
+        try:
+            from ui.binary_interpreter_fixed import BinaryInterpreterFixed
+        except ImportError:
+            from binary_interpreter_fixed import BinaryInterpreterFixed
+        return BinaryInterpreterFixed()
+
+    if name == "enhanced":
+        try:
+            from ui.binary_interpreter_enhanced_v2 import BinaryInterpreterEnhancedV2
+        except ImportError:
+            from binary_interpreter_enhanced_v2 import BinaryInterpreterEnhancedV2
+        return BinaryInterpreterEnhancedV2()
+
+    if name == "parser":
+        try:
+            from ui.binary_syntax_parser import BinarySyntaxParser
+        except ImportError:
+            from binary_syntax_parser import BinarySyntaxParser
+        return BinarySyntaxParser()
+
+    if name == "binario":
+        try:
+            from ui.binario_interpreter import BinarioInterpreter
+        except ImportError:
+            from binario_interpreter import BinarioInterpreter
+        return BinarioInterpreter()
+
+    raise ValueError(f"Interpretador desconhecido: {name}")
+
+
+def iter_translate(fileobj, chunk_size=DEFAULT_CHUNK_SIZE, engine="fixed", workers=None):
+    """
+    Traduz código binário para texto em fluxo.
+
+    Args:
+        fileobj: Arquivo de texto contendo código binário
+        chunk_size: Quantidade de caracteres lidos por vez
+        engine: Nome do interpretador ou uma instância já criada
+        workers: Processos usados na tradução, se o interpretador traduzir em paralelo
+
+    Yields:
+        Trechos consecutivos do texto traduzido
+    """
+    if isinstance(engine, str):
+        engine = create_engine(engine)
+
+    if workers and workers > 1 and hasattr(engine, "iter_binary_to_python_parallel"):
+        return engine.iter_binary_to_python_parallel(fileobj, workers, chunk_size)
+    if hasattr(engine, "iter_binary_to_python"):
+        return engine.iter_binary_to_python(fileobj, chunk_size)
+    return engine.traduzir_binario_stream(fileobj, chunk_size)
+
+
+def iter_encode(fileobj, chunk_size=DEFAULT_CHUNK_SIZE, engine="fixed"):
+    """
+    Converte texto para código binário em fluxo.
+
+    Args:
+        fileobj: Arquivo de texto
+        chunk_size: Quantidade de caracteres lidos por vez
+        engine: Nome do interpretador ou uma instância já criada
+
+    Yields:
+        Trechos consecutivos do código binário
+    """
+    if isinstance(engine, str):
+        engine = create_engine(engine)
+
+    if hasattr(engine, "iter_python_to_binary"):
+        return engine.iter_python_to_binary(fileobj, chunk_size)
+    return engine.converter_para_binario_stream(fileobj, chunk_size)
+
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando.
+
+    Args:
+        argv: Argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        Código de saída
+    """
+    parser = argparse.ArgumentParser(
+        description="Tradução em fluxo de arquivos binários do The Collector Binarie"
+    )
+    parser.add_argument("command", choices=("translate", "encode"),
+                        help="translate: binário -> texto; encode: texto -> binário")
+    parser.add_argument("input", help="Arquivo de entrada ('-' para stdin)")
+    parser.add_argument("-o", "--output", default="-", help="Arquivo de saída ('-' para stdout)")
+    parser.add_argument("-e", "--engine", choices=ENGINES, default="fixed",
+                        help="Interpretador usado na tradução")
+    parser.add_argument("-c", "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Caracteres lidos por bloco")
+    parser.add_argument("-j", "--jobs", type=int,
+                        help="Processos usados em translate com o interpretador parser (padrão: CPUs)")
+    parser.add_argument("-s", "--stats", action="store_true",
+                        help="Mostra tempo e vazão em stderr")
+    args = parser.parse_args(argv)
+
+    if args.command == "translate":
+        jobs = args.jobs or os.cpu_count() or 1
+        stream = partial(iter_translate, workers=jobs)
+    else:
+        stream = iter_encode
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    start = time.perf_counter()
+    written = 0
+    try:
+        for piece in stream(source, args.chunk_size, args.engine):
+            target.write(piece)
+            written += len(piece)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+    if args.stats:
+        elapsed = time.perf_counter() - start
+        print(f"{written} caracteres gerados em {elapsed:.3f} s "
+              f"({written / 1e6 / max(elapsed, 1e-9):.1f} MB/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,189 +4,96 @@ Este módulo expande as capacidades do interpretador binário original,
 adicionando suporte para estruturas de controle e funções em binário.
 """
 
-import re
-from typing import Dict, List, Tuple, Optional
+import io
+import os
+import ast
+import multiprocessing
+from collections import deque
+from itertools import chain, islice
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Tuple, Optional
+
+try:
+    from ui.binary_ast_compiler import DEFAULT_FILENAME, BinaryAstCompiler, BinaryTextTranslator
+    from ui.binary_codec_registry import get_dialect
+    from ui.binary_stream import DEFAULT_CHUNK_SIZE, iter_line_batches
+    from ui.binary_validator import Diagnostic, IncrementalValidator
+    from ui.python_token_encoder import PythonTokenEncoder
+    from ui.source_map import SourceMap
+except ImportError:
+    from binary_ast_compiler import DEFAULT_FILENAME, BinaryAstCompiler, BinaryTextTranslator
+    from binary_codec_registry import get_dialect
+    from binary_stream import DEFAULT_CHUNK_SIZE, iter_line_batches
+    from binary_validator import Diagnostic, IncrementalValidator
+    from python_token_encoder import PythonTokenEncoder
+    from source_map import SourceMap
+
+# Palavras que abrem e fecham blocos (previsão do nível de cada lote na tradução em paralelo)
+_BINSTART = "11010000"
+_BINEND = "11010001"
 
 
 class BinarySyntaxParser:
     def __init__(self):
-        # Dicionário expandido de palavras-chave binárias
-        self.binary_keywords = {
-            # Dígitos
-            "00110000": "0", "00110001": "1", "00110010": "2", "00110011": "3",
-            "00110100": "4", "00110101": "5", "00110110": "6", "00110111": "7",
-            "00111000": "8", "00111001": "9",
-
-            # Letras maiúsculas
-            "01000001": "A", "01000010": "B", "01000011": "C", "01000100": "D",
-            "01000101": "E", "01000110": "F", "01000111": "G", "01001000": "H",
-            "01001001": "I", "01001010": "J", "01001011": "K", "01001100": "L",
-            "01001101": "M", "01001110": "N", "01001111": "O", "01010000": "P",
-            "01010001": "Q", "01010010": "R", "01010011": "S", "01010100": "T",
-            "01010101": "U", "01010110": "V", "01010111": "W", "01011000": "X",
-            "01011001": "Y", "01011010": "Z",
-
-            # Letras minúsculas
-            "01100001": "a", "01100010": "b", "01100011": "c", "01100100": "d",
-            "01100101": "e", "01100110": "f", "01100111": "g", "01101000": "h",
-            "01101001": "i", "01101010": "j", "01101011": "k", "01101100": "l",
-            "01101101": "m", "01101110": "n", "01101111": "o", "01110000": "p",
-            "01110001": "q", "01110010": "r", "01110011": "s", "01110100": "t",
-            "01110101": "u", "01110110": "v", "01110111": "w", "01111000": "x",
-            "01111001": "y", "01111010": "z",
-
-            # Caracteres especiais
-            "00100000": " ",     # Espaço
-            "00100001": "!",     # Ponto de exclamação
-            "00100010": "\"",    # Aspas duplas
-            "00100011": "#",     # Hashtag
-            "00100100": "$",     # Cifrão
-            "00100101": "%",     # Porcentagem
-            "00100110": "&",     # E comercial
-            "00100111": "'",     # Aspas simples
-            "00101000": "(",     # Parêntese aberto
-            "00101001": ")",     # Parêntese fechado
-            "00101010": "*",     # Asterisco
-            "00101011": "+",     # Mais
-            "00101100": ",",     # Vírgula
-            "00101101": "-",     # Hífen
-            "00101110": ".",     # Ponto
-            "00101111": "/",     # Barra
-            "00111010": ":",     # Dois pontos
-            "00111011": ";",     # Ponto e vírgula
-            "00111100": "<",     # Menor que
-            "00111101": "=",     # Igual
-            "00111110": ">",     # Maior que
-            "00111111": "?",     # Ponto de interrogação
-            "01000000": "@",     # Arroba
-            "01011011": "[",     # Colchete aberto
-            "01011100": "\\",    # Barra invertida
-            "01011101": "]",     # Colchete fechado
-            "01011110": "^",     # Circunflexo
-            "01011111": "_",     # Sublinhado
-            "01100000": "`",     # Crase
-            "01111011": "{",     # Chave aberta
-            "01111100": "|",     # Barra vertical
-            "01111101": "}",     # Chave fechada
-            "01111110": "~",     # Til
-
-            # Palavras-chave Python (expandidas)
-            "10000000": "and",
-            "10000001": "as",
-            "10000010": "assert",
-            "10000011": "async",
-            "10000100": "await",
-            "10000101": "break",
-            "10000110": "class",
-            "10000111": "continue",
-            "10001000": "def",
-            "10001001": "del",
-            "10001010": "elif",
-            "10001011": "else",
-            "10001100": "except",
-            "10001101": "False",
-            "10001110": "finally",
-            "10001111": "for",
-            "10010000": "from",
-            "10010001": "global",
-            "10010010": "if",
-            "10010011": "import",
-            "10010100": "in",
-            "10010101": "is",
-            "10010110": "lambda",
-            "10010111": "None",
-            "10011000": "nonlocal",
-            "10011001": "not",
-            "10011010": "or",
-            "10011011": "pass",
-            "10011100": "raise",
-            "10011101": "return",
-            "10011110": "True",
-            "10011111": "try",
-            "10100000": "while",
-            "10100001": "with",
-            "10100010": "yield",
-
-            # Funções comuns
-            "10100011": "print",
-            "10100100": "input",
-            "10100101": "len",
-            "10100110": "range",
-            "10100111": "int",
-            "10101000": "str",
-            "10101001": "float",
-            "10101010": "list",
-            "10101011": "dict",
-            "10101100": "set",
-            "10101101": "tuple",
-            "10101110": "sum",
-            "10101111": "min",
-            "10110000": "max",
-            "10110001": "sorted",
-            "10110010": "open",
-            "10110011": "read",
-            "10110100": "write",
-            "10110101": "append",
-            "10110110": "extend",
-            "10110111": "pop",
-            "10111000": "remove",
-            "10111001": "join",
-            "10111010": "split",
-            "10111011": "strip",
-            "10111100": "replace",
-            "10111101": "format",
-            "10111110": "enumerate",
-            "10111111": "zip",
-            "11000000": "map",
-            "11000001": "filter",
-            "11000010": "lambda",
-            
-            # Operadores compostos
-            "11000011": "==",    # Igual a
-            "11000100": "!=",    # Diferente de
-            "11000101": "<=",    # Menor ou igual a
-            "11000110": ">=",    # Maior ou igual a
-            "11000111": "+=",    # Incremento
-            "11001000": "-=",    # Decremento
-            "11001001": "*=",    # Multiplicação e atribuição
-            "11001010": "/=",    # Divisão e atribuição
-            "11001011": "//",    # Divisão inteira
-            "11001100": "**",    # Potência
-            "11001101": "%=",    # Módulo e atribuição
-            "11001110": "//=",   # Divisão inteira e atribuição
-            "11001111": "**=",   # Potência e atribuição
+        # Dialeto compartilhado (tabelas construídas uma única vez por processo)
+        self.codec = get_dialect("parser")
+        
+        # Palavras-chave binárias (já com os caracteres ASCII sem código próprio)
+        # e dicionário inverso para conversão de texto para binário, somente leitura
+        self.binary_keywords = self.codec.binary_to_text
+        self.text_to_binary = self.codec.text_to_binary
+        
+        # Codificador de código Python guiado pelo tokenize
+        self.python_encoder = PythonTokenEncoder(self.text_to_binary)
+
+        # Compilador direto binário -> ast.Module (sem passar por texto Python)
+        self.ast_compiler = BinaryAstCompiler(self.binary_keywords)
+    
+    def get_text_keyword(self, binary: str) -> Optional[str]:
+        """
+        Retorna o significado de um token binário.
+        
+        Args:
+            binary: Token binário de 8 dígitos
             
-            # Comandos especiais da linguagem binária
-            "11010000": "BINSTART",  # Início de bloco binário
-            "11010001": "BINEND",    # Fim de bloco binário
-            "11010010": "BINVAR",    # Declaração de variável
-            "11010011": "BINFUNC",   # Declaração de função
-            "11010100": "BINIF",     # Estrutura condicional
-            "11010101": "BINELSE",   # Estrutura condicional (else)
-            "11010110": "BINLOOP",   # Estrutura de repetição
-            "11010111": "BINBREAK",  # Interromper loop
-            "11011000": "BINCONT",   # Continuar loop
-            "11011001": "BINRET",    # Retorno de função
-            "11011010": "BINPRINT",  # Impressão formatada
-            "11011011": "BININPUT",  # Entrada formatada
-            "11011100": "BINCOMMENT" # Comentário
-        }
+        Returns:
+            Texto correspondente ou None se o token não existir
+        """
+        return self.binary_keywords.get(binary)
+    
+    def validate_binary_syntax(self, binary_code: str) -> List[Tuple[int, str]]:
+        """
+        Valida a sintaxe do código binário.
         
-        # Dicionário inverso para conversão de texto para binário
-        self.text_to_binary = {v: k for k, v in self.binary_keywords.items()}
+        Args:
+            binary_code: String contendo código em formato binário
+            
+        Returns:
+            Lista de tuplas (linha, mensagem de erro)
+        """
+        return [diagnostic.as_tuple() for diagnostic in self.validate_binary_diagnostics(binary_code)]
+    
+    def validate_binary_diagnostics(self, binary_code: str) -> List[Diagnostic]:
+        """
+        Valida a sintaxe do código binário: BINSTART/BINEND desbalanceados,
+        BINVAR/BINFUNC/BINLOOP/BININPUT incompletos, tokens desconhecidos e
+        palavras com largura diferente de 8 bits.
         
-        # Adiciona mapeamento para caracteres individuais que não estão no dicionário
-        for i in range(32, 127):
-            char = chr(i)
-            if char not in self.text_to_binary:
-                binary = format(i, '08b')
-                if binary not in self.binary_keywords:
-                    self.binary_keywords[binary] = char
-                    self.text_to_binary[char] = binary
+        Args:
+            binary_code: String contendo código em formato binário
+            
+        Returns:
+            Lista de Diagnostic, com linha e coluna de cada erro
+        """
+        validator = IncrementalValidator(self.binary_keywords)
+        validator.set_text(binary_code)
+        return validator.diagnostics()
     
     def parse_binary_to_python(self, binary_code: str) -> str:
         """
         Converte código binário para código Python.
+        O texto segue as mesmas regras (tokens, blocos e linhas lógicas) da árvore de
+        parse_binary_to_ast: compilado, dá o mesmo programa.
         
         Args:
             binary_code: String contendo código em formato binário
@@ -194,113 +101,222 @@ class BinarySyntaxParser:
         Returns:
             String contendo código Python equivalente
         """
-        lines = binary_code.strip().splitlines()
-        python_lines = []
+        return "\n".join(self.ast_compiler.iter_python_lines(binary_code.strip().splitlines()))
+
+    def traduzir_binario(self, binary_code: str) -> str:
+        """
+        Converte código binário para código Python, com o nome usado pelos
+        demais interpretadores (executores, TranslationCache, DialectRouter).
+
+        Args:
+            binary_code: String contendo código em formato binário
+
+        Returns:
+            String contendo código Python equivalente
+        """
+        # Sempre em um processo: a tradução em paralelo (parse_binary_to_python_parallel,
+        # binary_stream -j) é pedida explicitamente e não parte da interface
+        return self.parse_binary_to_python(binary_code)
+
+    def parse_binary_to_python_parallel(self, binary_code: str, workers: Optional[int] = None,
+                                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+        """
+        Converte código binário para código Python dividindo o trabalho entre processos.
+        O resultado é igual ao de parse_binary_to_python.
+
+        Args:
+            binary_code: String contendo código em formato binário
+            workers: Quantidade de processos (padrão: os.cpu_count())
+            chunk_size: Quantidade de caracteres de cada lote
+
+        Returns:
+            String contendo código Python equivalente
+        """
+        return "".join(self.iter_binary_to_python_parallel(io.StringIO(binary_code), workers, chunk_size))
+
+    def traduzir_binario_com_mapa(self, binary_code: str) -> Tuple[str, SourceMap]:
+        """
+        Converte código binário para código Python junto com o mapa de origem.
+        Cada token Python emitido fica ligado à palavra binária que o produziu,
+        de modo que um erro no meio da linha aponta para a palavra certa.
+
+        Args:
+            binary_code: String contendo código em formato binário
+
+        Returns:
+            Tupla (código Python, SourceMap entre o código Python e o binário)
+        """
+        # Como em parse_binary_to_python, o código começa depois dos espaços iniciais
+        binary_offset = len(binary_code) - len(binary_code.lstrip())
+        python_offset = 0
+        python_lines, python_offsets, binary_offsets = [], [], []
+        lines = binary_code.strip().splitlines(keepends=True)
+        translator = self.ast_compiler.translator()
+        for index, line in enumerate(lines):
+            pairs = []
+            following = lines[index + 1] if index + 1 < len(lines) else None
+            python_line = translator.translate_line(line, following, pairs)
+            for python_col, binary_col in pairs:
+                python_offsets.append(python_offset + python_col)
+                # As buscas no sentido binário -> Python precisam de posições crescentes
+                # (BININPUT, por exemplo, emite o nome antes do "=" que vem do comando)
+                position = binary_offset + binary_col
+                binary_offsets.append(max(position, binary_offsets[-1]) if binary_offsets else position)
+            python_lines.append(python_line)
+            binary_offset += len(line)
+            python_offset += len(python_line) + 1
+        python_code = "\n".join(python_lines)
+        return python_code, SourceMap(python_code, binary_code, python_offsets, binary_offsets)
+
+    def parse_binary_to_ast(self, binary_code: str, filename: str = DEFAULT_FILENAME) -> ast.Module:
+        """
+        Converte código binário diretamente em uma árvore sintática Python.
+        Linhas e colunas dos nós apontam para as palavras do código binário.
+
+        Args:
+            binary_code: String contendo código em formato binário
+            filename: Nome de arquivo usado nas mensagens de erro
+
+        Returns:
+            ast.Module equivalente
+
+        Raises:
+            SyntaxError: Com a linha e a coluna do erro no código binário
+        """
+        return self.ast_compiler.parse(binary_code, filename)
+
+    def compile_binary(self, binary_code: str, filename: str = DEFAULT_FILENAME):
+        """
+        Compila código binário sem gerar texto Python intermediário.
+
+        Args:
+            binary_code: String contendo código em formato binário
+            filename: Nome de arquivo registrado no objeto de código
+
+        Returns:
+            Objeto de código
+
+        Raises:
+            SyntaxError: Com a linha e a coluna do erro no código binário
+        """
+        return self.ast_compiler.compile(binary_code, filename)
+
+    def unparse_binary(self, binary_code: str) -> str:
+        """
+        Gera o código Python de um código binário a partir da árvore sintática
+        (ast.unparse), para exibição.
+
+        Args:
+            binary_code: String contendo código em formato binário
+
+        Returns:
+            Código Python equivalente
+        """
+        return self.ast_compiler.to_python(binary_code)
+
+    def iter_binary_to_python(self, binary_file, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Converte código binário para código Python em fluxo.
+        Lê o arquivo em blocos e mantém entre eles apenas o estado do tradutor (blocos
+        e parênteses abertos e a linha lógica em andamento). A última linha de cada
+        bloco espera o bloco seguinte, que pode continuar a sua linha lógica.
         
-        # Controle de indentação
-        indent_level = 0
+        Args:
+            binary_file: Arquivo de texto contendo código em formato binário
+            chunk_size: Quantidade de caracteres lidos por vez
+            
+        Yields:
+            Trechos consecutivos do código Python equivalente
+        """
+        translator = self.ast_compiler.translator()
+        held = None
+        separator = ""
         
-        for line in lines:
-            # Ignora linhas vazias
-            if not line.strip():
-                python_lines.append("")
+        for lines in iter_line_batches(binary_file, chunk_size):
+            if held is not None:
+                lines.insert(0, held)
+            held = lines.pop()
+            if not lines:
                 continue
-                
-            tokens = line.strip().split()
-            python_tokens = []
-            
-            # Processa tokens especiais de controle
-            i = 0
-            while i < len(tokens):
-                token = tokens[i]
-                
-                # Verifica se é um token especial
-                if token == "11010000":  # BINSTART - início de bloco
-                    indent_level += 1
-                    python_tokens.append(":")
-                elif token == "11010001":  # BINEND - fim de bloco
-                    indent_level -= 1
-                    # Não adiciona nada, apenas reduz a indentação
-                elif token == "11010010":  # BINVAR - declaração de variável
-                    if i + 2 < len(tokens):
-                        var_name = self.binary_keywords.get(tokens[i+1], f"[{tokens[i+1]}]")
-                        python_tokens.append(var_name)
-                        python_tokens.append("=")
-                        i += 2  # Pula os próximos dois tokens
-                    else:
-                        python_tokens.append("[ERRO: BINVAR incompleto]")
-                elif token == "11010011":  # BINFUNC - declaração de função
-                    if i + 1 < len(tokens):
-                        func_name = self.binary_keywords.get(tokens[i+1], f"[{tokens[i+1]}]")
-                        python_tokens.append("def")
-                        python_tokens.append(func_name)
-                        python_tokens.append("()")
-                        i += 1  # Pula o próximo token
-                    else:
-                        python_tokens.append("[ERRO: BINFUNC incompleto]")
-                elif token == "11010100":  # BINIF - estrutura condicional
-                    python_tokens.append("if")
-                elif token == "11010101":  # BINELSE - estrutura condicional (else)
-                    python_tokens.append("else")
-                elif token == "11010110":  # BINLOOP - estrutura de repetição
-                    if i + 1 < len(tokens):
-                        count = self.binary_keywords.get(tokens[i+1], f"[{tokens[i+1]}]")
-                        python_tokens.append(f"for _ in range({count})")
-                        i += 1  # Pula o próximo token
-                    else:
-                        python_tokens.append("[ERRO: BINLOOP incompleto]")
-                elif token == "11010111":  # BINBREAK - interromper loop
-                    python_tokens.append("break")
-                elif token == "11011000":  # BINCONT - continuar loop
-                    python_tokens.append("continue")
-                elif token == "11011001":  # BINRET - retorno de função
-                    python_tokens.append("return")
-                elif token == "11011010":  # BINPRINT - impressão formatada
-                    python_tokens.append("print")
-                    python_tokens.append("(")
-                    
-                    # Coleta todos os tokens até o fim da linha para o print
-                    j = i + 1
-                    print_tokens = []
-                    while j < len(tokens):
-                        print_token = self.binary_keywords.get(tokens[j], f"[{tokens[j]}]")
-                        print_tokens.append(print_token)
-                        j += 1
-                    
-                    python_tokens.append(" ".join(print_tokens))
-                    python_tokens.append(")")
-                    i = j - 1  # Ajusta o índice para o último token processado
-                elif token == "11011011":  # BININPUT - entrada formatada
-                    if i + 1 < len(tokens):
-                        var_name = self.binary_keywords.get(tokens[i+1], f"[{tokens[i+1]}]")
-                        python_tokens.append(f"{var_name} = input()")
-                        i += 1  # Pula o próximo token
-                    else:
-                        python_tokens.append("[ERRO: BININPUT incompleto]")
-                elif token == "11011100":  # BINCOMMENT - comentário
-                    # Coleta todos os tokens até o fim da linha para o comentário
-                    j = i + 1
-                    comment_tokens = []
-                    while j < len(tokens):
-                        comment_token = self.binary_keywords.get(tokens[j], f"[{tokens[j]}]")
-                        comment_tokens.append(comment_token)
-                        j += 1
-                    
-                    python_tokens.append("# " + " ".join(comment_tokens))
-                    i = j - 1  # Ajusta o índice para o último token processado
-                else:
-                    # Token normal, traduz diretamente
-                    translated = self.binary_keywords.get(token, f"[{token}]")
-                    python_tokens.append(translated)
-                
-                i += 1
-            
-            # Adiciona a linha com a indentação correta
-            indentation = "    " * max(0, indent_level)
-            python_line = indentation + " ".join(python_tokens)
-            python_lines.append(python_line)
+            python_lines = [translator.translate_line(line, following)
+                            for line, following in zip(lines, chain(islice(lines, 1, None), [held]))]
+            yield separator + "\n".join(python_lines)
+            separator = "\n"
         
-        return "\n".join(python_lines)
+        if held is not None:
+            yield separator + translator.translate_line(held)
+
+    def iter_binary_to_python_parallel(self, binary_file, workers: Optional[int] = None,
+                                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Converte código binário para código Python em fluxo, usando vários processos.
+        Cada lote é traduzido por um processo a partir de um estado previsto: fora de
+        parênteses e de linhas lógicas em andamento, no nível de blocos dado pela soma
+        dos BINSTART/BINEND dos lotes anteriores (block_delta). Se o estado real no
+        início do lote for outro, o lote é traduzido de novo neste processo. Os trechos
+        saem na ordem de leitura e, juntos, formam o mesmo texto de iter_binary_to_python.
+
+        Args:
+            binary_file: Arquivo de texto contendo código em formato binário
+            workers: Quantidade de processos (padrão: os.cpu_count())
+            chunk_size: Quantidade de caracteres lidos por vez
+
+        Yields:
+            Trechos consecutivos do código Python equivalente
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1:
+            yield from self.iter_binary_to_python(binary_file, chunk_size)
+            return
+
+        # Lotes em andamento em cada etapa (limita a memória usada pela leitura adiantada)
+        window = 2 * workers
+        # "spawn" não copia o estado do processo (threads da interface, Qt)
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(workers, mp_context=context) as executor:
+            # Lotes lidos, com a contagem de blocos em andamento
+            counting = deque()
+            # Lotes em tradução: (linhas, primeira linha do lote seguinte, estado previsto, variação, future)
+            translating = deque()
+            # Nível de blocos previsto para o início do próximo lote a enviar
+            depth = 0
+            state = self.ast_compiler.translator().state()
+
+            def start_translation(lookahead):
+                nonlocal depth
+                lines, delta = counting.popleft()
+                expected = BinaryTextTranslator.block_state(depth)
+                delta = delta.result()
+                translating.append((lines, lookahead, expected, delta,
+                                    executor.submit(_translate_batch, lines, lookahead, expected)))
+                depth += delta
+
+            def finish_translation():
+                nonlocal depth, state
+                lines, lookahead, expected, delta, future = translating.popleft()
+                text, end_state = future.result()
+                if state != expected:
+                    # Lote que começa dentro de parênteses, de uma linha lógica ou em outro nível
+                    text, end_state = _translate_lines(self.ast_compiler, lines, lookahead, state)
+                state = end_state
+                # Corrige a previsão dos lotes ainda não enviados
+                depth = state[0] + sum(entry[3] for entry in translating)
+                return text
+
+            separator = ""
+            for lines in iter_line_batches(binary_file, chunk_size):
+                counting.append((lines, executor.submit(block_delta, lines)))
+                if len(counting) >= window:
+                    start_translation(counting[1][0][0])
+                if len(translating) >= window:
+                    yield separator + finish_translation()
+                    separator = "\n"
+
+            while counting:
+                start_translation(counting[1][0][0] if len(counting) > 1 else None)
+            while translating:
+                yield separator + finish_translation()
+                separator = "\n"
     
     def parse_python_to_binary(self, python_code: str) -> str:
         """
@@ -312,106 +328,107 @@ class BinarySyntaxParser:
         Returns:
             String contendo código em formato binário equivalente
         """
-        lines = python_code.strip().splitlines()
-        binary_lines = []
+        # Linhas só com espaços ficam vazias, como na versão em fluxo
+        lines = [line if line.strip() else "" for line in python_code.strip().splitlines()]
+        return "\n".join(self.python_encoder.iter_lines(lines))
+    
+    def iter_python_to_binary(self, python_file, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Converte código Python para código binário em fluxo, linha a linha.
         
-        for line in lines:
-            # Ignora linhas vazias
-            if not line.strip():
-                binary_lines.append("")
-                continue
-            
-            # Analisa a indentação
-            indent_count = len(line) - len(line.lstrip())
-            indent_level = indent_count // 4  # Assume 4 espaços por nível
-            line = line.strip()
-            
-            # Tokens especiais para estruturas Python comuns
-            if line.startswith("def "):
-                parts = line.split("(")[0].split()
-                func_name = parts[1]
-                binary_tokens = ["11010011"]  # BINFUNC
-                
-                # Adiciona o nome da função em binário
-                if func_name in self.text_to_binary:
-                    binary_tokens.append(self.text_to_binary[func_name])
-                else:
-                    # Converte caractere por caractere
-                    for char in func_name:
-                        if char in self.text_to_binary:
-                            binary_tokens.append(self.text_to_binary[char])
-                        else:
-                            binary_tokens.append(format(ord(char), '08b'))
-                
-                # Adiciona o início do bloco
-                if line.endswith(":"):
-                    binary_tokens.append("11010000")  # BINSTART
-                
-                binary_lines.append(" ".join(binary_tokens))
-                continue
-            
-            elif line.startswith("if "):
-                parts = line.split(":")
-                condition = parts[0][3:].strip()
-                
-                binary_tokens = ["11010100"]  # BINIF
-                
-                # Converte a condição
-                for word in condition.split():
-                    if word in self.text_to_binary:
-                        binary_tokens.append(self.text_to_binary[word])
-                    else:
-                        # Converte caractere por caractere
-                        for char in word:
-                            if char in self.text_to_binary:
-                                binary_tokens.append(self.text_to_binary[char])
-                            else:
-                                binary_tokens.append(format(ord(char), '08b'))
-                
-                # Adiciona o início do bloco
-                if line.endswith(":"):
-                    binary_tokens.append("11010000")  # BINSTART
-                
-                binary_lines.append(" ".join(binary_tokens))
-                continue
-            
-            elif line.startswith("for "):
-                parts = line.split("(")
-                var_part = parts[1].split("in")[0].strip()
-                range_part = parts[2].strip()[:-1]  # Remove o ")"
-                
-                binary_tokens = ["11010110"]  # BINLOOP
-                
-                # Converte a variável
-                var_name = var_part.split("=")[0].strip()
-                if var_name in self.text_to_binary:
-                    binary_tokens.append(self.text_to_binary[var_name])
-                else:
-                    binary_tokens.append(format(ord(var_name), '08b'))
-                
-                # Converte o intervalo
-                if range_part.startswith("range"):
-                    range_args = range_part[6:-1].split(",")
-                    for arg in range_args:
-                        binary_tokens.append("11000111")  # Operador de incremento
-                        arg = arg.strip()
-                        if arg.isdigit():
-                            binary_tokens.append(format(int(arg), '08b'))
-                        else:
-                            binary_tokens.append(self.text_to_binary.get(arg, f"[{arg}]"))
-                
-                binary_tokens.append("11010000")  # BINSTART
-                binary_lines.append(" ".join(binary_tokens))
-                continue
-            
-            # Tradução padrão de linha
-            binary_line = []
-            for char in line:
-                if char in self.text_to_binary:
-                    binary_line.append(self.text_to_binary[char])
-                else:
-                    binary_line.append(format(ord(char), '08b'))
+        Args:
+            python_file: Arquivo de texto contendo código Python
+            chunk_size: Quantidade de caracteres lidos por vez
             
-            binary_lines.append(" ".join(binary_line))
+        Yields:
+            Trechos consecutivos do código em formato binário
+        """
+        # Tamanhos dos lotes lidos, para devolver a saída com a mesma divisão
+        batch_sizes = deque()
+        
+        def iter_source_lines():
+            first = True
+            for lines in iter_line_batches(python_file, chunk_size):
+                batch_sizes.append(len(lines))
+                if first:
+                    # Como em strip(), a primeira linha perde a indentação
+                    lines[0] = lines[0].lstrip()
+                    first = False
+                yield from lines
         
-        return "\n".join(binary_lines)
\ No newline at end of file
+        separator = ""
+        binary_lines = []
+        for binary_line in self.python_encoder.iter_lines(iter_source_lines()):
+            binary_lines.append(binary_line)
+            if len(binary_lines) == batch_sizes[0]:
+                batch_sizes.popleft()
+                yield separator + "\n".join(binary_lines)
+                separator = "\n"
+                binary_lines = []
+        
+        if binary_lines:
+            yield separator + "\n".join(binary_lines)
+
+
+def block_delta(lines: List[str]) -> int:
+    """
+    Estima a variação do nível de blocos causada por um lote de linhas, sem
+    traduzi-las: BINSTART soma 1 e BINEND subtrai 1. Palavras com esses códigos
+    dentro de strings, comentários ou operandos erram a conta; a previsão só
+    decide se o lote precisa ser traduzido de novo.
+
+    Args:
+        lines: Linhas em formato binário
+
+    Returns:
+        Soma das variações do nível de blocos das linhas
+    """
+    delta = 0
+    for line in lines:
+        # A maioria das linhas não abre nem fecha blocos
+        if _BINSTART in line or _BINEND in line:
+            words = line.split()
+            delta += words.count(_BINSTART) - words.count(_BINEND)
+    return delta
+
+
+def _translate_lines(compiler: BinaryAstCompiler, lines: List[str], lookahead: Optional[str],
+                     state: tuple) -> Tuple[str, tuple]:
+    """
+    Traduz um lote de linhas a partir de um estado do tradutor.
+
+    Args:
+        compiler: BinaryAstCompiler do dialeto
+        lines: Linhas em formato binário
+        lookahead: Primeira linha do lote seguinte (None no fim do código)
+        state: Estado antes da primeira linha
+
+    Returns:
+        Tupla (linhas Python do lote separadas por quebras de linha, estado depois do lote)
+    """
+    translator = compiler.translator(state)
+    python_lines = [translator.translate_line(line, following)
+                    for line, following in zip(lines, chain(islice(lines, 1, None), [lookahead]))]
+    return "\n".join(python_lines), translator.state()
+
+
+# Analisador de cada processo da tradução em paralelo (criado no primeiro lote)
+_worker_parser = None
+
+
+def _translate_batch(lines: List[str], lookahead: Optional[str], state: tuple) -> Tuple[str, tuple]:
+    """
+    Traduz um lote de linhas a partir de um estado previsto (processo de trabalho).
+
+    Args:
+        lines: Linhas em formato binário
+        lookahead: Primeira linha do lote seguinte (None no fim do código)
+        state: Estado previsto antes da primeira linha
+
+    Returns:
+        Tupla (linhas Python do lote, estado depois do lote)
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = BinarySyntaxParser()
+    return _translate_lines(_worker_parser.ast_compiler, lines, lookahead, state)
@@ -0,0 +1,351 @@
+"""
+Módulo de decodificação rápida de código binário baseada em tabela.
+Substitui a normalização e a tokenização caractere a caractere dos interpretadores
+por operações em bloco sobre bytes (bytes.translate / bytes.split) e resolve cada
+grupo de 8 bits por uma tabela de 256 entradas construída uma única vez.
+Quando o NumPy está disponível, o código no formato canônico ("01100001 01100010")
+é empacotado em valores de byte de forma vetorizada.
+"""
+
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Caracteres não ASCII (tratados antes da conversão para bytes)
+_NON_ASCII_PATTERN = re.compile(r'[^\x00-\x7f]+')
+
+# Marcador que substitui a quebra de linha antes da divisão em grupos
+_NEWLINE_MARKER = b'|'
+
+# Valor do token de quebra de linha ("00001010")
+_NEWLINE_VALUE = 0b00001010
+
+# Grupo de caracteres entre espaços em branco (antes de descartar os que não são 0/1)
+_GROUP_PATTERN = re.compile(r'[^\s]+')
+
+# Grupo já no formato canônico de 8 bits
+_CANONICAL_GROUP = re.compile(r'[01]{8}')
+
+if np is not None:
+    # Cada grupo de 8 caracteres '0'/'1' é lido como um inteiro de 64 bits
+    _ASCII_MASK = np.uint64(0xFEFEFEFEFEFEFEFE)
+    _ASCII_ZEROS = np.uint64(0x3030303030303030)
+    _LOW_BITS = np.uint64(0x0101010101010101)
+    # Multiplicador que reúne os 8 bits no byte mais alto (primeiro caractere = bit 7)
+    _GATHER = np.uint64(0x8040201008040201)
+    _SHIFT = np.uint64(56)
+
+
+def _build_normalize_tables():
+    """
+    Constrói as tabelas usadas por bytes.translate na normalização.
+
+    Returns:
+        Tupla (tabela de tradução, bytes a remover)
+    """
+    # Espaços em branco (exceto \n) viram espaço simples, como em str.isspace()
+    whitespace = bytes(i for i in range(128) if chr(i).isspace() and chr(i) != '\n')
+    table = bytes.maketrans(whitespace, b' ' * len(whitespace))
+
+    # Todo o resto que não for 0, 1, \n ou espaço em branco é descartado
+    keep = set(b'01\n') | set(whitespace)
+    delete = bytes(i for i in range(256) if i not in keep)
+    return table, delete
+
+
+_NORMALIZE_TABLE, _NORMALIZE_DELETE = _build_normalize_tables()
+
+
+def _strip_comments(binary_code):
+    """
+    Remove comentários (tudo após // até o fim da linha) e os espaços que os precedem.
+
+    Args:
+        binary_code: Código binário com comentários
+
+    Returns:
+        Código binário sem comentários
+    """
+    parts = binary_code.split('//')
+    last = len(parts) - 1
+    cleaned = []
+    for index, part in enumerate(parts):
+        if index > 0:
+            # Só sobrevive o que vem depois da quebra de linha que encerra o comentário
+            newline = part.find('\n')
+            if newline < 0:
+                continue
+            part = part[newline:]
+        if index < last:
+            # Espaços antes do comentário não alteram os tokens
+            part = part.rstrip(' \t')
+        cleaned.append(part)
+    return ''.join(cleaned)
+
+
+def _strip_non_ascii(match):
+    """Converte espaços não ASCII em espaço simples e descarta o restante."""
+    return ''.join(' ' for char in match.group() if char.isspace())
+
+
+class _TokenLookup(dict):
+    """
+    Dicionário de grupos de 8 bits -> texto.
+    Grupos irregulares (tamanho diferente de 8) retornam None para serem
+    expandidos depois, sem custo extra no caminho comum.
+    """
+
+    def __missing__(self, key):
+        return None
+
+
+class BinaryTableDecoder:
+    """
+    Decodificador de código binário orientado a tabela.
+    Produz exatamente os mesmos tokens traduzidos que a combinação
+    _normalize_binary + _tokenize_binary + consulta a binary_to_text.
+    """
+
+    def __init__(self, binary_to_text):
+        """
+        Inicializa o decodificador.
+
+        Args:
+            binary_to_text: Dicionário de tradução binário -> texto do interpretador
+        """
+        # Tabela de 256 entradas: valor do byte -> texto traduzido
+        self.byte_to_text = []
+        for value in range(256):
+            token = format(value, '08b')
+            self.byte_to_text.append(binary_to_text.get(token, f"<{token}>"))
+        self.newline_text = self.byte_to_text[_NEWLINE_VALUE]
+
+        # Índice por grupo de 8 caracteres já empacotado em bytes
+        self._lookup = _TokenLookup()
+        for value, text in enumerate(self.byte_to_text):
+            self._lookup[format(value, '08b').encode('ascii')] = text
+        self._lookup[_NEWLINE_MARKER] = self.newline_text
+
+        # Tabelas vetorizadas: índices 256-511 são o token seguido de quebra de linha
+        if np is not None:
+            self._token_array = np.array(self.byte_to_text + [self.newline_text], dtype=object)
+            self._joined_array = np.array(
+                self.byte_to_text + [text + self.newline_text for text in self.byte_to_text],
+                dtype=object
+            )
+
+    def normalize(self, binary_code):
+        """
+        Normaliza o código binário em bloco.
+
+        Args:
+            binary_code: Código binário a ser normalizado
+
+        Returns:
+            Bytes contendo apenas 0, 1, espaço e quebra de linha
+        """
+        if '//' in binary_code:
+            binary_code = _strip_comments(binary_code)
+
+        if not binary_code.isascii():
+            binary_code = _NON_ASCII_PATTERN.sub(_strip_non_ascii, binary_code)
+
+        data = binary_code.encode('ascii')
+        return data.translate(_NORMALIZE_TABLE, _NORMALIZE_DELETE)
+
+    def decode_tokens(self, binary_code):
+        """
+        Decodifica o código binário em uma lista de tokens traduzidos.
+
+        Args:
+            binary_code: Código binário a ser traduzido
+
+        Returns:
+            Lista de textos, um por token
+        """
+        data, packed = self._pack(binary_code)
+        if packed is not None:
+            values, newlines = packed
+            order = np.empty(len(values) * 2, dtype=np.intp)
+            order[0::2] = values
+            order[1::2] = -1
+            order[1:-1:2][newlines] = 256
+            return self._token_array[order[order >= 0]].tolist()
+
+        return self._decode_groups(data)
+
+    def decode_tokens_with_offsets(self, binary_code):
+        """
+        Decodifica o código como decode_tokens, informando onde começa cada token
+        no texto original (antes da remoção de comentários e da normalização).
+
+        Args:
+            binary_code: Código binário a ser traduzido
+
+        Returns:
+            Tupla (lista de textos, lista de posições no código, uma por token)
+        """
+        tokens = []
+        offsets = []
+        lookup = self._lookup
+        line_start = 0
+        for line in binary_code.split('\n'):
+            comment = line.find('//')
+            content = line if comment < 0 else line[:comment]
+            for match in _GROUP_PATTERN.finditer(content):
+                group = match.group()
+                start = line_start + match.start()
+                if _CANONICAL_GROUP.fullmatch(group):
+                    tokens.append(lookup[group.encode('ascii')])
+                    offsets.append(start)
+                    continue
+
+                # Caracteres que não são 0/1 são descartados sem separar o grupo
+                bits = [index for index, char in enumerate(group) if char in '01']
+                for first in range(0, len(bits), 8):
+                    chunk = ''.join(group[index] for index in bits[first:first + 8])
+                    text = lookup[chunk.encode('ascii')] if len(chunk) == 8 else chunk
+                    tokens.append(text)
+                    offsets.append(start + bits[first])
+
+            line_start += len(line) + 1
+            if line_start <= len(binary_code):
+                tokens.append(self.newline_text)
+                offsets.append(line_start - 1)
+
+        return tokens, offsets
+
+    def decode(self, binary_code):
+        """
+        Traduz código binário para texto (equivalente a BinaryInterpreterFixed.traduzir_binario).
+
+        Args:
+            binary_code: Código binário a ser traduzido
+
+        Returns:
+            Texto traduzido
+        """
+        data, packed = self._pack(binary_code)
+        if packed is not None:
+            values, newlines = packed
+            values = values.astype(np.intp)
+            values[:-1][newlines] += 256
+            return ''.join(self._joined_array[values].tolist())
+
+        return ''.join(self._decode_groups(data))
+
+    def _pack(self, binary_code):
+        """
+        Tenta empacotar o código no formato canônico em valores de byte.
+
+        Args:
+            binary_code: Código binário a ser traduzido
+
+        Returns:
+            Tupla (bytes normalizados, (valores, máscara de quebras) ou None)
+        """
+        if '//' in binary_code:
+            binary_code = _strip_comments(binary_code)
+
+        if np is not None and binary_code.isascii():
+            # Código já limpo: o empacotamento valida os caracteres e evita a normalização
+            data = binary_code.encode('ascii')
+            packed = self._pack_canonical(data)
+            if packed is not None:
+                return data, packed
+
+        data = self.normalize(binary_code)
+        if np is None:
+            return data, None
+
+        packed = self._pack_canonical(data)
+        if packed is not None:
+            return data, packed
+
+        # Espaços extras e espaços junto a quebras de linha não alteram os tokens
+        while b'  ' in data:
+            data = data.replace(b'  ', b' ')
+        if b' \n' in data:
+            data = data.replace(b' \n', b'\n')
+        if b'\n ' in data:
+            data = data.replace(b'\n ', b'\n')
+        data = data.strip(b' ')
+        return data, self._pack_canonical(data)
+
+    def _pack_canonical(self, data):
+        """
+        Empacota grupos de 8 bits separados por um único espaço ou quebra de linha.
+
+        Args:
+            data: Bytes normalizados
+
+        Returns:
+            Tupla (valores uint64, máscara de quebras de linha) ou None se o
+            código não estiver no formato canônico
+        """
+        if len(data) % 9 != 8:
+            return None
+
+        count = (len(data) + 1) // 9
+        words = np.ndarray(shape=(count,), dtype='<u8', buffer=data, strides=(9,)).copy()
+        if ((words & _ASCII_MASK) != _ASCII_ZEROS).any():
+            return None
+
+        separators = np.frombuffer(data, dtype=np.uint8)[8::9]
+        newlines = separators == ord('\n')
+        if not (newlines | (separators == ord(' '))).all():
+            return None
+
+        words &= _LOW_BITS
+        words *= _GATHER
+        words >>= _SHIFT
+        return words, newlines
+
+    def _decode_groups(self, data):
+        """
+        Decodifica bytes normalizados pela divisão em grupos (caminho geral).
+
+        Args:
+            data: Bytes normalizados
+
+        Returns:
+            Lista de tokens traduzidos
+        """
+        groups = data.replace(b'\n', b' | ').split()
+
+        translated = list(map(self._lookup.__getitem__, groups))
+        if None in translated:
+            translated = self._expand_irregular(groups, translated)
+
+        return translated
+
+    def _expand_irregular(self, groups, translated):
+        """
+        Expande grupos com tamanho diferente de 8 bits.
+
+        Args:
+            groups: Grupos de bits separados por espaço
+            translated: Tradução parcial (None nos grupos irregulares)
+
+        Returns:
+            Lista de tokens traduzidos completa
+        """
+        lookup = self._lookup
+        result = []
+        for group, text in zip(groups, translated):
+            if text is not None:
+                result.append(text)
+                continue
+
+            # Grupos longos são quebrados a cada 8 bits; a sobra fica como está
+            full = len(group) - len(group) % 8
+            for start in range(0, full, 8):
+                result.append(lookup[group[start:start + 8]])
+            if full < len(group):
+                result.append(group[full:].decode('ascii'))
+
+        return result
@@ -0,0 +1,170 @@
+"""
+Módulo de codificação rápida de texto Python para código binário.
+Substitui as várias passadas de re.sub / str.replace e a consulta token a token
+por uma única divisão do texto com correspondência mais longa. Uma expressão
+regular separa strings literais, entradas como "print()", identificadores,
+sequências de operadores e sequências dos demais caracteres; cada pedaço distinto
+é codificado uma vez (identificadores inteiros são comparados às palavras-chave,
+operadores pela correspondência mais longa) e as repetições saem de um dicionário.
+Strings literais são codificadas caractere a caractere, com os espaços.
+"""
+
+import re
+
+# Strings literais (as de três aspas primeiro); o conteúdo não é dividido em tokens
+_STRING_PATTERN = (
+    r'"""[\s\S]*?"""|' r"'''[\s\S]*?'''|"
+    r'"[^"\\\n]*(?:\\.[^"\\\n]*)*"|' r"'[^'\\\n]*(?:\\.[^'\\\n]*)*'"
+)
+
+# Caracteres de identificador (como \w com re.ASCII)
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+
+# Comprimento máximo de um pedaço guardado no dicionário de pedaços já codificados
+_MAX_CACHED_PIECE = 64
+
+
+def _is_word_char(char):
+    """Indica se o caractere faz parte de um identificador."""
+    return char in _WORD_CHARS
+
+
+def _is_blank(char):
+    """Indica se o caractere é um espaço em branco que só separa tokens."""
+    return char.isascii() and char.isspace()
+
+
+def _is_operator(text):
+    """Indica se a entrada só tem símbolos de operador (nem letras, dígitos, espaços ou aspas)."""
+    return not any(_is_word_char(char) or char.isspace() or char in "\"'" for char in text)
+
+
+class _CharTable(dict):
+    """
+    Tabela de str.translate: código do caractere -> token binário seguido de espaço.
+    Caracteres fora da tabela viram "<c> "; espaços em branco fora de strings são descartados.
+    """
+
+    def __init__(self, tokens, keep_spaces):
+        super().__init__(tokens)
+        self.keep_spaces = keep_spaces
+
+    def __missing__(self, code):
+        char = chr(code)
+        value = "" if _is_blank(char) and not self.keep_spaces else f"<{char}> "
+        self[code] = value
+        return value
+
+
+class _PieceCache(dict):
+    """
+    Codificação de cada pedaço distinto do texto, calculada no primeiro acesso.
+    Pedaços longos (strings literais grandes) não são guardados.
+    """
+
+    def __init__(self, encode_piece):
+        super().__init__()
+        self.encode_piece = encode_piece
+
+    def __missing__(self, piece):
+        value = self.encode_piece(piece)
+        if len(piece) <= _MAX_CACHED_PIECE:
+            self[piece] = value
+        return value
+
+
+class BinaryTextEncoder:
+    """
+    Codificador de texto para código binário por correspondência mais longa.
+    """
+
+    def __init__(self, text_to_binary):
+        """
+        Compila a divisão em pedaços e as tabelas de caracteres.
+
+        Args:
+            text_to_binary: Dicionário de tradução texto -> binário do interpretador
+        """
+        self.text_to_binary = text_to_binary
+        self._tokens = {text: f"{binary} " for text, binary in text_to_binary.items()}
+
+        # Caracteres isolados: convertidos em bloco por str.translate
+        single = {ord(text): f"{binary} " for text, binary in text_to_binary.items() if len(text) == 1}
+        self._plain_table = _CharTable(single, keep_spaces=False)
+        for code in single:
+            if _is_blank(chr(code)):
+                # Fora de strings, espaços em branco só separam tokens
+                self._plain_table[code] = ""
+        self._string_table = _CharTable(single, keep_spaces=True)
+
+        # Entradas de várias letras: palavras-chave (identificadores inteiros), operadores
+        # (divididos dentro de cada sequência de símbolos) e as demais, como "print()",
+        # procuradas como alternativas próprias, das mais longas para as mais curtas
+        words = [text for text in text_to_binary if len(text) > 1]
+        symbols = [text for text in words if _is_operator(text)]
+        explicit = [text for text in words if not _is_operator(text) and not all(map(_is_word_char, text))]
+        self._symbol_chars = frozenset("".join(symbols))
+        self._longest_symbol = max(map(len, symbols), default=0)
+
+        symbol_class = "".join(sorted(map(re.escape, self._symbol_chars)))
+        alternatives = [_STRING_PATTERN]
+        for text in sorted(explicit, key=len, reverse=True):
+            before = r"(?<!\w)" if _is_word_char(text[0]) else ""
+            after = r"(?!\w)" if _is_word_char(text[-1]) else ""
+            alternatives.append(before + re.escape(text) + after)
+        alternatives.append(r"\w+")
+        if symbol_class:
+            alternatives.append(f"[{symbol_class}]+")
+        # As sequências dos demais caracteres param onde uma entrada própria pode começar
+        stop_class = symbol_class + "".join(sorted({re.escape(text[0]) for text in explicit}))
+        alternatives.append(f"[^\\w\"'{stop_class}]+|[\\s\\S]")
+        self._pieces = re.compile("|".join(alternatives), re.ASCII)
+
+    def encode(self, text):
+        """
+        Converte texto para código binário em uma única passada.
+
+        Args:
+            text: Texto a ser convertido
+
+        Returns:
+            Código binário (tokens de 8 bits separados por espaço)
+        """
+        pieces = _PieceCache(self._encode_piece)
+        return "".join(map(pieces.__getitem__, self._pieces.findall(text)))[:-1]
+
+    def _encode_piece(self, piece):
+        """
+        Codifica um pedaço do texto (string, entrada própria, identificador, operadores ou demais caracteres).
+
+        Args:
+            piece: Pedaço produzido pela divisão
+
+        Returns:
+            Tokens do pedaço, cada um seguido de espaço
+        """
+        first = piece[0]
+        if first in "\"'" and len(piece) > 1 and piece[-1] == first:
+            return piece.translate(self._string_table)
+        token = self._tokens.get(piece)
+        if token is not None and len(piece) > 1:
+            # Palavra-chave, entrada como "print()" ou sequência de operadores que é um só token
+            return token
+        if first not in self._symbol_chars:
+            return piece.translate(self._plain_table)
+
+        # Operadores: correspondência mais longa, da esquerda para a direita
+        tokens = self._tokens
+        output = []
+        position = 0
+        while position < len(piece):
+            for length in range(min(self._longest_symbol, len(piece) - position), 1, -1):
+                token = tokens.get(piece[position:position + length])
+                if token is not None:
+                    output.append(token)
+                    position += length
+                    break
+            else:
+                output.append(piece[position].translate(self._plain_table))
+                position += 1
+        return "".join(output)
@@ -0,0 +1,138 @@
+"""
+Módulo de índice de tokens do código binário, linha a linha.
+Uma única passada de expressão regular por linha classifica palavras de 8 bits,
+strings binárias e comentários. O resultado de cada linha é guardado em uma
+tupla plana (início, comprimento, tipo, ...), compartilhada por quem precisa dos
+tokens, e é calculado sob demanda: linhas ainda não
+examinadas ficam como None até serem exibidas ou processadas em segundo plano.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Tipos de token
+TOKEN_KEYWORD = 0
+TOKEN_CONTROL = 1
+TOKEN_FUNCTION = 2
+TOKEN_INVALID = 3
+TOKEN_STRING = 4
+TOKEN_COMMENT = 5
+
+# Comentários e strings têm prioridade sobre as palavras que contêm
+_TOKEN_PATTERN = re.compile(r'//[^\n]*|"[01\s]*"|\b[01]{8}\b')
+
+CONTROL_TOKENS = (
+    "11010000",  # BINSTART
+    "11010001",  # BINEND
+    "11010010",  # BINVAR
+    "11010011",  # BINFUNC
+    "11010100",  # BINIF
+    "11010101",  # BINELSE
+    "11010110",  # BINLOOP
+    "11010111",  # BINBREAK
+    "11011000",  # BINCONT
+    "11011001",  # BINRET
+)
+
+FUNCTION_TOKENS = (
+    "11011010",  # BINPRINT
+    "11011011",  # BININPUT
+)
+
+
+class BinaryTokenIndex:
+    """
+    Tokens de cada linha de um documento binário, calculados sob demanda.
+    """
+
+    def __init__(self, keywords: Iterable[str], control_tokens: Iterable[str] = CONTROL_TOKENS,
+                 function_tokens: Iterable[str] = FUNCTION_TOKENS):
+        """
+        Inicializa o índice.
+
+        Args:
+            keywords: Palavras de 8 bits conhecidas
+            control_tokens: Tokens de controle (BINSTART, BINEND, ...)
+            function_tokens: Tokens de função (BINPRINT, BININPUT)
+        """
+        self._kinds: Dict[str, int] = {word: TOKEN_KEYWORD for word in keywords}
+        for word in control_tokens:
+            if word in self._kinds:
+                self._kinds[word] = TOKEN_CONTROL
+        for word in function_tokens:
+            if word in self._kinds:
+                self._kinds[word] = TOKEN_FUNCTION
+        self._lines: List[Optional[Tuple[int, ...]]] = []
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def reset(self, line_count: int):
+        """
+        Descarta todos os tokens e redimensiona o índice.
+
+        Args:
+            line_count: Quantidade de linhas do documento
+        """
+        self._lines = [None] * line_count
+
+    def replace_lines(self, first: int, removed: int, added: int):
+        """
+        Substitui um intervalo de linhas por linhas ainda não examinadas.
+
+        Args:
+            first: Índice da primeira linha alterada
+            removed: Quantidade de linhas antigas substituídas
+            added: Quantidade de linhas novas
+        """
+        self._lines[first:first + removed] = [None] * added
+
+    def kind(self, word: str) -> int:
+        """Retorna o tipo de uma palavra de 8 bits (TOKEN_INVALID se for desconhecida)."""
+        return self._kinds.get(word, TOKEN_INVALID)
+
+    def get(self, index: int) -> Optional[Tuple[int, ...]]:
+        """Retorna os tokens já calculados de uma linha (ou None)."""
+        return self._lines[index]
+
+    def scan(self, index: int, text: str) -> Tuple[int, ...]:
+        """
+        Calcula e guarda os tokens de uma linha.
+
+        Args:
+            index: Índice da linha
+            text: Texto atual da linha
+
+        Returns:
+            Tupla plana (início, comprimento, tipo, ...)
+        """
+        tokens = self.scan_line(text)
+        self._lines[index] = tokens
+        return tokens
+
+    def scan_line(self, text: str) -> Tuple[int, ...]:
+        """
+        Classifica os tokens de uma linha em uma única passada.
+
+        Args:
+            text: Texto da linha
+
+        Returns:
+            Tupla plana (início, comprimento, tipo, ...)
+        """
+        kinds = self._kinds
+        tokens = []
+        append = tokens.append
+        for match in _TOKEN_PATTERN.finditer(text):
+            start, end = match.span()
+            first = text[start]
+            if first == "/":
+                kind = TOKEN_COMMENT
+            elif first == '"':
+                kind = TOKEN_STRING
+            else:
+                kind = kinds.get(match.group(), TOKEN_INVALID)
+            append(start)
+            append(end - start)
+            append(kind)
+        return tuple(tokens)
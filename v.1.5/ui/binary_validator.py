@@ -0,0 +1,293 @@
+"""
+Módulo de validação da sintaxe binária, linha a linha.
+Cada linha é examinada uma única vez e o resultado (erros locais e os
+BINSTART/BINEND que contém) fica guardado; uma edição reexamina apenas as linhas
+alteradas. O balanceamento de blocos só é refeito fora do trecho editado quando
+o saldo de BINSTART/BINEND do trecho muda, e nesse caso usa os resumos numéricos
+das linhas (saldo e menor profundidade), sem reler o texto.
+Não depende do Qt, para poder rodar em uma thread de trabalho ou fora do editor.
+
+As palavras, os comandos e os operandos de cada linha são localizados pelas
+mesmas regras do tradutor (split_words e BinaryAstCompiler.command_words):
+comentários de editor (//), strings, comentários e operandos de
+BINVAR/BINFUNC/BINLOOP/BININPUT não contam como BINSTART/BINEND.
+"""
+
+import re
+from itertools import accumulate
+from typing import Dict, List, Mapping, Optional, Tuple
+
+try:
+    from ui.binary_ast_compiler import COMMAND_OPERANDS, INCOMPLETE_MESSAGE, BinaryAstCompiler, split_words
+except ImportError:
+    from binary_ast_compiler import COMMAND_OPERANDS, INCOMPLETE_MESSAGE, BinaryAstCompiler, split_words
+
+BINSTART = "11010000"
+BINEND = "11010001"
+
+# Variação de profundidade de cada comando de bloco
+_BLOCK_STEPS = {"BINSTART": 1, "BINEND": -1}
+
+_BITS_PATTERN = re.compile(r'[01]+')
+
+# Limite de diagnósticos entregues por validação
+MAX_DIAGNOSTICS = 1000
+
+# Linhas repetidas são examinadas uma só vez (memória limitada)
+_MEMO_SIZE = 4096
+
+
+class Diagnostic:
+    """
+    Erro encontrado na validação, com a posição exata no código binário.
+    """
+
+    def __init__(self, line: int, column: int, length: int, message: str,
+                 code: str, severity: str = "error"):
+        """
+        Args:
+            line: Número da linha (baseado em 1)
+            column: Coluna inicial (baseada em 0)
+            length: Comprimento do trecho com erro
+            message: Mensagem de erro
+            code: Identificador do tipo de erro
+            severity: Gravidade ("error" ou "warning")
+        """
+        self.line = line
+        self.column = column
+        self.length = length
+        self.message = message
+        self.code = code
+        self.severity = severity
+
+    def as_tuple(self) -> Tuple[int, str]:
+        """Retorna o formato (linha, mensagem) usado pelos painéis de erro."""
+        return self.line, self.message
+
+    def __repr__(self):
+        return f"Diagnostic({self.line}:{self.column}, {self.code!r}, {self.message!r})"
+
+
+class IncrementalValidator:
+    """
+    Validador com resultados guardados por linha.
+    """
+
+    def __init__(self, keywords: Mapping[str, str]):
+        """
+        Inicializa o validador.
+
+        Args:
+            keywords: Tabela binário -> texto do dialeto (palavras de 8 bits conhecidas e comandos)
+        """
+        self.keywords = frozenset(keywords)
+        self.compiler = BinaryAstCompiler(keywords)
+        # Por linha: (erros locais, eventos de bloco, saldo, menor profundidade relativa)
+        self._lines: List[tuple] = []
+        # Erros de balanceamento de cada linha
+        self._nesting: List[tuple] = []
+        # Profundidade antes de cada linha, menor profundidade antes dela e dela até o fim
+        self._levels: List[int] = [0]
+        self._prefix_min: List[int] = [0]
+        self._suffix_min: List[int] = [0]
+        self._stale = False
+        self._memo: Dict[str, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def set_text(self, text: str):
+        """
+        Substitui todo o conteúdo.
+
+        Args:
+            text: Código binário completo
+        """
+        self.set_lines(text.split("\n"))
+
+    def set_lines(self, lines: List[str]):
+        """
+        Substitui todo o conteúdo por uma lista de linhas.
+
+        Args:
+            lines: Linhas do código binário
+        """
+        self._lines = [self._summarize(line) for line in lines]
+        self._nesting = [()] * len(self._lines)
+        self._stale = True
+
+    def replace_lines(self, first: int, removed: int, new_lines: List[str]):
+        """
+        Substitui um intervalo de linhas; só as novas linhas são examinadas.
+        Se o saldo e a menor profundidade do intervalo não mudam, o balanceamento
+        das demais linhas continua válido e só o do intervalo é refeito.
+
+        Args:
+            first: Índice da primeira linha alterada
+            removed: Quantidade de linhas antigas substituídas
+            new_lines: Novas linhas
+        """
+        summaries = [self._summarize(line) for line in new_lines]
+        old_profile = self._profile(self._lines[first:first + removed])
+        self._lines[first:first + removed] = summaries
+        self._nesting[first:first + removed] = [()] * len(summaries)
+
+        if self._stale or self._profile(summaries) != old_profile:
+            # O balanceamento muda fora do intervalo: refeito na próxima consulta
+            self._stale = True
+            return
+
+        end = first + len(summaries)
+        lows = [summary[3] for summary in summaries]
+        levels = list(accumulate((summary[2] for summary in summaries), initial=self._levels[first]))
+        lows = [level + low for level, low in zip(levels, lows)]
+        self._levels[first:first + removed + 1] = levels
+        self._prefix_min[first:first + removed + 1] = accumulate(lows, min, initial=self._prefix_min[first])
+        suffix = list(accumulate(reversed(lows), min, initial=self._suffix_min[first + removed]))
+        suffix.reverse()
+        self._suffix_min[first:first + removed + 1] = suffix
+        for number in range(first, end):
+            self._nesting[number] = self._check_nesting(number)
+
+    def diagnostics(self, limit: Optional[int] = MAX_DIAGNOSTICS) -> List[Diagnostic]:
+        """
+        Retorna os erros do documento, ordenados por posição.
+
+        Args:
+            limit: Quantidade máxima de erros (None para todos)
+
+        Returns:
+            Lista de Diagnostic
+        """
+        if self._stale:
+            self._rebuild_nesting()
+
+        result = []
+        for number, summary in enumerate(self._lines):
+            local = summary[0]
+            nesting = self._nesting[number]
+            if not local and not nesting:
+                continue
+            errors = sorted(local + nesting) if local and nesting else local or nesting
+            for column, length, code, message in errors:
+                result.append(Diagnostic(number + 1, column, length, message, code))
+            if limit is not None and len(result) >= limit:
+                return result[:limit]
+        return result
+
+    def _rebuild_nesting(self):
+        """Refaz o balanceamento de BINSTART/BINEND do documento inteiro."""
+        lines = self._lines
+        self._levels = list(accumulate((summary[2] for summary in lines), initial=0))
+        lows = [level + summary[3] for level, summary in zip(self._levels, lines)]
+        self._prefix_min = list(accumulate(lows, min, initial=0))
+        self._suffix_min = list(accumulate(reversed(lows), min, initial=self._levels[-1]))
+        self._suffix_min.reverse()
+        self._nesting = [self._check_nesting(number) if summary[1] else ()
+                         for number, summary in enumerate(lines)]
+        self._stale = False
+
+    def _check_nesting(self, number: int) -> tuple:
+        """
+        Verifica os BINSTART/BINEND de uma linha contra o restante do documento.
+        Um BINEND não tem par quando leva a profundidade abaixo de todas as
+        anteriores; um BINSTART não tem par quando a profundidade nunca volta
+        ao nível anterior a ele.
+
+        Args:
+            number: Índice da linha
+
+        Returns:
+            Tupla de erros (coluna, comprimento, código, mensagem)
+        """
+        events = self._lines[number][1]
+        if not events:
+            return ()
+
+        depths = list(accumulate((step for _column, step in events), initial=self._levels[number]))[1:]
+        # Menor profundidade depois de cada evento, dentro da linha e nas seguintes
+        after = list(accumulate(reversed(depths), min, initial=self._suffix_min[number + 1]))
+        after.reverse()
+
+        errors = []
+        prefix_min = self._prefix_min[number]
+        for index, (column, step) in enumerate(events):
+            depth = depths[index]
+            if step < 0:
+                if depth < prefix_min:
+                    prefix_min = depth
+                    errors.append((column, 8, "unbalanced-end", "BINEND sem BINSTART correspondente"))
+            elif after[index + 1] >= depth:
+                errors.append((column, 8, "unclosed-start", "BINSTART sem BINEND correspondente"))
+        return tuple(errors)
+
+    @staticmethod
+    def _profile(summaries: List[tuple]) -> Tuple[int, int]:
+        """Retorna o saldo e a menor profundidade relativa de um intervalo de linhas."""
+        depth = 0
+        low = 0
+        for summary in summaries:
+            low = min(low, depth + summary[3])
+            depth += summary[2]
+        return depth, low
+
+    def _summarize(self, line: str) -> tuple:
+        """Examina uma linha, reaproveitando o resultado de linhas idênticas."""
+        summary = self._memo.get(line)
+        if summary is None:
+            summary = self.check_line(line)
+            if len(self._memo) >= _MEMO_SIZE:
+                self._memo.clear()
+            self._memo[line] = summary
+        return summary
+
+    def check_line(self, line: str) -> tuple:
+        """
+        Valida uma linha isoladamente.
+
+        Args:
+            line: Linha em formato binário
+
+        Returns:
+            Tupla (erros locais, eventos de bloco (coluna, +1/-1), saldo, menor profundidade relativa)
+        """
+        words = split_words(line)
+        local = []
+        for column, word in words:
+            self._check_word(column, word, local)
+
+        events = []
+        count = len(words)
+        for index, command in self.compiler.command_words([word for _column, word in words]):
+            column, word = words[index]
+            step = _BLOCK_STEPS.get(command)
+            if step:
+                events.append((column, step))
+            elif index + COMMAND_OPERANDS.get(command, 0) >= count:
+                local.append((column, len(word), "incomplete", INCOMPLETE_MESSAGE.format(command=command)))
+        local.sort()
+
+        delta = 0
+        dip = 0
+        for _column, step in events:
+            delta += step
+            dip = min(dip, delta)
+        return tuple(local), tuple(events), delta, dip
+
+    def _check_word(self, column: int, word: str, local: list) -> bool:
+        """
+        Verifica a largura e o significado de uma palavra.
+
+        Returns:
+            True se a palavra é um token conhecido de 8 bits
+        """
+        if len(word) == 8 and word in self.keywords:
+            return True
+        if not _BITS_PATTERN.fullmatch(word):
+            local.append((column, len(word), "invalid-token", f"Token inválido: '{word}'"))
+        elif len(word) != 8:
+            local.append((column, len(word), "malformed-width",
+                          f"Largura inválida: '{word}' tem {len(word)} bits (esperados 8)"))
+        else:
+            local.append((column, len(word), "unknown-token", f"Token desconhecido: '{word}'"))
+        return False
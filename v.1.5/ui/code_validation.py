@@ -9,27 +9,34 @@ from PyQt5.QtWidgets import (
     QListWidgetItem, QSplitter, QTextEdit
 )
 from PyQt5.QtGui import QColor, QTextCursor, QTextCharFormat, QBrush, QFont
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal
 
 from binary_syntax_parser import BinarySyntaxParser
 
+try:
+    from ui.validation_service import ValidationService
+except ImportError:
+    from validation_service import ValidationService
+
 class ErrorHighlighter:
     """
     Classe para destacar erros de sintaxe no editor de código.
     """
     
-    def __init__(self, editor):
+    def __init__(self, editor, service=None):
         """
         Inicializa o destacador de erros.
         
         Args:
             editor: Editor de código (QPlainTextEdit ou similar)
+            service: ValidationService do documento (padrão: o do realce do editor, se houver)
         """
         self.editor = editor
         self.parser = BinarySyntaxParser()
         
-        # Lista de erros atuais
+        # Lista de erros atuais (linha, mensagem) e os diagnósticos completos
         self.current_errors = []
+        self.diagnostics = []
         
         # Formato para destacar erros
         self.error_format = QTextCharFormat()
@@ -37,28 +44,35 @@ class ErrorHighlighter:
         self.error_format.setUnderlineColor(QColor("#ff5555"))
         self.error_format.setBackground(QBrush(QColor(255, 85, 85, 30)))
         
-        # Timer para validação com delay
-        self.validation_timer = QTimer()
-        self.validation_timer.setSingleShot(True)
-        self.validation_timer.timeout.connect(self.validate_code)
-        
-        # Conecta ao sinal de mudança de texto
-        self.editor.textChanged.connect(self.schedule_validation)
+        # Validação em segundo plano; reaproveita a do realce aprimorado, se houver
+        if service is None:
+            service = getattr(getattr(editor, "highlighter", None), "validator", None)
+        if service is None:
+            service = ValidationService(editor.document())
+        self.service = service
+        self.service.diagnostics_ready.connect(self._on_diagnostics)
     
     def schedule_validation(self):
         """Agenda a validação do código com um pequeno delay."""
-        self.validation_timer.start(500)  # 500ms de delay
+        self.service.schedule()
     
     def validate_code(self):
-        """Valida o código e destaca os erros."""
+        """Valida o código imediatamente e destaca os erros."""
+        code = self.editor.toPlainText()
+        self._on_diagnostics(self.parser.validate_binary_diagnostics(code))
+    
+    def _on_diagnostics(self, diagnostics):
+        """
+        Recebe os erros da validação e atualiza os destaques.
+        
+        Args:
+            diagnostics: Lista de Diagnostic
+        """
         # Limpa os destaques anteriores
         self.clear_highlights()
         
-        # Obtém o código atual
-        code = self.editor.toPlainText()
-        
-        # Valida a sintaxe
-        self.current_errors = self.parser.validate_binary_syntax(code)
+        self.diagnostics = diagnostics
+        self.current_errors = [diagnostic.as_tuple() for diagnostic in diagnostics]
         
         # Destaca os erros
         self.highlight_errors()
@@ -77,23 +91,23 @@ class ErrorHighlighter:
         extra_selections = []
         
         # Para cada erro, cria uma seleção
-        for line_num, error_msg in self.current_errors:
-            # Ajusta para índice baseado em 0
-            line_index = line_num - 1
-            
-            # Obtém o bloco de texto da linha com erro
-            block = self.editor.document().findBlockByLineNumber(line_index)
+        for diagnostic in self.diagnostics:
+            # Obtém o bloco de texto da linha com erro (linhas baseadas em 1)
+            block = self.editor.document().findBlockByNumber(diagnostic.line - 1)
             if not block.isValid():
                 continue
             
-            # Cria uma seleção para a linha inteira
+            # Cria uma seleção para o trecho com erro
             selection = QTextEdit.ExtraSelection()
-            selection.format = self.error_format
-            selection.format.setToolTip(error_msg)
+            selection.format = QTextCharFormat(self.error_format)
+            selection.format.setToolTip(diagnostic.message)
             
-            # Posiciona o cursor no início da linha
+            # Seleciona o token indicado pelo diagnóstico
             cursor = QTextCursor(block)
-            cursor.movePosition(QTextCursor.EndOfLine, QTextCursor.KeepAnchor)
+            start = min(diagnostic.column, block.length() - 1)
+            cursor.setPosition(block.position() + start)
+            cursor.setPosition(block.position() + min(start + diagnostic.length, block.length() - 1),
+                               QTextCursor.KeepAnchor)
             
             selection.cursor = cursor
             extra_selections.append(selection)
@@ -227,7 +241,7 @@ class CodeValidationWidget(QWidget):
         self._setup_ui()
         
         # Conecta sinais
-        self.error_highlighter.validation_timer.timeout.connect(self._update_error_panel)
+        self.error_highlighter.service.diagnostics_ready.connect(self._update_error_panel)
         self.error_panel.error_selected.connect(self._go_to_error_line)
     
     def _setup_ui(self):
@@ -252,7 +266,7 @@ class CodeValidationWidget(QWidget):
         # Adiciona o splitter ao layout
         layout.addWidget(splitter)
     
-    def _update_error_panel(self):
+    def _update_error_panel(self, diagnostics=None):
         """Atualiza o painel de erros com os erros atuais."""
         errors = self.error_highlighter.get_errors()
         self.error_panel.update_errors(errors)
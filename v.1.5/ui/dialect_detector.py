@@ -0,0 +1,452 @@
+"""
+Módulo de detecção automática do dialeto de um código binário.
+Os primeiros tokens de 8 bits do código formam um histograma de 256 posições,
+comparado de uma só vez (produto matriz-vetor) com a tabela de cada dialeto:
+um token conhecido por poucos dialetos pesa mais que um conhecido por todos, e
+um token desconhecido penaliza o dialeto. A escolha fica guardada por arquivo em
+~/.the_collector_binarie/dialects.json, e o DialectRouter encaminha tradução,
+validação e execução para o interpretador do dialeto escolhido.
+"""
+
+import json
+import math
+import os
+import re
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from ui.binary_codec_registry import get_dialect
+    from ui.binary_stream import ENGINES, create_engine
+    from ui.binary_validator import IncrementalValidator
+    from ui.source_map import SourceMap
+except ImportError:
+    from binary_codec_registry import get_dialect
+    from binary_stream import ENGINES, create_engine
+    from binary_validator import IncrementalValidator
+    from source_map import SourceMap
+
+# Quantidade de tokens examinados no início do código
+DEFAULT_SAMPLE_TOKENS = 512
+
+# Peso negativo de um token que o dialeto não conhece
+UNKNOWN_PENALTY = 4.0
+
+# Dialeto usado quando o código não tem tokens (ou nada o distingue)
+DEFAULT_DIALECT = "fixed"
+
+# Comentário de editor (// até o fim da linha)
+_COMMENT_PATTERN = re.compile(r"//[^\n]*")
+
+# Caracteres lidos por token na primeira tentativa de amostragem
+_CHARS_PER_TOKEN = 12
+
+# Máscara dos bits que não podem estar ligados em 8 dígitos "0"/"1" menos 48
+_NOT_BITS = 0xFEFEFEFEFEFEFEFE
+
+# Limite de mensagens na validação por diagnósticos
+_MAX_MESSAGES = 20
+
+
+def default_memory_path() -> str:
+    """Retorna o caminho padrão do arquivo de dialetos por arquivo."""
+    return os.path.join(os.path.expanduser("~"), ".the_collector_binarie", "dialects.json")
+
+
+class DialectDetector:
+    """
+    Detector do dialeto de um código binário pelo histograma dos primeiros tokens.
+    """
+
+    def __init__(self, dialects=ENGINES, sample_tokens: int = DEFAULT_SAMPLE_TOKENS,
+                 penalty: float = UNKNOWN_PENALTY):
+        """
+        Inicializa o detector.
+
+        Args:
+            dialects: Nomes dos dialetos candidatos (a ordem desempata as pontuações)
+            sample_tokens: Quantidade de tokens examinados
+            penalty: Peso negativo de um token desconhecido pelo dialeto
+        """
+        self.dialects = tuple(dialects)
+        self.sample_tokens = sample_tokens
+
+        known = [[0] * 256 for _ in self.dialects]
+        for row, name in zip(known, self.dialects):
+            for binary in get_dialect(name).binary_to_text:
+                if len(binary) == 8:
+                    row[int(binary, 2)] = 1
+
+        # Peso de cada byte por dialeto: 1 + log(D / dialetos que o conhecem), ou -penalty
+        count = len(self.dialects)
+        owners = [sum(row[value] for row in known) for value in range(256)]
+        self.weights = [
+            [1.0 + math.log(count / owners[value]) if row[value] else -penalty
+             for value in range(256)]
+            for row in known
+        ]
+
+        if np is not None:
+            self._matrix = np.array(self.weights, dtype=np.float64)
+            self._bits = 1 << np.arange(7, -1, -1, dtype=np.int64)
+
+    def sample(self, binary_code: str):
+        """
+        Converte os primeiros tokens de 8 bits do código (fora de comentários) em bytes.
+
+        Args:
+            binary_code: Código binário
+
+        Returns:
+            Até sample_tokens valores de 0 a 255 (array do numpy, se disponível)
+        """
+        limit = self.sample_tokens * _CHARS_PER_TOKEN
+        while True:
+            window = binary_code[:limit]
+            if "//" in window:
+                window = _COMMENT_PATTERN.sub("", window)
+            words = window.split()
+            if limit < len(binary_code) and words and not binary_code[limit].isspace():
+                # A última palavra pode ter sido cortada pela janela
+                words.pop()
+            values = self._values(words)
+            if len(values) >= self.sample_tokens or limit >= len(binary_code):
+                return values[:self.sample_tokens]
+            # Comentários ou palavras que não são tokens demais no início: amplia a janela
+            limit *= 4
+
+    def _values(self, words: List[str]):
+        """
+        Converte as palavras que são grupos de 8 bits em bytes.
+
+        Args:
+            words: Palavras do código
+
+        Returns:
+            Valores na ordem das palavras (array do numpy, se disponível)
+        """
+        words = [word for word in words if len(word) == 8]
+        if np is None:
+            return [int(word, 2) for word in words if not word.strip("01")]
+
+        digits = np.frombuffer("".join(words).encode("ascii", "replace"), dtype=np.uint8) - 48
+        # Cada grupo ocupa 8 bytes: um uint64 sem bits fora do bit 0 de cada byte é só 0 e 1
+        valid = (digits.view(np.uint64) & _NOT_BITS) == 0
+        return digits.reshape(-1, 8)[valid] @ self._bits
+
+    def scores(self, binary_code: str) -> Dict[str, float]:
+        """
+        Calcula a pontuação de cada dialeto para o código.
+
+        Args:
+            binary_code: Código binário
+
+        Returns:
+            Dicionário dialeto -> pontuação
+        """
+        values = self.sample(binary_code)
+        if not len(values):
+            return {name: 0.0 for name in self.dialects}
+
+        if np is not None:
+            histogram = np.bincount(values, minlength=256)
+            return dict(zip(self.dialects, (self._matrix @ histogram).tolist()))
+
+        histogram = [0] * 256
+        for value in values:
+            histogram[value] += 1
+        used = [(value, hits) for value, hits in enumerate(histogram) if hits]
+        return {name: sum(row[value] * hits for value, hits in used)
+                for name, row in zip(self.dialects, self.weights)}
+
+    def detect(self, binary_code: str, preferred: Optional[str] = None) -> str:
+        """
+        Escolhe o dialeto de maior pontuação.
+
+        Args:
+            binary_code: Código binário
+            preferred: Dialeto mantido em caso de empate (padrão: o primeiro candidato)
+
+        Returns:
+            Nome do dialeto
+        """
+        scores = self.scores(binary_code)
+        best = max(scores.values())
+        if preferred in scores and scores[preferred] >= best:
+            return preferred
+        for name in self.dialects:
+            if scores[name] >= best:
+                return name
+        return DEFAULT_DIALECT
+
+
+class DialectMemory:
+    """
+    Dialeto escolhido para cada arquivo, guardado em disco.
+
+    Uma escolha detectada vale enquanto o arquivo não muda (tamanho e data de
+    modificação); uma escolha manual vale até ser esquecida.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Inicializa a memória.
+
+        Args:
+            path: Arquivo JSON usado (padrão: ~/.the_collector_binarie/dialects.json)
+        """
+        self.path = path or default_memory_path()
+        self.entries: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """Carrega as escolhas salvas (vazio se o arquivo não existir ou for inválido)."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _save(self):
+        """Grava as escolhas de forma atômica (arquivo temporário + os.replace)."""
+        directory = os.path.dirname(self.path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, indent=2)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _signature(filepath: str) -> Optional[Tuple[int, int]]:
+        """Retorna (tamanho, data de modificação em ns) do arquivo, ou None se não existir."""
+        try:
+            info = os.stat(filepath)
+        except OSError:
+            return None
+        return info.st_size, info.st_mtime_ns
+
+    def get(self, filepath: str) -> Optional[str]:
+        """
+        Retorna o dialeto guardado para o arquivo, se ainda for válido.
+
+        Args:
+            filepath: Caminho do arquivo
+
+        Returns:
+            Nome do dialeto ou None
+        """
+        entry = self.entries.get(os.path.abspath(filepath))
+        if not entry:
+            return None
+        if entry.get("manual"):
+            return entry.get("dialect")
+        signature = self._signature(filepath)
+        if signature is None or [entry.get("size"), entry.get("mtime_ns")] != list(signature):
+            return None
+        return entry.get("dialect")
+
+    def remember(self, filepath: str, dialect: str, manual: bool = False):
+        """
+        Guarda o dialeto do arquivo.
+
+        Args:
+            filepath: Caminho do arquivo
+            dialect: Nome do dialeto
+            manual: True se a escolha foi feita pelo usuário
+        """
+        key = os.path.abspath(filepath)
+        signature = self._signature(filepath) or (None, None)
+        entry = {"dialect": dialect, "size": signature[0], "mtime_ns": signature[1], "manual": manual}
+        if self.entries.get(key) != entry:
+            self.entries[key] = entry
+            self._save()
+
+    def forget(self, filepath: str):
+        """
+        Remove o dialeto guardado para o arquivo.
+
+        Args:
+            filepath: Caminho do arquivo
+        """
+        if self.entries.pop(os.path.abspath(filepath), None) is not None:
+            self._save()
+
+
+class DialectRouter:
+    """
+    Encaminha tradução, validação e execução para o interpretador do dialeto detectado.
+    """
+
+    def __init__(self, detector: Optional[DialectDetector] = None,
+                 memory: Optional[DialectMemory] = None,
+                 engines: Optional[Dict] = None, preferred: str = DEFAULT_DIALECT):
+        """
+        Inicializa o roteador.
+
+        Args:
+            detector: Detector usado (padrão: um DialectDetector com os dialetos de ENGINES)
+            memory: Memória por arquivo (padrão: a do diretório do usuário)
+            engines: Interpretadores já criados, por dialeto (os demais são criados sob demanda)
+            preferred: Dialeto mantido em caso de empate
+        """
+        self.detector = detector or DialectDetector()
+        self.memory = memory if memory is not None else DialectMemory()
+        self.engines = dict(engines or {})
+        self.preferred = preferred
+
+    def dialect_for(self, binary_code: str, filepath: Optional[str] = None) -> str:
+        """
+        Retorna o dialeto do código: o guardado para o arquivo ou o detectado.
+
+        Args:
+            binary_code: Código binário
+            filepath: Caminho do arquivo de origem, se houver
+
+        Returns:
+            Nome do dialeto
+        """
+        if filepath:
+            dialect = self.memory.get(filepath)
+            if dialect in self.detector.dialects:
+                return dialect
+
+        dialect = self.detector.detect(binary_code, self.preferred)
+        if filepath and os.path.exists(filepath):
+            self.memory.remember(filepath, dialect)
+        return dialect
+
+    def set_dialect(self, filepath: str, dialect: Optional[str]):
+        """
+        Fixa manualmente o dialeto de um arquivo (None volta à detecção automática).
+
+        Args:
+            filepath: Caminho do arquivo
+            dialect: Nome do dialeto ou None
+        """
+        if dialect is None:
+            self.memory.forget(filepath)
+        elif dialect not in self.detector.dialects:
+            raise ValueError(f"Dialeto desconhecido: {dialect}")
+        else:
+            self.memory.remember(filepath, dialect, manual=True)
+
+    def engine(self, dialect: str):
+        """
+        Retorna o interpretador do dialeto, criado uma única vez.
+
+        Args:
+            dialect: Nome do dialeto
+
+        Returns:
+            Instância do interpretador
+        """
+        engine = self.engines.get(dialect)
+        if engine is None:
+            engine = self.engines[dialect] = create_engine(dialect)
+        return engine
+
+    def engine_for(self, binary_code: str, filepath: Optional[str] = None,
+                   dialect: Optional[str] = None) -> Tuple[str, object]:
+        """
+        Retorna o dialeto do código e o interpretador correspondente.
+
+        Args:
+            binary_code: Código binário
+            filepath: Caminho do arquivo de origem, se houver
+            dialect: Dialeto fixo (padrão: o guardado para o arquivo ou o detectado)
+
+        Returns:
+            Tupla (dialeto, interpretador)
+        """
+        if dialect is None:
+            dialect = self.dialect_for(binary_code, filepath)
+        elif dialect not in self.detector.dialects:
+            raise ValueError(f"Dialeto desconhecido: {dialect}")
+        return dialect, self.engine(dialect)
+
+    def translate(self, binary_code: str, filepath: Optional[str] = None, cache=None,
+                  dialect: Optional[str] = None) -> str:
+        """
+        Traduz o código com o interpretador do dialeto detectado.
+
+        Args:
+            binary_code: Código binário
+            filepath: Caminho do arquivo de origem, se houver
+            cache: TranslationCache opcional
+            dialect: Dialeto fixo (padrão: o guardado para o arquivo ou o detectado)
+
+        Returns:
+            Código traduzido
+        """
+        _, engine = self.engine_for(binary_code, filepath, dialect)
+        if cache is not None:
+            return cache.translate(engine, binary_code)
+        return engine.traduzir_binario(binary_code)
+
+    def translate_with_map(self, binary_code: str,
+                           filepath: Optional[str] = None) -> Tuple[str, Optional[SourceMap]]:
+        """
+        Traduz o código junto com o mapa de origem, se o interpretador do dialeto o oferecer.
+
+        Args:
+            binary_code: Código binário
+            filepath: Caminho do arquivo de origem, se houver
+
+        Returns:
+            Tupla (código traduzido, SourceMap ou None)
+        """
+        _, engine = self.engine_for(binary_code, filepath)
+        if hasattr(engine, "traduzir_binario_com_mapa"):
+            return engine.traduzir_binario_com_mapa(binary_code)
+        return engine.traduzir_binario(binary_code), None
+
+    def validate(self, binary_code: str, filepath: Optional[str] = None,
+                 dialect: Optional[str] = None) -> Tuple[bool, str]:
+        """
+        Valida o código com as regras do dialeto detectado.
+
+        Args:
+            binary_code: Código binário
+            filepath: Caminho do arquivo de origem, se houver
+            dialect: Dialeto fixo (padrão: o guardado para o arquivo ou o detectado)
+
+        Returns:
+            Tupla (válido, mensagem de erro)
+        """
+        dialect, engine = self.engine_for(binary_code, filepath, dialect)
+        if hasattr(engine, "validar_codigo_binario"):
+            return engine.validar_codigo_binario(binary_code)
+
+        if hasattr(engine, "validate_binary_diagnostics"):
+            diagnostics = engine.validate_binary_diagnostics(binary_code)
+        else:
+            validator = IncrementalValidator(get_dialect(dialect).binary_to_text)
+            validator.set_text(binary_code)
+            diagnostics = validator.diagnostics()
+
+        if not diagnostics:
+            return True, ""
+        messages = [f"Linha {d.line}, coluna {d.column + 1}: {d.message}" for d in diagnostics[:_MAX_MESSAGES]]
+        if len(diagnostics) > _MAX_MESSAGES:
+            messages.append(f"... e mais {len(diagnostics) - _MAX_MESSAGES} erros")
+        return False, "\n".join(messages)
+
+    def known_tokens(self, dialect: str):
+        """
+        Retorna os tokens binários conhecidos pelo dialeto.
+
+        Args:
+            dialect: Nome do dialeto
+
+        Returns:
+            Mapeamento somente leitura binário -> texto
+        """
+        return get_dialect(dialect).binary_to_text
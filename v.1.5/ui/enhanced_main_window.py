@@ -346,8 +346,9 @@ class EnhancedMainWindow(QMainWindow):
         # Cria um novo editor
         editor = CodeEditor()
         
-        # Configura o realce de sintaxe aprimorado
-        editor.highlighter = BinarySyntaxHighlighterEnhanced(editor.document())
+        # Configura o realce de sintaxe aprimorado (substitui o realce síncrono do CodeEditor)
+        editor.highlighter.setDocument(None)
+        editor.highlighter = BinarySyntaxHighlighterEnhanced(editor.document(), editor)
         
         # Define o conteúdo inicial
         if content:
@@ -9,10 +9,11 @@ from PyQt5.QtWidgets import (
     QProgressBar, QMessageBox, QToolButton, QMenu, QAction
 )
 from PyQt5.QtGui import QIcon, QPixmap
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal
 
 from binary_runner_enhanced import BinaryRunner
 from terminal_enhanced import TerminalEnhanced
+from execution_service import ExecutionService, STAGE_TRANSLATING, STAGE_RUNNING
 
 class ExecutionPanel(QWidget):
     """
@@ -23,6 +24,8 @@ class ExecutionPanel(QWidget):
     execution_started = pyqtSignal()
     execution_finished = pyqtSignal(str)
     execution_error = pyqtSignal(str)
+    # Trecho da saída da execução atual, à medida que chega
+    execution_output = pyqtSignal(str)
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -30,11 +33,24 @@ class ExecutionPanel(QWidget):
         # Inicializa o executor de código binário
         self.runner = BinaryRunner()
         
+        # Tradução e execução fora da thread da interface; novas execuções entram na fila
+        self.service = ExecutionService(timeout=5, parent=self)
+        self.service.job_started.connect(lambda job_id: self.execution_started.emit())
+        self.service.stage_changed.connect(self._on_stage_changed)
+        self.service.progress_changed.connect(self._on_progress)
+        self.service.output_received.connect(self._on_output)
+        self.service.job_finished.connect(self._on_job_finished)
+        self.service.queue_changed.connect(self._on_queue_changed)
+        # Código de origem de cada pedido (para o histórico do BinaryRunner)
+        self._job_sources = {}
+        
         # Configura a interface
         self._setup_ui()
         
-        # Estado de execução
-        self.is_executing = False
+    @property
+    def is_executing(self):
+        """Indica se há uma execução em andamento ou na fila."""
+        return self.service.is_busy()
         
     def _setup_ui(self):
         """Configura a interface do painel de execução."""
@@ -90,9 +106,28 @@ class ExecutionPanel(QWidget):
         self.run_button.setMenu(run_menu)
         self.run_button.clicked.connect(self.execute_code)
         
-        # Barra de progresso para indicar execução
+        # Botão para interromper a execução atual
+        self.stop_button = QPushButton("Parar", self)
+        self.stop_button.setToolTip("Interromper a execução")
+        self.stop_button.setVisible(False)
+        self.stop_button.clicked.connect(self.stop_execution)
+        self.stop_button.setStyleSheet("""
+            QPushButton {
+                background-color: #ff5555;
+                color: #282a36;
+                border: none;
+                padding: 5px 10px;
+                border-radius: 3px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #ff6e6e;
+            }
+        """)
+        
+        # Barra de progresso: etapa atual e tempo decorrido em relação ao limite
         self.progress_bar = QProgressBar(self)
-        self.progress_bar.setRange(0, 0)  # Modo indeterminado
+        self.progress_bar.setRange(0, 0)
         self.progress_bar.setVisible(False)
         self.progress_bar.setStyleSheet("""
             QProgressBar {
@@ -114,16 +149,10 @@ class ExecutionPanel(QWidget):
         
         # Adiciona widgets ao layout
         layout.addWidget(self.run_button)
+        layout.addWidget(self.stop_button)
         layout.addWidget(self.progress_bar)
         layout.addWidget(self.status_label, 1)  # 1 = stretch factor
         
-        # Timer para animação durante execução
-        self.execution_timer = QTimer(self)
-        self.execution_timer.timeout.connect(self._update_execution_animation)
-        
-        # Contador para animação
-        self.animation_counter = 0
-        
     def execute_code(self, checked=False, as_binary=True):
         """
         Executa o código atual, interpretando-o como binário ou Python conforme especificado.
@@ -132,67 +161,93 @@ class ExecutionPanel(QWidget):
             checked: Parâmetro ignorado (usado pelo sistema de sinais do Qt)
             as_binary: Se True, interpreta o código como binário; caso contrário, como Python
         """
-        if self.is_executing:
-            return
-        
         # Obtém o código do editor atual
         code = self._get_current_code()
         if not code:
             self.status_label.setText("Nenhum código para executar")
             return
         
-        # Inicia a execução
-        self.is_executing = True
-        self.execution_started.emit()
-        
-        # Atualiza a interface
-        self.progress_bar.setVisible(True)
-        self.status_label.setText("Executando...")
-        self.run_button.setEnabled(False)
-        
-        # Inicia a animação
-        self.execution_timer.start(100)
-        
-        # Executa o código em um timer para não bloquear a interface
-        QTimer.singleShot(100, lambda: self._perform_execution(code, as_binary))
+        self._perform_execution(code, as_binary)
     
     def _perform_execution(self, code, as_binary):
         """
-        Realiza a execução do código e atualiza a interface.
+        Enfileira a execução do código no serviço de execução, sem bloquear a interface.
         
         Args:
             code: Código a ser executado
             as_binary: Se True, interpreta o código como binário; caso contrário, como Python
         """
-        try:
-            # Executa o código
-            if as_binary:
-                result = self.runner.executar_binario(code)
-            else:
-                result = self.runner.executar_codigo(code)
-            
-            # Exibe o resultado no terminal
-            self._show_terminal(result)
-            
-            # Emite sinal de conclusão
-            self.execution_finished.emit(result)
-            
-        except Exception as e:
-            # Em caso de erro, exibe mensagem
-            error_msg = f"Erro durante a execução: {str(e)}"
-            self.status_label.setText(error_msg)
-            self.execution_error.emit(error_msg)
-            
-            # Exibe o erro no terminal
-            self._show_terminal(error_msg)
-            
-        finally:
-            # Finaliza a execução
-            self.is_executing = False
+        queued = self.service.is_busy()
+        job_id = self.service.submit(
+            code,
+            compile_source=self.runner.compilar if as_binary else None,
+            merge_stderr=True
+        )
+        self._job_sources[job_id] = code
+        
+        # Atualiza a interface
+        self.stop_button.setVisible(True)
+        self.progress_bar.setVisible(True)
+        if queued:
+            self.status_label.setText(f"Na fila ({self.service.pending_count()} aguardando)")
+    
+    def stop_execution(self):
+        """Interrompe a execução atual, encerrando o processo do programa."""
+        self.service.stop()
+    
+    def _on_stage_changed(self, job_id, stage):
+        """Mostra a etapa da execução atual."""
+        if stage == STAGE_TRANSLATING:
+            self.progress_bar.setRange(0, 0)
+            self.status_label.setText("Traduzindo...")
+        elif stage == STAGE_RUNNING:
+            self.status_label.setText("Executando...")
+    
+    def _on_progress(self, job_id, elapsed, timeout):
+        """Mostra o tempo decorrido da execução em relação ao tempo limite."""
+        if timeout > 0:
+            self.progress_bar.setRange(0, 1000)
+            self.progress_bar.setValue(min(1000, int(elapsed / timeout * 1000)))
+            self.progress_bar.setFormat(f"{elapsed:.1f} s / {timeout:.0f} s")
+        self.status_label.setText(f"Executando... {elapsed:.1f} s")
+    
+    def _on_output(self, job_id, name, text):
+        """Repassa a saída da execução à medida que chega."""
+        self.execution_output.emit(text)
+    
+    def _on_queue_changed(self, pending):
+        """Atualiza o botão de parada conforme a fila."""
+        self.stop_button.setVisible(self.service.is_busy())
+    
+    def _on_job_finished(self, job_id, result):
+        """
+        Exibe o resultado de uma execução concluída, interrompida ou retirada da fila.
+        
+        Args:
+            job_id: Identificador do pedido
+            result: SandboxResult da execução
+        """
+        code = self._job_sources.pop(job_id, "")
+        output = self.runner.resultado_execucao(code, result)
+        
+        if not self.service.is_busy():
+            self.stop_button.setVisible(False)
             self.progress_bar.setVisible(False)
-            self.run_button.setEnabled(True)
-            self.execution_timer.stop()
             self.status_label.setText("Pronto")
+        
+        if result.returncode is None and not result.stdout:
+            # Falha antes da execução (tradução) ou pedido cancelado
+            error_msg = result.stderr or result.stop_message()
+            self.status_label.setText(error_msg.splitlines()[0] if error_msg else "Pronto")
+            self.execution_error.emit(error_msg)
+            self._show_terminal(error_msg)
+            return
+        
+        # Exibe o resultado no terminal
+        self._show_terminal(output)
+        
+        # Emite sinal de conclusão
+        self.execution_finished.emit(output)
     
     def translate_binary(self):
         """
@@ -205,8 +260,8 @@ class ExecutionPanel(QWidget):
             return
         
         try:
-            # Traduz o código binário para Python
-            translated = self.runner.interpretar(code)
+            # Traduz o código binário para Python a partir da árvore sintática
+            translated = self.runner.interpretar_ast(code)
             
             # Emite sinal para criar uma nova aba com o código traduzido
             self.execution_finished.emit(translated)
@@ -214,6 +269,10 @@ class ExecutionPanel(QWidget):
             # Atualiza o status
             self.status_label.setText("Tradução concluída")
             
+        except SyntaxError as e:
+            error_msg = f"Erro de sintaxe na linha {e.lineno}, coluna {e.offset}: {e.msg}"
+            self.status_label.setText(error_msg)
+            self.execution_error.emit(error_msg)
         except Exception as e:
             # Em caso de erro, exibe mensagem
             error_msg = f"Erro durante a tradução: {str(e)}"
@@ -241,12 +300,6 @@ class ExecutionPanel(QWidget):
         terminal = TerminalEnhanced(output, self)
         terminal.exec_()
     
-    def _update_execution_animation(self):
-        """Atualiza a animação durante a execução."""
-        self.animation_counter += 1
-        dots = "." * (self.animation_counter % 4)
-        self.status_label.setText(f"Executando{dots}")
-    
     def set_get_code_callback(self, callback):
         """
         Define a função de callback para obter o código do editor atual.
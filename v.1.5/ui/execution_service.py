@@ -0,0 +1,392 @@
+"""
+Módulo de execução de programas fora da thread da interface.
+Cada pedido (tradução + execução) entra em uma fila atendida por uma thread de
+trabalho; a interface só recebe sinais. A saída do programa é acumulada pela
+thread de trabalho e entregue à interface uma vez por quadro (QTimer), junto com
+o progresso real da execução (etapa e tempo decorrido em relação ao limite).
+Parar uma execução encerra o processo do programa; parar um pedido ainda na fila
+apenas o remove.
+"""
+
+import time
+import threading
+import traceback
+from collections import deque
+from typing import Callable, Optional
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+try:
+    from ui.sandbox_runner import STOP_CANCELLED, SandboxResult, get_default_runner
+    from ui.translation_cache import get_default_cache
+    from ui.app_logging import get_logger
+except ImportError:
+    from sandbox_runner import STOP_CANCELLED, SandboxResult, get_default_runner
+    from translation_cache import get_default_cache
+    from app_logging import get_logger
+
+logger = get_logger("execution")
+# Trechos da saída dos programas (um registro por leitura, com nível próprio)
+output_logger = get_logger("execution.output")
+
+# Etapas de um pedido
+STAGE_QUEUED = "queued"
+STAGE_TRANSLATING = "translating"
+STAGE_PREPARING = "preparing"
+STAGE_RUNNING = "running"
+STAGE_FINISHED = "finished"
+
+# Motivo de parada de um pedido que falhou antes de executar (tradução ou preparação)
+STOP_ERROR = "error"
+
+# Intervalo de entrega da saída e do progresso à interface (ms)
+FRAME_INTERVAL = 50
+
+# Valor padrão de timeout em submit: usa o tempo limite do serviço
+_SERVICE_TIMEOUT = object()
+
+
+class ExecutionJob:
+    """
+    Pedido de execução na fila do ExecutionService.
+    """
+
+    def __init__(self, job_id: int, source: str, translate: Optional[Callable[[str], str]],
+                 prepare: Optional[Callable[[str], str]], stdin: str, timeout: Optional[float],
+                 merge_stderr: bool, limits, compile_source: Optional[Callable[[str], object]] = None):
+        self.job_id = job_id
+        self.source = source
+        self.translate = translate
+        self.compile_source = compile_source
+        self.prepare = prepare
+        self.stdin = stdin
+        self.timeout = timeout
+        self.merge_stderr = merge_stderr
+        self.limits = limits
+
+        self.stage = STAGE_QUEUED
+        self.python_code = None
+        self.started_at = None
+        self.cancel = threading.Event()
+        # Preparação feita na thread da interface (por exemplo, diálogos de input())
+        self.prepared = threading.Event()
+        self.prepare_error = None
+
+
+class ExecutionService(QObject):
+    """
+    Fila de execuções atendida por uma thread de trabalho.
+    """
+
+    # Pedido na fila (id, posição a partir de 1)
+    job_queued = pyqtSignal(int, int)
+    # Pedido passou a ser atendido (id)
+    job_started = pyqtSignal(int)
+    # Nova etapa do pedido (id, etapa)
+    stage_changed = pyqtSignal(int, str)
+    # Tempo decorrido e tempo limite da execução em segundos (id, decorrido, limite; 0 = sem limite)
+    progress_changed = pyqtSignal(int, float, float)
+    # Trecho da saída (id, "stdout"/"stderr", texto)
+    output_received = pyqtSignal(int, str, str)
+    # Resultado do pedido (id, SandboxResult)
+    job_finished = pyqtSignal(int, object)
+    # Quantidade de pedidos aguardando na fila
+    queue_changed = pyqtSignal(int)
+
+    # Sinais internos emitidos pela thread de trabalho
+    _started = pyqtSignal(int)
+    _stage = pyqtSignal(int, str)
+    _prepare_requested = pyqtSignal(int)
+    _finished = pyqtSignal(int, object)
+
+    def __init__(self, runner=None, cache=None, timeout: Optional[float] = 10.0, parent=None):
+        """
+        Inicializa o serviço e a thread de trabalho.
+
+        Args:
+            runner: SandboxRunner usado (padrão: o compartilhado da aplicação)
+            cache: TranslationCache usado na compilação (padrão: o compartilhado)
+            timeout: Tempo limite padrão de cada execução, em segundos
+            parent: Objeto pai
+        """
+        super().__init__(parent)
+        self.runner = runner if runner is not None else get_default_runner()
+        self.cache = cache if cache is not None else get_default_cache()
+        self.timeout = timeout
+
+        self.current: Optional[ExecutionJob] = None
+        self._jobs = {}
+        self._pending = deque()
+        self._next_id = 1
+        self._output = []
+        self._output_lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._running = True
+
+        self._started.connect(self._on_started)
+        self._stage.connect(self._on_stage)
+        self._prepare_requested.connect(self._on_prepare_requested)
+        self._finished.connect(self._on_finished)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(FRAME_INTERVAL)
+        self._timer.timeout.connect(self._flush)
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, source: str, translate: Optional[Callable[[str], str]] = None,
+               prepare: Optional[Callable[[str], str]] = None, stdin: str = "",
+               timeout=_SERVICE_TIMEOUT, merge_stderr: bool = False, limits=None,
+               compile_source: Optional[Callable[[str], object]] = None) -> int:
+        """
+        Coloca um pedido na fila.
+
+        Args:
+            source: Código a executar
+            translate: Função que traduz source para Python, chamada na thread de trabalho
+                (None se source já for Python)
+            prepare: Função chamada na thread da interface com o código Python, antes da
+                execução, que devolve o código a executar
+            stdin: Texto entregue na entrada padrão do programa
+            timeout: Tempo limite em segundos (None sem limite; padrão: o do serviço)
+            merge_stderr: Se True, stderr é entregue junto com stdout
+            limits: SandboxLimits desta execução (padrão: os do runner)
+            compile_source: Função que compila source diretamente em um objeto de código,
+                chamada na thread de trabalho no lugar de translate e da compilação
+                (sem preparação, que precisa do texto Python)
+
+        Returns:
+            Identificador do pedido
+        """
+        job = ExecutionJob(self._next_id, source, translate, prepare, stdin,
+                           self.timeout if timeout is _SERVICE_TIMEOUT else timeout, merge_stderr, limits,
+                           compile_source)
+        self._next_id += 1
+        with self._condition:
+            self._jobs[job.job_id] = job
+            self._pending.append(job)
+            position = len(self._pending) + (1 if self.current is not None else 0)
+            self._condition.notify()
+        logger.debug("Pedido %d na fila (posição %d)", job.job_id, position)
+        self.job_queued.emit(job.job_id, position)
+        self.queue_changed.emit(self.pending_count())
+        return job.job_id
+
+    def stop(self, job_id: Optional[int] = None):
+        """
+        Interrompe a execução atual (encerrando o processo) ou retira um pedido da fila.
+
+        Args:
+            job_id: Pedido a interromper (padrão: o que está em execução)
+        """
+        with self._condition:
+            job = self._jobs.get(job_id) if job_id is not None else self.current
+            if job is None:
+                return
+            queued = job in self._pending
+            if queued:
+                self._pending.remove(job)
+                del self._jobs[job.job_id]
+        job.cancel.set()
+
+        if queued:
+            job.stage = STAGE_FINISHED
+            self.queue_changed.emit(self.pending_count())
+            self.job_finished.emit(job.job_id, SandboxResult(returncode=None, stop_reason=STOP_CANCELLED))
+
+    def stop_all(self):
+        """Esvazia a fila e interrompe a execução atual."""
+        with self._condition:
+            queued = [job.job_id for job in self._pending]
+        for job_id in queued:
+            self.stop(job_id)
+        self.stop()
+
+    def position(self, job_id: int) -> int:
+        """
+        Retorna a situação de um pedido na fila.
+
+        Args:
+            job_id: Identificador do pedido
+
+        Returns:
+            0 se estiver em atendimento, a posição na fila (a partir de 1) ou -1 se já terminou
+        """
+        with self._condition:
+            if self.current is not None and self.current.job_id == job_id:
+                return 0
+            for index, job in enumerate(self._pending):
+                if job.job_id == job_id:
+                    return index + 1
+        return -1
+
+    def pending_count(self) -> int:
+        """Retorna a quantidade de pedidos aguardando na fila."""
+        with self._condition:
+            return len(self._pending)
+
+    def is_busy(self) -> bool:
+        """Indica se há um pedido em atendimento ou na fila."""
+        with self._condition:
+            return self.current is not None or bool(self._pending)
+
+    def shutdown(self):
+        """Interrompe tudo e encerra a thread de trabalho."""
+        self.stop_all()
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self._timer.stop()
+
+    def _run(self):
+        """Laço da thread de trabalho."""
+        while True:
+            with self._condition:
+                while self._running and not self._pending:
+                    self._condition.wait()
+                if not self._running:
+                    break
+                job = self.current = self._pending.popleft()
+
+            self._started.emit(job.job_id)
+            result = self._execute(job)
+            logger.info("Pedido %d finalizado: %s, código %s, %.3f s", job.job_id, result.stop_reason,
+                        result.returncode, result.duration)
+            with self._condition:
+                self.current = None
+                self._jobs.pop(job.job_id, None)
+            try:
+                self._finished.emit(job.job_id, result)
+            except RuntimeError:
+                # O serviço foi destruído junto com a janela
+                break
+
+    def _execute(self, job: ExecutionJob) -> SandboxResult:
+        """
+        Traduz, prepara e executa um pedido (na thread de trabalho).
+
+        Args:
+            job: Pedido em atendimento
+
+        Returns:
+            SandboxResult da execução
+        """
+        start = time.perf_counter()
+        try:
+            if job.compile_source is not None:
+                self._set_stage(job, STAGE_TRANSLATING)
+                try:
+                    code = job.compile_source(job.source)
+                except SyntaxError as e:
+                    return self._syntax_error(e, start)
+                return self._run_code(job, code, start)
+
+            python_code = job.source
+            if job.translate is not None:
+                self._set_stage(job, STAGE_TRANSLATING)
+                python_code = job.translate(job.source)
+
+            if job.prepare is not None and not job.cancel.is_set():
+                job.python_code = python_code
+                self._set_stage(job, STAGE_PREPARING)
+                self._prepare_requested.emit(job.job_id)
+                job.prepared.wait()
+                if job.prepare_error is not None:
+                    raise job.prepare_error
+                python_code = job.python_code
+
+            if job.cancel.is_set():
+                return SandboxResult(returncode=None, stop_reason=STOP_CANCELLED,
+                                     duration=time.perf_counter() - start)
+
+            try:
+                code = self.cache.compile(python_code)
+            except SyntaxError as e:
+                return self._syntax_error(e, start)
+            return self._run_code(job, code, start)
+        except Exception as e:
+            logger.exception("Erro no pedido %d", job.job_id)
+            return SandboxResult(stderr=f"Erro ao executar código binário: {str(e)}", returncode=None,
+                                 stop_reason=STOP_ERROR, duration=time.perf_counter() - start)
+
+    def _run_code(self, job: ExecutionJob, code, start: float) -> SandboxResult:
+        """Executa o objeto de código de um pedido no runner (thread de trabalho)."""
+        if job.cancel.is_set():
+            return SandboxResult(returncode=None, stop_reason=STOP_CANCELLED,
+                                 duration=time.perf_counter() - start)
+        job.started_at = time.perf_counter()
+        self._set_stage(job, STAGE_RUNNING)
+        return self.runner.run(code, stdin=job.stdin, timeout=job.timeout,
+                               merge_stderr=job.merge_stderr, limits=job.limits,
+                               on_output=lambda name, text: self._collect(job.job_id, name, text),
+                               cancel=job.cancel)
+
+    @staticmethod
+    def _syntax_error(error: SyntaxError, start: float) -> SandboxResult:
+        """Resultado de um programa que não compila."""
+        return SandboxResult(stderr="".join(traceback.format_exception_only(type(error), error)),
+                             returncode=1, duration=time.perf_counter() - start)
+
+    def _set_stage(self, job: ExecutionJob, stage: str):
+        """Muda a etapa de um pedido e avisa a interface (thread de trabalho)."""
+        job.stage = stage
+        logger.debug("Pedido %d: %s", job.job_id, stage)
+        self._stage.emit(job.job_id, stage)
+
+    def _collect(self, job_id: int, name: str, text: str):
+        """Acumula um trecho da saída até o próximo quadro (thread de trabalho)."""
+        output_logger.debug("Pedido %d %s: %r", job_id, name, text)
+        with self._output_lock:
+            self._output.append((job_id, name, text))
+
+    def _flush(self):
+        """Entrega a saída acumulada e o progresso da execução atual (uma vez por quadro)."""
+        with self._output_lock:
+            output, self._output = self._output, []
+
+        # Trechos seguidos do mesmo fluxo viram um só sinal
+        merged = []
+        for job_id, name, text in output:
+            if merged and merged[-1][0] == job_id and merged[-1][1] == name:
+                merged[-1][2].append(text)
+            else:
+                merged.append((job_id, name, [text]))
+        for job_id, name, parts in merged:
+            self.output_received.emit(job_id, name, "".join(parts))
+
+        job = self.current
+        if job is not None and job.stage == STAGE_RUNNING and job.started_at is not None:
+            self.progress_changed.emit(job.job_id, time.perf_counter() - job.started_at, job.timeout or 0.0)
+
+    def _on_started(self, job_id: int):
+        """Publica o início do atendimento de um pedido."""
+        self.job_started.emit(job_id)
+        self.queue_changed.emit(self.pending_count())
+
+    def _on_stage(self, job_id: int, stage: str):
+        """Publica a nova etapa de um pedido."""
+        if stage == STAGE_RUNNING:
+            self._timer.start()
+        self.stage_changed.emit(job_id, stage)
+
+    def _on_prepare_requested(self, job_id: int):
+        """Executa a preparação de um pedido na thread da interface."""
+        job = self.current
+        if job is None or job.job_id != job_id:
+            return
+        try:
+            if not job.cancel.is_set():
+                job.python_code = job.prepare(job.python_code)
+        except Exception as e:
+            job.prepare_error = e
+        finally:
+            job.prepared.set()
+
+    def _on_finished(self, job_id: int, result):
+        """Entrega o restante da saída e o resultado de um pedido."""
+        self._flush()
+        if not self.is_busy():
+            self._timer.stop()
+        self.stage_changed.emit(job_id, STAGE_FINISHED)
+        self.job_finished.emit(job_id, result)
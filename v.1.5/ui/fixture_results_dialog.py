@@ -0,0 +1,236 @@
+"""
+Módulo com o diálogo de teste de um programa binário contra casos .in/.out.
+Os casos rodam em paralelo fora da thread da interface (fixture_runner); cada
+resultado chega por sinal e entra na tabela com situação e tempo, e o caso
+selecionado mostra o diff entre a saída esperada e a obtida.
+"""
+
+import threading
+import time
+
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget, QTableWidgetItem,
+    QHeaderView, QSplitter, QPlainTextEdit, QProgressBar
+)
+from PyQt5.QtGui import QColor
+from PyQt5.QtCore import Qt, pyqtSignal
+
+try:
+    from ui.fixture_runner import (
+        STATUS_PASSED, STATUS_FAILED, STATUS_ERROR, STATUS_TEXTS, iter_fixture_results, summarize
+    )
+    from ui.sandbox_runner import get_default_runner
+except ImportError:
+    from fixture_runner import (
+        STATUS_PASSED, STATUS_FAILED, STATUS_ERROR, STATUS_TEXTS, iter_fixture_results, summarize
+    )
+    from sandbox_runner import get_default_runner
+
+# Cor de cada situação na tabela
+_STATUS_COLORS = {
+    STATUS_PASSED: "#50fa7b",
+    STATUS_FAILED: "#ff5555",
+    STATUS_ERROR: "#ffb86c",
+}
+
+_DIALOG_STYLE = """
+    QDialog {
+        background-color: #23272e;
+    }
+    QLabel {
+        color: #fff;
+        font-size: 15px;
+    }
+    QTableWidget {
+        background-color: #181a20;
+        color: #e6e6e6;
+        border: 1px solid #282a36;
+        gridline-color: #282a36;
+        border-radius: 5px;
+    }
+    QTableWidget::item:selected {
+        background-color: #44475a;
+    }
+    QHeaderView::section {
+        background-color: #282a36;
+        color: #ffffff;
+        padding: 5px;
+        border: 1px solid #44475a;
+    }
+    QPlainTextEdit {
+        background-color: #181a20;
+        color: #e6e6e6;
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 14px;
+        border-radius: 5px;
+        border: 1px solid #282a36;
+    }
+    QPushButton {
+        background-color: #bd93f9;
+        color: #23272e;
+        border-radius: 7px;
+        padding: 8px 18px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #a882e6;
+    }
+    QPushButton:disabled {
+        background-color: #44475a;
+        color: #8b8b8b;
+    }
+    QProgressBar {
+        background-color: #44475a;
+        color: #f8f8f2;
+        border: none;
+        border-radius: 4px;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        background-color: #bd93f9;
+    }
+"""
+
+
+class FixtureResultsDialog(QDialog):
+    """
+    Executa os casos de teste de um programa e mostra os resultados à medida que chegam.
+    """
+
+    # Resultado de um caso (índice na lista de casos, FixtureResult), emitido pela thread de teste
+    result_ready = pyqtSignal(int, object)
+    # Fim da execução (tempo total em segundos, mensagem de erro ou "")
+    run_finished = pyqtSignal(float, str)
+
+    def __init__(self, python_code, fixtures, title="Casos de Teste", timeout=None, parent=None):
+        """
+        Args:
+            python_code: Programa já traduzido para Python ou objeto de código
+            fixtures: Casos de teste (collect_fixtures)
+            title: Título do diálogo
+            timeout: Tempo limite de cada caso em segundos (padrão: o do fixture_runner)
+            parent: Janela pai
+        """
+        super().__init__(parent)
+        self.python_code = python_code
+        self.fixtures = fixtures
+        self.timeout = timeout
+        self.results = [None] * len(fixtures)
+        self.cancel = threading.Event()
+        self._thread = None
+
+        self.setWindowTitle(title)
+        self.setMinimumSize(760, 520)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        layout = QVBoxLayout(self)
+
+        self.status_label = QLabel(f"Executando {len(fixtures)} caso(s)...")
+        layout.addWidget(self.status_label)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, len(fixtures))
+        layout.addWidget(self.progress_bar)
+
+        splitter = QSplitter(Qt.Vertical)
+        self.table = QTableWidget(len(fixtures), 3)
+        self.table.setHorizontalHeaderLabels(["Caso", "Resultado", "Tempo"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        for row, fixture in enumerate(fixtures):
+            self.table.setItem(row, 0, QTableWidgetItem(fixture.name))
+            self.table.setItem(row, 1, QTableWidgetItem("..."))
+            self.table.setItem(row, 2, QTableWidgetItem(""))
+        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        splitter.addWidget(self.table)
+
+        self.details = QPlainTextEdit()
+        self.details.setReadOnly(True)
+        self.details.setPlaceholderText("Selecione um caso para ver a diferença entre a saída esperada e a obtida.")
+        splitter.addWidget(self.details)
+        layout.addWidget(splitter)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        self.stop_button = QPushButton("Parar")
+        self.stop_button.clicked.connect(self.cancel.set)
+        buttons.addWidget(self.stop_button)
+        close_button = QPushButton("Fechar")
+        close_button.clicked.connect(self.close)
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
+        self.setStyleSheet(_DIALOG_STYLE)
+
+        self.result_ready.connect(self._on_result)
+        self.run_finished.connect(self._on_run_finished)
+
+    def start(self):
+        """Inicia a execução dos casos em uma thread de teste."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """Executa os casos (thread de teste)."""
+        start = time.perf_counter()
+        error = ""
+        try:
+            options = {} if self.timeout is None else {"timeout": self.timeout}
+            results = iter_fixture_results(self.python_code, self.fixtures, runner=get_default_runner(),
+                                           cancel=self.cancel, **options)
+            for index, result in enumerate(results):
+                self.result_ready.emit(index, result)
+        except SyntaxError as e:
+            error = f"O programa traduzido não compila: {e}"
+        except Exception as e:
+            error = f"Erro ao executar os casos: {e}"
+        try:
+            self.run_finished.emit(time.perf_counter() - start, error)
+        except RuntimeError:
+            # O diálogo já foi destruído
+            pass
+
+    def _on_result(self, index, result):
+        self.results[index] = result
+        status_item = QTableWidgetItem(STATUS_TEXTS[result.status])
+        status_item.setForeground(QColor(_STATUS_COLORS.get(result.status, "#8be9fd")))
+        self.table.setItem(index, 1, status_item)
+        self.table.setItem(index, 2, QTableWidgetItem(f"{result.duration * 1000:.0f} ms"))
+        self.progress_bar.setValue(sum(1 for r in self.results if r is not None))
+        if self.table.currentRow() == index:
+            self._on_selection_changed()
+
+    def _on_run_finished(self, elapsed, error):
+        self.stop_button.setEnabled(False)
+        if error:
+            self.status_label.setText(error)
+            return
+        done = [result for result in self.results if result is not None]
+        self.status_label.setText(f"{summarize(done)} em {elapsed:.2f} s")
+        # Seleciona a primeira falha, se houver
+        for row, result in enumerate(self.results):
+            if result is not None and result.status in (STATUS_FAILED, STATUS_ERROR):
+                self.table.selectRow(row)
+                break
+
+    def _on_selection_changed(self):
+        row = self.table.currentRow()
+        result = self.results[row] if 0 <= row < len(self.results) else None
+        if result is None:
+            self.details.clear()
+            return
+        parts = [result.message] if result.message else []
+        if result.status == STATUS_FAILED:
+            parts.append(result.diff())
+        elif result.stderr:
+            parts.append(result.stderr.rstrip())
+        elif result.status != STATUS_ERROR:
+            parts.append(result.actual)
+        self.details.setPlainText("\n".join(parts))
+
+    def closeEvent(self, event):
+        # Fechar o diálogo interrompe os casos que ainda não terminaram
+        self.cancel.set()
+        super().closeEvent(event)
@@ -0,0 +1,347 @@
+"""
+Módulo de teste de um programa binário contra casos de teste (.in/.out).
+Cada caso é um par de arquivos com o mesmo nome: NOME.in é entregue na entrada
+padrão do programa e NOME.out contém a saída esperada. O programa é traduzido e
+compilado uma única vez; os casos rodam em paralelo, cada um em um processo
+isolado do SandboxRunner (sem estado compartilhado entre casos), e cada
+resultado informa aprovação, diferença em relação ao esperado e tempo.
+Não depende do Qt.
+
+Uso:
+    python -m ui.fixture_runner programa.bin casos/ [-e fixed|enhanced|parser|binario] [-j N]
+"""
+
+import argparse
+import difflib
+import os
+import sys
+import time
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
+
+try:
+    from ui.sandbox_runner import STOP_CANCELLED, STOP_EXITED, STOP_MESSAGES, SandboxRunner
+except ImportError:
+    from sandbox_runner import STOP_CANCELLED, STOP_EXITED, STOP_MESSAGES, SandboxRunner
+
+# Extensões dos arquivos de um caso de teste
+INPUT_SUFFIX = ".in"
+OUTPUT_SUFFIX = ".out"
+
+# Tempo limite padrão de cada caso (segundos)
+DEFAULT_CASE_TIMEOUT = 5.0
+
+# Situação de cada caso
+STATUS_PASSED = "passed"
+STATUS_FAILED = "failed"
+STATUS_ERROR = "error"
+STATUS_NO_EXPECTED = "no_expected"
+
+# Texto exibido para cada situação
+STATUS_TEXTS = {
+    STATUS_PASSED: "OK",
+    STATUS_FAILED: "FALHOU",
+    STATUS_ERROR: "ERRO",
+    STATUS_NO_EXPECTED: "SEM .out",
+}
+
+
+class Fixture:
+    """
+    Caso de teste: arquivo de entrada e, se existir, arquivo de saída esperada.
+    """
+
+    def __init__(self, name: str, input_path: str, output_path: Optional[str]):
+        self.name = name
+        self.input_path = input_path
+        self.output_path = output_path
+
+    def read_input(self) -> str:
+        """Retorna o conteúdo do arquivo .in."""
+        with open(self.input_path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def read_expected(self) -> Optional[str]:
+        """Retorna o conteúdo do arquivo .out, ou None se não houver."""
+        if self.output_path is None:
+            return None
+        with open(self.output_path, "r", encoding="utf-8") as f:
+            return f.read()
+
+
+class FixtureResult:
+    """
+    Resultado de um caso de teste.
+    """
+
+    def __init__(self, fixture: Fixture, status: str, expected: Optional[str], actual: str,
+                 stderr: str = "", duration: float = 0.0, message: str = ""):
+        self.fixture = fixture
+        self.name = fixture.name
+        self.status = status
+        self.expected = expected
+        self.actual = actual
+        self.stderr = stderr
+        self.duration = duration
+        self.message = message
+
+    @property
+    def passed(self) -> bool:
+        """Indica se a saída foi a esperada."""
+        return self.status == STATUS_PASSED
+
+    def diff(self) -> str:
+        """
+        Retorna a diferença (unified diff) entre a saída esperada e a obtida.
+
+        Returns:
+            Texto do diff, vazio se não houver saída esperada ou diferença
+        """
+        if self.expected is None:
+            return ""
+        return "\n".join(difflib.unified_diff(
+            _normalize(self.expected), _normalize(self.actual),
+            f"{self.name}{OUTPUT_SUFFIX} (esperado)", f"{self.name} (obtido)", lineterm=""
+        ))
+
+
+def _normalize(text: str) -> List[str]:
+    """Linhas da saída sem espaços no fim nem linhas em branco finais."""
+    lines = [line.rstrip() for line in text.splitlines()]
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def outputs_match(expected: str, actual: str, exact: bool = False) -> bool:
+    """
+    Compara a saída obtida com a esperada.
+
+    Args:
+        expected: Saída esperada
+        actual: Saída obtida
+        exact: Se True, exige igualdade exata; senão ignora espaços no fim das linhas
+            e linhas em branco no fim
+
+    Returns:
+        True se as saídas forem equivalentes
+    """
+    if exact:
+        return expected == actual
+    return _normalize(expected) == _normalize(actual)
+
+
+def collect_fixtures(directory: str) -> List[Fixture]:
+    """
+    Lista os casos de teste de um diretório (percorrido recursivamente).
+
+    Args:
+        directory: Diretório com os arquivos .in/.out
+
+    Returns:
+        Casos em ordem de nome (caminho relativo sem a extensão)
+    """
+    fixtures = []
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith(INPUT_SUFFIX):
+                continue
+            input_path = os.path.join(dirpath, filename)
+            base = input_path[:-len(INPUT_SUFFIX)]
+            output_path = base + OUTPUT_SUFFIX
+            fixtures.append(Fixture(
+                os.path.relpath(base, directory),
+                input_path,
+                output_path if os.path.isfile(output_path) else None
+            ))
+    return fixtures
+
+
+def run_fixture(runner: SandboxRunner, code, fixture: Fixture, timeout: Optional[float] = DEFAULT_CASE_TIMEOUT,
+                limits=None, exact: bool = False, cancel: Optional[threading.Event] = None) -> FixtureResult:
+    """
+    Executa um caso de teste.
+
+    Args:
+        runner: SandboxRunner usado
+        code: Objeto de código do programa (já compilado)
+        fixture: Caso de teste
+        timeout: Tempo limite do caso em segundos
+        limits: SandboxLimits do caso (padrão: os do runner)
+        exact: Exige saída exatamente igual
+        cancel: Evento que, quando ativado, interrompe o caso (ou impede que comece)
+
+    Returns:
+        FixtureResult do caso
+    """
+    if cancel is not None and cancel.is_set():
+        return FixtureResult(fixture, STATUS_ERROR, None, "", message=STOP_MESSAGES[STOP_CANCELLED])
+    try:
+        stdin = fixture.read_input()
+        expected = fixture.read_expected()
+    except (OSError, UnicodeDecodeError) as e:
+        return FixtureResult(fixture, STATUS_ERROR, None, "", message=f"Erro ao ler o caso: {e}")
+
+    result = runner.run(code, stdin=stdin, timeout=timeout, limits=limits, cancel=cancel)
+    if result.stop_reason != STOP_EXITED or result.returncode != 0:
+        status = STATUS_ERROR
+        message = result.stop_message() or f"O programa terminou com o código {result.returncode}."
+    elif expected is None:
+        status, message = STATUS_NO_EXPECTED, ""
+    else:
+        status = STATUS_PASSED if outputs_match(expected, result.stdout, exact) else STATUS_FAILED
+        message = ""
+    return FixtureResult(fixture, status, expected, result.stdout, result.stderr, result.duration, message)
+
+
+def iter_fixture_results(python_code, fixtures: List[Fixture], workers: Optional[int] = None,
+                         timeout: Optional[float] = DEFAULT_CASE_TIMEOUT, limits=None,
+                         exact: bool = False, runner: Optional[SandboxRunner] = None,
+                         cancel: Optional[threading.Event] = None) -> Iterator[FixtureResult]:
+    """
+    Executa os casos em paralelo e produz os resultados na ordem dos casos.
+
+    Args:
+        python_code: Programa já traduzido para Python (compilado uma única vez aqui)
+            ou objeto de código já compilado
+        fixtures: Casos de teste
+        workers: Casos executados ao mesmo tempo (padrão: número de CPUs)
+        timeout: Tempo limite de cada caso em segundos
+        limits: SandboxLimits de cada caso
+        exact: Exige saída exatamente igual
+        runner: SandboxRunner usado (padrão: um novo, encerrado no fim)
+        cancel: Evento que, quando ativado, interrompe os casos em andamento e os seguintes
+
+    Yields:
+        FixtureResult de cada caso
+
+    Raises:
+        SyntaxError: Se o programa traduzido não compilar
+    """
+    if isinstance(python_code, types.CodeType):
+        code = python_code
+    else:
+        code = compile(python_code, "<binario>", "exec")
+    workers = max(1, min(workers or os.cpu_count() or 1, len(fixtures) or 1))
+    own_runner = runner is None
+    if own_runner:
+        runner = SandboxRunner()
+    try:
+        with ThreadPoolExecutor(workers) as executor:
+            # Cada caso ocupa um processo isolado; as threads só esperam pelos processos
+            yield from executor.map(
+                lambda fixture: run_fixture(runner, code, fixture, timeout, limits, exact, cancel), fixtures
+            )
+    finally:
+        if own_runner:
+            runner.shutdown()
+
+
+def run_fixtures(python_code, fixtures: List[Fixture], **options) -> List[FixtureResult]:
+    """
+    Executa os casos em paralelo.
+
+    Args:
+        python_code: Programa já traduzido para Python ou objeto de código
+        fixtures: Casos de teste
+        **options: Opções de iter_fixture_results
+
+    Returns:
+        Lista de FixtureResult na ordem dos casos
+    """
+    return list(iter_fixture_results(python_code, fixtures, **options))
+
+
+def summarize(results: List[FixtureResult]) -> str:
+    """
+    Resume os resultados.
+
+    Args:
+        results: Resultados dos casos
+
+    Returns:
+        Texto com a quantidade de casos em cada situação
+    """
+    counts = {status: 0 for status in STATUS_TEXTS}
+    for result in results:
+        counts[result.status] += 1
+    parts = [f"{counts[STATUS_PASSED]}/{len(results)} caso(s) aprovado(s)"]
+    if counts[STATUS_FAILED]:
+        parts.append(f"{counts[STATUS_FAILED]} falha(s)")
+    if counts[STATUS_ERROR]:
+        parts.append(f"{counts[STATUS_ERROR]} erro(s)")
+    if counts[STATUS_NO_EXPECTED]:
+        parts.append(f"{counts[STATUS_NO_EXPECTED]} sem saída esperada")
+    return ", ".join(parts)
+
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando.
+
+    Args:
+        argv: Argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        Código de saída (1 se algum caso não passou)
+    """
+    try:
+        from ui.binary_stream import ENGINES, create_engine
+        from ui.dialect_detector import DialectDetector
+    except ImportError:
+        from binary_stream import ENGINES, create_engine
+        from dialect_detector import DialectDetector
+
+    parser = argparse.ArgumentParser(
+        description="Testa um programa binário contra casos .in/.out do The Collector Binarie"
+    )
+    parser.add_argument("program", help="Arquivo com o código binário")
+    parser.add_argument("fixtures", help="Diretório com os casos de teste (.in/.out)")
+    parser.add_argument("-e", "--engine", choices=ENGINES,
+                        help="Interpretador usado na tradução (padrão: detectado pelo código)")
+    parser.add_argument("-j", "--jobs", type=int, help="Casos executados ao mesmo tempo (padrão: CPUs)")
+    parser.add_argument("-t", "--timeout", type=float, default=DEFAULT_CASE_TIMEOUT,
+                        help="Tempo limite de cada caso, em segundos")
+    parser.add_argument("--exact", action="store_true",
+                        help="Exige saída exatamente igual (sem ignorar espaços finais)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Não mostra os diffs das falhas")
+    args = parser.parse_args(argv)
+
+    with open(args.program, "r", encoding="utf-8") as f:
+        binary_code = f.read()
+    fixtures = collect_fixtures(args.fixtures)
+    if not fixtures:
+        print(f"Nenhum caso '*{INPUT_SUFFIX}' encontrado em {args.fixtures}", file=sys.stderr)
+        return 0
+
+    engine = args.engine or DialectDetector().detect(binary_code)
+    interpreter = create_engine(engine)
+
+    start = time.perf_counter()
+    results = []
+    try:
+        # O dialeto "parser" compila direto do binário, com as posições de erro no binário
+        compile_binary = getattr(interpreter, "compile_binary", None)
+        program = compile_binary(binary_code) if compile_binary else interpreter.traduzir_binario(binary_code)
+        for result in iter_fixture_results(program, fixtures, args.jobs, args.timeout, exact=args.exact):
+            results.append(result)
+            line = f"{STATUS_TEXTS[result.status]:>8}  {result.name}  ({result.duration * 1000:.0f} ms)"
+            print(f"{line}  {result.message}" if result.message else line)
+            if not args.quiet and result.status == STATUS_FAILED:
+                print(result.diff())
+            elif not args.quiet and result.status == STATUS_ERROR and result.stderr:
+                print(result.stderr.rstrip())
+    except SyntaxError as e:
+        print(f"O programa traduzido ({engine}) não compila: {e}", file=sys.stderr)
+        return 2
+
+    elapsed = time.perf_counter() - start
+    print(f"{summarize(results)} em {elapsed:.2f} s (dialeto: {engine})")
+    return 0 if all(result.status in (STATUS_PASSED, STATUS_NO_EXPECTED) for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
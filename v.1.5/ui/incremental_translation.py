@@ -0,0 +1,151 @@
+"""
+Módulo de tradução incremental de código binário para Python, linha a linha.
+Mantém, para cada linha do editor, o texto traduzido e o estado do tradutor
+(BinaryTextTranslator: blocos e parênteses abertos e a linha lógica em andamento)
+antes dela. Uma edição retraduz a partir da linha anterior à alterada até o estado
+voltar a coincidir com o antigo; dali em diante a tradução é reaproveitada. As
+linhas são traduzidas sob demanda, até a última pedida.
+"""
+
+from typing import List, Optional, Tuple
+
+try:
+    from ui.binary_syntax_parser import BinarySyntaxParser
+except ImportError:
+    from binary_syntax_parser import BinarySyntaxParser
+
+# Linhas retraduzidas depois de uma edição à espera de que o estado volte a coincidir;
+# passado esse limite, as seguintes voltam a ser traduzidas sob demanda
+RETRANSLATE_LIMIT = 200
+
+
+class IncrementalTranslation:
+    """
+    Tradução incremental alinhada às linhas (QTextBlocks) do editor.
+    """
+
+    def __init__(self, parser: Optional[BinarySyntaxParser] = None):
+        """
+        Inicializa a tradução incremental.
+
+        Args:
+            parser: Parser usado na tradução de cada linha
+        """
+        self.parser = parser or BinarySyntaxParser()
+        self.source_lines: List[str] = []
+        # Tradução das primeiras linhas (as demais são traduzidas sob demanda)
+        self._python: List[str] = []
+        # Estado do tradutor antes de cada linha traduzida e da primeira ainda não traduzida
+        self._states: List[tuple] = [self.parser.ast_compiler.translator().state()]
+
+    def __len__(self) -> int:
+        return len(self.source_lines)
+
+    def set_text(self, text: str):
+        """
+        Substitui todo o conteúdo.
+
+        Args:
+            text: Código binário completo
+        """
+        self.source_lines = text.split("\n")
+        self._python = []
+        del self._states[1:]
+
+    def replace_lines(self, first: int, removed: int, new_lines: List[str]) -> Tuple[int, int]:
+        """
+        Substitui um intervalo de linhas e refaz a tradução afetada.
+
+        Args:
+            first: Índice da primeira linha alterada
+            removed: Quantidade de linhas antigas substituídas
+            new_lines: Novas linhas
+
+        Returns:
+            Intervalo (início, fim) de linhas cuja tradução mudou
+        """
+        self.source_lines[first:first + removed] = new_lines
+        end = first + len(new_lines)
+        # A tradução de uma linha depende do início da seguinte: a anterior à edição também é refeita
+        start = max(0, first - 1)
+        if start >= len(self._python):
+            # Linhas ainda não traduzidas
+            return first, end
+
+        # Tradução antiga das linhas depois do intervalo editado
+        old_python = self._python[first + removed:]
+        old_states = self._states[first + removed:]
+        del self._python[start:]
+        del self._states[start + 1:]
+
+        lines = self.source_lines
+        translator = self.parser.ast_compiler.translator(self._states[start], start + 1)
+        index = start
+        while index < len(lines):
+            if index >= end:
+                old = index - end
+                if old >= len(old_python) or index - end >= RETRANSLATE_LIMIT:
+                    # Sem tradução antiga a reaproveitar: as linhas seguintes ficam sob demanda
+                    return start, len(lines)
+                if self._states[index] == old_states[old]:
+                    self._python.extend(old_python[old:])
+                    self._states.extend(old_states[old + 1:])
+                    return start, index
+            following = lines[index + 1] if index + 1 < len(lines) else None
+            self._python.append(translator.translate_line(lines[index], following))
+            self._states.append(translator.state())
+            index += 1
+        return start, len(lines)
+
+    def python_line(self, index: int) -> str:
+        """
+        Retorna a tradução de uma linha do editor.
+
+        Args:
+            index: Índice da linha
+
+        Returns:
+            Linha Python com indentação (duas, separadas por quebra de linha, quando um
+            BINSTART é seguido de código na mesma linha)
+        """
+        if index >= len(self._python):
+            self._translate(index + 1)
+        return self._python[index]
+
+    def python_lines(self, start: int, end: int) -> List[str]:
+        """
+        Retorna um intervalo de linhas Python.
+
+        Args:
+            start: Primeira linha
+            end: Linha final (exclusiva)
+
+        Returns:
+            Lista de linhas Python
+        """
+        end = min(end, len(self.source_lines))
+        if end > len(self._python):
+            self._translate(end)
+        return self._python[max(0, start):end]
+
+    def indent_level(self, index: int) -> int:
+        """Retorna o nível de blocos antes da linha indicada."""
+        if index > len(self._python):
+            self._translate(index)
+        return self._states[index][0]
+
+    def text(self) -> str:
+        """Retorna a tradução completa, com uma linha Python por linha do editor."""
+        return "\n".join(self.python_lines(0, len(self.source_lines)))
+
+    def _translate(self, stop: int):
+        """Traduz as linhas ainda não traduzidas até a linha stop (exclusiva)."""
+        lines = self.source_lines
+        index = len(self._python)
+        translator = self.parser.ast_compiler.translator(self._states[index], index + 1)
+        while index < stop:
+            following = lines[index + 1] if index + 1 < len(lines) else None
+            self._python.append(translator.translate_line(lines[index], following))
+            self._states.append(translator.state())
+            index += 1
+
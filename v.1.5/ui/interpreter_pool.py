@@ -0,0 +1,262 @@
+"""
+Módulo de execução de código por um conjunto de interpretadores pré-iniciados.
+Em vez de gravar um arquivo temporário e iniciar um novo interpretador Python a
+cada execução, mantém processos trabalhadores (interpreter_worker.py) já
+carregados, que recebem o código compilado por um pipe. Cada programa roda em um
+processo filho criado a partir do trabalhador (ou, sem fork, em um namespace e
+builtins limpos) e o trabalhador é substituído após um número de execuções, em
+caso de falha, quando o tempo limite é excedido ou quando ele pede (threads do
+programa ainda ativas).
+"""
+
+import os
+import sys
+import time
+import atexit
+import queue
+import signal
+import threading
+import subprocess
+from typing import List, Optional
+
+try:
+    from ui.interpreter_worker import read_frame, write_frame
+except ImportError:
+    from interpreter_worker import read_frame, write_frame
+
+# Caminho do script do trabalhador
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "interpreter_worker.py")
+
+# Configuração padrão do conjunto
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_RUNS = 50
+
+# Total de bytes de stdout e stderr guardados por execução; ao passar dele o programa é interrompido
+DEFAULT_OUTPUT_BYTES = 1024 * 1024
+
+# Aviso acrescentado à saída truncada
+TRUNCATION_MARKER = "\n[... saída truncada: limite de {limit} bytes atingido ...]\n"
+
+# Tempo limite das execuções interativas: sem limite, um programa preso ocuparia um trabalhador para sempre
+INTERACTIVE_TIMEOUT = 60.0
+
+
+class ExecutionResult:
+    """
+    Resultado de uma execução no conjunto de interpretadores.
+    """
+
+    def __init__(self, stdout: str = "", stderr: str = "", returncode: Optional[int] = 0,
+                 timed_out: bool = False, crashed: bool = False, duration: float = 0.0,
+                 truncated: bool = False):
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode = returncode
+        self.timed_out = timed_out
+        self.crashed = crashed
+        self.duration = duration
+        self.truncated = truncated
+
+    def combined_output(self) -> str:
+        """
+        Retorna a saída no formato usado pelos executores.
+
+        Returns:
+            stdout seguido de "--- Erros ---" e stderr, se houver
+        """
+        output = self.stdout
+        if self.stderr:
+            output += f"\n--- Erros ---\n{self.stderr}"
+        return output
+
+
+def _decode(data: bytes) -> str:
+    """Decodifica a saída como faria subprocess com text=True."""
+    text = data.decode("utf-8", "replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class _Worker:
+    """
+    Processo trabalhador e a thread que lê suas respostas.
+    """
+
+    def __init__(self, python: str):
+        self.runs = 0
+        self.responses = queue.Queue()
+        # Grupo de processos próprio: encerrar o trabalhador encerra também o programa em execução
+        options = {"start_new_session": True} if os.name == "posix" else {}
+        self.process = subprocess.Popen(
+            [python, "-u", WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            **options
+        )
+        self.reader = threading.Thread(target=self._read_responses, daemon=True)
+        self.reader.start()
+
+    def _read_responses(self):
+        """Repassa as respostas do trabalhador para a fila (None indica fim do processo)."""
+        try:
+            while True:
+                response = read_frame(self.process.stdout)
+                self.responses.put(response)
+                if response is None:
+                    break
+        except Exception:
+            self.responses.put(None)
+
+    def send(self, code, stdin_data: bytes, merge_stderr: bool, output_limit: Optional[int]):
+        """Envia um programa ao trabalhador."""
+        self.runs += 1
+        write_frame(self.process.stdin, (code, stdin_data, merge_stderr, output_limit))
+
+    def alive(self) -> bool:
+        """Indica se o processo ainda está ativo."""
+        return self.process.poll() is None
+
+    def kill(self):
+        """Encerra o processo do trabalhador e os que ele tiver criado."""
+        try:
+            if os.name == "posix":
+                os.killpg(self.process.pid, signal.SIGKILL)
+            else:
+                self.process.kill()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class InterpreterPool:
+    """
+    Conjunto de interpretadores Python pré-iniciados para execução de código.
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, max_runs: int = DEFAULT_MAX_RUNS,
+                 python: Optional[str] = None, output_bytes: Optional[int] = DEFAULT_OUTPUT_BYTES):
+        """
+        Inicializa o conjunto e inicia os trabalhadores.
+
+        Args:
+            size: Quantidade de trabalhadores (execuções simultâneas)
+            max_runs: Execuções por trabalhador antes de substituí-lo
+            python: Interpretador usado pelos trabalhadores (padrão: sys.executable)
+            output_bytes: Total de bytes de stdout e stderr guardados por execução
+                (None para sem limite); ao passar dele o programa é interrompido
+        """
+        self.size = max(1, size)
+        self.max_runs = max(1, max_runs)
+        self.python = python or sys.executable
+        self.output_bytes = output_bytes
+        self._idle = queue.Queue()
+        self._workers: List[_Worker] = []
+        self._lock = threading.Lock()
+
+        for _ in range(self.size):
+            self._idle.put(self._spawn())
+
+    def run(self, code, stdin: str = "", timeout: Optional[float] = 10.0,
+            merge_stderr: bool = False) -> ExecutionResult:
+        """
+        Executa um programa em um trabalhador livre.
+
+        Args:
+            code: Código Python (texto) ou objeto de código já compilado
+            stdin: Texto entregue na entrada padrão do programa
+            timeout: Tempo limite em segundos (None para sem limite)
+            merge_stderr: Se True, stderr é entregue junto com stdout
+
+        Returns:
+            ExecutionResult com as saídas e o código de saída
+
+        Raises:
+            SyntaxError: Se o código em texto não compilar
+        """
+        if isinstance(code, str):
+            code = compile(code, "<binario>", "exec")
+
+        worker = self._idle.get()
+        start = time.perf_counter()
+        try:
+            if not worker.alive():
+                worker = self._replace(worker)
+            try:
+                worker.send(code, stdin.encode("utf-8"), merge_stderr, self.output_bytes)
+            except (OSError, ValueError):
+                # O trabalhador morreu entre execuções: tenta uma vez com um novo
+                worker = self._replace(worker)
+                worker.send(code, stdin.encode("utf-8"), merge_stderr, self.output_bytes)
+
+            try:
+                response = worker.responses.get(timeout=timeout)
+            except queue.Empty:
+                worker = self._replace(worker)
+                return ExecutionResult(returncode=None, timed_out=True,
+                                       duration=time.perf_counter() - start)
+
+            if response is None:
+                returncode = worker.process.wait()
+                worker = self._replace(worker)
+                return ExecutionResult(returncode=returncode, crashed=True,
+                                       duration=time.perf_counter() - start)
+
+            stdout, stderr, returncode, recycle, truncated = response
+            if recycle or worker.runs >= self.max_runs:
+                worker = self._replace(worker)
+            stdout = _decode(stdout)
+            if truncated:
+                stdout += TRUNCATION_MARKER.format(limit=self.output_bytes)
+            return ExecutionResult(stdout, _decode(stderr), returncode, duration=time.perf_counter() - start,
+                                   truncated=truncated)
+        finally:
+            self._idle.put(worker)
+
+    def shutdown(self):
+        """Encerra todos os trabalhadores."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.kill()
+
+    def _spawn(self) -> _Worker:
+        """Inicia um novo trabalhador."""
+        worker = _Worker(self.python)
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        """Substitui um trabalhador (reciclagem, falha ou tempo limite)."""
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        worker.kill()
+        return self._spawn()
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> InterpreterPool:
+    """
+    Retorna o conjunto de interpretadores compartilhado da aplicação.
+
+    Returns:
+        Instância única de InterpreterPool
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = InterpreterPool()
+            atexit.register(_default_pool.shutdown)
+    return _default_pool
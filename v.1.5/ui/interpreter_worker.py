@@ -0,0 +1,453 @@
+"""
+Processo trabalhador do conjunto de interpretadores pré-iniciados.
+É iniciado pelo InterpreterPool e fica aguardando programas pelo canal de
+controle (stdin/stdout originais). Cada programa roda com stdin, stdout e stderr
+próprios (pipes no nível de descritor), e o resultado é devolvido pelo mesmo
+canal. Onde há fork, cada programa roda em um processo filho criado a partir do
+trabalhador já carregado (como um forkserver): o filho é uma cópia do
+interpretador, e o que o programa alterar (builtins, sys.modules, threads que
+continuam rodando) termina com ele. Sem fork, o programa roda no próprio
+trabalhador com uma cópia dos builtins; builtins e sys.modules são restaurados
+depois, e o trabalhador pede para ser substituído se restarem threads.
+
+Protocolo (quadros de 4 bytes de tamanho + marshal):
+    pedido:   (código compilado, dados de entrada, mesclar stderr em stdout, limite de saída)
+    resposta: (stdout, stderr, código de saída, substituir o trabalhador, saída truncada)
+
+Quando stdout e stderr juntos passam do limite de saída, o restante é descartado
+e o programa é interrompido: o processo filho termina com a saída guardada até
+ali; sem fork, o programa recebe KeyboardInterrupt e o trabalhador é substituído.
+
+Com --sandbox, o processo roda um único programa sob limites de recursos
+(SandboxRunner): o pedido (código compilado, limites, mesclar stderr) chega no
+início do stdin, o restante do stdin é a entrada do programa, e stdout/stderr
+vão direto para o processo pai. No fim, (código de saída, motivo da parada) é
+escrito no descritor de estado recebido na linha de comando.
+"""
+
+import os
+import sys
+import errno
+import signal
+import _thread
+import struct
+import marshal
+import builtins
+import tempfile
+import threading
+import traceback
+
+_HEADER = struct.Struct(">I")
+
+_MISSING = object()
+
+
+def read_frame(stream):
+    """
+    Lê um quadro do canal de controle.
+
+    Args:
+        stream: Arquivo binário de leitura
+
+    Returns:
+        Objeto decodificado ou None se o canal foi fechado
+    """
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    size = _HEADER.unpack(header)[0]
+    data = stream.read(size)
+    if len(data) < size:
+        return None
+    return marshal.loads(data)
+
+
+def write_frame(stream, obj):
+    """
+    Escreve um quadro no canal de controle.
+
+    Args:
+        stream: Arquivo binário de escrita
+        obj: Objeto serializável por marshal
+    """
+    data = marshal.dumps(obj)
+    stream.write(_HEADER.pack(len(data)) + data)
+    stream.flush()
+
+
+class _OutputBudget:
+    """
+    Limite total de bytes de stdout e stderr de um programa.
+    """
+
+    def __init__(self, limit, on_limit):
+        """
+        Args:
+            limit: Bytes guardados (None para sem limite)
+            on_limit: Função chamada uma vez, quando o limite é atingido
+        """
+        self.remaining = limit
+        self.on_limit = on_limit
+        self.truncated = False
+        self._lock = threading.Lock()
+
+    def take(self, chunk):
+        """
+        Separa a parte do trecho que cabe no limite.
+
+        Returns:
+            Tupla (bytes a guardar, True se o limite foi atingido agora)
+        """
+        with self._lock:
+            if self.remaining is None or len(chunk) <= self.remaining:
+                if self.remaining is not None:
+                    self.remaining -= len(chunk)
+                return chunk, False
+            chunk = chunk[:self.remaining]
+            self.remaining = 0
+            reached = not self.truncated
+            self.truncated = True
+        return chunk, reached
+
+
+def _drain(fd, buffer, budget):
+    """Lê um descritor até o fim, acumulando os bytes que cabem no limite de saída."""
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            break
+        # Depois do limite a leitura continua, descartando, para o programa não travar na escrita
+        data, reached = budget.take(chunk)
+        buffer += data
+        if reached:
+            budget.on_limit()
+    os.close(fd)
+
+
+def _feed(fd, data):
+    """Escreve os dados de entrada no descritor e o fecha."""
+    try:
+        if data:
+            os.write(fd, data)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _run_program(code, stdin_data, merge_stderr, devnull, output_limit=None, on_limit=None):
+    """
+    Executa um programa com stdin/stdout/stderr redirecionados.
+
+    Args:
+        code: Objeto de código
+        stdin_data: Bytes entregues na entrada padrão
+        merge_stderr: Se True, stderr vai para o mesmo destino de stdout
+        devnull: Descritor para onde os fluxos padrão voltam após a execução
+        output_limit: Total de bytes de stdout e stderr guardados (None para sem limite)
+        on_limit: Chamada com (stdout, stderr) quando o limite é atingido (padrão:
+            interrompe o programa com KeyboardInterrupt)
+
+    Returns:
+        Tupla (stdout, stderr, código de saída, substituir o trabalhador, saída truncada)
+    """
+    out_buffer, err_buffer = bytearray(), bytearray()
+    if on_limit is None:
+        budget = _OutputBudget(output_limit, _thread.interrupt_main)
+    else:
+        budget = _OutputBudget(output_limit, lambda: on_limit(out_buffer, err_buffer))
+    in_r, in_w = os.pipe()
+    out_r, out_w = os.pipe()
+    threads = [
+        threading.Thread(target=_feed, args=(in_w, stdin_data), daemon=True),
+        threading.Thread(target=_drain, args=(out_r, out_buffer, budget), daemon=True),
+    ]
+    if merge_stderr:
+        err_w = out_w
+    else:
+        err_r, err_w = os.pipe()
+        threads.append(threading.Thread(target=_drain, args=(err_r, err_buffer, budget), daemon=True))
+
+    os.dup2(in_r, 0)
+    os.dup2(out_w, 1)
+    os.dup2(err_w, 2)
+    for fd in {in_r, out_w, err_w}:
+        os.close(fd)
+    for thread in threads:
+        thread.start()
+
+    # Fluxos como os de um script com pipes: stdout em bloco, stderr por linha
+    sys.stdin = open(0, "r", encoding="utf-8", closefd=False)
+    sys.stdout = open(1, "w", encoding="utf-8", closefd=False)
+    sys.stderr = open(2, "w", encoding="utf-8", errors="backslashreplace", closefd=False, buffering=1)
+    stdout, stderr = sys.stdout, sys.stderr
+
+    cwd = os.getcwd()
+    argv = list(sys.argv)
+    builtins_snapshot = dict(builtins.__dict__)
+    modules_snapshot = dict(sys.modules)
+    # O programa recebe a sua cópia dos builtins; o módulo builtins é restaurado no fim
+    namespace = {"__name__": "__main__", "__builtins__": dict(builtins_snapshot)}
+    returncode = 0
+    try:
+        exec(code, namespace)
+    except SystemExit as e:
+        if e.code is None:
+            returncode = 0
+        elif isinstance(e.code, int):
+            returncode = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            returncode = 1
+    except BaseException as e:
+        # Mesmo formato do interpretador, sem o quadro deste módulo
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next, file=sys.stderr)
+        returncode = 1
+    finally:
+        _restore(builtins.__dict__, builtins_snapshot)
+        _restore(sys.modules, modules_snapshot)
+        for stream in (sys.stdout, sys.stderr, stdout, stderr):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+        sys.stdin, sys.stdout, sys.stderr = sys.__stdin__, sys.__stdout__, sys.__stderr__
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        namespace.clear()
+        sys.argv = argv
+        try:
+            os.chdir(cwd)
+        except OSError:
+            pass
+
+    for thread in threads:
+        thread.join()
+    # Threads criadas pelo programa continuariam rodando durante o próximo programa
+    # (e um programa interrompido pode ter deixado o trabalhador em qualquer estado)
+    recycle = threading.active_count() > 1 or budget.truncated
+    return bytes(out_buffer), bytes(err_buffer), returncode, recycle, budget.truncated
+
+
+def _restore(mapping, snapshot):
+    """Devolve um dicionário (builtins, sys.modules) ao estado de snapshot."""
+    for key in [key for key in mapping if key not in snapshot]:
+        del mapping[key]
+    for key, value in snapshot.items():
+        if mapping.get(key, _MISSING) is not value:
+            mapping[key] = value
+
+
+def _run_forked(code, stdin_data, merge_stderr, devnull, output_limit=None):
+    """
+    Executa um programa em um processo filho, cópia do trabalhador.
+
+    Args:
+        code: Objeto de código
+        stdin_data: Bytes entregues na entrada padrão
+        merge_stderr: Se True, stderr vai para o mesmo destino de stdout
+        devnull: Descritor para onde os fluxos padrão voltam após a execução
+        output_limit: Total de bytes de stdout e stderr guardados (None para sem limite)
+
+    Returns:
+        Tupla (stdout, stderr, código de saída, substituir o trabalhador, saída truncada)
+    """
+    result_r, result_w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Filho: o resultado sai pelo pipe e o processo termina junto com as threads do programa
+        sent = threading.Lock()
+
+        def send(result):
+            # Um único resultado: o primeiro a enviar encerra o processo sem soltar a trava
+            sent.acquire()
+            data = marshal.dumps(result)
+            os.write(result_w, _HEADER.pack(len(data)) + data)
+            os._exit(0)
+
+        def on_limit(out_buffer, err_buffer):
+            # Limite de saída: o programa termina aqui, como se tivesse recebido SIGKILL
+            send((bytes(out_buffer), bytes(err_buffer), -signal.SIGKILL, True))
+
+        try:
+            os.close(result_r)
+            stdout, stderr, returncode, _recycle, truncated = _run_program(
+                code, stdin_data, merge_stderr, devnull, output_limit, on_limit)
+            send((stdout, stderr, returncode, truncated))
+        finally:
+            os._exit(1)
+
+    os.close(result_w)
+    try:
+        # O quadro tem tamanho: um processo criado pelo programa que herde o pipe não atrasa a leitura
+        header = _read_exact(result_r, _HEADER.size)
+        data = _read_exact(result_r, _HEADER.unpack(header)[0]) if len(header) == _HEADER.size else b""
+    finally:
+        os.close(result_r)
+    status = os.waitpid(pid, 0)[1]
+    if data:
+        stdout, stderr, returncode, truncated = marshal.loads(data)
+        return stdout, stderr, returncode, False, truncated
+    # O programa encerrou o processo filho (os._exit, sinal) antes de devolver a saída
+    return b"", b"", os.waitstatus_to_exitcode(status), False, False
+
+
+def _read_exact(fd, size):
+    """Lê exatamente size bytes de um descritor (menos se ele for fechado antes)."""
+    data = bytearray()
+    while len(data) < size:
+        chunk = os.read(fd, size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return bytes(data)
+
+
+def _apply_limits(limits):
+    """
+    Reduz os limites de recursos do próprio processo (não podem mais ser aumentados).
+
+    Args:
+        limits: Tupla (segundos de CPU, bytes de memória, bytes por arquivo, processos);
+            None em uma posição mantém o limite atual
+    """
+    try:
+        import resource
+    except ImportError:
+        # Sem rlimits (Windows): valem só o tempo limite e o limite de saída
+        return
+
+    cpu_seconds, memory_bytes, file_size_bytes, max_processes = limits
+
+    def lower(kind, soft, hard=None):
+        hard = soft if hard is None else hard
+        current_hard = resource.getrlimit(kind)[1]
+        if current_hard != resource.RLIM_INFINITY:
+            soft, hard = min(soft, current_hard), min(hard, current_hard)
+        try:
+            resource.setrlimit(kind, (soft, hard))
+        except (ValueError, OSError):
+            pass
+
+    if cpu_seconds is not None:
+        # RLIMIT_CPU conta o tempo do processo inteiro: o orçamento começa agora
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        spent = int(usage.ru_utime + usage.ru_stime) + 1
+        # SIGXCPU no limite; SIGKILL um segundo depois, se o sinal for ignorado
+        lower(resource.RLIMIT_CPU, spent + cpu_seconds, spent + cpu_seconds + 1)
+    if memory_bytes is not None:
+        lower(resource.RLIMIT_AS, memory_bytes)
+    if file_size_bytes is not None:
+        lower(resource.RLIMIT_FSIZE, file_size_bytes)
+    if max_processes is not None and hasattr(resource, "RLIMIT_NPROC"):
+        lower(resource.RLIMIT_NPROC, max_processes)
+
+
+def _limit_reason(error):
+    """
+    Identifica o limite de recursos responsável por uma exceção não tratada.
+
+    Args:
+        error: Exceção que encerrou o programa
+
+    Returns:
+        Motivo ("memory_limit", "file_size_limit", "process_limit") ou None
+    """
+    if isinstance(error, MemoryError):
+        return "memory_limit"
+    if isinstance(error, OSError) and error.errno == errno.EFBIG:
+        return "file_size_limit"
+    if isinstance(error, OSError) and error.errno == errno.EAGAIN:
+        return "process_limit"
+    if isinstance(error, RuntimeError) and "can't start new thread" in str(error):
+        return "process_limit"
+    return None
+
+
+def run_sandboxed(status_fd):
+    """
+    Executa um único programa sob limites de recursos e encerra o processo.
+
+    Args:
+        status_fd: Descritor onde (código de saída, motivo) é escrito no fim, ou -1
+    """
+    header = _read_exact(0, _HEADER.size)
+    if len(header) < _HEADER.size:
+        os._exit(0)
+    code, limits, merge_stderr = marshal.loads(_read_exact(0, _HEADER.unpack(header)[0]))
+
+    if merge_stderr:
+        os.dup2(1, 2)
+    sys.path[0] = tempfile.gettempdir()
+    # Fluxos como os de um script com pipes: stdout em bloco, stderr por linha
+    sys.stdin = open(0, "r", encoding="utf-8", closefd=False)
+    sys.stdout = open(1, "w", encoding="utf-8", closefd=False)
+    sys.stderr = open(2, "w", encoding="utf-8", errors="backslashreplace", closefd=False, buffering=1)
+
+    _apply_limits(limits)
+
+    namespace = {"__name__": "__main__", "__builtins__": builtins}
+    returncode = 0
+    reason = None
+    try:
+        exec(code, namespace)
+    except SystemExit as e:
+        if e.code is None:
+            returncode = 0
+        elif isinstance(e.code, int):
+            returncode = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            returncode = 1
+    except BaseException as e:
+        reason = _limit_reason(e)
+        returncode = 1
+        try:
+            traceback.print_exception(type(e), e, e.__traceback__.tb_next, file=sys.stderr)
+        except BaseException:
+            # Sem memória nem para formatar o traceback
+            pass
+
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except BaseException as e:
+            reason = reason or _limit_reason(e)
+    if status_fd >= 0:
+        try:
+            data = marshal.dumps((returncode, reason))
+            os.write(status_fd, _HEADER.pack(len(data)) + data)
+        except OSError:
+            pass
+    os._exit(returncode & 0xFF)
+
+
+def main():
+    """Laço principal do trabalhador."""
+    if len(sys.argv) > 1 and sys.argv[1] == "--sandbox":
+        run_sandboxed(int(sys.argv[2]) if len(sys.argv) > 2 else -1)
+
+    # O canal de controle usa os descritores originais; os fluxos padrão passam a ser do programa
+    control_in = os.fdopen(os.dup(0), "rb")
+    control_out = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+
+    # Como em um script temporário, o diretório do programa é o diretório temporário
+    sys.path[0] = tempfile.gettempdir()
+
+    run = _run_forked if hasattr(os, "fork") else _run_program
+    while True:
+        request = read_frame(control_in)
+        if request is None:
+            break
+        code, stdin_data, merge_stderr, output_limit = request
+        response = run(code, stdin_data, merge_stderr, devnull, output_limit)
+        write_frame(control_out, response)
+        if response[3]:
+            break
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Módulo de índice de linhas para arquivos muito grandes.
+O arquivo é mapeado em memória (mmap) e apenas as posições de início de cada
+linha são guardadas, em um array de inteiros de 8 bytes construído por blocos:
+com o NumPy, cada bloco é varrido de forma vetorizada (np.flatnonzero); sem ele,
+por bytes.split. O texto de uma linha só é decodificado quando é pedido, de modo
+que arquivos de centenas de MB podem ser exibidos e pesquisados sem ser
+carregados em um QTextDocument.
+"""
+
+import re
+import mmap
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Callable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Tamanho de cada bloco varrido na construção do índice
+INDEX_BLOCK_SIZE = 16 * 1024 * 1024
+
+
+class LargeFileIndex:
+    """
+    Arquivo de texto mapeado em memória, com acesso às linhas por número.
+    """
+
+    def __init__(self, path, encoding: str = "utf-8"):
+        """
+        Mapeia o arquivo (o índice é construído por build()).
+
+        Args:
+            path: Caminho do arquivo
+            encoding: Codificação usada para decodificar as linhas
+        """
+        self.path = path
+        self.encoding = encoding
+        self._file = open(path, "rb")
+        self.size = self._file.seek(0, 2)
+        # Arquivos vazios não podem ser mapeados
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        # Posição inicial de cada linha, mais a posição final do arquivo
+        self._offsets = array("q", [0])
+        self.ready = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.line_count
+
+    @property
+    def line_count(self) -> int:
+        """Quantidade de linhas indexadas."""
+        return len(self._offsets) - 1 if self.ready else 0
+
+    def build(self, progress: Optional[Callable[[int, int], None]] = None):
+        """
+        Constrói o índice de linhas.
+
+        Args:
+            progress: Função chamada com (bytes processados, tamanho total) a cada bloco
+        """
+        offsets = array("q", [0])
+        data = self._data
+        for start in range(0, self.size, INDEX_BLOCK_SIZE):
+            block = data[start:start + INDEX_BLOCK_SIZE]
+            if np is not None:
+                newlines = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == 10)
+                offsets.frombytes((newlines + (start + 1)).astype(np.int64).tobytes())
+            else:
+                parts = block.split(b"\n")
+                positions = accumulate((len(part) + 1 for part in parts[:-1]), initial=start)
+                next(positions)
+                offsets.extend(positions)
+            if progress is not None:
+                progress(min(start + INDEX_BLOCK_SIZE, self.size), self.size)
+
+        # Fim da última linha (se o arquivo termina em "\n", a linha vazia após ele existe, como em split("\n"))
+        offsets.append(self.size)
+        self._offsets = offsets
+        self.ready = True
+
+    def line_bytes(self, index: int, limit: Optional[int] = None) -> bytes:
+        """
+        Retorna os bytes de uma linha, sem o "\\n" (e sem o "\\r" de arquivos Windows).
+
+        Args:
+            index: Número da linha (baseado em 0)
+            limit: Quantidade máxima de bytes (linhas enormes são cortadas)
+        """
+        start = self._offsets[index]
+        end = self._offsets[index + 1]
+        if end > start and self._data[end - 1:end] == b"\n":
+            end -= 1
+        if end > start and self._data[end - 1:end] == b"\r":
+            end -= 1
+        if limit is not None:
+            end = min(end, start + limit)
+        return self._data[start:end]
+
+    def line(self, index: int, limit: Optional[int] = None) -> str:
+        """
+        Retorna o texto de uma linha.
+
+        Args:
+            index: Número da linha (baseado em 0)
+            limit: Quantidade máxima de bytes lidos
+
+        Returns:
+            Texto da linha
+        """
+        return self.line_bytes(index, limit).decode(self.encoding, "replace")
+
+    def lines(self, start: int, end: int) -> List[str]:
+        """
+        Retorna um intervalo de linhas.
+
+        Args:
+            start: Primeira linha
+            end: Linha final (exclusiva)
+
+        Returns:
+            Lista de textos
+        """
+        end = min(end, self.line_count)
+        return [self.line(index) for index in range(max(0, start), end)]
+
+    def line_offset(self, index: int) -> int:
+        """Retorna a posição (em bytes) do início de uma linha."""
+        return self._offsets[index]
+
+    def line_of_offset(self, offset: int) -> int:
+        """
+        Retorna a linha que contém uma posição do arquivo.
+
+        Args:
+            offset: Posição em bytes
+
+        Returns:
+            Número da linha (baseado em 0)
+        """
+        return max(0, min(bisect_right(self._offsets, offset) - 1, self.line_count - 1))
+
+    def search(self, pattern: str, start_line: int = 0, start_column: int = 0,
+               regex: bool = False, wrap: bool = True) -> Optional[Tuple[int, int, int]]:
+        """
+        Procura um texto diretamente no arquivo mapeado.
+
+        Args:
+            pattern: Texto (ou expressão regular) procurado
+            start_line: Linha onde a busca começa
+            start_column: Coluna (em caracteres) onde a busca começa
+            regex: Se True, pattern é uma expressão regular
+            wrap: Se True, recomeça do início do arquivo ao chegar ao fim
+
+        Returns:
+            Tupla (linha, coluna, comprimento em caracteres) ou None
+        """
+        if not pattern or not self.ready or not self.size:
+            return None
+        needle = pattern.encode(self.encoding)
+        compiled = re.compile(needle) if regex else None
+
+        prefix = self.line(start_line)[:start_column].encode(self.encoding)
+        start = self._offsets[start_line] + len(prefix)
+        ranges = [(start, self.size)] + ([(0, start)] if wrap else [])
+        for begin, end in ranges:
+            if compiled is not None:
+                match = compiled.search(self._data, begin, end)
+                found = (match.start(), match.end()) if match else None
+            else:
+                position = self._data.find(needle, begin, end)
+                found = (position, position + len(needle)) if position >= 0 else None
+            if found is None:
+                continue
+
+            line = self.line_of_offset(found[0])
+            line_start = self._offsets[line]
+            column = len(self._data[line_start:found[0]].decode(self.encoding, "replace"))
+            length = len(self._data[found[0]:found[1]].decode(self.encoding, "replace"))
+            return line, column, length
+        return None
+
+    def close(self):
+        """Libera o mapeamento e o arquivo."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b""
+        self._file.close()
+        self.ready = False
@@ -0,0 +1,412 @@
+"""
+Módulo da visualização somente leitura de arquivos binários muito grandes.
+Em vez de carregar o arquivo em um QTextDocument, a visualização usa um
+LargeFileIndex (arquivo mapeado em memória + índice de linhas) e desenha apenas
+as linhas da janela visível, com realce de sintaxe, números de linha e a dica
+com o significado de cada token. Permite ir para uma linha (Ctrl+G) e pesquisar
+(Ctrl+F / F3) sem ler o arquivo inteiro para a memória.
+"""
+
+import threading
+from collections import OrderedDict
+
+from PyQt5.QtWidgets import QAbstractScrollArea, QToolTip, QInputDialog
+from PyQt5.QtGui import QPainter, QColor, QFont, QFontMetrics
+from PyQt5.QtCore import Qt, QRect, pyqtSignal
+
+try:
+    from ui.large_file_index import LargeFileIndex
+    from ui.binary_token_index import (
+        BinaryTokenIndex, TOKEN_KEYWORD, TOKEN_CONTROL, TOKEN_FUNCTION,
+        TOKEN_INVALID, TOKEN_STRING, TOKEN_COMMENT
+    )
+    from ui.binary_syntax_parser import BinarySyntaxParser
+    from ui.syntax_highlighter_enhanced import BinarySyntaxHighlighterEnhanced
+except ImportError:
+    from large_file_index import LargeFileIndex
+    from binary_token_index import (
+        BinaryTokenIndex, TOKEN_KEYWORD, TOKEN_CONTROL, TOKEN_FUNCTION,
+        TOKEN_INVALID, TOKEN_STRING, TOKEN_COMMENT
+    )
+    from binary_syntax_parser import BinarySyntaxParser
+    from syntax_highlighter_enhanced import BinarySyntaxHighlighterEnhanced
+
+# Arquivos a partir deste tamanho são abertos nesta visualização
+LARGE_FILE_THRESHOLD = 32 * 1024 * 1024
+
+# Bytes exibidos de cada linha (linhas maiores são cortadas)
+MAX_LINE_BYTES = 16 * 1024
+
+# Linhas decodificadas e realçadas mantidas em memória
+LINE_CACHE_SIZE = 4096
+
+
+class LargeFileView(QAbstractScrollArea):
+    """
+    Visualização virtualizada, somente leitura, de um arquivo grande.
+    """
+
+    # Emitido quando o índice de linhas fica pronto
+    index_ready = pyqtSignal()
+
+    # Resultados internos das threads de trabalho
+    _index_built = pyqtSignal(object)
+    _search_finished = pyqtSignal(object)
+
+    def __init__(self, path, parent=None):
+        """
+        Abre o arquivo e inicia a construção do índice em segundo plano.
+
+        Args:
+            path: Caminho do arquivo
+            parent: Widget pai
+        """
+        super().__init__(parent)
+        self.path = path
+        self.index = LargeFileIndex(path)
+        self.parser = BinarySyntaxParser()
+        self.binary_keywords = self.parser.binary_keywords
+        self.token_index = BinaryTokenIndex(self.binary_keywords)
+
+        self.background_color = QColor("#181a20")
+        self.text_color = QColor("#e6e6e6")
+        self.gutter_color = QColor("#2e2e2e")
+        self.line_number_color = QColor("#6272a4")
+        self.current_line_color = QColor("#2d2d5a")
+        self.match_color = QColor(241, 250, 140, 90)
+        self.token_colors = {
+            TOKEN_KEYWORD: (QColor(BinarySyntaxHighlighterEnhanced.DEFAULT_KEYWORD_COLOR), True, False),
+            TOKEN_CONTROL: (QColor("#bd93f9"), True, False),
+            TOKEN_FUNCTION: (QColor("#50fa7b"), True, False),
+            TOKEN_INVALID: (QColor("#ff5555"), False, False),
+            TOKEN_STRING: (QColor("#f1fa8c"), False, False),
+            TOKEN_COMMENT: (QColor("#6272a4"), False, True),
+        }
+
+        font = QFont("JetBrains Mono")
+        font.setStyleHint(QFont.Monospace)
+        font.setPointSize(12)
+        self.setFont(font)
+        self.bold_font = QFont(font)
+        self.bold_font.setBold(True)
+        self.italic_font = QFont(font)
+        self.italic_font.setItalic(True)
+
+        self.current_line = 0
+        self.search_text = ""
+        self.search_match = None
+        self._searching = False
+        self._max_columns = 0
+        self._cache = OrderedDict()
+
+        self.viewport().setMouseTracking(True)
+        self.verticalScrollBar().setSingleStep(1)
+        self.setFocusPolicy(Qt.StrongFocus)
+
+        self._index_built.connect(self._on_index_built)
+        self._search_finished.connect(self._on_search_finished)
+        threading.Thread(target=self._build_index, daemon=True).start()
+
+    def _build_index(self):
+        """Constrói o índice de linhas (thread de trabalho)."""
+        try:
+            self.index.build()
+            error = None
+        except Exception as e:
+            error = e
+        try:
+            self._index_built.emit(error)
+        except RuntimeError:
+            # A visualização foi fechada durante a indexação
+            pass
+
+    def _on_index_built(self, error):
+        """Atualiza a visualização com o índice pronto."""
+        if error is not None:
+            QToolTip.showText(self.mapToGlobal(self.rect().center()), f"Erro ao indexar o arquivo:\n{error}", self)
+            return
+        self._update_scrollbars()
+        self.viewport().update()
+        self.index_ready.emit()
+
+    def close_file(self):
+        """Libera o mapeamento do arquivo."""
+        self._cache.clear()
+        self.index.close()
+
+    def line_count(self):
+        """Quantidade de linhas do arquivo (0 enquanto o índice é construído)."""
+        return self.index.line_count
+
+    # ------------------------------------------------------------------
+    # Geometria
+
+    def _line_height(self):
+        return QFontMetrics(self.font()).height()
+
+    def _char_width(self):
+        return QFontMetrics(self.font()).width("0")
+
+    def _visible_rows(self):
+        return max(1, self.viewport().height() // max(1, self._line_height()))
+
+    def _gutter_width(self):
+        digits = len(str(max(1, self.line_count())))
+        return 10 + self._char_width() * digits
+
+    def _update_scrollbars(self):
+        """Ajusta as barras de rolagem ao número de linhas e à largura das linhas vistas."""
+        rows = self._visible_rows()
+        vertical = self.verticalScrollBar()
+        vertical.setRange(0, max(0, self.line_count() - rows))
+        vertical.setPageStep(rows)
+
+        horizontal = self.horizontalScrollBar()
+        content = self._max_columns * self._char_width()
+        available = self.viewport().width() - self._gutter_width()
+        horizontal.setRange(0, max(0, content - available + self._char_width()))
+        horizontal.setPageStep(max(1, available))
+        horizontal.setSingleStep(self._char_width())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scrollbars()
+
+    def scrollContentsBy(self, dx, dy):
+        self.viewport().update()
+
+    # ------------------------------------------------------------------
+    # Linhas
+
+    def _line(self, number):
+        """
+        Retorna o texto e os tokens de uma linha, com cache das linhas recentes.
+
+        Args:
+            number: Número da linha (baseado em 0)
+
+        Returns:
+            Tupla (texto, tokens)
+        """
+        entry = self._cache.get(number)
+        if entry is None:
+            text = self.index.line(number, MAX_LINE_BYTES)
+            entry = (text, self.token_index.scan_line(text))
+            self._cache[number] = entry
+            if len(self._cache) > LINE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+            if len(text) > self._max_columns:
+                self._max_columns = len(text)
+                self._update_scrollbars()
+        else:
+            self._cache.move_to_end(number)
+        return entry
+
+    def paintEvent(self, event):
+        """Desenha somente as linhas visíveis."""
+        painter = QPainter(self.viewport())
+        painter.fillRect(event.rect(), self.background_color)
+
+        line_height = self._line_height()
+        char_width = self._char_width()
+        ascent = QFontMetrics(self.font()).ascent()
+        gutter = self._gutter_width()
+        x_offset = gutter + 4 - self.horizontalScrollBar().value()
+        width = self.viewport().width()
+
+        painter.fillRect(QRect(0, 0, gutter, self.viewport().height()), self.gutter_color)
+        if not self.index.ready:
+            painter.setPen(self.line_number_color)
+            painter.drawText(QRect(gutter + 4, 0, width, line_height), Qt.AlignLeft, "Indexando arquivo...")
+            return
+
+        first = self.verticalScrollBar().value()
+        last = min(self.line_count(), first + self._visible_rows() + 1)
+        for row, number in enumerate(range(first, last)):
+            top = row * line_height
+            baseline = top + ascent
+            text, tokens = self._line(number)
+
+            if number == self.current_line:
+                painter.fillRect(QRect(gutter, top, width - gutter, line_height), self.current_line_color)
+            if self.search_match is not None and self.search_match[0] == number:
+                _, column, length = self.search_match
+                painter.fillRect(QRect(x_offset + column * char_width, top, length * char_width, line_height),
+                                 self.match_color)
+
+            painter.setClipRect(QRect(gutter, top, width - gutter, line_height))
+            position = 0
+            for i in range(0, len(tokens), 3):
+                start, length, kind = tokens[i], tokens[i + 1], tokens[i + 2]
+                if start > position:
+                    self._draw_segment(painter, x_offset + position * char_width, baseline,
+                                       text[position:start], self.text_color, False, False)
+                color, bold, italic = self.token_colors[kind]
+                self._draw_segment(painter, x_offset + start * char_width, baseline,
+                                   text[start:start + length], color, bold, italic)
+                position = start + length
+            if position < len(text):
+                self._draw_segment(painter, x_offset + position * char_width, baseline,
+                                   text[position:], self.text_color, False, False)
+            painter.setClipping(False)
+
+            painter.setPen(self.line_number_color)
+            painter.setFont(self.font())
+            painter.drawText(QRect(0, top, gutter - 6, line_height), Qt.AlignRight | Qt.AlignVCenter,
+                             str(number + 1))
+
+    def _draw_segment(self, painter, x, baseline, text, color, bold, italic):
+        """Desenha um trecho de uma linha com a cor e o estilo indicados."""
+        painter.setPen(color)
+        painter.setFont(self.bold_font if bold else self.italic_font if italic else self.font())
+        painter.drawText(x, baseline, text)
+
+    # ------------------------------------------------------------------
+    # Dicas, navegação e busca
+
+    def _position_at(self, point):
+        """Retorna (linha, coluna) sob um ponto do viewport, ou None."""
+        if not self.index.ready:
+            return None
+        number = self.verticalScrollBar().value() + point.y() // max(1, self._line_height())
+        if number >= self.line_count():
+            return None
+        x = point.x() - self._gutter_width() - 4 + self.horizontalScrollBar().value()
+        if x < 0:
+            return None
+        return number, x // max(1, self._char_width())
+
+    def mouseMoveEvent(self, event):
+        """Mostra o significado do token sob o cursor."""
+        position = self._position_at(event.pos())
+        if position is not None:
+            number, column = position
+            text, tokens = self._line(number)
+            for i in range(0, len(tokens), 3):
+                start, length, kind = tokens[i], tokens[i + 1], tokens[i + 2]
+                if start <= column < start + length and kind not in (TOKEN_STRING, TOKEN_COMMENT):
+                    word = text[start:start + length]
+                    meaning = self.binary_keywords.get(word, "Comando desconhecido")
+                    QToolTip.showText(event.globalPos(), f"{word} → {meaning}", self)
+                    return
+        QToolTip.hideText()
+        super().mouseMoveEvent(event)
+
+    def mousePressEvent(self, event):
+        position = self._position_at(event.pos())
+        if position is not None:
+            self.current_line = position[0]
+            self.viewport().update()
+        super().mousePressEvent(event)
+
+    def keyPressEvent(self, event):
+        key = event.key()
+        control = event.modifiers() & Qt.ControlModifier
+        vertical = self.verticalScrollBar()
+        if control and key == Qt.Key_G:
+            self.prompt_goto_line()
+        elif control and key == Qt.Key_F:
+            self.prompt_find()
+        elif key == Qt.Key_F3:
+            self.find(self.search_text)
+        elif control and key == Qt.Key_Home:
+            self.goto_line(1)
+        elif control and key == Qt.Key_End:
+            self.goto_line(self.line_count())
+        elif key == Qt.Key_Up:
+            self._move_current(-1)
+        elif key == Qt.Key_Down:
+            self._move_current(1)
+        elif key == Qt.Key_PageUp:
+            self._move_current(-vertical.pageStep())
+        elif key == Qt.Key_PageDown:
+            self._move_current(vertical.pageStep())
+        else:
+            super().keyPressEvent(event)
+
+    def _move_current(self, delta):
+        """Move a linha atual mantendo-a visível."""
+        self.goto_line(self.current_line + 1 + delta, center=False)
+
+    def goto_line(self, line, center=True):
+        """
+        Vai para uma linha.
+
+        Args:
+            line: Número da linha (baseado em 1)
+            center: Se True, a linha fica no terço superior da janela
+        """
+        if not self.index.ready or self.line_count() == 0:
+            return
+        number = max(0, min(line - 1, self.line_count() - 1))
+        self.current_line = number
+        vertical = self.verticalScrollBar()
+        rows = self._visible_rows()
+        if center:
+            vertical.setValue(number - rows // 3)
+        elif number < vertical.value():
+            vertical.setValue(number)
+        elif number >= vertical.value() + rows:
+            vertical.setValue(number - rows + 1)
+        self.viewport().update()
+
+    def prompt_goto_line(self):
+        """Pergunta a linha de destino (Ctrl+G)."""
+        if not self.index.ready:
+            return
+        line, ok = QInputDialog.getInt(self, "Ir para linha", f"Linha (1 - {self.line_count()}):",
+                                       self.current_line + 1, 1, max(1, self.line_count()))
+        if ok:
+            self.goto_line(line)
+
+    def prompt_find(self):
+        """Pergunta o texto a pesquisar (Ctrl+F)."""
+        text, ok = QInputDialog.getText(self, "Pesquisar", "Texto:", text=self.search_text)
+        if ok and text:
+            self.search_match = None
+            self.find(text)
+
+    def find(self, text):
+        """
+        Procura a próxima ocorrência de um texto (em uma thread de trabalho).
+
+        Args:
+            text: Texto procurado
+        """
+        if not text or not self.index.ready or self._searching:
+            return
+        self.search_text = text
+        if self.search_match is not None:
+            line, column, _ = self.search_match
+            column += 1
+        else:
+            line, column = self.current_line, 0
+        self._searching = True
+        threading.Thread(target=self._search, args=(text, line, column), daemon=True).start()
+
+    def _search(self, text, line, column):
+        """Executa a busca no arquivo mapeado (thread de trabalho)."""
+        try:
+            result = self.index.search(text, line, column)
+        except Exception:
+            result = None
+        try:
+            self._search_finished.emit(result)
+        except RuntimeError:
+            pass
+
+    def _on_search_finished(self, result):
+        """Mostra o resultado da busca."""
+        self._searching = False
+        self.search_match = result
+        if result is None:
+            QToolTip.showText(self.mapToGlobal(self.rect().center()),
+                              f"'{self.search_text}' não encontrado", self)
+            self.viewport().update()
+            return
+        self.goto_line(result[0] + 1)
+        # Garante que a coluna encontrada fique visível
+        x = result[1] * self._char_width()
+        horizontal = self.horizontalScrollBar()
+        if not horizontal.value() <= x < horizontal.value() + horizontal.pageStep():
+            horizontal.setValue(max(0, x - horizontal.pageStep() // 2))
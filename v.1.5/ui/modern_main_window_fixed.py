@@ -5,6 +5,7 @@ Este módulo implementa a janela principal com todas as correções e melhorias
 
 import os
 import sys
+import ast
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QAction, QFileDialog, QMessageBox,
     QTabWidget, QToolBar, QStatusBar, QVBoxLayout, QWidget, QSplitter,
@@ -25,6 +26,7 @@ try:
     from ui.binary_interpreter_v2 import BinaryInterpreterV2
     from ui.binary_code_executor import BinaryCodeExecutor
     from ui.code_editor import CodeEditor
+    from ui.dialect_detector import DialectRouter
 except ImportError:
     # Se falhar, tenta importar do diretório atual
     from three_panel_layout import ThreePanelLayout
@@ -36,6 +38,7 @@ except ImportError:
     from binary_interpreter_v2 import BinaryInterpreterV2
     from binary_code_executor import BinaryCodeExecutor
     from code_editor import CodeEditor
+    from dialect_detector import DialectRouter
 
 class ModernMainWindow(QMainWindow):
     """
@@ -57,6 +60,12 @@ class ModernMainWindow(QMainWindow):
         self.binary_interpreter = BinaryInterpreterV2()
         self.code_executor = BinaryCodeExecutor(self.binary_interpreter)
         
+        # Dialeto detectado por arquivo (em caso de empate vale o interpretador padrão)
+        self.dialect_router = DialectRouter(engines={"fixed": self.binary_interpreter}, preferred="fixed")
+        
+        # Erro da última execução no código binário: (código executado, (linha, coluna, mensagem))
+        self._last_runtime_error = None
+        
         # Configuração da interface
         self._setup_ui()
         
@@ -712,7 +721,7 @@ class ModernMainWindow(QMainWindow):
         
         # Converte para texto
         try:
-            text = self.binary_interpreter.traduzir_binario(binary)
+            text = self.dialect_router.translate(binary, current_editor.property("filepath"))
             
             # Cria um novo arquivo com o resultado
             self._new_file()
@@ -739,7 +748,14 @@ class ModernMainWindow(QMainWindow):
         
         # Executa o código usando o executor aprimorado
         try:
-            result = self.code_executor.execute_binary_code(code)
+            _, engine = self.dialect_router.engine_for(code, current_editor.property("filepath"))
+            result = self.code_executor.execute_binary_code(code, interpreter=engine)
+            
+            # O erro de execução, já na posição do binário, entra no painel de bugs
+            error = self.code_executor.last_error
+            self._last_runtime_error = (code, error) if error else None
+            if error and self.bugs_panel:
+                self.bugs_panel.set_bugs(self._analyze_code_for_bugs(code, current_editor.property("filepath")))
             
             # Exibe o resultado no terminal
             self._show_terminal(result)
@@ -794,7 +810,7 @@ class ModernMainWindow(QMainWindow):
             self.bugs_panel.fix_error.connect(self._fix_error)
         
         # Analisa o código em busca de bugs
-        bugs = self._analyze_code_for_bugs(code)
+        bugs = self._analyze_code_for_bugs(code, current_editor.property("filepath"))
         
         # Define os bugs no painel
         self.bugs_panel.set_bugs(bugs)
@@ -804,12 +820,13 @@ class ModernMainWindow(QMainWindow):
         self.bugs_panel.raise_()
         self.bugs_panel.activateWindow()
     
-    def _analyze_code_for_bugs(self, code):
+    def _analyze_code_for_bugs(self, code, filepath=None):
         """
-        Analisa o código em busca de bugs.
+        Analisa o código em busca de bugs, com as regras do dialeto detectado.
         
         Args:
             code: Código a ser analisado
+            filepath: Caminho do arquivo de origem, se houver
             
         Returns:
             Lista de bugs no formato [(tipo, linha, coluna, mensagem, descrição, sugestão)]
@@ -821,7 +838,9 @@ class ModernMainWindow(QMainWindow):
             return bugs
         
         # Valida o código binário
-        valid, error_msg = self.binary_interpreter.validar_codigo_binario(code)
+        dialect = self.dialect_router.dialect_for(code, filepath)
+        known_tokens = self.dialect_router.known_tokens(dialect)
+        valid, error_msg = self.dialect_router.validate(code, filepath)
         if not valid:
             bugs.append((
                 "Erro",
@@ -864,7 +883,7 @@ class ModernMainWindow(QMainWindow):
                     break
                 
                 if all(c in '01' for c in token) and len(token) == 8:
-                    if token not in self.binary_interpreter.binary_to_text:
+                    if token not in known_tokens:
                         bugs.append((
                             "Aviso",
                             i + 1,
@@ -874,6 +893,54 @@ class ModernMainWindow(QMainWindow):
                             f"Verifique se o token está correto ou adicione-o ao dicionário."
                         ))
         
+        # Erros do código traduzido, levados ao código binário pelo mapa de origem
+        bugs.extend(self._translation_bugs(code, filepath))
+        
+        return bugs
+    
+    def _translation_bugs(self, code, filepath=None):
+        """
+        Localiza no código binário o erro de sintaxe do código traduzido e o erro
+        da última execução.
+        
+        Args:
+            code: Código binário
+            filepath: Caminho do arquivo de origem, se houver
+            
+        Returns:
+            Lista de bugs no formato de _analyze_code_for_bugs
+        """
+        bugs = []
+        try:
+            python_code, source_map = self.dialect_router.translate_with_map(code, filepath)
+        except Exception:
+            return bugs
+        
+        if source_map is not None:
+            try:
+                ast.parse(python_code)
+            except SyntaxError as e:
+                mapped = source_map.map_syntax_error(e)
+                bugs.append((
+                    "Erro",
+                    mapped.lineno,
+                    mapped.offset,
+                    f"Erro de sintaxe no código traduzido: {e.msg}",
+                    f"{mapped.msg}\nPython: {source_map.python_line(e.lineno).strip()}",
+                    "Corrija os tokens binários a partir desta posição."
+                ))
+        
+        if self._last_runtime_error is not None and self._last_runtime_error[0] == code:
+            line, column, message = self._last_runtime_error[1]
+            bugs.append((
+                "Erro",
+                line,
+                column,
+                f"Erro de execução: {message.split(':')[0]}",
+                message,
+                "Verifique os tokens binários da linha indicada."
+            ))
+        
         return bugs
     
     def _navigate_to_error(self, line, column):
@@ -897,11 +964,13 @@ class ModernMainWindow(QMainWindow):
         line_index = line - 1
         column_index = column - 1
         
-        # Cria um cursor na posição do erro
+        # Cria um cursor na posição do erro (pelo bloco do documento: linhas binárias longas
+        # ocupam várias linhas visuais e Down andaria por elas)
+        block = current_editor.document().findBlockByNumber(max(0, line_index))
+        if not block.isValid():
+            block = current_editor.document().lastBlock()
         cursor = current_editor.textCursor()
-        cursor.movePosition(cursor.Start)
-        cursor.movePosition(cursor.Down, cursor.MoveAnchor, line_index)
-        cursor.movePosition(cursor.Right, cursor.MoveAnchor, column_index)
+        cursor.setPosition(block.position() + min(max(0, column_index), block.length() - 1))
         
         # Define o cursor no editor
         current_editor.setTextCursor(cursor)
@@ -0,0 +1,140 @@
+"""
+Módulo do buffer circular da saída do terminal.
+A saída do processo chega em blocos de bytes, muitas vezes mais rápido do que o
+widget consegue exibir. O buffer decodifica cada fluxo de forma incremental
+(caracteres de vários bytes divididos entre blocos não viram lixo) e guarda só
+o texto ainda não exibido, em pedaços com a contagem de linhas de cada um; o que
+passa do limite de linhas ou de caracteres é descartado pelo início, sem
+percorrer o texto linha a linha. A interface retira o acumulado uma vez por
+quadro: em geral um trecho a acrescentar, ou, se o quadro recebeu mais que o
+limite, o texto que deve substituir todo o conteúdo. Não depende do Qt.
+"""
+
+import codecs
+import threading
+from collections import deque
+from typing import Tuple
+
+# Linhas mantidas na tela do terminal
+DEFAULT_MAX_LINES = 10000
+
+# Caracteres acumulados entre dois quadros (limita linhas muito longas)
+DEFAULT_MAX_CHARS = 4 * 1024 * 1024
+
+# Intervalo mínimo entre duas atualizações do widget (ms, cerca de 60 quadros por segundo)
+FRAME_INTERVAL = 16
+
+
+class OutputRingBuffer:
+    """
+    Saída pendente do terminal, limitada em linhas e caracteres.
+    Pode ser alimentado por outra thread; take é chamado pela thread da interface.
+    """
+
+    def __init__(self, max_lines: int = DEFAULT_MAX_LINES, max_chars: int = DEFAULT_MAX_CHARS,
+                 encoding: str = "utf-8"):
+        """
+        Args:
+            max_lines: Linhas mantidas (as mais recentes)
+            max_chars: Caracteres mantidos entre duas retiradas
+            encoding: Codificação da saída do processo
+        """
+        self.max_lines = max(1, max_lines)
+        self.max_chars = max(1, max_chars)
+        self.encoding = encoding
+        self.total_bytes = 0
+        self.dropped_chars = 0
+
+        self._decoders = {}
+        self._chunks = deque()
+        self._lines = 0
+        self._chars = 0
+        self._overflow = False
+        self._lock = threading.Lock()
+
+    def feed(self, data: bytes, source: str = "stdout"):
+        """
+        Acrescenta um bloco de bytes de um fluxo.
+
+        Args:
+            data: Bytes lidos do processo
+            source: Nome do fluxo (cada fluxo tem o seu decodificador)
+        """
+        decoder = self._decoders.get(source)
+        if decoder is None:
+            decoder = self._decoders[source] = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        self.total_bytes += len(data)
+        self.feed_text(decoder.decode(data))
+
+    def feed_text(self, text: str):
+        """
+        Acrescenta texto já decodificado.
+
+        Args:
+            text: Texto da saída
+        """
+        if not text:
+            return
+        lines = text.count("\n")
+        with self._lock:
+            chunks = self._chunks
+            chunks.append((text, lines))
+            self._lines += lines
+            self._chars += len(text)
+            # Descarta pedaços inteiros do início enquanto o restante ainda enche o limite
+            while len(chunks) > 1 and (self._lines - chunks[0][1] >= self.max_lines
+                                       or self._chars - len(chunks[0][0]) >= self.max_chars):
+                old_text, old_lines = chunks.popleft()
+                self._lines -= old_lines
+                self._chars -= len(old_text)
+                self.dropped_chars += len(old_text)
+                self._overflow = True
+            if self._lines >= self.max_lines or self._chars > self.max_chars:
+                self._overflow = True
+
+    def take(self) -> Tuple[bool, str]:
+        """
+        Retira o texto acumulado desde a última chamada.
+
+        Returns:
+            Tupla (substituir, texto): se substituir for True, o texto acumulado
+            ultrapassou o limite e deve substituir todo o conteúdo exibido (são as
+            últimas max_lines linhas); senão, deve ser acrescentado ao final
+        """
+        with self._lock:
+            if not self._chunks:
+                return False, ""
+            text = "".join(chunk for chunk, _lines in self._chunks)
+            replace = self._overflow
+            self._chunks.clear()
+            self._lines = 0
+            self._chars = 0
+            self._overflow = False
+
+        if replace:
+            text = self._tail(text)
+        return replace, text
+
+    def pending(self) -> bool:
+        """True se há texto ainda não retirado."""
+        return bool(self._chunks)
+
+    def clear(self):
+        """Descarta o texto pendente e o estado dos decodificadores."""
+        with self._lock:
+            self._chunks.clear()
+            self._lines = 0
+            self._chars = 0
+            self._overflow = False
+            self._decoders.clear()
+
+    def _tail(self, text: str) -> str:
+        """Últimas max_lines linhas (e no máximo max_chars caracteres) do texto."""
+        if len(text) > self.max_chars:
+            text = text[-self.max_chars:]
+        position = len(text)
+        for _ in range(self.max_lines):
+            position = text.rfind("\n", 0, position)
+            if position < 0:
+                return text
+        return text[position + 1:]
@@ -0,0 +1,359 @@
+"""
+Módulo do formato compactado de programas binários (.binp).
+No texto, cada token de 8 bits ocupa 9 bytes ("01100001 "); no formato
+compactado ele ocupa 1 byte. As quebras de linha e tudo o que não for uma
+sequência de tokens separados por um espaço (comentários //, espaços extras,
+palavras inválidas) ficam em um anexo pequeno, de modo que a conversão de e para
+o texto é exata. O arquivo é lido por mmap: os tokens ficam disponíveis como uma
+memoryview, sem análise de caracteres.
+
+Estrutura (little-endian):
+    cabeçalho: "TCBP", versão (1 byte), 3 bytes reservados,
+               quantidade de tokens (8 bytes), quantidade de linhas (8 bytes)
+    tokens:    1 byte por token, na ordem do texto
+    anexo:     por linha: varint(tokens da linha), varint(tamanho do resto),
+               resto da linha em UTF-8 (texto após os tokens)
+
+Uso:
+    python -m ui.packed_binary pack ENTRADA.bin SAIDA.binp
+    python -m ui.packed_binary unpack ENTRADA.binp SAIDA.bin
+"""
+
+import io
+import os
+import re
+import sys
+import mmap
+import struct
+import argparse
+from typing import Iterable, Iterator
+
+MAGIC = b"TCBP"
+VERSION = 1
+PACKED_EXTENSION = ".binp"
+
+_HEADER = struct.Struct("<4sBxxxQQ")
+
+# Tokens de 8 bits separados por um único espaço, no início da linha
+_CANONICAL_PREFIX = re.compile(r'(?:[01]{8}(?: [01]{8})*)?')
+
+# Conversões entre a palavra de 8 bits e o byte
+_WORDS = [format(value, "08b") for value in range(256)]
+_BYTES = {word: value for value, word in enumerate(_WORDS)}
+
+# Tokens decodificados de uma vez na reconstrução do texto
+_WINDOW_TOKENS = 1 << 16
+
+
+class PackedFormatError(ValueError):
+    """Arquivo que não está no formato compactado ou está corrompido."""
+
+
+def _write_varint(buffer: bytearray, value: int):
+    """Acrescenta um inteiro sem sinal em formato varint."""
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data, position: int):
+    """
+    Lê um varint.
+
+    Returns:
+        Tupla (valor, posição seguinte)
+    """
+    value = 0
+    shift = 0
+    while True:
+        try:
+            byte = data[position]
+        except IndexError:
+            raise PackedFormatError("Anexo de linhas truncado")
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def iter_text_lines(fileobj) -> Iterator[str]:
+    """
+    Lê as linhas de um arquivo de texto como text.split("\\n"), sem carregá-lo inteiro.
+
+    Args:
+        fileobj: Arquivo de texto aberto com newline=""
+
+    Yields:
+        Linhas sem o "\\n" final (a última pode ser vazia)
+    """
+    last = ""
+    for line in fileobj:
+        if line.endswith("\n"):
+            yield line[:-1]
+            last = ""
+        else:
+            last = line
+    yield last
+
+
+def write_packed(target, lines: Iterable[str]):
+    """
+    Grava linhas de código binário no formato compactado.
+
+    Args:
+        target: Caminho do arquivo ou arquivo binário com seek
+        lines: Linhas do texto (como em text.split("\\n"))
+
+    Returns:
+        Quantidade de bytes gravados
+    """
+    if isinstance(target, (str, bytes, os.PathLike)):
+        temp_path = f"{os.fspath(target)}.tmp"
+        try:
+            with open(temp_path, "wb") as stream:
+                size = write_packed(stream, lines)
+            os.replace(temp_path, target)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return size
+
+    stream = target
+    start = stream.tell()
+    stream.write(_HEADER.pack(MAGIC, VERSION, 0, 0))
+
+    # Os tokens vão direto para o arquivo; o anexo fica em memória (poucos bytes por linha)
+    sidecar = bytearray()
+    token_count = 0
+    line_count = 0
+    byte_of = _BYTES.__getitem__
+    for line in lines:
+        prefix = _CANONICAL_PREFIX.match(line).group()
+        if prefix:
+            tokens = bytes(map(byte_of, prefix.split(" ")))
+            stream.write(tokens)
+            token_count += len(tokens)
+        else:
+            tokens = b""
+        rest = line[len(prefix):].encode("utf-8", "surrogatepass")
+        _write_varint(sidecar, len(tokens))
+        _write_varint(sidecar, len(rest))
+        sidecar += rest
+        line_count += 1
+
+    stream.write(sidecar)
+    end = stream.tell()
+    stream.seek(start)
+    stream.write(_HEADER.pack(MAGIC, VERSION, token_count, line_count))
+    stream.seek(end)
+    return end - start
+
+
+def pack_text(text: str) -> bytes:
+    """
+    Converte código binário em texto para o formato compactado.
+
+    Args:
+        text: Código binário
+
+    Returns:
+        Bytes do arquivo compactado
+    """
+    buffer = io.BytesIO()
+    write_packed(buffer, text.split("\n"))
+    return buffer.getvalue()
+
+
+def unpack_bytes(data) -> str:
+    """
+    Converte bytes no formato compactado de volta para o texto original.
+
+    Args:
+        data: Bytes (ou memoryview) do arquivo compactado
+
+    Returns:
+        Código binário em texto, idêntico ao que foi compactado
+    """
+    return "\n".join(_iter_lines(memoryview(data)))
+
+
+def is_packed_file(path) -> bool:
+    """Indica se o arquivo começa com a assinatura do formato compactado."""
+    try:
+        with open(path, "rb") as stream:
+            return stream.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def read_binary_source(path) -> str:
+    """
+    Lê um programa binário, compactado ou em texto.
+
+    Args:
+        path: Caminho do arquivo
+
+    Returns:
+        Código binário em texto
+    """
+    if is_packed_file(path):
+        with PackedBinaryFile(path) as packed:
+            return packed.text()
+    with open(path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
+def _parse_header(data):
+    """
+    Valida o cabeçalho.
+
+    Returns:
+        Tupla (quantidade de tokens, quantidade de linhas)
+    """
+    if len(data) < _HEADER.size:
+        raise PackedFormatError("Arquivo compactado truncado")
+    magic, version, token_count, line_count = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise PackedFormatError("Assinatura inválida: não é um arquivo .binp")
+    if version != VERSION:
+        raise PackedFormatError(f"Versão {version} do formato compactado não suportada")
+    if _HEADER.size + token_count > len(data):
+        raise PackedFormatError("Arquivo compactado truncado")
+    return token_count, line_count
+
+
+def _iter_lines(data) -> Iterator[str]:
+    """Reconstrói as linhas de texto a partir do cabeçalho, dos tokens e do anexo."""
+    token_count, line_count = _parse_header(data)
+    tokens = data[_HEADER.size:_HEADER.size + token_count]
+    sidecar = data[_HEADER.size + token_count:]
+    words = _WORDS.__getitem__
+    offset = 0
+    position = 0
+    # Os tokens são decodificados em janelas: cada token ocupa 9 caracteres ("01100001 ")
+    # e a linha é uma fatia da janela
+    window = ""
+    window_start = window_end = 0
+    for _ in range(line_count):
+        count, position = _read_varint(sidecar, position)
+        size, position = _read_varint(sidecar, position)
+        if count:
+            if offset + count > window_end:
+                window_start = offset
+                window_end = min(token_count, offset + max(count, _WINDOW_TOKENS))
+                window = " ".join(map(words, tokens[window_start:window_end]))
+            begin = (offset - window_start) * 9
+            line = window[begin:begin + count * 9 - 1]
+            offset += count
+        else:
+            line = ""
+        if size:
+            if position + size > len(sidecar):
+                raise PackedFormatError("Anexo de linhas truncado")
+            line += bytes(sidecar[position:position + size]).decode("utf-8", "surrogatepass")
+            position += size
+        yield line
+    if offset != token_count:
+        raise PackedFormatError("Quantidade de tokens não confere com o anexo de linhas")
+
+
+class PackedBinaryFile:
+    """
+    Arquivo compactado aberto por mmap.
+    """
+
+    def __init__(self, path):
+        """
+        Abre e valida o arquivo.
+
+        Args:
+            path: Caminho do arquivo .binp
+
+        Raises:
+            PackedFormatError: Se o arquivo não estiver no formato compactado
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Arquivo vazio não pode ser mapeado
+            self._file.close()
+            raise PackedFormatError("Arquivo compactado vazio")
+        self._view = memoryview(self._map)
+        try:
+            self.token_count, self.line_count = _parse_header(self._view)
+        except PackedFormatError:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def tokens(self) -> memoryview:
+        """
+        Retorna os tokens do programa, 1 byte por token, sem cópia.
+
+        Returns:
+            memoryview sobre o mapeamento (válida até close())
+        """
+        return self._view[_HEADER.size:_HEADER.size + self.token_count]
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Reconstrói as linhas do texto original uma a uma.
+
+        Yields:
+            Linhas do código binário
+        """
+        return _iter_lines(self._view)
+
+    def text(self) -> str:
+        """Retorna o texto original completo."""
+        return "\n".join(self.iter_lines())
+
+    def close(self):
+        """Libera o mapeamento e o arquivo."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            try:
+                self._map.close()
+            except BufferError:
+                # Ainda há memoryviews de tokens() em uso; o mapeamento é liberado junto com elas
+                pass
+            self._file.close()
+
+
+def main(argv=None):
+    """Ponto de entrada da linha de comando."""
+    parser = argparse.ArgumentParser(description="Converte programas binários de e para o formato compactado (.binp)")
+    parser.add_argument("command", choices=("pack", "unpack"), help="pack: texto -> .binp; unpack: .binp -> texto")
+    parser.add_argument("input", help="Arquivo de entrada")
+    parser.add_argument("output", help="Arquivo de saída")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "pack":
+            with open(args.input, "r", encoding="utf-8", newline="") as source:
+                write_packed(args.output, iter_text_lines(source))
+        else:
+            with PackedBinaryFile(args.input) as packed, \
+                    open(args.output, "w", encoding="utf-8", newline="") as target:
+                separator = ""
+                for line in packed.iter_lines():
+                    target.write(separator + line)
+                    separator = "\n"
+    except (OSError, PackedFormatError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
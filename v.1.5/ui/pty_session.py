@@ -0,0 +1,259 @@
+"""
+Módulo de sessões de terminal sobre um pseudoterminal (Linux).
+O processo filho recebe o lado escravo de um pty como entrada, saída e erro e
+como terminal de controle: os programas se veem em um terminal e entregam a
+saída linha a linha, a disciplina de linha do kernel cuida do eco, da edição da
+linha e dos sinais (Ctrl+C vira SIGINT para o grupo em primeiro plano) e o
+tamanho da janela chega aos programas por TIOCSWINSZ/SIGWINCH. Uma thread lê o
+lado mestre em blocos grandes e entrega os bytes a um callback; se o consumidor
+não confirmar o que recebeu (acknowledge), a leitura para ao atingir o limite de
+bytes pendentes, o buffer do pty enche e o filho fica bloqueado na escrita, em
+vez de a saída se acumular na memória. Não depende do Qt.
+"""
+
+import os
+import sys
+import errno
+import signal
+import struct
+import threading
+import subprocess
+from typing import Callable, Dict, List, Optional
+
+try:
+    import fcntl
+    import pty
+    import termios
+except ImportError:
+    fcntl = pty = termios = None
+
+# Sessões com pty só são usadas no Linux
+PTY_AVAILABLE = sys.platform.startswith("linux") and pty is not None
+
+# Tamanho de cada leitura do lado mestre
+READ_SIZE = 64 * 1024
+
+# Bytes entregues e ainda não confirmados pelo consumidor antes de a leitura parar
+DEFAULT_HIGH_WATER = 1024 * 1024
+
+# Tamanho inicial da janela (linhas, colunas)
+DEFAULT_ROWS = 24
+DEFAULT_COLUMNS = 80
+
+# Caracteres de controle enviados pela disciplina de linha como sinais
+INTERRUPT = b"\x03"
+END_OF_FILE = b"\x04"
+
+
+def _make_controlling_tty():
+    """Torna a entrada padrão (o lado escravo) o terminal de controle do filho, já líder de sessão."""
+    fcntl.ioctl(0, termios.TIOCSCTTY, 0)
+
+
+class PtySession:
+    """
+    Processo filho ligado a um pseudoterminal, com leitura em segundo plano.
+    Os callbacks são chamados pela thread de leitura.
+    """
+
+    def __init__(self, argv: List[str], env: Optional[Dict[str, str]] = None, cwd: Optional[str] = None,
+                 rows: int = DEFAULT_ROWS, columns: int = DEFAULT_COLUMNS,
+                 on_output: Optional[Callable[[bytes], None]] = None,
+                 on_exit: Optional[Callable[[int], None]] = None,
+                 high_water: int = DEFAULT_HIGH_WATER):
+        """
+        Args:
+            argv: Programa e argumentos
+            env: Ambiente do processo (padrão: o atual)
+            cwd: Diretório de trabalho
+            rows: Linhas da janela
+            columns: Colunas da janela
+            on_output: Recebe cada bloco lido do terminal
+            on_exit: Recebe o código de saída (negativo se o processo terminou por um sinal)
+            high_water: Bytes entregues e não confirmados antes de a leitura parar
+                (0 desativa o controle de fluxo)
+        """
+        if not PTY_AVAILABLE:
+            raise OSError("Pseudoterminais não são suportados nesta plataforma")
+        self.argv = list(argv)
+        self.env = env
+        self.cwd = cwd
+        self.rows = rows
+        self.columns = columns
+        self.on_output = on_output
+        self.on_exit = on_exit
+        self.high_water = high_water
+        self.process = None
+        self.returncode = None
+
+        self._master = -1
+        self._unacknowledged = 0
+        self._flow = threading.Condition()
+        self._closed = False
+        self._reader = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process else None
+
+    def start(self):
+        """
+        Abre o pty e inicia o processo e a thread de leitura.
+
+        Raises:
+            OSError: Se o pty não puder ser aberto ou o programa não puder ser iniciado
+        """
+        master, slave = pty.openpty()
+        try:
+            self._configure(slave)
+            self._set_window_size(master, self.rows, self.columns)
+            # setsid (start_new_session) acontece antes de preexec_fn, que então adota o pty
+            self.process = subprocess.Popen(
+                self.argv, stdin=slave, stdout=slave, stderr=slave, env=self.env, cwd=self.cwd,
+                start_new_session=True, preexec_fn=_make_controlling_tty, close_fds=True
+            )
+        except BaseException:
+            os.close(master)
+            raise
+        finally:
+            # Com o escravo fechado aqui, a leitura do mestre termina (EIO) quando o filho sai
+            os.close(slave)
+
+        self._master = master
+        self._reader = threading.Thread(target=self._read_loop, name="pty-reader", daemon=True)
+        self._reader.start()
+
+    @staticmethod
+    def _configure(slave: int):
+        """Disciplina de linha do lado escravo: modo canônico com eco, sinais, XON/XOFF e UTF-8."""
+        attributes = termios.tcgetattr(slave)
+        iflag, oflag, cflag, lflag = attributes[:4]
+        iflag |= termios.ICRNL | termios.IXON
+        iflag |= getattr(termios, "IUTF8", 0)
+        # Quebras de linha como \n: a tela não interpreta \r
+        oflag &= ~termios.ONLCR
+        lflag |= termios.ICANON | termios.ECHO | termios.ECHOE | termios.ECHOK | termios.ISIG | termios.IEXTEN
+        attributes[:4] = [iflag, oflag, cflag, lflag]
+        termios.tcsetattr(slave, termios.TCSANOW, attributes)
+
+    @staticmethod
+    def _set_window_size(fd: int, rows: int, columns: int):
+        fcntl.ioctl(fd, termios.TIOCSWINSZ, struct.pack("HHHH", rows, columns, 0, 0))
+
+    def is_running(self) -> bool:
+        """Indica se o processo ainda está ativo."""
+        return self.process is not None and self.returncode is None and self.process.poll() is None
+
+    def write(self, data: bytes) -> int:
+        """
+        Envia bytes ao terminal, como se fossem digitados.
+
+        Args:
+            data: Bytes a enviar
+
+        Returns:
+            Quantidade de bytes escritos, ou -1 se a sessão está encerrada
+        """
+        if self._master < 0:
+            return -1
+        view = memoryview(data)
+        written = 0
+        try:
+            while written < len(view):
+                written += os.write(self._master, view[written:])
+        except OSError:
+            return written or -1
+        return written
+
+    def interrupt(self):
+        """Envia Ctrl+C (SIGINT para o programa em primeiro plano)."""
+        self.write(INTERRUPT)
+
+    def resize(self, rows: int, columns: int):
+        """
+        Altera o tamanho da janela; o kernel avisa o grupo em primeiro plano com SIGWINCH.
+
+        Args:
+            rows: Linhas
+            columns: Colunas
+        """
+        rows, columns = max(1, rows), max(1, columns)
+        if (rows, columns) == (self.rows, self.columns):
+            return
+        self.rows, self.columns = rows, columns
+        if self._master >= 0:
+            try:
+                self._set_window_size(self._master, rows, columns)
+            except OSError:
+                pass
+
+    def acknowledge(self, nbytes: int):
+        """
+        Confirma que o consumidor tratou bytes entregues, liberando a leitura.
+
+        Args:
+            nbytes: Bytes tratados
+        """
+        with self._flow:
+            self._unacknowledged = max(0, self._unacknowledged - nbytes)
+            self._flow.notify()
+
+    def _read_loop(self):
+        """Lê o lado mestre até o processo sair (thread de leitura)."""
+        master = self._master
+        while True:
+            with self._flow:
+                while self.high_water and self._unacknowledged >= self.high_water and not self._closed:
+                    self._flow.wait()
+                if self._closed:
+                    break
+            try:
+                data = os.read(master, READ_SIZE)
+            except OSError as e:
+                # EIO: todos os descritores do lado escravo foram fechados
+                if e.errno == errno.EINTR:
+                    continue
+                break
+            if not data:
+                break
+            with self._flow:
+                self._unacknowledged += len(data)
+            if self.on_output is not None:
+                self.on_output(data)
+
+        self.returncode = self.process.wait()
+        self._close_master()
+        if self.on_exit is not None and not self._closed:
+            self.on_exit(self.returncode)
+
+    def _close_master(self):
+        with self._flow:
+            master, self._master = self._master, -1
+        if master >= 0:
+            os.close(master)
+
+    def terminate(self, timeout: float = 1.0):
+        """
+        Encerra a sessão: SIGHUP para o grupo do processo e, se não bastar, SIGKILL.
+        O callback on_exit não é chamado.
+
+        Args:
+            timeout: Espera em segundos antes do SIGKILL
+        """
+        with self._flow:
+            self._closed = True
+            self._flow.notify()
+        if self.process is not None and self.process.poll() is None:
+            for sig in (signal.SIGHUP, signal.SIGKILL):
+                try:
+                    os.killpg(self.process.pid, sig)
+                except OSError:
+                    break
+                try:
+                    self.process.wait(timeout)
+                    break
+                except subprocess.TimeoutExpired:
+                    continue
+        if self._reader is not None and self._reader is not threading.current_thread():
+            self._reader.join(timeout)
+        self._close_master()
@@ -0,0 +1,139 @@
+"""
+Módulo do painel de pré-visualização Python ao lado do editor.
+O painel acompanha o CodeEditor: a cada contentsChange, apenas os blocos
+(QTextBlocks) tocados são retraduzidos pelo IncrementalTranslation e somente as
+linhas visíveis são desenhadas, alinhadas às linhas do editor.
+"""
+
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QPainter, QColor
+from PyQt5.QtCore import Qt, QRect
+
+try:
+    from ui.incremental_translation import IncrementalTranslation
+except ImportError:
+    from incremental_translation import IncrementalTranslation
+
+
+class PythonPreviewPane(QWidget):
+    """
+    Painel somente leitura com a tradução Python do editor associado.
+    """
+
+    def __init__(self, parser=None, parent=None):
+        """
+        Inicializa o painel.
+
+        Args:
+            parser: BinarySyntaxParser usado na tradução (opcional)
+            parent: Widget pai
+        """
+        super().__init__(parent)
+        self.translation = IncrementalTranslation(parser)
+        self.editor = None
+        self.background_color = QColor("#1e2029")
+        self.text_color = QColor("#8be9fd")
+        self.setMinimumWidth(200)
+
+    def set_editor(self, editor):
+        """
+        Associa o painel a um editor (ou desassocia, com None).
+
+        Args:
+            editor: CodeEditor a acompanhar
+        """
+        if self.editor is not None:
+            try:
+                self.editor.document().contentsChange.disconnect(self._on_contents_change)
+                self.editor.updateRequest.disconnect(self._on_editor_update)
+            except (TypeError, RuntimeError):
+                pass
+
+        self.editor = editor
+        if editor is not None:
+            self.translation.set_text(editor.toPlainText())
+            editor.document().contentsChange.connect(self._on_contents_change)
+            editor.updateRequest.connect(self._on_editor_update)
+        else:
+            self.translation.set_text("")
+        self.update()
+
+    def python_code(self):
+        """Retorna a tradução completa atual."""
+        return self.translation.text()
+
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """
+        Retraduz apenas os blocos afetados por uma alteração do documento.
+
+        Args:
+            position: Posição da alteração
+            chars_removed: Caracteres removidos
+            chars_added: Caracteres inseridos
+        """
+        if not self.isVisible() or self.editor is None:
+            return
+
+        document = self.editor.document()
+        block_count = document.blockCount()
+        first = document.findBlock(position).blockNumber()
+        last_block = document.findBlock(position + chars_added)
+        last = last_block.blockNumber() if last_block.isValid() else block_count - 1
+
+        removed = (last - first + 1) - (block_count - len(self.translation))
+        if first < 0 or removed < 0 or first + removed > len(self.translation):
+            # Alteração que não corresponde ao estado conhecido: refaz tudo
+            self.translation.set_text(self.editor.toPlainText())
+        else:
+            new_lines = []
+            block = document.findBlockByNumber(first)
+            while block.isValid() and block.blockNumber() <= last:
+                new_lines.append(block.text())
+                block = block.next()
+            self.translation.replace_lines(first, removed, new_lines)
+
+        self.update()
+
+    def _on_editor_update(self, rect, dy):
+        """Redesenha o painel quando o editor rola ou é redesenhado."""
+        if dy or rect.contains(self.editor.viewport().rect()):
+            self.update()
+
+    def showEvent(self, event):
+        """Sincroniza a tradução ao voltar a ser exibido (alterações feitas com o painel oculto)."""
+        if self.editor is not None:
+            self.translation.set_text(self.editor.toPlainText())
+        super().showEvent(event)
+
+    def paintEvent(self, event):
+        """Desenha somente as linhas Python correspondentes aos blocos visíveis do editor."""
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self.background_color)
+        if self.editor is None:
+            return
+
+        editor = self.editor
+        painter.setFont(editor.font())
+        painter.setPen(self.text_color)
+
+        margin = 6
+        offset = editor.viewport().y()
+        line_height = editor.fontMetrics().height()
+        block = editor.firstVisibleBlock()
+        top = editor.blockBoundingGeometry(block).translated(editor.contentOffset()).top() + offset
+        bottom = self.height()
+
+        while block.isValid() and top <= bottom:
+            height = editor.blockBoundingRect(block).height()
+            number = block.blockNumber()
+            if block.isVisible() and top + height >= event.rect().top() and number < len(self.translation):
+                first, *rest = self.translation.python_line(number).split("\n")
+                # BINSTART seguido de código na mesma linha: o início do bloco fica na mesma linha
+                text = " ".join([first] + [part.strip() for part in rest])
+                painter.drawText(
+                    QRect(margin, int(top), self.width() - margin, int(line_height)),
+                    Qt.AlignLeft | Qt.AlignVCenter,
+                    text
+                )
+            top += height
+            block = block.next()
@@ -0,0 +1,184 @@
+"""
+Módulo de codificação de código Python para binário guiada pelo tokenize.
+O módulo padrão tokenize lê o código linha a linha e fornece os tokens já
+classificados: os blocos viram BINSTART (no lugar do ":" que abre o bloco) e
+BINEND (um por DEDENT, no início da linha que fecha o bloco), nomes e
+operadores são procurados primeiro na tabela de palavras-chave de várias
+letras e só depois codificados caractere a caractere, e comentários viram
+BINCOMMENT. Cada linha do código gera exatamente uma linha binária, e só as
+linhas ainda não tokenizadas ficam em memória.
+"""
+
+import tokenize
+from collections import deque
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List
+
+# Tokens ignorados na saída (a estrutura de linhas é preservada à parte)
+_SKIPPED_TOKENS = {tokenize.NEWLINE, tokenize.NL, tokenize.ENCODING, tokenize.ENDMARKER}
+
+# Tokens que não encerram a espera por um INDENT após um cabeçalho de bloco
+_LAYOUT_TOKENS = {tokenize.NEWLINE, tokenize.NL, tokenize.COMMENT, tokenize.INDENT}
+
+# Quantidade máxima de tokens codificados guardados em cache
+MAX_CACHED_TOKENS = 1 << 16
+
+
+class PythonTokenEncoder:
+    """
+    Codificador de código Python para binário baseado no tokenize.
+    """
+
+    def __init__(self, text_to_binary: Dict[str, str]):
+        """
+        Inicializa o codificador.
+
+        Args:
+            text_to_binary: Dicionário texto -> binário do BinarySyntaxParser
+        """
+        self.text_to_binary = text_to_binary
+        self.block_start = text_to_binary["BINSTART"]
+        self.block_end = text_to_binary["BINEND"]
+        self.comment = text_to_binary["BINCOMMENT"]
+        # Os comandos especiais (BINSTART, BINEND, ...) não correspondem a nomes do código
+        self._words = {text: binary for text, binary in text_to_binary.items()
+                       if not (text.startswith("BIN") and text.isupper())}
+        self._cache: Dict[str, List[str]] = {}
+
+    def encode(self, python_code: str) -> str:
+        """
+        Converte código Python para binário.
+
+        Args:
+            python_code: Código Python
+
+        Returns:
+            Código binário, uma linha por linha do código
+        """
+        return "\n".join(self.iter_lines(python_code.splitlines()))
+
+    def iter_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Converte linhas de código Python para binário em fluxo.
+
+        Args:
+            lines: Linhas do código (sem o terminador), lidas sob demanda
+
+        Yields:
+            Linhas binárias, exatamente uma por linha de entrada
+        """
+        source = iter(lines)
+        # Linhas já lidas pelo tokenize cuja saída ainda não foi produzida
+        unread = deque()
+
+        def readline():
+            line = next(source, None)
+            if line is None:
+                return ""
+            unread.append(line)
+            return line + "\n"
+
+        codes: List[str] = []
+        row = 1
+        depth = 0
+        colon = None
+        awaiting_indent = False
+        try:
+            for token in tokenize.generate_tokens(readline):
+                kind, text, (start_row, _), _, line = token
+
+                if kind == tokenize.ENDMARKER:
+                    if awaiting_indent:
+                        codes.append(self.block_end)
+                        depth -= 1
+                    break
+
+                if kind == tokenize.DEDENT and not line:
+                    # DEDENT do fim do arquivo: fecha o bloco na última linha
+                    codes.append(self.block_end)
+                    depth -= 1
+                    continue
+
+                while start_row > row:
+                    yield " ".join(codes)
+                    unread.popleft()
+                    codes = []
+                    row += 1
+
+                if awaiting_indent and kind not in _LAYOUT_TOKENS:
+                    # Cabeçalho sem bloco indentado (código inválido): mantém BINSTART/BINEND balanceados
+                    codes.append(self.block_end)
+                    depth -= 1
+                    awaiting_indent = False
+
+                if kind in _SKIPPED_TOKENS:
+                    if kind == tokenize.NEWLINE and colon is not None:
+                        # O ":" no fim da linha lógica abre um bloco
+                        codes[colon] = self.block_start
+                        depth += 1
+                        awaiting_indent = True
+                    colon = None
+                elif kind == tokenize.INDENT:
+                    if awaiting_indent:
+                        awaiting_indent = False
+                    else:
+                        codes.append(self.block_start)
+                        depth += 1
+                elif kind == tokenize.DEDENT:
+                    codes.append(self.block_end)
+                    depth -= 1
+                elif kind == tokenize.COMMENT:
+                    codes.append(self.comment)
+                    body = text[1:].rstrip()
+                    codes.extend(self._encode_chars(body[1:] if body.startswith(" ") else body))
+                else:
+                    colon = len(codes) if kind == tokenize.OP and text == ":" else None
+                    codes.extend(self._encode_token(text))
+
+        except (tokenize.TokenError, SyntaxError):
+            # Código que o tokenize não aceita: o restante segue caractere a caractere
+            depth -= codes.count(self.block_start) - codes.count(self.block_end)
+            last = None
+            for line in chain(unread, source):
+                if last is not None:
+                    yield last
+                last = " ".join(self._encode_chars(line.strip()))
+            # Os blocos ainda abertos são fechados na última linha
+            closing = [self.block_end] * max(0, depth)
+            yield " ".join(([last] if last else []) + closing)
+            return
+
+        if unread:
+            yield " ".join(codes)
+
+    def _encode_token(self, text: str) -> List[str]:
+        """
+        Codifica um token: pela tabela de palavras-chave ou caractere a caractere.
+
+        Args:
+            text: Texto do token
+
+        Returns:
+            Lista de tokens binários
+        """
+        codes = self._cache.get(text)
+        if codes is None:
+            binary = self._words.get(text)
+            codes = [binary] if binary is not None else self._encode_chars(text)
+            if len(self._cache) >= MAX_CACHED_TOKENS:
+                self._cache.clear()
+            self._cache[text] = codes
+        return codes
+
+    def _encode_chars(self, text: str) -> List[str]:
+        """
+        Codifica um texto caractere a caractere.
+
+        Args:
+            text: Texto
+
+        Returns:
+            Lista de tokens binários
+        """
+        table = self.text_to_binary
+        return [table.get(char) or format(ord(char), '08b') for char in text]
@@ -0,0 +1,428 @@
+"""
+Módulo de execução isolada de programas com limites de recursos.
+Cada programa roda em um processo próprio (interpreter_worker.py --sandbox), que
+reduz os próprios rlimits antes de executá-lo: tempo de CPU, espaço de
+endereçamento, tamanho de arquivo e quantidade de processos. A saída é lida aos
+poucos, enquanto o programa roda, para um buffer limitado em bytes: ao atingir o
+limite, o processo é encerrado e a saída recebe um aviso de truncamento. O
+resultado informa o motivo da parada. Um processo de reserva fica pré-iniciado
+para a próxima execução.
+"""
+
+import os
+import sys
+import time
+import atexit
+import codecs
+import signal
+import threading
+import subprocess
+from typing import Callable, Optional
+
+try:
+    from ui.interpreter_pool import DEFAULT_OUTPUT_BYTES, TRUNCATION_MARKER, ExecutionResult, WORKER_SCRIPT
+    from ui.interpreter_worker import read_frame, write_frame
+except ImportError:
+    from interpreter_pool import DEFAULT_OUTPUT_BYTES, TRUNCATION_MARKER, ExecutionResult, WORKER_SCRIPT
+    from interpreter_worker import read_frame, write_frame
+
+# Limites padrão de cada execução
+DEFAULT_CPU_SECONDS = 10
+DEFAULT_MEMORY_BYTES = 512 * 1024 * 1024
+DEFAULT_FILE_SIZE_BYTES = 16 * 1024 * 1024
+# RLIMIT_NPROC conta todos os processos e threads do usuário, não só os do programa: qualquer valor
+# abaixo do que o usuário já tem em execução impede até threads, por isso fica desativado por padrão
+DEFAULT_MAX_PROCESSES = None
+
+# Motivos de parada
+STOP_EXITED = "exited"
+STOP_TIMEOUT = "timeout"
+STOP_OUTPUT_LIMIT = "output_limit"
+STOP_CPU_LIMIT = "cpu_limit"
+STOP_MEMORY_LIMIT = "memory_limit"
+STOP_FILE_SIZE_LIMIT = "file_size_limit"
+STOP_PROCESS_LIMIT = "process_limit"
+STOP_SIGNAL = "signal"
+STOP_CANCELLED = "cancelled"
+
+# Mensagem exibida para cada motivo de parada
+STOP_MESSAGES = {
+    STOP_TIMEOUT: "A execução do código excedeu o tempo limite.",
+    STOP_OUTPUT_LIMIT: "A saída excedeu o limite de {output_bytes} bytes e a execução foi interrompida.",
+    STOP_CPU_LIMIT: "O programa excedeu o limite de {cpu_seconds} s de tempo de CPU.",
+    STOP_MEMORY_LIMIT: "O programa excedeu o limite de memória ({memory_bytes} bytes).",
+    STOP_FILE_SIZE_LIMIT: "O programa excedeu o tamanho máximo de arquivo ({file_size_bytes} bytes).",
+    STOP_PROCESS_LIMIT: "O programa tentou criar processos ou threads além do permitido.",
+    STOP_SIGNAL: "O processo de execução terminou inesperadamente (código {returncode}).",
+    STOP_CANCELLED: "A execução foi interrompida pelo usuário.",
+}
+
+# Bytes lidos por vez de stdout/stderr
+_READ_SIZE = 65536
+
+
+class SandboxLimits:
+    """
+    Limites de recursos de uma execução (None desativa o limite correspondente).
+    """
+
+    def __init__(self, cpu_seconds: Optional[int] = DEFAULT_CPU_SECONDS,
+                 memory_bytes: Optional[int] = DEFAULT_MEMORY_BYTES,
+                 file_size_bytes: Optional[int] = DEFAULT_FILE_SIZE_BYTES,
+                 max_processes: Optional[int] = DEFAULT_MAX_PROCESSES,
+                 output_bytes: Optional[int] = DEFAULT_OUTPUT_BYTES):
+        """
+        Args:
+            cpu_seconds: Tempo de CPU do programa (RLIMIT_CPU)
+            memory_bytes: Espaço de endereçamento do processo (RLIMIT_AS)
+            file_size_bytes: Tamanho máximo de um arquivo gravado (RLIMIT_FSIZE)
+            max_processes: Processos e threads do usuário (RLIMIT_NPROC)
+            output_bytes: Total de bytes guardados de stdout e stderr
+        """
+        self.cpu_seconds = cpu_seconds
+        self.memory_bytes = memory_bytes
+        self.file_size_bytes = file_size_bytes
+        self.max_processes = max_processes
+        self.output_bytes = output_bytes
+
+    def rlimits(self) -> tuple:
+        """Retorna os limites no formato enviado ao processo de execução."""
+        return self.cpu_seconds, self.memory_bytes, self.file_size_bytes, self.max_processes
+
+
+class SandboxResult(ExecutionResult):
+    """
+    Resultado de uma execução isolada, com o motivo da parada.
+    """
+
+    def __init__(self, stdout: str = "", stderr: str = "", returncode: Optional[int] = 0,
+                 stop_reason: str = STOP_EXITED, truncated: bool = False, duration: float = 0.0,
+                 limits: Optional[SandboxLimits] = None):
+        super().__init__(stdout, stderr, returncode,
+                         timed_out=stop_reason == STOP_TIMEOUT,
+                         crashed=stop_reason not in (STOP_EXITED, STOP_TIMEOUT),
+                         duration=duration, truncated=truncated)
+        self.stop_reason = stop_reason
+        self.limits = limits or SandboxLimits()
+
+    def stop_message(self) -> str:
+        """
+        Retorna a descrição do motivo da parada.
+
+        Returns:
+            Mensagem, ou texto vazio se o programa terminou normalmente
+        """
+        message = STOP_MESSAGES.get(self.stop_reason)
+        if message is None:
+            return ""
+        return message.format(returncode=self.returncode, **vars(self.limits))
+
+
+class BoundedOutput:
+    """
+    Buffer de stdout e stderr com limite total de bytes.
+    """
+
+    def __init__(self, max_bytes: Optional[int], on_output: Optional[Callable[[str, str], None]] = None):
+        """
+        Args:
+            max_bytes: Total de bytes guardados (None para sem limite)
+            on_output: Função chamada com (nome do fluxo, texto) a cada trecho recebido
+        """
+        self.max_bytes = max_bytes
+        self.on_output = on_output
+        self.size = 0
+        self.truncated = False
+        self.streams = {"stdout": bytearray(), "stderr": bytearray()}
+        self._decoders = {name: codecs.getincrementaldecoder("utf-8")("replace") for name in self.streams}
+        self._lock = threading.Lock()
+
+    def write(self, name: str, data: bytes) -> bool:
+        """
+        Guarda um trecho da saída.
+
+        Args:
+            name: "stdout" ou "stderr"
+            data: Bytes recebidos
+
+        Returns:
+            False se o limite foi atingido (o restante foi descartado)
+        """
+        with self._lock:
+            if self.truncated:
+                return False
+            if self.max_bytes is not None and self.size + len(data) > self.max_bytes:
+                data = data[:self.max_bytes - self.size]
+                self.truncated = True
+            self.streams[name] += data
+            self.size += len(data)
+            text = self._decoders[name].decode(data) if self.on_output else ""
+        if text:
+            self.on_output(name, text)
+        return not self.truncated
+
+    def text(self, name: str) -> str:
+        """Retorna um dos fluxos decodificado, como faria subprocess com text=True."""
+        text = bytes(self.streams[name]).decode("utf-8", "replace")
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class _SandboxProcess:
+    """
+    Processo de execução isolada, iniciado antes de receber o programa.
+    """
+
+    def __init__(self, python: str):
+        self.status_r = -1
+        status_w = -1
+        options = {}
+        if os.name == "posix":
+            # Estado final por um pipe à parte; grupo de processos próprio para encerrar também os filhos
+            self.status_r, status_w = os.pipe()
+            options = {"pass_fds": (status_w,), "start_new_session": True}
+        try:
+            self.process = subprocess.Popen(
+                [python, "-u", WORKER_SCRIPT, "--sandbox", str(status_w)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                **options
+            )
+        finally:
+            if status_w >= 0:
+                os.close(status_w)
+
+    def alive(self) -> bool:
+        """Indica se o processo ainda está ativo."""
+        return self.process.poll() is None
+
+    def kill(self):
+        """Encerra o processo e os que ele tiver criado."""
+        try:
+            if os.name == "posix":
+                os.killpg(self.process.pid, signal.SIGKILL)
+            else:
+                self.process.kill()
+        except OSError:
+            pass
+
+    def read_status(self) -> Optional[tuple]:
+        """Lê (código de saída, motivo) escrito pelo processo, se houver."""
+        if self.status_r < 0:
+            return None
+        with os.fdopen(self.status_r, "rb") as stream:
+            self.status_r = -1
+            try:
+                return read_frame(stream)
+            except (OSError, ValueError, EOFError):
+                return None
+
+    def close(self):
+        """Libera os descritores do processo."""
+        for stream in (self.process.stdin, self.process.stdout, self.process.stderr):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        if self.status_r >= 0:
+            os.close(self.status_r)
+            self.status_r = -1
+
+
+class SandboxRunner:
+    """
+    Executa programas em processos isolados, com limites de recursos e de saída.
+    """
+
+    def __init__(self, limits: Optional[SandboxLimits] = None, python: Optional[str] = None,
+                 prestart: bool = True):
+        """
+        Args:
+            limits: Limites padrão das execuções
+            python: Interpretador usado (padrão: sys.executable)
+            prestart: Se True, mantém um processo de reserva pronto para a próxima execução
+        """
+        self.limits = limits or SandboxLimits()
+        self.python = python or sys.executable
+        self.prestart = prestart
+        self._spare: Optional[_SandboxProcess] = None
+        self._lock = threading.Lock()
+        if prestart:
+            self._spare = _SandboxProcess(self.python)
+
+    def run(self, code, stdin: str = "", timeout: Optional[float] = 10.0,
+            merge_stderr: bool = False, limits: Optional[SandboxLimits] = None,
+            on_output: Optional[Callable[[str, str], None]] = None,
+            cancel: Optional[threading.Event] = None) -> SandboxResult:
+        """
+        Executa um programa em um processo isolado.
+
+        Args:
+            code: Código Python (texto) ou objeto de código já compilado
+            stdin: Texto entregue na entrada padrão do programa
+            timeout: Tempo limite (de relógio) em segundos, ou None
+            merge_stderr: Se True, stderr é entregue junto com stdout
+            limits: Limites desta execução (padrão: os do executor)
+            on_output: Função chamada com (nome do fluxo, texto) enquanto o programa roda
+            cancel: Evento que, quando ativado, interrompe a execução
+
+        Returns:
+            SandboxResult com as saídas, o código de saída e o motivo da parada
+
+        Raises:
+            SyntaxError: Se o código em texto não compilar
+        """
+        if isinstance(code, str):
+            code = compile(code, "<binario>", "exec")
+        limits = limits or self.limits
+
+        sandbox = self._take()
+        output = BoundedOutput(limits.output_bytes, on_output)
+        stopped = []
+        start = time.perf_counter()
+
+        def stop(reason):
+            if not stopped:
+                stopped.append(reason)
+                sandbox.kill()
+
+        def pump(name, stream):
+            fd = stream.fileno()
+            try:
+                while True:
+                    chunk = os.read(fd, _READ_SIZE)
+                    if not chunk:
+                        break
+                    if not output.write(name, chunk):
+                        stop(STOP_OUTPUT_LIMIT)
+                        break
+            except OSError:
+                pass
+
+        def feed():
+            try:
+                write_frame(sandbox.process.stdin, (code, limits.rlimits(), merge_stderr))
+                sandbox.process.stdin.write(stdin.encode("utf-8"))
+                sandbox.process.stdin.close()
+            except (OSError, ValueError):
+                pass
+
+        threads = [
+            threading.Thread(target=feed, daemon=True),
+            threading.Thread(target=pump, args=("stdout", sandbox.process.stdout), daemon=True),
+            threading.Thread(target=pump, args=("stderr", sandbox.process.stderr), daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+
+        deadline = None if timeout is None else start + timeout
+        while sandbox.process.poll() is None:
+            if cancel is not None and cancel.is_set():
+                stop(STOP_CANCELLED)
+            elif deadline is not None and time.perf_counter() >= deadline:
+                stop(STOP_TIMEOUT)
+            try:
+                sandbox.process.wait(timeout=0.05)
+            except subprocess.TimeoutExpired:
+                pass
+        # Processos criados pelo programa podem manter os pipes abertos
+        if os.name == "posix" and not stopped:
+            sandbox.kill()
+        for thread in threads:
+            thread.join(timeout=1.0)
+
+        returncode = sandbox.process.returncode
+        status = sandbox.read_status()
+        sandbox.close()
+
+        if stopped:
+            reason = stopped[0]
+        elif status is not None:
+            reason = status[1] or STOP_EXITED
+        elif returncode is not None and returncode < 0:
+            reason = self._signal_reason(-returncode, limits)
+        else:
+            reason = STOP_EXITED
+
+        stdout, stderr = output.text("stdout"), output.text("stderr")
+        if output.truncated:
+            stdout += TRUNCATION_MARKER.format(limit=limits.output_bytes)
+        return SandboxResult(stdout, stderr, returncode, reason, output.truncated,
+                             time.perf_counter() - start, limits)
+
+    def shutdown(self):
+        """Encerra o processo de reserva."""
+        with self._lock:
+            spare, self._spare = self._spare, None
+        if spare is not None:
+            spare.kill()
+            try:
+                spare.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                pass
+            spare.close()
+
+    def _take(self) -> _SandboxProcess:
+        """Retorna um processo pronto e já inicia o de reserva da próxima execução."""
+        with self._lock:
+            sandbox, self._spare = self._spare, None
+            if sandbox is None or not sandbox.alive():
+                if sandbox is not None:
+                    sandbox.close()
+                sandbox = _SandboxProcess(self.python)
+            if self.prestart:
+                self._spare = _SandboxProcess(self.python)
+        return sandbox
+
+    @staticmethod
+    def _signal_reason(signum: int, limits: SandboxLimits) -> str:
+        """Identifica o limite correspondente ao sinal que encerrou o processo."""
+        if signum == getattr(signal, "SIGXCPU", None):
+            return STOP_CPU_LIMIT
+        if signum == getattr(signal, "SIGXFSZ", None):
+            return STOP_FILE_SIZE_LIMIT
+        if signum == getattr(signal, "SIGKILL", None) and limits.cpu_seconds is not None:
+            # O limite rígido de CPU envia SIGKILL quando o SIGXCPU é ignorado
+            return STOP_CPU_LIMIT
+        return STOP_SIGNAL
+
+
+_default_runner = None
+_default_runner_lock = threading.Lock()
+
+
+def get_default_runner() -> SandboxRunner:
+    """
+    Retorna o executor isolado compartilhado da aplicação.
+
+    Returns:
+        Instância única de SandboxRunner
+    """
+    global _default_runner
+    with _default_runner_lock:
+        if _default_runner is None:
+            _default_runner = SandboxRunner()
+            atexit.register(_default_runner.shutdown)
+    return _default_runner
+
+
+def _demo():
+    """Executa programas que atingem cada limite e mostra o motivo da parada."""
+    programs = {
+        "normal": "print('olá')",
+        "saída infinita": "while True:\n    print('x' * 100)",
+        "memória": "dados = bytearray(4 * 1024 ** 3)",
+        "CPU": "while True:\n    pass",
+        "arquivo": "import tempfile\nwith tempfile.TemporaryFile() as f:\n    f.write(b'0' * (64 * 1024 * 1024))",
+        "processos": "import subprocess, sys\nsubprocess.run([sys.executable, '-c', 'pass'])",
+    }
+    runner = SandboxRunner(SandboxLimits(cpu_seconds=2))
+    for name, source in programs.items():
+        result = runner.run(source, timeout=10)
+        print(f"{name:>15}: {result.stop_reason:<16} {result.duration * 1000:7.1f} ms, "
+              f"{len(result.stdout) + len(result.stderr)} caracteres de saída")
+    runner.shutdown()
+
+
+if __name__ == "__main__":
+    _demo()
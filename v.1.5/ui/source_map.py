@@ -0,0 +1,244 @@
+"""
+Módulo de mapas de origem entre o código binário e o código Python traduzido.
+O mapa guarda, para cada token traduzido, a posição do token no texto Python e a
+posição da palavra binária que o produziu, em dois arrays ordenados (as duas
+sequências crescem juntas, porque a tradução segue a ordem do código). Uma
+consulta em qualquer sentido é uma busca binária (bisect) em um dos arrays.
+Com o mapa, tracebacks e SyntaxErrors do código traduzido passam a apontar para
+a linha e a coluna do código binário. Não depende do Qt.
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable, List, Optional, Tuple
+
+# Nome de arquivo usado na compilação do código traduzido
+DEFAULT_FILENAME = "<binario>"
+
+# Linha de um quadro do traceback ('  File "<binario>", line 3, in <module>')
+_FRAME_PATTERN = re.compile(r'^(?P<indent>\s*)File "(?P<filename>[^"]*)", line (?P<line>\d+)(?P<rest>.*)$')
+
+# Quebra de linha (início da linha seguinte)
+_NEWLINE = re.compile(r'\n')
+
+
+def _line_starts(text: str) -> array:
+    """Posição do início de cada linha de text."""
+    starts = array("q", [0])
+    starts.extend(match.end() for match in _NEWLINE.finditer(text))
+    return starts
+
+
+class SourceMap:
+    """
+    Mapa bidirecional entre posições do código Python traduzido e do código binário.
+    Linhas começam em 1 e colunas em 0, como nos nós do ast.
+    """
+
+    def __init__(self, python_code: str, binary_code: str, python_offsets: Iterable[int],
+                 binary_offsets: Iterable[int]):
+        """
+        Inicializa o mapa.
+
+        Args:
+            python_code: Código Python traduzido
+            binary_code: Código binário de origem
+            python_offsets: Início de cada token no código Python (ordem crescente)
+            binary_offsets: Início da palavra binária de cada token (ordem crescente)
+        """
+        self.python_code = python_code
+        self.binary_code = binary_code
+        self.python_offsets = array("q", python_offsets)
+        self.binary_offsets = array("q", binary_offsets)
+        if len(self.python_offsets) != len(self.binary_offsets):
+            raise ValueError("Os dois lados do mapa devem ter a mesma quantidade de posições")
+        self._python_lines = _line_starts(python_code)
+        self._binary_lines = _line_starts(binary_code)
+
+    @classmethod
+    def from_tokens(cls, tokens: List[str], binary_offsets: List[int], binary_code: str) -> "SourceMap":
+        """
+        Cria o mapa de uma tradução que apenas concatena os textos dos tokens.
+
+        Args:
+            tokens: Texto de cada token, na ordem
+            binary_offsets: Início da palavra binária de cada token
+            binary_code: Código binário de origem
+
+        Returns:
+            SourceMap da tradução ''.join(tokens)
+        """
+        python_offsets = array("q", [0])
+        python_offsets.extend(accumulate(len(token) for token in tokens))
+        python_offsets.pop()
+        return cls("".join(tokens), binary_code, python_offsets, binary_offsets)
+
+    def __len__(self) -> int:
+        return len(self.python_offsets)
+
+    def python_to_binary(self, line: int, col: int = 0) -> Tuple[int, int]:
+        """
+        Converte uma posição do código Python na posição do token binário correspondente.
+
+        Args:
+            line: Linha no código Python
+            col: Coluna no código Python
+
+        Returns:
+            Tupla (linha, coluna) no código binário
+        """
+        offset = self._offset(self._python_lines, len(self.python_code), line, col)
+        index = max(0, bisect_right(self.python_offsets, offset) - 1)
+        if not self.binary_offsets:
+            return 1, 0
+        return self._position(self._binary_lines, self.binary_offsets[index])
+
+    def binary_to_python(self, line: int, col: int = 0) -> Tuple[int, int]:
+        """
+        Converte uma posição do código binário na posição do texto Python gerado por ela.
+
+        Args:
+            line: Linha no código binário
+            col: Coluna no código binário
+
+        Returns:
+            Tupla (linha, coluna) no código Python
+        """
+        offset = self._offset(self._binary_lines, len(self.binary_code), line, col)
+        index = max(0, bisect_right(self.binary_offsets, offset) - 1)
+        if not self.python_offsets:
+            return 1, 0
+        return self._position(self._python_lines, self.python_offsets[index])
+
+    def python_line_to_binary(self, line: int) -> Tuple[int, int]:
+        """
+        Posição no código binário do primeiro token de uma linha do código Python
+        (os tracebacks informam só a linha).
+
+        Args:
+            line: Linha no código Python
+
+        Returns:
+            Tupla (linha, coluna) no código binário
+        """
+        text = self.python_line(line)
+        return self.python_to_binary(line, len(text) - len(text.lstrip()))
+
+    def python_line(self, line: int) -> str:
+        """Texto de uma linha do código Python (sem a quebra de linha)."""
+        return self._line_text(self.python_code, self._python_lines, line)
+
+    def binary_line(self, line: int) -> str:
+        """Texto de uma linha do código binário (sem a quebra de linha)."""
+        return self._line_text(self.binary_code, self._binary_lines, line)
+
+    def map_syntax_error(self, error: SyntaxError, filename: str = DEFAULT_FILENAME) -> SyntaxError:
+        """
+        Converte um SyntaxError do código Python em um SyntaxError no código binário.
+
+        Args:
+            error: Erro levantado por compile/ast.parse no código traduzido
+            filename: Nome de arquivo do novo erro
+
+        Returns:
+            SyntaxError com linha e coluna (a partir de 1) no código binário
+        """
+        if not error.lineno:
+            return error
+        col = max(0, (error.offset or 1) - 1)
+        line, binary_col = self.python_to_binary(error.lineno, col)
+        end = (line, binary_col + 8)
+        if error.end_lineno and error.end_offset and (error.end_lineno, error.end_offset) > (error.lineno, col + 1):
+            end_line, end_col = self.python_to_binary(error.end_lineno, max(0, error.end_offset - 2))
+            end = (end_line, end_col + 8) if (end_line, end_col) >= (line, binary_col) else end
+        message = f"{error.msg} (Python: linha {error.lineno}, coluna {col + 1})"
+        mapped = SyntaxError(message, (filename, line, binary_col + 1, self.binary_line(line),
+                                       end[0], end[1] + 1))
+        mapped.python_lineno = error.lineno
+        return mapped
+
+    def rewrite_traceback(self, text: str, filenames: Iterable[str] = (DEFAULT_FILENAME,)) -> str:
+        """
+        Reescreve os quadros do código traduzido de um traceback com as posições binárias.
+        Cada quadro passa a informar a linha e a coluna no binário, seguidas da linha Python.
+
+        Args:
+            text: Traceback (ou saída de erro contendo tracebacks)
+            filenames: Nomes de arquivo que identificam o código traduzido
+
+        Returns:
+            Traceback reescrito
+        """
+        filenames = set(filenames)
+        lines = text.split("\n")
+        rewritten = []
+        skip_source = False
+        for current in lines:
+            if skip_source:
+                skip_source = False
+                # O Python já mostrou a linha de origem: ela é substituída pela do código traduzido
+                if current.startswith(" ") and not _FRAME_PATTERN.match(current):
+                    continue
+            match = _FRAME_PATTERN.match(current)
+            if match is None or match.group("filename") not in filenames:
+                rewritten.append(current)
+                continue
+            python_line = int(match.group("line"))
+            line, col = self.python_line_to_binary(python_line)
+            indent = match.group("indent")
+            rewritten.append(f'{indent}File "{match.group("filename")}", linha {line}, coluna {col + 1} '
+                             f'(Python: linha {python_line}){match.group("rest")}')
+            source = self.python_line(python_line).strip()
+            if source:
+                rewritten.append(f"{indent}  {source}")
+            skip_source = True
+        return "\n".join(rewritten)
+
+    def locate_traceback(self, text: str,
+                         filenames: Iterable[str] = (DEFAULT_FILENAME,)) -> Optional[Tuple[int, int, str]]:
+        """
+        Encontra no código binário o ponto em que um traceback ocorreu.
+
+        Args:
+            text: Traceback original (antes de rewrite_traceback)
+            filenames: Nomes de arquivo que identificam o código traduzido
+
+        Returns:
+            Tupla (linha, coluna a partir de 1, mensagem da exceção) do quadro mais interno
+            do código traduzido, ou None se o traceback não passar por ele
+        """
+        filenames = set(filenames)
+        position = None
+        message = ""
+        for current in text.split("\n"):
+            match = _FRAME_PATTERN.match(current)
+            if match is not None:
+                if match.group("filename") in filenames:
+                    line, col = self.python_line_to_binary(int(match.group("line")))
+                    position = (line, col + 1)
+            elif current and not current.startswith((" ", "Traceback")):
+                message = current.strip()
+        if position is None:
+            return None
+        return position[0], position[1], message
+
+    @staticmethod
+    def _offset(starts: array, length: int, line: int, col: int) -> int:
+        """Posição absoluta de (linha, coluna), limitada ao texto."""
+        line = min(max(1, line), len(starts))
+        return min(starts[line - 1] + max(0, col), length)
+
+    @staticmethod
+    def _position(starts: array, offset: int) -> Tuple[int, int]:
+        """Linha e coluna de uma posição absoluta."""
+        index = bisect_right(starts, offset) - 1
+        return index + 1, offset - starts[index]
+
+    @staticmethod
+    def _line_text(text: str, starts: array, line: int) -> str:
+        if not 0 < line <= len(starts):
+            return ""
+        end = starts[line] - 1 if line < len(starts) else len(text)
+        return text[starts[line - 1]:end]
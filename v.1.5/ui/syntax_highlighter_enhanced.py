@@ -2,18 +2,46 @@
 Módulo aprimorado para realce de sintaxe binária com validação e sublinhado vermelho para comandos inválidos.
 Este módulo estende o realce de sintaxe original para adicionar validação em tempo real
 e destacar visualmente comandos inválidos com sublinhado vermelho.
+
+O realce não percorre o documento inteiro de forma síncrona: os tokens de cada
+linha vêm do BinaryTokenIndex compartilhado e os formatos são aplicados
+diretamente nos QTextLayouts dos blocos, primeiro nos blocos visíveis e depois,
+em fatias curtas durante o tempo ocioso do laço de eventos, no restante do
+documento. Assim a primeira tela de um arquivo grande aparece imediatamente e a
+entrada do usuário nunca fica bloqueada por mais de uma fatia. A validação roda
+no ValidationService, em uma thread de trabalho, e os erros recebidos são
+sublinhados apenas nos blocos em que mudaram.
 """
 
-import re
-from PyQt5.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont, QTextCursor
+import time
+from PyQt5.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont, QTextLayout
 from PyQt5.QtCore import QRegExp, Qt, QTimer
 
 from ui.binary_syntax_parser import BinarySyntaxParser
+from ui.validation_service import ValidationService
+from ui.binary_token_index import (
+    BinaryTokenIndex, CONTROL_TOKENS, FUNCTION_TOKENS, TOKEN_KEYWORD, TOKEN_CONTROL,
+    TOKEN_FUNCTION, TOKEN_INVALID, TOKEN_STRING, TOKEN_COMMENT
+)
+
+# Tempo máximo de cada fatia de realce em segundo plano (menos que um quadro de 60 Hz)
+SLICE_BUDGET = 0.008
+
+# Alterações com até este número de blocos são realçadas imediatamente
+SYNC_BLOCK_LIMIT = 200
+
+# Blocos considerados visíveis quando não há um editor associado
+DEFAULT_VISIBLE_BLOCKS = 80
+
 
 class BinarySyntaxHighlighterEnhanced(QSyntaxHighlighter):
     DEFAULT_KEYWORD_COLOR = "#ff79c6"
-    def __init__(self, document):
-        super().__init__(document)
+    def __init__(self, document, view=None):
+        # O documento não é entregue ao QSyntaxHighlighter, que o realçaria por
+        # inteiro de uma vez; os blocos são formatados pelo agendador abaixo
+        super().__init__(None)
+        self._document = None
+        self.view = None
         
         # Inicializa o parser de sintaxe binária
         self.parser = BinarySyntaxParser()
@@ -32,6 +60,16 @@ class BinarySyntaxHighlighterEnhanced(QSyntaxHighlighter):
             'variable': self._create_format(QColor("#8be9fd")),
         }
         
+        # Formato de cada tipo de token do índice
+        self.token_formats = {
+            TOKEN_KEYWORD: self.formats['keyword'],
+            TOKEN_CONTROL: self.formats['control'],
+            TOKEN_FUNCTION: self.formats['function'],
+            TOKEN_INVALID: self.formats['invalid'],
+            TOKEN_STRING: self.formats['string'],
+            TOKEN_COMMENT: self.formats['comment'],
+        }
+        
         # Regras de realce
         self.highlighting_rules = []
         
@@ -46,31 +84,38 @@ class BinarySyntaxHighlighterEnhanced(QSyntaxHighlighter):
         self.highlighting_rules.append((QRegExp(r'//[^\n]*'), self.formats['comment']))
         
         # Categorias especiais de tokens binários
-        self.control_tokens = [
-            "11010000",  # BINSTART
-            "11010001",  # BINEND
-            "11010010",  # BINVAR
-            "11010011",  # BINFUNC
-            "11010100",  # BINIF
-            "11010101",  # BINELSE
-            "11010110",  # BINLOOP
-            "11010111",  # BINBREAK
-            "11011000",  # BINCONT
-            "11011001",  # BINRET
-        ]
-        
-        self.function_tokens = [
-            "11011010",  # BINPRINT
-            "11011011",  # BININPUT
-        ]
+        self.control_tokens = list(CONTROL_TOKENS)
+        self.function_tokens = list(FUNCTION_TOKENS)
+        
+        # Tokens de cada bloco, compartilhados com a validação
+        self.token_index = BinaryTokenIndex(self.binary_keywords, self.control_tokens, self.function_tokens)
+        
+        # Blocos cujos formatos já foram aplicados (1 byte por bloco)
+        self._applied = bytearray()
+        self._next_block = 0
+        self._applying = False
         
         # Lista para armazenar erros encontrados
         self.errors = []
         
-        # Timer para validação com delay
-        self.validation_timer = QTimer()
-        self.validation_timer.setSingleShot(True)
-        self.validation_timer.timeout.connect(self.validate_document)
+        # Formato de sublinhado dos erros de validação (combinado ao realce do token)
+        self.error_format = QTextCharFormat()
+        self.error_format.setUnderlineStyle(QTextCharFormat.WaveUnderline)
+        self.error_format.setUnderlineColor(QColor("#ff5555"))
+        
+        # Validação em segundo plano; erros por bloco (coluna, comprimento, mensagem)
+        self.validator = ValidationService(keywords=self.binary_keywords)
+        self.validator.diagnostics_ready.connect(self._on_diagnostics)
+        self._block_errors = {}
+        
+        # Timer das fatias de realce em segundo plano (dispara quando o laço de eventos fica ocioso)
+        self.slice_timer = QTimer()
+        self.slice_timer.setInterval(0)
+        self.slice_timer.timeout.connect(self._process_slice)
+        
+        self.set_document(document)
+        if view is not None:
+            self.set_view(view)
         
     def _create_format(self, color, bold=False, italic=False, underline=False):
         """
@@ -100,92 +145,280 @@ class BinarySyntaxHighlighterEnhanced(QSyntaxHighlighter):
         
         return fmt
     
+    def set_document(self, document):
+        """
+        Associa o realce a um documento (ou desassocia, com None).
+        
+        Args:
+            document: QTextDocument a realçar
+        """
+        if self._document is not None:
+            try:
+                self._document.contentsChange.disconnect(self._on_contents_change)
+            except (TypeError, RuntimeError):
+                pass
+        
+        self._document = document
+        self.slice_timer.stop()
+        self.validator.set_document(document)
+        if document is None:
+            self.token_index.reset(0)
+            self._applied = bytearray()
+            return
+        
+        document.contentsChange.connect(self._on_contents_change)
+        self.rehighlight()
+    
+    def document(self):
+        """Retorna o documento realçado."""
+        return self._document
+    
+    def set_view(self, view):
+        """
+        Associa o editor que exibe o documento, para realçar primeiro os blocos visíveis.
+        
+        Args:
+            view: QPlainTextEdit que exibe o documento
+        """
+        if self.view is not None:
+            try:
+                self.view.updateRequest.disconnect(self._on_view_update)
+            except (TypeError, RuntimeError):
+                pass
+        
+        self.view = view
+        if view is not None:
+            view.updateRequest.connect(self._on_view_update)
+            self._schedule()
+    
+    def rehighlight(self):
+        """Descarta os tokens e realça novamente o documento inteiro (visíveis primeiro)."""
+        if self._document is None:
+            return
+        count = self._document.blockCount()
+        self.token_index.reset(count)
+        self._applied = bytearray(count)
+        self._next_block = 0
+        self._schedule()
+    
+    def rehighlightBlock(self, block):
+        """
+        Realça novamente um único bloco, de imediato.
+        
+        Args:
+            block: QTextBlock a realçar
+        """
+        number = block.blockNumber()
+        if 0 <= number < len(self._applied):
+            self.token_index.scan(number, block.text())
+            self._apply_blocks(block, number + 1)
+    
     def highlightBlock(self, text):
         """
-        Realça um bloco de texto.
+        Realça um bloco de texto (usado apenas se o documento for associado
+        diretamente pelo QSyntaxHighlighter.setDocument).
         
         Args:
             text: Texto a ser realçado
         """
-        # Reseta os erros para este bloco
-        self.errors = []
+        tokens = self.token_index.scan_line(text)
+        for i in range(0, len(tokens), 3):
+            self.setFormat(tokens[i], tokens[i + 1], self.token_formats[tokens[i + 2]])
+    
+    def _schedule(self):
+        """Agenda as fatias de realce em segundo plano."""
+        if not self.slice_timer.isActive():
+            self.slice_timer.start()
+    
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """
+        Atualiza os tokens dos blocos alterados e os realça.
         
-        # 1. Palavras binárias com ou sem significado
-        pattern = r'\b[01]{8}\b'
-        for match in re.finditer(pattern, text):
-            word = match.group()
-            start = match.start()
-            length = len(word)
-            
-            # Determina o formato com base no tipo de token
-            if word in self.binary_keywords:
-                if word in self.control_tokens:
-                    fmt = self.formats['control']
-                elif word in self.function_tokens:
-                    fmt = self.formats['function']
-                else:
-                    fmt = self.formats['keyword']
+        Args:
+            position: Posição da alteração
+            chars_removed: Caracteres removidos
+            chars_added: Caracteres inseridos
+        """
+        if self._applying or self._document is None:
+            return
+        
+        document = self._document
+        block_count = document.blockCount()
+        first_block = document.findBlock(position)
+        first = first_block.blockNumber()
+        last_block = document.findBlock(position + chars_added)
+        last = last_block.blockNumber() if last_block.isValid() else block_count - 1
+        
+        added = last - first + 1
+        removed = added - (block_count - len(self._applied))
+        if first < 0 or removed < 0 or first + removed > len(self._applied):
+            # Alteração que não corresponde ao estado conhecido: refaz tudo
+            self.rehighlight()
+        else:
+            self.token_index.replace_lines(first, removed, added)
+            self._applied[first:first + removed] = bytes(added)
+            if added <= SYNC_BLOCK_LIMIT:
+                self._apply_blocks(first_block, last + 1)
             else:
-                fmt = self.formats['invalid']
-                self.errors.append((self.currentBlock().blockNumber() + 1, start, length, f"Token desconhecido: '{word}'"))
+                # Colagens e carregamentos grandes seguem pelas fatias
+                self._next_block = first
+                self._schedule()
+    
+    def _on_view_update(self, rect, dy):
+        """Ao rolar o editor, realça os blocos que ficaram visíveis."""
+        if self._applied.find(0) >= 0:
+            self._schedule()
+    
+    def _visible_range(self):
+        """
+        Retorna o intervalo de blocos visíveis no editor.
+        
+        Returns:
+            Tupla (primeiro bloco, fim exclusivo)
+        """
+        count = len(self._applied)
+        if self.view is None:
+            return 0, min(count, DEFAULT_VISIBLE_BLOCKS)
+        
+        first = max(0, self.view.firstVisibleBlock().blockNumber())
+        line_height = max(1, self.view.fontMetrics().height())
+        visible = self.view.viewport().height() // line_height + 2
+        return first, min(count, first + visible)
+    
+    def _format_ranges(self, number, tokens):
+        """
+        Converte os tokens e os erros de validação de um bloco em intervalos de formato.
+        
+        Args:
+            number: Número do bloco
+            tokens: Tupla plana (início, comprimento, tipo, ...)
             
-            self.setFormat(start, length, fmt)
+        Returns:
+            Lista de QTextLayout.FormatRange
+        """
+        formats = self.token_formats
+        ranges = []
+        for i in range(0, len(tokens), 3):
+            format_range = QTextLayout.FormatRange()
+            format_range.start = tokens[i]
+            format_range.length = tokens[i + 1]
+            format_range.format = formats[tokens[i + 2]]
+            ranges.append(format_range)
         
-        # 2. Strings entre aspas
-        for match in re.finditer(r'"[01\s]*"', text):
-            self.setFormat(match.start(), len(match.group()), self.formats['string'])
+        for column, length, message in self._block_errors.get(number, ()):
+            error_format = QTextCharFormat(self.error_format)
+            error_format.setToolTip(message)
+            format_range = QTextLayout.FormatRange()
+            format_range.start = column
+            format_range.length = length
+            format_range.format = error_format
+            ranges.append(format_range)
+        return ranges
+    
+    def _apply_blocks(self, block, end, deadline=None):
+        """
+        Aplica os formatos a blocos consecutivos e marca o trecho para redesenho de uma só vez.
         
-        # 3. Comentários
-        for match in re.finditer(r'//[^\n]*', text):
-            self.setFormat(match.start(), len(match.group()), self.formats['comment'])
+        Args:
+            block: Primeiro bloco
+            end: Número do bloco final (exclusivo)
+            deadline: Instante (perf_counter) em que o processamento é interrompido
+            
+        Returns:
+            Próximo bloco não processado
+        """
+        start_position = block.position()
+        end_position = start_position
+        number = block.blockNumber()
+        index = self.token_index
         
-        # Aplica as demais regras (strings, comentários, etc.)
-        for pattern, fmt in self.highlighting_rules:
-            index = pattern.indexIn(text)
-            while index >= 0:
-                length = pattern.matchedLength()
-                self.setFormat(index, length, fmt)
-                index = pattern.indexIn(text, index + length)
+        while block.isValid() and number < end:
+            tokens = index.get(number)
+            if tokens is None:
+                tokens = index.scan(number, block.text())
+            block.layout().setFormats(self._format_ranges(number, tokens))
+            self._applied[number] = 1
+            end_position = block.position() + block.length()
+            block = block.next()
+            number += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
         
-        # Agenda validação do documento completo
-        self.validation_timer.start(500)  # 500ms de delay para não sobrecarregar durante digitação
+        if end_position > start_position:
+            # markContentsDirty emite contentsChange; a alteração é só de formato
+            self._applying = True
+            try:
+                self._document.markContentsDirty(start_position, end_position - start_position)
+            finally:
+                self._applying = False
+        return block
     
-    def validate_document(self):
+    def _process_slice(self):
         """
-        Valida o documento completo e destaca erros de sintaxe.
+        Fatia de realce: blocos visíveis primeiro, depois o restante do documento
+        até esgotar o tempo da fatia.
         """
-        # Obtém o texto completo do documento
-        doc = self.document()
-        text = doc.toPlainText()
+        if self._document is None:
+            self.slice_timer.stop()
+            return
         
-        # Valida a sintaxe usando o parser
-        syntax_errors = self.parser.validate_binary_syntax(text)
+        deadline = time.perf_counter() + SLICE_BUDGET
+        applied = self._applied
+        count = len(applied)
         
-        # Limpa formatações de erro anteriores
-        cursor = QTextCursor(doc)
-        cursor.beginEditBlock()
+        # 1. Blocos visíveis, sempre por inteiro
+        first, end = self._visible_range()
+        number = applied.find(0, first, end)
+        while number >= 0:
+            run_end = applied.find(1, number, end)
+            if run_end < 0:
+                run_end = end
+            self._apply_blocks(self._document.findBlockByNumber(number), run_end)
+            number = applied.find(0, run_end, end)
         
-        # Aplica formatação de erro para cada erro de sintaxe
-        for line_num, error_msg in syntax_errors:
-            # Posiciona o cursor no início da linha com erro
-            cursor.setPosition(doc.findBlockByLineNumber(line_num - 1).position())
-            
-            # Seleciona a linha inteira
-            cursor.movePosition(QTextCursor.EndOfLine, QTextCursor.KeepAnchor)
-            
-            # Aplica o formato de erro
-            format_error = QTextCharFormat()
-            format_error.setUnderlineStyle(QTextCharFormat.WaveUnderline)
-            format_error.setUnderlineColor(QColor("#ff5555"))
-            format_error.setToolTip(error_msg)
-            
-            # Armazena o erro para referência
-            self.errors.append((line_num, 0, cursor.selectedText().length(), error_msg))
+        # 2. Restante do documento, a partir do último ponto processado
+        while time.perf_counter() < deadline:
+            number = applied.find(0, self._next_block)
+            if number < 0:
+                number = applied.find(0)
+                if number < 0:
+                    self.slice_timer.stop()
+                    return
+            run_end = applied.find(1, number)
+            if run_end < 0:
+                run_end = count
+            block = self._apply_blocks(self._document.findBlockByNumber(number), run_end, deadline)
+            self._next_block = block.blockNumber() if block.isValid() else count
+    
+    def validate_document(self):
+        """
+        Valida o documento completo imediatamente e destaca os erros de sintaxe.
+        """
+        doc = self.document()
+        if doc is None:
+            return
+        self._on_diagnostics(self.parser.validate_binary_diagnostics(doc.toPlainText()))
+    
+    def _on_diagnostics(self, diagnostics):
+        """
+        Recebe os erros da validação e realça novamente apenas os blocos cujos erros mudaram.
+        
+        Args:
+            diagnostics: Lista de Diagnostic
+        """
+        block_errors = {}
+        for diagnostic in diagnostics:
+            block_errors.setdefault(diagnostic.line - 1, []).append(
+                (diagnostic.column, diagnostic.length, diagnostic.message))
         
-        cursor.endEditBlock()
+        previous, self._block_errors = self._block_errors, block_errors
+        self.errors = [(d.line, d.column, d.length, d.message) for d in diagnostics]
         
-        # Emite sinal de que o documento foi modificado para atualizar a visualização
-        doc.markContentsDirty(0, doc.characterCount())
+        count = len(self._applied)
+        for number in set(previous) | set(block_errors):
+            if number < count and previous.get(number) != block_errors.get(number):
+                self._applied[number] = 0
+        self._schedule()
     
     def get_errors(self):
         """
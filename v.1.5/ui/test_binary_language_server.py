@@ -0,0 +1,85 @@
+"""
+Testes do servidor LSP (BinaryLanguageServer) sobre fluxos em memória: mensagens
+malformadas não derrubam o servidor e os pedidos seguintes continuam respondidos.
+"""
+
+import io
+import json
+import logging
+import unittest
+
+try:
+    from ui.binary_language_server import BinaryLanguageServer, logger
+    from ui.binary_daemon import INTERNAL_ERROR
+except ImportError:
+    from binary_language_server import BinaryLanguageServer, logger
+    from binary_daemon import INTERNAL_ERROR
+
+URI = "file:///tmp/teste.bin"
+
+
+def _frame(message):
+    body = json.dumps(message).encode("utf-8")
+    return b"Content-Length: %d\r\n\r\n" % len(body) + body
+
+
+def _responses(output):
+    """Decodifica as mensagens gravadas pelo servidor."""
+    data = output.getvalue()
+    messages = []
+    while data:
+        header, _, data = data.partition(b"\r\n\r\n")
+        length = int(header.split(b":")[1])
+        messages.append(json.loads(data[:length]))
+        data = data[length:]
+    return messages
+
+
+class TestBinaryLanguageServerErrors(unittest.TestCase):
+    """Erros nos tratadores viram log (notificações) ou INTERNAL_ERROR (pedidos)."""
+
+    def run_server(self, *messages):
+        output = io.BytesIO()
+        server = BinaryLanguageServer(io.BytesIO(b"".join(_frame(m) for m in messages)), output,
+                                      dialect="parser")
+        with self.assertLogs(logger, logging.ERROR):
+            code = server.serve()
+        return code, [m for m in _responses(output) if "id" in m]
+
+    def test_malformed_notifications_keep_serving(self):
+        code, responses = self.run_server(
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+            {"jsonrpc": "2.0", "method": "textDocument/didOpen",
+             "params": {"textDocument": {"uri": URI, "text": "01100001", "version": 1}}},
+            # Sem textDocument.uri
+            {"jsonrpc": "2.0", "method": "textDocument/didChange",
+             "params": {"textDocument": {"version": 2}, "contentChanges": [{"text": ""}]}},
+            # Intervalo sem end
+            {"jsonrpc": "2.0", "method": "textDocument/didChange",
+             "params": {"textDocument": {"uri": URI, "version": 3},
+                        "contentChanges": [{"range": {"start": {"line": 0, "character": 0}}, "text": "1"}]}},
+            {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+            {"jsonrpc": "2.0", "method": "exit"},
+        )
+        self.assertEqual(code, 0)
+        self.assertEqual([response["id"] for response in responses], [1, 2])
+        self.assertNotIn("error", responses[1])
+
+    def test_unexpected_request_error(self):
+        output = io.BytesIO()
+        server = BinaryLanguageServer(io.BytesIO(), output, dialect="parser")
+        server.initialized = True
+
+        def broken(params):
+            raise RuntimeError("falha")
+
+        server._requests["textDocument/hover"] = broken
+        with self.assertLogs(logger, logging.ERROR):
+            server.handle({"jsonrpc": "2.0", "id": 7, "method": "textDocument/hover", "params": {}})
+        response = _responses(output)[0]
+        self.assertEqual(response["id"], 7)
+        self.assertEqual(response["error"]["code"], INTERNAL_ERROR)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Testes da leitura em fluxo (binary_stream): os trechos produzidos por
+iter_binary_segments e iter_text_segments, traduzidos ou codificados
+separadamente, devem dar o mesmo resultado que o texto inteiro, com qualquer
+tamanho de bloco (palavras divididas entre blocos, CRLF, comentários e última
+linha sem quebra de linha).
+"""
+
+import io
+import unittest
+
+try:
+    from ui.binary_stream import iter_binary_segments, iter_text_segments, iter_translate, iter_encode
+    from ui.binary_interpreter_fixed import BinaryInterpreterFixed
+    from ui.binary_interpreter_enhanced_v2 import BinaryInterpreterEnhancedV2
+except ImportError:
+    from binary_stream import iter_binary_segments, iter_text_segments, iter_translate, iter_encode
+    from binary_interpreter_fixed import BinaryInterpreterFixed
+    from binary_interpreter_enhanced_v2 import BinaryInterpreterEnhancedV2
+
+# Tamanhos de bloco: menores que uma palavra, do tamanho dela e maiores
+CHUNK_SIZES = (1, 2, 3, 5, 7, 8, 9, 13, 64, 1 << 20)
+
+BINARY_SOURCES = {
+    "palavras": "01100001 01100010 01100011 01100100 01100101",
+    "crlf": "01100001 01100010\r\n01100011\r\n\r\n01100100\r\n",
+    "sem_quebra_final": "01100001\n01100010 01100011\n01100100",
+    "comentarios": "01100001 // comentário 01100010\n01100011//x\n// linha inteira\n01100100 // fim",
+    "espacos": "  01100001\t\t01100010   \n\t01100011  ",
+    "grupo_longo": "011000010110001001100011 0110000101100010\n0110",
+    "lixo": "0110x0001 01é100010 2 01100011",
+}
+
+TEXT_SOURCES = {
+    "palavras": "if valor == 10:\n    print(valor)\nelse:\n    total += valor ** 2\n",
+    "crlf": "x = 1\r\nprint(x)\r\n",
+    "sem_quebra_final": "a = 1\nb = a + 2",
+    "strings": "print(\"uma string com espaços e while dentro\")\nnome = 'outra string'\n",
+    "tres_aspas": "texto = \"\"\"linha 1\n  if x:\n linha 3\"\"\"\nfim = ''' a\n b '''\n",
+    "sem_espacos": "identificadorbemcomprido+outroidentificador*3",
+}
+
+
+def _binary_segments(source, chunk_size):
+    return list(iter_binary_segments(io.StringIO(source), chunk_size))
+
+
+def _text_segments(source, chunk_size):
+    return list(iter_text_segments(io.StringIO(source), chunk_size))
+
+
+class TestBinarySegments(unittest.TestCase):
+    """Trechos de código binário decodificáveis de forma independente."""
+
+    def setUp(self):
+        self.decoder = BinaryInterpreterFixed().decoder
+
+    def test_segments_decode_like_whole_text(self):
+        for name, source in BINARY_SOURCES.items():
+            expected = self.decoder.decode_tokens(source)
+            for chunk_size in CHUNK_SIZES:
+                with self.subTest(source=name, chunk_size=chunk_size):
+                    segments = _binary_segments(source, chunk_size)
+                    tokens = [token for segment in segments for token in self.decoder.decode_tokens(segment)]
+                    self.assertEqual(tokens, expected)
+
+    def test_word_split_across_chunks(self):
+        segments = _binary_segments("01100001 01100010 01100011", 4)
+        # Nenhum trecho termina no meio de um grupo de 8 bits
+        for segment in segments[:-1]:
+            self.assertTrue(segment.endswith((" ", "\n")), segment)
+        self.assertEqual("".join(segments).split(), ["01100001", "01100010", "01100011"])
+
+    def test_crlf(self):
+        source = BINARY_SOURCES["crlf"]
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual("".join(_binary_segments(source, chunk_size)), source)
+
+    def test_trailing_line_without_newline(self):
+        source = BINARY_SOURCES["sem_quebra_final"]
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                segments = _binary_segments(source, chunk_size)
+                self.assertEqual("".join(segments), source)
+                self.assertTrue(segments[-1].endswith("01100100"))
+
+    def test_long_comment_is_not_accumulated(self):
+        source = "01100001 // " + "comentário " * 100 + "\n01100010"
+        for chunk_size in (16, 64):
+            with self.subTest(chunk_size=chunk_size):
+                segments = _binary_segments(source, chunk_size)
+                self.assertNotIn("comentário", "".join(segments))
+                self.assertLessEqual(max(map(len, segments)), 2 * chunk_size)
+                self.assertEqual("".join(segments).split(), ["01100001", "01100010"])
+
+    def test_pending_remainder_is_bounded(self):
+        source = "01100001" * 200
+        for chunk_size in (8, 16, 100):
+            with self.subTest(chunk_size=chunk_size):
+                segments = _binary_segments(source, chunk_size)
+                self.assertGreater(len(segments), 1)
+                self.assertLessEqual(max(map(len, segments)), 2 * chunk_size)
+                self.assertEqual("".join(segments), source)
+
+    def test_iter_translate(self):
+        interpreter = BinaryInterpreterFixed()
+        for name, source in BINARY_SOURCES.items():
+            for chunk_size in CHUNK_SIZES:
+                with self.subTest(source=name, chunk_size=chunk_size):
+                    translated = "".join(iter_translate(io.StringIO(source), chunk_size, interpreter))
+                    self.assertEqual(translated, interpreter.traduzir_binario(source))
+
+
+class TestTextSegments(unittest.TestCase):
+    """Trechos de texto que não dividem palavras nem strings literais."""
+
+    def setUp(self):
+        self.interpreter = BinaryInterpreterEnhancedV2()
+
+    def test_segments_are_lossless(self):
+        for name, source in TEXT_SOURCES.items():
+            for chunk_size in CHUNK_SIZES:
+                with self.subTest(source=name, chunk_size=chunk_size):
+                    self.assertEqual("".join(_text_segments(source, chunk_size)), source)
+
+    def test_segments_encode_like_whole_text(self):
+        for name, source in TEXT_SOURCES.items():
+            expected = self.interpreter.converter_para_binario(source)
+            for chunk_size in CHUNK_SIZES:
+                with self.subTest(source=name, chunk_size=chunk_size):
+                    encoded = "".join(iter_encode(io.StringIO(source), chunk_size, self.interpreter))
+                    self.assertEqual(encoded, expected)
+
+    def test_word_split_across_chunks(self):
+        for chunk_size in (3, 5, 8):
+            with self.subTest(chunk_size=chunk_size):
+                segments = _text_segments("primeiro segundo terceiro", chunk_size)
+                self.assertEqual([segment.strip() for segment in segments], ["primeiro", "segundo", "terceiro"])
+
+    def test_crlf(self):
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                segments = _text_segments(TEXT_SOURCES["crlf"], chunk_size)
+                # \r\n nunca é separado da linha que termina
+                for segment in segments[:-1]:
+                    self.assertFalse(segment.endswith("\r"), segment)
+
+    def test_trailing_line_without_newline(self):
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                segments = _text_segments(TEXT_SOURCES["sem_quebra_final"], chunk_size)
+                self.assertEqual("".join(segments).split("\n")[-1], "b = a + 2")
+                self.assertTrue(segments[-1].endswith("2"))
+
+    def test_strings_are_not_split(self):
+        for name in ("strings", "tres_aspas"):
+            source = TEXT_SOURCES[name]
+            for chunk_size in CHUNK_SIZES:
+                with self.subTest(source=name, chunk_size=chunk_size):
+                    for segment in _text_segments(source, chunk_size):
+                        # Cada trecho tem aspas balanceadas
+                        self.assertEqual(segment.count('"""') % 2, 0, segment)
+                        self.assertEqual(segment.count("'''") % 2, 0, segment)
+                        self.assertEqual(segment.replace('"""', "").count('"') % 2, 0, segment)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Testes da tradução em paralelo do BinarySyntaxParser: com qualquer divisão em
+blocos, iter_binary_to_python_parallel deve produzir o mesmo texto que a tradução
+serial, inclusive quando um BINSTART/BINEND ou um parêntese aberto atravessa o
+limite entre dois lotes (o estado previsto do lote seguinte fica errado e o lote
+é traduzido de novo).
+"""
+
+import io
+import os
+import unittest
+
+try:
+    from ui.binary_syntax_parser import BinarySyntaxParser
+except ImportError:
+    from binary_syntax_parser import BinarySyntaxParser
+
+# Processos usados na tradução em paralelo
+WORKERS = 2
+
+
+class TestParallelTranslation(unittest.TestCase):
+    """A tradução em paralelo coincide com a serial."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = BinarySyntaxParser()
+
+    def binary(self, *lines):
+        """Monta código binário a partir de linhas com as palavras da tabela separadas por espaços."""
+        table = self.parser.text_to_binary
+        return "\n".join(" ".join(table[word] for word in line.split()) for line in lines)
+
+    def assertParallelMatches(self, binary_code, chunk_sizes):
+        serial = self.parser.parse_binary_to_python(binary_code)
+        for chunk_size in chunk_sizes:
+            with self.subTest(chunk_size=chunk_size):
+                streamed = "".join(self.parser.iter_binary_to_python(io.StringIO(binary_code), chunk_size))
+                parallel = "".join(self.parser.iter_binary_to_python_parallel(
+                    io.StringIO(binary_code), WORKERS, chunk_size))
+                self.assertEqual(streamed, serial)
+                self.assertEqual(parallel, serial)
+
+    def test_block_words_across_chunks(self):
+        lines = []
+        for index in range(40):
+            lines += ["if x BINSTART", "y = 1", "z = ( 1 ,", "2 )", "BINEND"]
+            if index % 3 == 0:
+                lines += ["for i in x BINSTART", "BINIF i BINSTART BINPRINT i", "BINEND", "BINEND"]
+        binary_code = self.binary(*lines)
+
+        # Limites de bloco no meio da palavra de um BINSTART e de um BINEND
+        start_word = self.parser.text_to_binary["BINSTART"]
+        end_word = self.parser.text_to_binary["BINEND"]
+        chunk_sizes = [binary_code.index(start_word) + 4, binary_code.index(end_word) + 3,
+                       binary_code.index(end_word) + 9]
+        self.assertParallelMatches(binary_code, chunk_sizes)
+
+    def test_open_bracket_across_batches(self):
+        # Uma linha lógica longa (parênteses abertos por muitas linhas) atravessa vários lotes
+        lines = ["x = ( 1 ,"] + ["2 ,"] * 60 + ["3 )", "if x BINSTART", "y = ( 1 ,"] + ["2 ,"] * 30 + ["3 )", "BINEND"]
+        self.assertParallelMatches(self.binary(*lines), (50, 200))
+
+    def test_repository_file(self):
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "binary_stream.py"),
+                  encoding="utf-8") as source_file:
+            binary_code = self.parser.parse_python_to_binary(source_file.read())
+        self.assertParallelMatches(binary_code, (300, 4096))
+
+
+if __name__ == "__main__":
+    unittest.main()
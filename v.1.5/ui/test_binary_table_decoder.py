@@ -0,0 +1,114 @@
+"""
+Testes do decodificador por tabela (BinaryTableDecoder) contra a tradução
+original dos interpretadores: normalização e tokenização caractere a caractere
+(_normalize_binary / _tokenize_binary) seguidas da consulta token a token. A
+entrada é gerada (formato canônico, comentários, espaços irregulares, grupos com
+tamanho diferente de 8 bits e caracteres inválidos) e os dois caminhos do
+decodificador, com e sem NumPy, devem dar os mesmos tokens.
+"""
+
+import random
+import unittest
+from unittest import mock
+
+try:
+    from ui import binary_table_decoder
+    from ui.binary_interpreter_fixed import BinaryInterpreterFixed
+    from ui.binary_interpreter_enhanced_v2 import BinaryInterpreterEnhancedV2
+except ImportError:
+    import binary_table_decoder
+    from binary_interpreter_fixed import BinaryInterpreterFixed
+    from binary_interpreter_enhanced_v2 import BinaryInterpreterEnhancedV2
+
+
+def legacy_tokens(interpreter, binary_code):
+    """Tradução original token a token de traduzir_binario."""
+    translated = []
+    for token in interpreter._tokenize_binary(interpreter._normalize_binary(binary_code)):
+        if token in interpreter.binary_to_text:
+            translated.append(interpreter.binary_to_text[token])
+        elif interpreter.binary_pattern.match(token):
+            translated.append(f"<{token}>")
+        else:
+            translated.append(token)
+    return translated
+
+
+def generate(interpreter, rng, lines, irregular):
+    """
+    Gera código binário com tokens da tabela e desconhecidos.
+
+    Args:
+        interpreter: Interpretador de onde vêm os tokens
+        rng: Gerador aleatório
+        lines: Quantidade de linhas
+        irregular: Se True, mistura espaços, comentários, grupos fora de 8 bits e lixo
+    """
+    tokens = list(interpreter.binary_to_text) + ["11111111", "00000000"]
+    noise = ["0101", "1", "0110000101", "01100001x", "2", "é", "abc", "01 10", "\t", "  "]
+    separators = [" ", "  ", "\t", " \t "]
+    output = []
+    for _ in range(lines):
+        # No formato canônico toda linha tem tokens (linhas vazias já saem do formato)
+        words = [rng.choice(tokens) for _ in range(rng.randrange(0 if irregular else 1, 12))]
+        if not irregular:
+            output.append(" ".join(words))
+            continue
+        if words and rng.random() < 0.3:
+            words.insert(rng.randrange(len(words)), rng.choice(noise))
+        line = "".join(word + rng.choice(separators) for word in words)
+        if rng.random() < 0.2:
+            line += "// comentário 0101 " + rng.choice(tokens)
+        elif rng.random() < 0.2:
+            line = " " + line
+        output.append(line)
+    return rng.choice(["\n", "\r\n"] if irregular else ["\n"]).join(output)
+
+
+class TestLegacyAgreement(unittest.TestCase):
+    """Os tokens do decodificador são os da tradução original."""
+
+    def assertDecodes(self, interpreter, source):
+        expected = legacy_tokens(interpreter, source)
+        decoder = interpreter.decoder
+        self.assertEqual(decoder.decode_tokens(source), expected)
+        self.assertEqual(decoder.decode(source), "".join(expected))
+        self.assertEqual(decoder.decode_tokens_with_offsets(source)[0], expected)
+
+    def check_interpreter(self, interpreter, seed):
+        rng = random.Random(seed)
+        for irregular in (False, True):
+            for _ in range(60):
+                source = generate(interpreter, rng, rng.randrange(1, 15), irregular)
+                for numpy_path in (True, False):
+                    with self.subTest(irregular=irregular, numpy=numpy_path, source=source):
+                        if numpy_path or binary_table_decoder.np is None:
+                            self.assertDecodes(interpreter, source)
+                        else:
+                            with mock.patch.object(binary_table_decoder, "np", None):
+                                self.assertDecodes(interpreter, source)
+
+    def test_fixed_interpreter(self):
+        interpreter = BinaryInterpreterFixed()
+        self.check_interpreter(interpreter, 1)
+        source = generate(interpreter, random.Random(2), 5, True)
+        self.assertEqual(interpreter.traduzir_binario(source), "".join(legacy_tokens(interpreter, source)))
+
+    def test_enhanced_interpreter(self):
+        self.check_interpreter(BinaryInterpreterEnhancedV2(), 3)
+
+    def test_large_canonical_input(self):
+        interpreter = BinaryInterpreterFixed()
+        source = generate(interpreter, random.Random(4), 5000, False)
+        self.assertEqual(interpreter.decoder.decode(source), "".join(legacy_tokens(interpreter, source)))
+
+    def test_edge_cases(self):
+        interpreter = BinaryInterpreterFixed()
+        for source in ("", "\n", "   ", "// só comentário", "01100001", "01100001\n", "\n01100001 ",
+                       "0110000", "011000010", "01100001  //x\n01100010", "x y z"):
+            with self.subTest(source=source):
+                self.assertDecodes(interpreter, source)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Testes do codificador de texto para código binário (BinaryTextEncoder).
+A referência é a conversão original de converter_para_binario (substituições e
+consulta token a token), reproduzida em legacy_encode. Em texto gerado em que as
+duas regras coincidem (tokens separados por espaço, a não ser junto dos símbolos
+que a conversão original já separava) a saída deve ser idêntica; as diferenças
+intencionais (operadores de vários caracteres, "print()" e espaços dentro de
+strings) são verificadas à parte.
+"""
+
+import random
+import re
+import unittest
+
+try:
+    from ui.binary_codec_registry import get_registry
+    from ui.binary_interpreter_enhanced_v2 import BinaryInterpreterEnhancedV2
+    from ui.binary_text_encoder import BinaryTextEncoder
+except ImportError:
+    from binary_codec_registry import get_registry
+    from binary_interpreter_enhanced_v2 import BinaryInterpreterEnhancedV2
+    from binary_text_encoder import BinaryTextEncoder
+
+# Símbolos que a conversão original cercava de espaços
+LEGACY_SYMBOLS = ['(', ')', ',', '+', '-', '*', '/', '=', '<', '>', ':', ';']
+
+
+def legacy_encode(text, text_to_binary):
+    """Conversão original de converter_para_binario."""
+    text = text.replace("print()", " print() ")
+    text = re.sub(r'print\(', 'print ( ', text)
+    text = re.sub(r'input\(', 'input ( ', text)
+    for symbol in LEGACY_SYMBOLS:
+        text = text.replace(symbol, f' {symbol} ')
+    binary_tokens = []
+    for token in ' '.join(text.split()).split():
+        if token in text_to_binary:
+            binary_tokens.append(text_to_binary[token])
+        else:
+            for char in token:
+                binary_tokens.append(text_to_binary.get(char, f"<{char}>"))
+    return ' '.join(binary_tokens)
+
+
+def generate(text_to_binary, rng, count):
+    """
+    Gera texto em que as duas conversões seguem a mesma regra.
+
+    Identificadores, números e palavras-chave são separados por espaço entre si e
+    dos símbolos; símbolos são separados entre si (nenhuma sequência forma um
+    operador de vários caracteres) e só podem encostar em palavras se a conversão
+    original os separava.
+    """
+    keywords = [text for text in text_to_binary if len(text) > 1 and text.isidentifier()]
+    symbols = [text for text in text_to_binary
+               if len(text) == 1 and not text.isalnum() and text not in "_\"'#" and not text.isspace()]
+    symbols.append("é")
+    items = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.3:
+            items.append(rng.choice(keywords))
+        elif kind < 0.55:
+            first = rng.choice("abcdefghijklmnopqrstuvwxyz_")
+            items.append(first + "".join(rng.choice("abcdefghijklmnopqrstuvwxyz_0123456789")
+                                         for _ in range(rng.randrange(6))))
+        elif kind < 0.65:
+            items.append(str(rng.randrange(1000)))
+        else:
+            items.append(rng.choice(symbols))
+
+    parts = [items[0]]
+    for previous, item in zip(items, items[1:]):
+        word_pair = previous[-1].isalnum() or previous[-1] == "_", item[0].isalnum() or item[0] == "_"
+        glued = word_pair[0] != word_pair[1] and (previous in LEGACY_SYMBOLS or item in LEGACY_SYMBOLS)
+        parts.append(rng.choice(["", " "]) if glued else rng.choice([" ", "  ", "\n", "\t"]))
+        parts.append(item)
+    return "".join(parts)
+
+
+class TestLegacyAgreement(unittest.TestCase):
+    """Saída idêntica à conversão original onde as regras coincidem."""
+
+    def test_interpreter_matches_legacy(self):
+        interpreter = BinaryInterpreterEnhancedV2()
+        rng = random.Random(11)
+        for _ in range(300):
+            text = generate(interpreter.text_to_binary, rng, rng.randrange(1, 40))
+            with self.subTest(text=text):
+                self.assertEqual(interpreter.converter_para_binario(text),
+                                 legacy_encode(text, interpreter.text_to_binary))
+
+    def test_dialects_match_legacy(self):
+        registry = get_registry()
+        rng = random.Random(12)
+        for name in registry.names():
+            table = registry.get(name).text_to_binary
+            encoder = BinaryTextEncoder(table)
+            for _ in range(100):
+                text = generate(table, rng, rng.randrange(1, 40))
+                with self.subTest(dialect=name, text=text):
+                    self.assertEqual(encoder.encode(text), legacy_encode(text, table))
+
+    def test_large_generated_text(self):
+        interpreter = BinaryInterpreterEnhancedV2()
+        text = generate(interpreter.text_to_binary, random.Random(13), 20000)
+        self.assertEqual(interpreter.converter_para_binario(text), legacy_encode(text, interpreter.text_to_binary))
+
+
+class TestIntendedDifferences(unittest.TestCase):
+    """Casos em que a conversão original perdia informação."""
+
+    def setUp(self):
+        self.interpreter = BinaryInterpreterEnhancedV2()
+        self.table = self.interpreter.text_to_binary
+
+    def test_multi_character_operators(self):
+        for operator in ("==", "**=", ">>=", "//"):
+            with self.subTest(operator=operator):
+                self.assertEqual(self.interpreter.converter_para_binario(f"a {operator} b"),
+                                 " ".join([self.table["a"], self.table[operator], self.table["b"]]))
+
+    def test_print_call_without_arguments(self):
+        self.assertEqual(self.interpreter.converter_para_binario("print()"), self.table["print()"])
+
+    def test_spaces_inside_strings(self):
+        encoded = self.interpreter.converter_para_binario('"a b"')
+        self.assertEqual(encoded, " ".join(self.table[char] for char in '"a b"'))
+
+    def test_irregular_table(self):
+        # Entradas com letras, espaços ou aspas junto de símbolos
+        table = {"a": "00000001", "+": "00000010", "+a": "00000100", "else if": "00000101",
+                 "'x": "00000110", "'": "00001000", "e": "00001101", "l": "00001110",
+                 "s": "00001111", "i": "00001011", "f": "00001100"}
+        encoder = BinaryTextEncoder(table)
+        self.assertEqual(encoder.encode("a +a"), "00000001 00000100")
+        self.assertEqual(encoder.encode("else if a"), "00000101 00000001")
+        self.assertEqual(encoder.encode("'x"), "00000110")
+
+
+if __name__ == "__main__":
+    unittest.main()
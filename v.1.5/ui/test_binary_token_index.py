@@ -0,0 +1,68 @@
+"""
+Testes do índice de tokens (BinaryTokenIndex): classificação de cada linha em
+uma passada (palavras conhecidas, de controle, de função e desconhecidas,
+strings e comentários) e linhas calculadas sob demanda depois de edições.
+"""
+
+import unittest
+
+try:
+    from ui.binary_token_index import (
+        BinaryTokenIndex, TOKEN_COMMENT, TOKEN_CONTROL, TOKEN_FUNCTION, TOKEN_INVALID, TOKEN_KEYWORD,
+        TOKEN_STRING
+    )
+except ImportError:
+    from binary_token_index import (
+        BinaryTokenIndex, TOKEN_COMMENT, TOKEN_CONTROL, TOKEN_FUNCTION, TOKEN_INVALID, TOKEN_KEYWORD,
+        TOKEN_STRING
+    )
+
+KEYWORDS = ("01100001", "11010000", "11011010")
+
+
+def _triples(tokens):
+    return [tuple(tokens[i:i + 3]) for i in range(0, len(tokens), 3)]
+
+
+class TestBinaryTokenIndex(unittest.TestCase):
+    """Tokens de cada linha e invalidação por edição."""
+
+    def setUp(self):
+        self.index = BinaryTokenIndex(KEYWORDS)
+
+    def test_scan_line_kinds(self):
+        line = '01100001 11010000 11011010 11111111 "01100001 0110" 0110 // 01100001 fim'
+        self.assertEqual(_triples(self.index.scan_line(line)), [
+            (0, 8, TOKEN_KEYWORD),
+            (9, 8, TOKEN_CONTROL),
+            (18, 8, TOKEN_FUNCTION),
+            (27, 8, TOKEN_INVALID),
+            (36, 15, TOKEN_STRING),
+            (57, 15, TOKEN_COMMENT),
+        ])
+        self.assertEqual(self.index.kind("11010000"), TOKEN_CONTROL)
+        self.assertEqual(self.index.kind("00000000"), TOKEN_INVALID)
+
+    def test_words_inside_longer_groups(self):
+        # Grupos de mais de 8 bits não contêm palavras
+        self.assertEqual(self.index.scan_line("011000010 101100001"), ())
+        self.assertEqual(self.index.scan_line(""), ())
+
+    def test_lines_on_demand(self):
+        lines = ["01100001", "11010000", "11011010"]
+        self.index.reset(len(lines))
+        self.assertEqual(len(self.index), 3)
+        self.assertIsNone(self.index.get(1))
+        self.assertEqual(self.index.scan(1, lines[1]), (0, 8, TOKEN_CONTROL))
+        self.assertEqual(self.index.get(1), (0, 8, TOKEN_CONTROL))
+
+        # Uma linha vira duas: as novas ficam por examinar e as demais mudam de posição
+        self.index.scan(2, lines[2])
+        self.index.replace_lines(0, 1, 2)
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual([self.index.get(i) for i in range(4)],
+                         [None, None, (0, 8, TOKEN_CONTROL), (0, 8, TOKEN_FUNCTION)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+Testes do validador linha a linha (IncrementalValidator) contra o tradutor
+(BinaryAstCompiler): os dois localizam palavras, comandos e operandos pelas
+mesmas regras (split_words e command_words), então comentários de editor (//),
+strings, comentários do dialeto e operandos de BINVAR/BINFUNC/BINLOOP/BININPUT
+não contam como BINSTART/BINEND em nenhum deles. As declarações do servidor LSP
+(declared_names) seguem a mesma regra. Depois de qualquer sequência de edições,
+os diagnósticos do validador incremental são os de uma validação nova.
+"""
+
+import random
+import unittest
+
+try:
+    from ui.binary_syntax_parser import BinarySyntaxParser
+    from ui.binary_validator import IncrementalValidator
+    from ui.binary_language_server import declared_names
+except ImportError:
+    from binary_syntax_parser import BinarySyntaxParser
+    from binary_validator import IncrementalValidator
+    from binary_language_server import declared_names
+
+# Códigos de diagnóstico de blocos e comandos (os de palavras inválidas ficam de fora)
+STRUCTURE_CODES = ("unbalanced-end", "unclosed-start", "incomplete")
+
+
+class TestValidatorAgreesWithTranslator(unittest.TestCase):
+    """Blocos e comandos incompletos vistos igualmente pelo validador e pelo tradutor."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = BinarySyntaxParser()
+        cls.compiler = cls.parser.ast_compiler
+
+    def setUp(self):
+        self.validator = IncrementalValidator(self.parser.binary_keywords)
+
+    def binary(self, *lines):
+        """Monta código binário a partir de linhas com as palavras da tabela separadas por espaços."""
+        table = self.parser.text_to_binary
+        return "\n".join(" ".join(table[word] for word in line.split()) for line in lines)
+
+    def structure(self, binary_code):
+        self.validator.set_lines(binary_code.split("\n"))
+        return [(d.line, d.code, d.message) for d in self.validator.diagnostics() if d.code in STRUCTURE_CODES]
+
+    def block_events(self, line):
+        return [step for _column, step in self.validator.check_line(line)[1]]
+
+    def test_editor_comment(self):
+        start = self.parser.text_to_binary["BINSTART"]
+        binary_code = self.binary("if x BINSTART y = 1") + " // " + start + "\n" + self.binary("BINEND")
+        self.assertEqual(self.structure(binary_code), [])
+        self.assertEqual(self.compiler.to_python(binary_code), "if x:\n    y = 1")
+        self.assertEqual(self.block_events(self.binary("x = 1") + "//" + start), [])
+
+    def test_incomplete_command(self):
+        for line in ("BINVAR x", "BINFUNC", "BINLOOP", "BININPUT"):
+            binary_code = self.binary(line)
+            with self.subTest(line=line):
+                with self.assertRaises(SyntaxError) as raised:
+                    self.compiler.parse(binary_code)
+                self.assertEqual(self.structure(binary_code), [(1, "incomplete", raised.exception.msg)])
+
+    def test_operands_are_not_commands(self):
+        # Nome de BINVAR/BINFUNC igual à palavra de um comando de bloco
+        for line in ("BINVAR BINSTART = 1", "BINFUNC BINEND"):
+            with self.subTest(line=line):
+                self.assertEqual(self.block_events(self.binary(line)), [])
+        self.assertEqual(self.compiler.to_python(self.binary("BINVAR BINSTART = 1")), "BINSTART = 1")
+
+    def test_print_arguments_end_at_next_command(self):
+        binary_code = self.binary("BINPRINT x BINSTART y = 1", "BINEND")
+        self.assertEqual(self.block_events(binary_code.split("\n")[0]), [1])
+        self.assertEqual(self.structure(binary_code), [])
+        with self.assertRaises(SyntaxError) as raised:
+            self.compiler.parse(binary_code)
+        self.assertNotIn("BINEND", raised.exception.msg)
+
+    def test_strings_and_comments(self):
+        start = self.parser.text_to_binary["BINSTART"]
+        lines = (
+            self.binary("x = 1 BINCOMMENT BINSTART"),
+            self.binary("x = 1 # BINSTART"),
+            self.binary('x = " BINSTART "'),
+        )
+        for line in lines:
+            with self.subTest(line=line):
+                self.assertIn(start, line)
+                self.assertEqual(self.block_events(line), [])
+                self.compiler.parse(line)
+
+    def test_unbalanced_blocks(self):
+        binary_code = self.binary("BINEND")
+        with self.assertRaises(SyntaxError) as raised:
+            self.compiler.parse(binary_code)
+        self.assertIn("BINEND", raised.exception.msg)
+        self.assertEqual([code for _line, code, _message in self.structure(binary_code)], ["unbalanced-end"])
+
+    def test_encoded_sources_have_no_structure_errors(self):
+        source = "def f(x):\n    if x:\n        return '// :'  # x:\n    return 0\n\nfor i in range(3):\n    f(i)\n"
+        binary_code = self.parser.parse_python_to_binary(source)
+        self.compiler.parse(binary_code)
+        self.assertEqual(self.structure(binary_code), [])
+
+
+class TestIncrementalValidation(unittest.TestCase):
+    """Edições sucessivas dão os mesmos diagnósticos que validar o texto de novo."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = BinarySyntaxParser()
+        table = cls.parser.text_to_binary
+        # Linhas com e sem BINSTART/BINEND, comandos incompletos e palavras inválidas
+        cls.lines = [" ".join(table[word] for word in line.split()) for line in (
+            "x = 1", "if x BINSTART", "BINEND", "BINEND BINELSE BINSTART y = 2", "BINVAR", "BINPRINT x",
+            "while x BINSTART BINEND", "BINCOMMENT BINSTART",
+        )] + ["", "0110 01100001", "11111111", "01100001 // " + table["BINEND"]]
+
+    def diagnostics(self, validator, limit=None):
+        return [(d.line, d.column, d.length, d.code, d.message) for d in validator.diagnostics(limit)]
+
+    def test_random_edits(self):
+        rng = random.Random(8)
+        keywords = self.parser.binary_keywords
+        lines = [rng.choice(self.lines) for _ in range(60)]
+        validator = IncrementalValidator(keywords)
+        validator.set_lines(list(lines))
+        for step in range(400):
+            first = rng.randrange(len(lines) + 1)
+            removed = rng.randrange(min(3, len(lines) - first) + 1)
+            new_lines = [rng.choice(self.lines) for _ in range(rng.randrange(3))]
+            lines[first:first + removed] = new_lines
+            validator.replace_lines(first, removed, new_lines)
+            if step % 3 == 0:
+                # Consultas intercaladas: parte das edições encontra o balanceamento já refeito
+                fresh = IncrementalValidator(keywords)
+                fresh.set_lines(lines)
+                with self.subTest(step=step):
+                    self.assertEqual(len(validator), len(lines))
+                    self.assertEqual(self.diagnostics(validator), self.diagnostics(fresh))
+                    self.assertEqual(self.diagnostics(validator, 5), self.diagnostics(fresh)[:5])
+
+
+class TestDeclaredNames(unittest.TestCase):
+    """Declarações do servidor LSP localizadas pelas regras do tradutor."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = BinarySyntaxParser()
+        cls.compiler = cls.parser.ast_compiler
+        cls.table = cls.parser.text_to_binary
+
+    def names(self, line):
+        binary_line = " ".join(self.table[word] for word in line.split())
+        return [(command, self.parser.binary_keywords[word]) for _column, command, _name_column, word
+                in declared_names(binary_line, self.compiler)]
+
+    def test_declarations(self):
+        self.assertEqual(self.names("BINVAR x = 1"), [("BINVAR", "x")])
+        self.assertEqual(self.names("BINFUNC f BINSTART BINVAR y = 2"), [("BINFUNC", "f"), ("BINVAR", "y")])
+
+    def test_ignored_declarations(self):
+        for line in ("BINVAR", "BINVAR x", "BINPRINT BINCOMMENT BINVAR x = 1", 'x = " BINVAR x "'):
+            with self.subTest(line=line):
+                self.assertEqual(self.names(line), [])
+        # O nome de uma declaração não é outra declaração
+        self.assertEqual(self.names("BINVAR BINFUNC = f"), [("BINVAR", "BINFUNC")])
+
+
+if __name__ == "__main__":
+    unittest.main()
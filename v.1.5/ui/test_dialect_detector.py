@@ -0,0 +1,139 @@
+"""
+Testes da detecção de dialeto (DialectDetector): o código gerado por cada
+interpretador é atribuído a ele, as pontuações são as mesmas com e sem NumPy, e
+a amostra só tem grupos de 8 bits fora de comentários (//), ampliando a janela
+quando o início não tem tokens suficientes. A memória por arquivo
+(DialectMemory) vale enquanto o arquivo não muda, a não ser para escolhas
+manuais.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    from ui import dialect_detector
+    from ui.binary_stream import create_engine
+    from ui.dialect_detector import DialectDetector, DialectMemory, DialectRouter
+except ImportError:
+    import dialect_detector
+    from binary_stream import create_engine
+    from dialect_detector import DialectDetector, DialectMemory, DialectRouter
+
+SOURCE = (
+    "def soma(a, b):\n"
+    "    if a != b:\n"
+    "        return a + b\n"
+    "    return a * 2\n"
+    "\n"
+    "for i in range(10):\n"
+    "    print(soma(i, 3))\n"
+)
+
+
+def _encode(dialect, source=SOURCE):
+    """Codifica o código Python com o interpretador do dialeto."""
+    engine = create_engine(dialect)
+    if dialect == "parser":
+        return engine.parse_python_to_binary(source)
+    return engine.converter_para_binario(source)
+
+
+class TestDialectDetector(unittest.TestCase):
+    """Escolha do dialeto pelo histograma dos primeiros tokens."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.detector = DialectDetector()
+        cls.samples = {dialect: _encode(dialect) for dialect in ("fixed", "enhanced", "parser")}
+
+    def test_detects_encoding_dialect(self):
+        for dialect, binary_code in self.samples.items():
+            with self.subTest(dialect=dialect):
+                self.assertEqual(self.detector.detect(binary_code), dialect)
+                # Só o início do código já basta
+                self.assertEqual(self.detector.detect(binary_code[:300]), dialect)
+
+    def test_scores_without_numpy(self):
+        if dialect_detector.np is None:
+            self.skipTest("NumPy não instalado")
+        with mock.patch.object(dialect_detector, "np", None):
+            detector = DialectDetector()
+            for dialect, binary_code in self.samples.items():
+                with self.subTest(dialect=dialect):
+                    plain = detector.scores(binary_code)
+                    for name, score in self.detector.scores(binary_code).items():
+                        self.assertAlmostEqual(plain[name], score)
+
+    def test_empty_code(self):
+        for binary_code in ("", "   \n", "// só comentário", "0110 abc"):
+            with self.subTest(binary_code=binary_code):
+                self.assertEqual(self.detector.detect(binary_code), self.detector.dialects[0])
+                self.assertEqual(self.detector.detect(binary_code, "parser"), "parser")
+
+    def test_sample(self):
+        detector = DialectDetector(sample_tokens=2)
+        values = detector.sample("// 01100001\n0110 011000011 01100010 abcdefgh 01100011 01100100")
+        self.assertEqual([int(value) for value in values], [0b01100010, 0b01100011])
+
+    def test_sample_widens_window(self):
+        detector = DialectDetector(sample_tokens=1)
+        # A primeira janela termina no meio do grupo, que não é contado cortado
+        self.assertEqual([int(value) for value in detector.sample("0110 0110 01100001")], [0b01100001])
+        binary_code = "// " + "x" * 200 + "\n01100001 01100010"
+        self.assertEqual([int(value) for value in detector.sample(binary_code)], [0b01100001])
+
+
+class TestDialectMemory(unittest.TestCase):
+    """Dialeto guardado por arquivo."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.memory_path = os.path.join(directory.name, "config", "dialects.json")
+        self.filepath = os.path.join(directory.name, "programa.bin")
+        with open(self.filepath, "w", encoding="utf-8") as file:
+            file.write(_encode("enhanced"))
+
+    def write(self, text):
+        with open(self.filepath, "w", encoding="utf-8") as file:
+            file.write(text)
+
+    def test_detected_choice_follows_file(self):
+        memory = DialectMemory(self.memory_path)
+        memory.remember(self.filepath, "enhanced")
+        self.assertEqual(DialectMemory(self.memory_path).get(self.filepath), "enhanced")
+        self.write("01100001")
+        self.assertIsNone(memory.get(self.filepath))
+
+    def test_manual_choice(self):
+        memory = DialectMemory(self.memory_path)
+        memory.remember(self.filepath, "parser", manual=True)
+        self.write("01100001")
+        self.assertEqual(DialectMemory(self.memory_path).get(self.filepath), "parser")
+        memory.forget(self.filepath)
+        self.assertIsNone(DialectMemory(self.memory_path).get(self.filepath))
+
+    def test_invalid_file(self):
+        os.makedirs(os.path.dirname(self.memory_path))
+        with open(self.memory_path, "w", encoding="utf-8") as file:
+            file.write("[1, 2")
+        self.assertEqual(DialectMemory(self.memory_path).entries, {})
+
+    def test_router(self):
+        router = DialectRouter(memory=DialectMemory(self.memory_path))
+        with open(self.filepath, encoding="utf-8") as file:
+            binary_code = file.read()
+        self.assertEqual(router.dialect_for(binary_code, self.filepath), "enhanced")
+        self.assertEqual(router.memory.get(self.filepath), "enhanced")
+        router.set_dialect(self.filepath, "parser")
+        self.assertEqual(router.dialect_for(binary_code, self.filepath), "parser")
+        with self.assertRaises(ValueError):
+            router.set_dialect(self.filepath, "inexistente")
+        router.set_dialect(self.filepath, None)
+        self.assertEqual(router.dialect_for(binary_code, self.filepath), "enhanced")
+
+
+if __name__ == "__main__":
+    unittest.main()
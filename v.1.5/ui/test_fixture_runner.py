@@ -0,0 +1,116 @@
+"""
+Testes do executor de casos .in/.out (fixture_runner): coleta recursiva dos
+casos, comparação da saída (ignorando espaços e linhas em branco no fim, a não
+ser no modo exato), situação de cada caso executado no SandboxRunner (aprovado,
+falhou, erro ou sem saída esperada) na ordem dos casos, e cancelamento.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+
+try:
+    from ui.fixture_runner import (
+        STATUS_ERROR, STATUS_FAILED, STATUS_NO_EXPECTED, STATUS_PASSED, collect_fixtures, outputs_match,
+        run_fixtures, summarize
+    )
+    from ui.sandbox_runner import SandboxRunner
+except ImportError:
+    from fixture_runner import (
+        STATUS_ERROR, STATUS_FAILED, STATUS_NO_EXPECTED, STATUS_PASSED, collect_fixtures, outputs_match,
+        run_fixtures, summarize
+    )
+    from sandbox_runner import SandboxRunner
+
+PROGRAM = "n = int(input())\nprint(n * 2)\n"
+
+# Casos: nome -> (entrada, saída esperada ou None)
+FIXTURES = {
+    "dobro": ("3\n", "6\n"),
+    "errado": ("4\n", "9\n"),
+    "espacos": ("1\n", "2  \n\n"),
+    "sem_saida": ("5\n", None),
+    os.path.join("grupo", "invalido"): ("x\n", "0\n"),
+}
+
+# Ordem dos casos: os arquivos de cada diretório, em ordem de nome, antes dos subdiretórios
+ORDER = ["dobro", "errado", "espacos", "sem_saida", os.path.join("grupo", "invalido")]
+
+
+class TestFixtureRunner(unittest.TestCase):
+    """Casos de teste executados contra um programa."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.runner = SandboxRunner()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.runner.shutdown()
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        os.mkdir(os.path.join(self.directory, "grupo"))
+        for name, (stdin, expected) in FIXTURES.items():
+            with open(os.path.join(self.directory, name + ".in"), "w", encoding="utf-8") as f:
+                f.write(stdin)
+            if expected is not None:
+                with open(os.path.join(self.directory, name + ".out"), "w", encoding="utf-8") as f:
+                    f.write(expected)
+        # Arquivo que não é caso de teste
+        open(os.path.join(self.directory, "notas.txt"), "w").close()
+
+    def run_cases(self, **options):
+        fixtures = collect_fixtures(self.directory)
+        return {result.name: result for result in run_fixtures(PROGRAM, fixtures, runner=self.runner, **options)}
+
+    def test_collect(self):
+        fixtures = collect_fixtures(self.directory)
+        self.assertEqual([fixture.name for fixture in fixtures], ORDER)
+        self.assertEqual({fixture.name: fixture.output_path is not None for fixture in fixtures},
+                         {name: expected is not None for name, (_stdin, expected) in FIXTURES.items()})
+
+    def test_outputs_match(self):
+        self.assertTrue(outputs_match("a\nb\n", "a  \nb\n\n\n"))
+        self.assertFalse(outputs_match("a\nb\n", "a  \nb\n", exact=True))
+        self.assertFalse(outputs_match("a\n\nb", "a\nb"))
+
+    def test_results(self):
+        results = self.run_cases(workers=2)
+        self.assertEqual(list(results), ORDER)
+        self.assertEqual({name: result.status for name, result in results.items()}, {
+            "dobro": STATUS_PASSED,
+            "errado": STATUS_FAILED,
+            "espacos": STATUS_PASSED,
+            "sem_saida": STATUS_NO_EXPECTED,
+            os.path.join("grupo", "invalido"): STATUS_ERROR,
+        })
+        self.assertEqual(results["sem_saida"].actual, "10\n")
+        self.assertIn("-9", results["errado"].diff())
+        self.assertIn("+8", results["errado"].diff())
+        self.assertEqual(results["dobro"].diff(), "")
+        self.assertIn("ValueError", results[os.path.join("grupo", "invalido")].stderr)
+        self.assertEqual(summarize(list(results.values())),
+                         "2/5 caso(s) aprovado(s), 1 falha(s), 1 erro(s), 1 sem saída esperada")
+
+    def test_exact(self):
+        results = self.run_cases(exact=True)
+        self.assertEqual(results["espacos"].status, STATUS_FAILED)
+        self.assertEqual(results["dobro"].status, STATUS_PASSED)
+
+    def test_cancelled(self):
+        cancel = threading.Event()
+        cancel.set()
+        results = self.run_cases(cancel=cancel)
+        self.assertTrue(all(result.status == STATUS_ERROR for result in results.values()))
+
+    def test_syntax_error(self):
+        with self.assertRaises(SyntaxError):
+            run_fixtures("print(", collect_fixtures(self.directory), runner=self.runner)
+
+
+if __name__ == "__main__":
+    unittest.main()
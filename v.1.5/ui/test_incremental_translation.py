@@ -0,0 +1,84 @@
+"""
+Testes da tradução incremental (IncrementalTranslation): depois de qualquer
+sequência de edições (inserções, remoções e substituições de linhas, com e sem
+BINSTART/BINEND), a tradução deve ser a mesma de uma tradução nova do texto
+editado, tanto lida por inteiro quanto só nas linhas visíveis.
+"""
+
+import random
+import unittest
+
+try:
+    from ui.binary_syntax_parser import BinarySyntaxParser
+    from ui.incremental_translation import IncrementalTranslation, RETRANSLATE_LIMIT
+except ImportError:
+    from binary_syntax_parser import BinarySyntaxParser
+    from incremental_translation import IncrementalTranslation, RETRANSLATE_LIMIT
+
+# Linhas do dialeto usadas nas edições (palavras da tabela separadas por espaços)
+LINES = (
+    "x = 1", "y = x + 2", "if x BINSTART", "BINEND", "while y BINSTART y = y - 1", "BINPRINT x",
+    "z = ( 1 ,", "2 )", "BINVAR w = 3", "BINEND BINELSE BINSTART", "pass", "",
+)
+
+
+class TestIncrementalTranslation(unittest.TestCase):
+    """Tradução incremental igual à tradução nova do texto editado."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = BinarySyntaxParser()
+
+    def binary(self, line):
+        table = self.parser.text_to_binary
+        return " ".join(table[word] for word in line.split())
+
+    def random_lines(self, rng, count):
+        return [self.binary(rng.choice(LINES)) for _ in range(count)]
+
+    def assertMatchesFresh(self, translation):
+        fresh = IncrementalTranslation(self.parser)
+        fresh.set_text("\n".join(translation.source_lines))
+        self.assertEqual(translation.text(), fresh.text())
+
+    def test_random_edits(self):
+        rng = random.Random(6)
+        translation = IncrementalTranslation(self.parser)
+        translation.set_text("\n".join(self.random_lines(rng, 80)))
+        for step in range(300):
+            first = rng.randrange(len(translation) + 1)
+            removed = rng.randrange(min(3, len(translation) - first) + 1)
+            translation.replace_lines(first, removed, self.random_lines(rng, rng.randrange(3)))
+            # Como na pré-visualização: só as linhas visíveis são pedidas depois de cada edição
+            translation.python_lines(first, first + 20)
+            if step % 25 == 0:
+                with self.subTest(step=step):
+                    self.assertMatchesFresh(translation)
+        self.assertMatchesFresh(translation)
+
+    def test_matches_full_translation(self):
+        rng = random.Random(7)
+        lines = [self.binary(line) for line in rng.choices(LINES[:-1], k=200)]
+        translation = IncrementalTranslation(self.parser)
+        translation.set_text("\n".join(lines))
+        for _ in range(50):
+            index = rng.randrange(len(lines))
+            lines[index] = self.binary(rng.choice(LINES[:-1]))
+            translation.replace_lines(index, 1, [lines[index]])
+            translation.python_lines(index, index + 10)
+        # Sem linhas em branco nas pontas, o resultado é idêntico à tradução completa
+        self.assertEqual(translation.text(), self.parser.parse_binary_to_python("\n".join(lines)))
+
+    def test_edit_beyond_retranslate_limit(self):
+        # Um BINSTART no início muda o nível de todas as linhas seguintes
+        lines = [self.binary("x = 1")] * (RETRANSLATE_LIMIT * 2)
+        translation = IncrementalTranslation(self.parser)
+        translation.set_text("\n".join(lines))
+        translation.text()
+        translation.replace_lines(0, 0, [self.binary("if x BINSTART")])
+        self.assertEqual(translation.indent_level(len(translation) - 1), 1)
+        self.assertMatchesFresh(translation)
+
+
+if __name__ == "__main__":
+    unittest.main()
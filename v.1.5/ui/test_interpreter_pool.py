@@ -0,0 +1,63 @@
+"""
+Testes do conjunto de interpretadores pré-iniciados (InterpreterPool): saída,
+entrada e código de saída de cada execução, isolamento entre execuções no mesmo
+trabalhador (builtins, sys.modules e threads), tempo limite e limite de saída.
+"""
+
+import os
+import unittest
+
+try:
+    from ui.interpreter_pool import InterpreterPool
+except ImportError:
+    from interpreter_pool import InterpreterPool
+
+
+class TestInterpreterPool(unittest.TestCase):
+    """Execuções no mesmo trabalhador não interferem umas nas outras."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Um único trabalhador: todas as execuções passam pelo mesmo processo
+        cls.pool = InterpreterPool(size=1, output_bytes=4096)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def test_output_input_and_returncode(self):
+        result = self.pool.run("nome = input()\nprint('ola', nome)\n", stdin="mundo\n")
+        self.assertEqual((result.stdout, result.returncode), ("ola mundo\n", 0))
+
+        result = self.pool.run("import sys\nprint('erro', file=sys.stderr)\nraise SystemExit(3)\n")
+        self.assertEqual((result.stderr, result.returncode), ("erro\n", 3))
+
+        result = self.pool.run("1 / 0\n")
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("ZeroDivisionError", result.stderr)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "sem fork o trabalhador roda o programa no próprio processo")
+    def test_runs_are_isolated(self):
+        self.pool.run("import builtins, sys\nbuiltins.len = lambda x: 42\nsys.modules['math'] = None\n")
+        result = self.pool.run("import math\nprint(len('abc'), math.floor(2.5))\n", timeout=5)
+        self.assertEqual((result.stdout, result.timed_out), ("3 2\n", False))
+
+        self.pool.run("import threading, time\n"
+                      "threading.Thread(target=lambda: (time.sleep(0.2), print('vazou')), daemon=True).start()\n")
+        result = self.pool.run("import time\ntime.sleep(0.4)\nprint('fim')\n", timeout=5)
+        self.assertEqual(result.stdout, "fim\n")
+
+    def test_timeout(self):
+        result = self.pool.run("while True:\n    pass\n", timeout=0.5)
+        self.assertTrue(result.timed_out)
+        self.assertEqual(self.pool.run("print(1)\n").stdout, "1\n")
+
+    def test_output_limit(self):
+        result = self.pool.run("while True:\n    print('x' * 100)\n", timeout=5)
+        self.assertFalse(result.timed_out)
+        self.assertLess(len(result.stdout), 4096 + 200)
+        self.assertIn("truncada", result.stdout + result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Testes do índice de linhas de arquivos grandes (LargeFileIndex): as linhas são
+as de text.split("\\n") (sem o "\\r" de arquivos Windows) com e sem NumPy e com
+blocos de qualquer tamanho, e a busca (texto ou expressão regular, a partir de
+uma linha e coluna, com ou sem recomeço) devolve linha, coluna e comprimento em
+caracteres, mesmo com texto não ASCII antes do trecho encontrado.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    from ui import large_file_index
+    from ui.large_file_index import LargeFileIndex
+except ImportError:
+    import large_file_index
+    from large_file_index import LargeFileIndex
+
+SOURCES = {
+    "vazio": "",
+    "uma_linha": "01100001 01100010",
+    "quebra_final": "a\nb\n",
+    "linhas_vazias": "\n\na\n\n",
+    "crlf": "a\r\nb\r\n\r\nc",
+    "nao_ascii": "ação\n🙂 x\nfim",
+}
+
+# Tamanhos de bloco da construção: menores que uma linha, do tamanho dela e o padrão
+BLOCK_SIZES = (1, 3, 7, large_file_index.INDEX_BLOCK_SIZE)
+
+
+class LargeFileTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def open_index(self, text, name="arquivo.bin"):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            file.write(text)
+        index = LargeFileIndex(path)
+        self.addCleanup(index.close)
+        index.build()
+        return index
+
+
+class TestLines(LargeFileTestCase):
+    """Linhas do índice iguais às de text.split("\\n")."""
+
+    def assertLinesMatch(self, text):
+        expected = [line[:-1] if line.endswith("\r") else line for line in text.split("\n")]
+        index = self.open_index(text)
+        self.assertEqual(index.line_count, len(expected))
+        self.assertEqual(index.lines(0, len(expected)), expected)
+        encoded = text.encode("utf-8")
+        for number in range(index.line_count):
+            offset = index.line_offset(number)
+            self.assertEqual(index.line_of_offset(offset), number)
+            self.assertEqual(encoded[offset:].decode("utf-8").split("\n")[0].rstrip("\r"), expected[number])
+
+    def test_sources(self):
+        for numpy_path in (True, False):
+            for block_size in BLOCK_SIZES:
+                for name, text in SOURCES.items():
+                    with self.subTest(source=name, numpy=numpy_path, block_size=block_size), \
+                            mock.patch.object(large_file_index, "INDEX_BLOCK_SIZE", block_size):
+                        if numpy_path or large_file_index.np is None:
+                            self.assertLinesMatch(text)
+                        else:
+                            with mock.patch.object(large_file_index, "np", None):
+                                self.assertLinesMatch(text)
+
+    def test_generated(self):
+        rng = random.Random(10)
+        words = [format(value, "08b") for value in range(32, 127)] + ["ção", "// x", ""]
+        text = "\n".join(" ".join(rng.choice(words) for _ in range(rng.randrange(20))) for _ in range(500))
+        with mock.patch.object(large_file_index, "INDEX_BLOCK_SIZE", 1000):
+            self.assertLinesMatch(text)
+
+    def test_window_and_limit(self):
+        index = self.open_index("\n".join(f"linha {number}" for number in range(100)))
+        self.assertEqual(index.lines(98, 200), ["linha 98", "linha 99"])
+        self.assertEqual(index.lines(-5, 2), ["linha 0", "linha 1"])
+        self.assertEqual(index.line(42, limit=3), "lin")
+        self.assertEqual(len(index), 100)
+
+    def test_progress(self):
+        calls = []
+        path = os.path.join(self.directory.name, "progresso.bin")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("a\n" * 10)
+        with mock.patch.object(large_file_index, "INDEX_BLOCK_SIZE", 8), LargeFileIndex(path) as index:
+            index.build(lambda done, total: calls.append((done, total)))
+        self.assertEqual(calls, [(8, 20), (16, 20), (20, 20)])
+
+
+class TestSearch(LargeFileTestCase):
+    """Busca direta no arquivo mapeado."""
+
+    def setUp(self):
+        super().setUp()
+        self.index = self.open_index("alfa beta\nção gama beta\r\n\nbeta 🙂 gama\nfim")
+
+    def test_literal(self):
+        self.assertEqual(self.index.search("beta"), (0, 5, 4))
+        self.assertEqual(self.index.search("beta", 0, 6), (1, 9, 4))
+        # Colunas em caracteres, com texto não ASCII antes do trecho
+        self.assertEqual(self.index.search("gama"), (1, 4, 4))
+        self.assertEqual(self.index.search("gama", 2), (3, 7, 4))
+        self.assertEqual(self.index.search("🙂 g"), (3, 5, 3))
+
+    def test_wrap(self):
+        self.assertEqual(self.index.search("alfa", 3), (0, 0, 4))
+        self.assertIsNone(self.index.search("alfa", 3, wrap=False))
+        self.assertIsNone(self.index.search("inexistente"))
+        self.assertIsNone(self.index.search(""))
+
+    def test_regex(self):
+        self.assertEqual(self.index.search(r"g\w+a", regex=True), (1, 4, 4))
+        self.assertEqual(self.index.search(r"(?m)^fim$", regex=True), (4, 0, 3))
+
+    def test_not_built(self):
+        path = os.path.join(self.directory.name, "sem_indice.bin")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("beta")
+        with LargeFileIndex(path) as index:
+            self.assertEqual(index.line_count, 0)
+            self.assertIsNone(index.search("beta"))
+
+
+if __name__ == "__main__":
+    unittest.main()
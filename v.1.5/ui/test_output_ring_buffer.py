@@ -0,0 +1,94 @@
+"""
+Testes do buffer circular da saída do terminal (OutputRingBuffer): cada fluxo é
+decodificado de forma incremental (caracteres de vários bytes divididos entre
+blocos chegam inteiros), e o que é retirado a cada quadro é o texto acumulado
+ou, quando ele passou do limite de linhas ou de caracteres, as suas últimas
+linhas para substituir o conteúdo, como se o texto inteiro tivesse sido guardado.
+"""
+
+import random
+import unittest
+
+try:
+    from ui.output_ring_buffer import OutputRingBuffer
+except ImportError:
+    from output_ring_buffer import OutputRingBuffer
+
+
+def _expected_take(text, max_lines, max_chars):
+    """Retirada esperada para o texto acumulado desde a última: (substituir, texto)."""
+    if text.count("\n") < max_lines and len(text) <= max_chars:
+        return False, text
+    return True, "\n".join(text[-max_chars:].split("\n")[-max_lines:])
+
+
+class TestOutputRingBuffer(unittest.TestCase):
+    """Texto retirado a cada quadro."""
+
+    def test_append(self):
+        buffer = OutputRingBuffer(max_lines=10)
+        self.assertEqual(buffer.take(), (False, ""))
+        buffer.feed(b"ola\n")
+        buffer.feed(b"mundo")
+        self.assertTrue(buffer.pending())
+        self.assertEqual(buffer.take(), (False, "ola\nmundo"))
+        self.assertFalse(buffer.pending())
+        self.assertEqual(buffer.take(), (False, ""))
+        self.assertEqual(buffer.total_bytes, 9)
+
+    def test_split_characters(self):
+        buffer = OutputRingBuffer()
+        data = "ação 🙂\n".encode("utf-8")
+        for position in range(len(data)):
+            buffer.feed(data[position:position + 1])
+        self.assertEqual(buffer.take(), (False, "ação 🙂\n"))
+
+    def test_sources_have_own_decoders(self):
+        buffer = OutputRingBuffer()
+        data = "é".encode("utf-8")
+        buffer.feed(data[:1], "stdout")
+        buffer.feed(b"erro ", "stderr")
+        buffer.feed(data[1:], "stdout")
+        self.assertEqual(buffer.take(), (False, "erro é"))
+        buffer.feed(b"\xff")
+        self.assertEqual(buffer.take(), (False, "�"))
+
+    def test_line_limit(self):
+        buffer = OutputRingBuffer(max_lines=3)
+        for number in range(10):
+            buffer.feed(f"linha {number}\n".encode())
+        self.assertEqual(buffer.take(), (True, "linha 8\nlinha 9\n"))
+        self.assertGreater(buffer.dropped_chars, 0)
+        buffer.feed(b"nova\n")
+        self.assertEqual(buffer.take(), (False, "nova\n"))
+
+    def test_char_limit(self):
+        buffer = OutputRingBuffer(max_chars=10)
+        buffer.feed(b"0123456789abcdef")
+        self.assertEqual(buffer.take(), (True, "6789abcdef"))
+
+    def test_clear(self):
+        buffer = OutputRingBuffer()
+        buffer.feed("é".encode("utf-8")[:1])
+        buffer.feed(b"x\n", "stderr")
+        buffer.clear()
+        self.assertFalse(buffer.pending())
+        # O byte pendente do decodificador também é descartado
+        buffer.feed(b"a")
+        self.assertEqual(buffer.take(), (False, "a"))
+
+    def test_random_frames(self):
+        rng = random.Random(23)
+        pieces = ["x", "linha\n", "\n\n", "ção", "texto longo " * 5, "a\nb\nc\n"]
+        for max_lines, max_chars in ((1, 1000), (4, 1000), (50, 40), (1000, 1000)):
+            buffer = OutputRingBuffer(max_lines=max_lines, max_chars=max_chars)
+            for frame in range(200):
+                text = "".join(rng.choice(pieces) for _ in range(rng.randrange(12)))
+                for position in range(0, len(text), 7):
+                    buffer.feed_text(text[position:position + 7])
+                with self.subTest(max_lines=max_lines, max_chars=max_chars, frame=frame):
+                    self.assertEqual(buffer.take(), _expected_take(text, max_lines, max_chars))
+
+
+if __name__ == "__main__":
+    unittest.main()
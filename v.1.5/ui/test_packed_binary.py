@@ -0,0 +1,132 @@
+"""
+Testes do formato compactado (.binp): a conversão de e para o texto é exata para
+qualquer conteúdo (tokens canônicos, comentários //, espaços extras, palavras
+inválidas, caracteres não ASCII, CRLF e linhas vazias), inclusive quando uma
+linha atravessa a janela de reconstrução; os tokens lidos por mmap são os bytes
+das palavras de 8 bits, e arquivos inválidos geram PackedFormatError.
+"""
+
+import io
+import os
+import random
+import tempfile
+import unittest
+
+try:
+    from ui.packed_binary import (
+        MAGIC, PackedBinaryFile, PackedFormatError, is_packed_file, iter_text_lines, pack_text,
+        read_binary_source, unpack_bytes, write_packed
+    )
+except ImportError:
+    from packed_binary import (
+        MAGIC, PackedBinaryFile, PackedFormatError, is_packed_file, iter_text_lines, pack_text,
+        read_binary_source, unpack_bytes, write_packed
+    )
+
+SOURCES = {
+    "vazio": "",
+    "quebra_final": "01100001 01100010\n",
+    "canonico": "01100001 01100010\n01100011\n\n01100100",
+    "comentarios": "01100001 // comentário 01100010\n// só comentário\n01100011//x",
+    "espacos": "  01100001\t01100010   01100011  \n01100100  ",
+    "invalidas": "0110 01100001 011000010 01100001x é 2\n11111111 00000000",
+    "crlf": "01100001 01100010\r\n01100011\r\n",
+    "nao_ascii": "01100001 ação 🙂 01100010\n\udcff",
+}
+
+
+def _generate(rng, lines):
+    """Gera código binário com tokens, comentários e trechos fora do formato canônico."""
+    words = [format(value, "08b") for value in range(256)]
+    noise = ["// comentário", "  ", "0101", "x", "é", "\t01100001"]
+    output = []
+    for _ in range(lines):
+        line = " ".join(rng.choice(words) for _ in range(rng.randrange(0, 20)))
+        if rng.random() < 0.2:
+            line += rng.choice(noise)
+        output.append(line)
+    return "\n".join(output)
+
+
+class TestPackedRoundTrip(unittest.TestCase):
+    """Texto -> .binp -> texto sem perda."""
+
+    def test_sources(self):
+        for name, text in SOURCES.items():
+            with self.subTest(source=name):
+                self.assertEqual(unpack_bytes(pack_text(text)), text)
+
+    def test_generated(self):
+        rng = random.Random(9)
+        for _ in range(50):
+            text = _generate(rng, rng.randrange(1, 40))
+            with self.subTest(text=text):
+                self.assertEqual(unpack_bytes(pack_text(text)), text)
+
+    def test_line_across_reconstruction_window(self):
+        # Mais tokens que uma janela de reconstrução, em linhas longas e curtas
+        line = " ".join(format(value % 256, "08b") for value in range(50000))
+        text = "\n".join([line, "01100001", line, "// fim"])
+        self.assertEqual(unpack_bytes(pack_text(text)), text)
+
+    def test_tokens_are_bytes(self):
+        data = pack_text("01100001 01100010 // 01100011\n0110 01100100\n11111111")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "programa.binp")
+            with open(path, "wb") as file:
+                file.write(data)
+            with PackedBinaryFile(path) as packed:
+                # Só os tokens do início canônico de cada linha vão para a área de tokens
+                self.assertEqual(bytes(packed.tokens()), b"ab\xff")
+                self.assertEqual(packed.line_count, 3)
+
+    def test_files(self):
+        text = SOURCES["comentarios"] + "\n" + SOURCES["nao_ascii"]
+        with tempfile.TemporaryDirectory() as directory:
+            text_path = os.path.join(directory, "programa.bin")
+            packed_path = os.path.join(directory, "programa.binp")
+            with open(text_path, "w", encoding="utf-8", newline="", errors="surrogatepass") as file:
+                file.write(text)
+            with open(text_path, "r", encoding="utf-8", newline="", errors="surrogatepass") as file:
+                size = write_packed(packed_path, iter_text_lines(file))
+            self.assertEqual(os.path.getsize(packed_path), size)
+            self.assertFalse(os.path.exists(packed_path + ".tmp"))
+
+            self.assertTrue(is_packed_file(packed_path))
+            self.assertFalse(is_packed_file(text_path))
+            self.assertEqual(read_binary_source(packed_path), text)
+            with PackedBinaryFile(packed_path) as packed:
+                self.assertEqual(list(packed.iter_lines()), text.split("\n"))
+
+    def test_iter_text_lines(self):
+        for text in ("", "a", "a\n", "a\nb", "a\n\nb\n"):
+            with self.subTest(text=text):
+                self.assertEqual(list(iter_text_lines(io.StringIO(text, newline=""))), text.split("\n"))
+
+
+class TestPackedErrors(unittest.TestCase):
+    """Arquivos que não estão no formato ou estão corrompidos."""
+
+    def test_invalid_data(self):
+        data = pack_text("01100001 01100010\n// x")
+        for name, broken in (("assinatura", b"XXXX" + data[4:]), ("versao", data[:4] + b"\x09" + data[5:]),
+                             ("cabecalho", data[:10]), ("tokens", data[:-6][:25]), ("anexo", data[:-2])):
+            with self.subTest(case=name):
+                with self.assertRaises(PackedFormatError):
+                    unpack_bytes(broken)
+
+    def test_empty_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "vazio.binp")
+            open(path, "wb").close()
+            with self.assertRaises(PackedFormatError):
+                PackedBinaryFile(path)
+            self.assertFalse(is_packed_file(path))
+            self.assertFalse(is_packed_file(os.path.join(directory, "inexistente.binp")))
+
+    def test_signature(self):
+        self.assertEqual(pack_text("01100001")[:len(MAGIC)], MAGIC)
+
+
+if __name__ == "__main__":
+    unittest.main()
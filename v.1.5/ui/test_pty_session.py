@@ -0,0 +1,135 @@
+"""
+Testes das sessões de terminal (PtySession), só no Linux: o programa se vê em um
+terminal (saída linha a linha sem flush, tamanho da janela, eco e Ctrl+C pela
+disciplina de linha), o código de saída chega ao on_exit, e sem confirmação dos
+bytes recebidos a leitura para perto do limite de bytes pendentes, com o
+programa bloqueado na escrita, até o consumidor confirmar o que tratou.
+"""
+
+import signal
+import sys
+import threading
+import time
+import unittest
+
+try:
+    from ui.pty_session import PTY_AVAILABLE, READ_SIZE, PtySession
+except ImportError:
+    from pty_session import PTY_AVAILABLE, READ_SIZE, PtySession
+
+# Espera máxima por um evento da sessão (segundos)
+TIMEOUT = 10.0
+
+
+class _Recorder:
+    """Guarda a saída e o código de saída entregues pela thread de leitura."""
+
+    def __init__(self):
+        self.chunks = []
+        self.returncode = None
+        self.exited = threading.Event()
+        self._changed = threading.Condition()
+
+    def on_output(self, data):
+        with self._changed:
+            self.chunks.append(data)
+            self._changed.notify_all()
+
+    def on_exit(self, returncode):
+        self.returncode = returncode
+        self.exited.set()
+
+    @property
+    def output(self):
+        with self._changed:
+            return b"".join(self.chunks)
+
+    def wait_for(self, text, timeout=TIMEOUT):
+        """Espera até a saída conter o texto."""
+        with self._changed:
+            return self._changed.wait_for(lambda: text in b"".join(self.chunks), timeout)
+
+
+@unittest.skipUnless(PTY_AVAILABLE, "pseudoterminais só são usados no Linux")
+class TestPtySession(unittest.TestCase):
+    """Processo ligado a um pseudoterminal."""
+
+    def start(self, code, **options):
+        recorder = _Recorder()
+        session = PtySession([sys.executable, "-c", code], on_output=recorder.on_output,
+                             on_exit=recorder.on_exit, **options)
+        session.start()
+        self.addCleanup(session.terminate)
+        return session, recorder
+
+    def test_output_and_exit_code(self):
+        _session, recorder = self.start("import sys; print('ola', sys.stdout.isatty()); sys.exit(3)")
+        self.assertTrue(recorder.exited.wait(TIMEOUT))
+        self.assertEqual(recorder.output, b"ola True\n")
+        self.assertEqual(recorder.returncode, 3)
+
+    def test_line_without_flush(self):
+        # No terminal a saída é por linha: a linha chega antes do fim do programa
+        session, recorder = self.start("import time; print('pronto'); time.sleep(30)")
+        self.assertTrue(recorder.wait_for(b"pronto\n"))
+        self.assertTrue(session.is_running())
+
+    def test_window_size(self):
+        code = ("import os, signal, sys\n"
+                "signal.signal(signal.SIGWINCH, lambda *a: print('janela', *os.get_terminal_size(0)))\n"
+                "print('janela', *os.get_terminal_size(0))\n"
+                "sys.stdin.readline()\n")
+        session, recorder = self.start(code, rows=30, columns=100)
+        self.assertTrue(recorder.wait_for(b"janela 100 30\n"))
+        session.resize(40, 120)
+        self.assertTrue(recorder.wait_for(b"janela 120 40\n"))
+
+    def test_input_and_interrupt(self):
+        code = ("import signal, sys\n"
+                "signal.signal(signal.SIGINT, signal.SIG_DFL)\n"
+                "print('lido', sys.stdin.readline().strip(), flush=True)\n"
+                "sys.stdin.readline()\n")
+        session, recorder = self.start(code)
+        session.write(b"abc\n")
+        # O eco da disciplina de linha e a resposta do programa
+        self.assertTrue(recorder.wait_for(b"abc\nlido abc\n"))
+        session.interrupt()
+        self.assertTrue(recorder.exited.wait(TIMEOUT))
+        self.assertEqual(recorder.returncode, -signal.SIGINT)
+
+    def test_flow_control(self):
+        size = 4 * 1024 * 1024
+        high_water = 16 * 1024
+        code = f"import sys; sys.stdout.buffer.write(b'x' * {size})"
+        session, recorder = self.start(code, high_water=high_water)
+
+        # Sem confirmação a leitura para: no máximo uma leitura passa do limite
+        self.assertTrue(recorder.wait_for(b"x"))
+        time.sleep(0.5)
+        received = len(recorder.output)
+        self.assertLess(received, high_water + READ_SIZE)
+        self.assertTrue(session.is_running())
+        self.assertFalse(recorder.exited.is_set())
+
+        acknowledged = 0
+        deadline = time.monotonic() + TIMEOUT
+        while not recorder.exited.wait(0.01) and time.monotonic() < deadline:
+            total = len(recorder.output)
+            session.acknowledge(total - acknowledged)
+            acknowledged = total
+        self.assertTrue(recorder.exited.is_set())
+        self.assertEqual(recorder.output, b"x" * size)
+        self.assertEqual(recorder.returncode, 0)
+
+    def test_terminate(self):
+        session, recorder = self.start("import time; print('pronto'); time.sleep(30)")
+        self.assertTrue(recorder.wait_for(b"pronto\n"))
+        session.terminate()
+        self.assertFalse(session.is_running())
+        # Encerrada pelo usuário: on_exit não é chamado e a escrita falha
+        self.assertFalse(recorder.exited.is_set())
+        self.assertEqual(session.write(b"x"), -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Testes do codificador de Python para binário guiado pelo tokenize
+(PythonTokenEncoder): cada linha do código gera exatamente uma linha binária, o
+código traduzido de volta tem a mesma árvore sintática do original, e código que
+o tokenize não aceita segue caractere a caractere com BINSTART/BINEND
+balanceados.
+"""
+
+import ast
+import unittest
+
+try:
+    from ui.binary_syntax_parser import BinarySyntaxParser
+except ImportError:
+    from binary_syntax_parser import BinarySyntaxParser
+
+SOURCES = {
+    "vazio": "",
+    "atribuicao": "x = 1\ny = x + 2\n",
+    "blocos": "def f(x):\n    if x >= 10:\n        return x ** 2\n    else:\n        return -x\n\nprint(f(3))\n",
+    "aninhados_no_fim": "for i in range(3):\n    while i:\n        i -= 1",
+    "comentarios": "# início\nx = 1  # valor\n\n    # recuado\ny = 2\n",
+    "strings": "s = 'a: b # c'\nt = \"\"\"várias\nlinhas: x\n\"\"\"\nprint(s, t)\n",
+    "continuacao": "x = (1,\n     2)\ny = [\n    3,\n]\n",
+    "bloco_em_linha": "if x: y = 1\nz = 2\n",
+    "nao_ascii": "ação = 'ç 🙂'\nprint(ação)\n",
+}
+
+# Código que o tokenize não aceita
+INVALID_SOURCES = {
+    "string_sem_fim": "def f():\n    x = 'abc\n    return x",
+    "parentese_aberto": "if x:\n    y = (1,\n",
+    "recuo_inconsistente": "if x:\n        y = 1\n    z = 2\n",
+}
+
+
+class TestPythonTokenEncoder(unittest.TestCase):
+    """Linhas e blocos da codificação de código Python."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = BinarySyntaxParser()
+        cls.encoder = cls.parser.python_encoder
+        cls.compiler = cls.parser.ast_compiler
+
+    def assertBalanced(self, binary_lines):
+        tokens = " ".join(binary_lines).split()
+        self.assertEqual(tokens.count(self.encoder.block_start), tokens.count(self.encoder.block_end))
+
+    def test_one_line_per_line(self):
+        for name, source in {**SOURCES, **INVALID_SOURCES}.items():
+            with self.subTest(source=name):
+                lines = source.splitlines()
+                binary_lines = list(self.encoder.iter_lines(lines))
+                self.assertEqual(len(binary_lines), len(lines))
+                self.assertEqual("\n".join(binary_lines), self.encoder.encode(source))
+                self.assertBalanced(binary_lines)
+
+    def test_round_trip(self):
+        for name, source in SOURCES.items():
+            with self.subTest(source=name):
+                python_code = self.compiler.to_python(self.encoder.encode(source))
+                self.assertEqual(ast.dump(ast.parse(python_code)), ast.dump(ast.parse(source)))
+
+    def test_lines_read_on_demand(self):
+        read = []
+
+        def lines():
+            for number in range(1000):
+                read.append(number)
+                yield f"x{number} = {number}"
+
+        binary_lines = self.encoder.iter_lines(lines())
+        next(binary_lines)
+        # O tokenize lê no máximo uma linha à frente da que foi produzida
+        self.assertLessEqual(len(read), 2)
+        self.assertEqual(len(list(binary_lines)), 999)
+
+    def test_comment(self):
+        binary_line = self.encoder.encode("# ab")
+        self.assertEqual(binary_line.split(), [self.encoder.comment, self.parser.text_to_binary["a"],
+                                               self.parser.text_to_binary["b"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
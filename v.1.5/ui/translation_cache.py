@@ -0,0 +1,477 @@
+"""
+Módulo de cache de traduções e de código compilado endereçado por conteúdo.
+Cada entrada é identificada pelo hash do dialeto (tabela de tradução e código
+do tradutor) e do texto de origem, de modo que reexecutar ou retraduzir um
+código inalterado não repete a tradução nem a compilação, e uma nova versão do
+tradutor não reaproveita traduções antigas.
+O cache fica em memória (LRU limitado por bytes) e, opcionalmente, em disco
+no diretório ~/.the_collector_binarie/cache, também limitado por bytes: a data
+de modificação de cada arquivo marca o último uso, e os menos usados são
+removidos quando o limite é ultrapassado.
+"""
+
+import os
+import re
+import sys
+import hashlib
+import marshal
+import tempfile
+import threading
+import importlib.util
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+from weakref import WeakKeyDictionary
+
+# Orçamento padrão do cache em memória (64 MB)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Orçamento padrão do cache em disco (256 MB) e fração mantida após a limpeza
+DEFAULT_DISK_MAX_BYTES = 256 * 1024 * 1024
+DISK_PRUNE_TARGET = 0.8
+
+# Nome de arquivo usado na compilação do código traduzido
+DEFAULT_FILENAME = "<binario>"
+
+
+def default_cache_dir() -> str:
+    """Retorna o diretório padrão do cache em disco."""
+    return os.path.join(os.path.expanduser("~"), ".the_collector_binarie", "cache")
+
+
+# Importações de módulos vizinhos no código de um tradutor (inclusive as feitas dentro de funções)
+_IMPORT_PATTERN = re.compile(rb"^[ \t]*(?:from[ \t]+ui[ \t]+import[ \t]+(\w+)|from[ \t]+(?:ui\.)?(\w+)[ \t]+import"
+                             rb"|import[ \t]+(?:ui\.)?(\w+))", re.MULTILINE)
+
+_translator_versions = {}
+_translator_versions_lock = threading.Lock()
+
+
+def translator_version(cls) -> bytes:
+    """
+    Calcula a versão do código de um tradutor: o hash do código-fonte do módulo
+    da classe e dos módulos do mesmo diretório que ele importa (decodificadores,
+    compilador da árvore sintática, ...), seguidos transitivamente.
+
+    Args:
+        cls: Classe do interpretador
+
+    Returns:
+        Hash do código dos módulos
+    """
+    with _translator_versions_lock:
+        version = _translator_versions.get(cls)
+        if version is not None:
+            return version
+
+    digest = hashlib.sha256()
+    module = sys.modules.get(cls.__module__)
+    root = getattr(module, "__file__", None)
+    if getattr(sys, "frozen", False) or not root or not os.path.isfile(root):
+        # Executável empacotado: o código acompanha o executável
+        try:
+            info = os.stat(sys.executable)
+            digest.update(f"{sys.executable}:{info.st_size}:{info.st_mtime_ns}".encode("utf-8"))
+        except OSError:
+            pass
+        digest.update(cls.__module__.encode("utf-8"))
+    else:
+        directory = os.path.dirname(os.path.abspath(root))
+        pending, seen = [os.path.abspath(root)], set()
+        while pending:
+            path = pending.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            try:
+                with open(path, "rb") as f:
+                    source = f.read()
+            except OSError:
+                continue
+            digest.update(os.path.basename(path).encode("utf-8") + b"\0" + source)
+            for match in _IMPORT_PATTERN.finditer(source):
+                name = next(group for group in match.groups() if group).decode("ascii")
+                dependency = os.path.join(directory, name + ".py")
+                if dependency not in seen and os.path.isfile(dependency):
+                    pending.append(dependency)
+    version = digest.digest()
+    with _translator_versions_lock:
+        _translator_versions[cls] = version
+    return version
+
+
+class TranslationCache:
+    """
+    Cache de traduções (binário -> Python) e de objetos de código compilados.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, cache_dir: Optional[str] = None,
+                 disk_max_bytes: int = DEFAULT_DISK_MAX_BYTES):
+        """
+        Inicializa o cache.
+
+        Args:
+            max_bytes: Tamanho máximo aproximado das entradas em memória
+            cache_dir: Diretório do cache em disco. Se None, o cache fica só em memória
+            disk_max_bytes: Tamanho máximo do cache em disco
+        """
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.current_bytes = 0
+
+        self._entries = OrderedDict()
+        self._dialects = WeakKeyDictionary()
+        self._lock = threading.Lock()
+        # Ocupação do disco: medida na primeira gravação e acompanhada depois
+        self._disk_bytes = None
+        self._disk_lock = threading.Lock()
+
+        # Contadores para ajuste do cache
+        self.stats = {
+            "translation_hits": 0,
+            "translation_misses": 0,
+            "compile_hits": 0,
+            "compile_misses": 0,
+            "disk_hits": 0,
+            "evictions": 0,
+            "disk_evictions": 0,
+        }
+
+        if self.cache_dir:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            except OSError:
+                # Sem permissão de escrita: continua apenas em memória
+                self.cache_dir = None
+
+    def dialect_key(self, interpreter) -> bytes:
+        """
+        Calcula a impressão digital do dialeto de um interpretador.
+
+        Args:
+            interpreter: Interpretador com binary_to_text ou binary_keywords
+
+        Returns:
+            Hash da classe, do código do tradutor e da tabela de tradução
+        """
+        try:
+            return self._dialects[interpreter]
+        except (KeyError, TypeError):
+            pass
+
+        # A classe entra no hash porque a formatação da saída varia entre interpretadores
+        digest = hashlib.sha256()
+        digest.update(f"{type(interpreter).__module__}.{type(interpreter).__qualname__}".encode("utf-8"))
+        # O cache em disco sobrevive a atualizações: uma mudança no tradutor muda a chave
+        digest.update(translator_version(type(interpreter)))
+
+        codec = getattr(interpreter, "codec", None)
+        if codec is not None:
+            # Dialeto do registro compartilhado: a impressão digital já vem calculada
+            digest.update(codec.fingerprint)
+        else:
+            table = getattr(interpreter, "binary_to_text", None)
+            if table is None:
+                table = getattr(interpreter, "binary_keywords", {})
+            digest.update(repr(sorted(table.items())).encode("utf-8", "surrogatepass"))
+        key = digest.digest()
+
+        try:
+            self._dialects[interpreter] = key
+        except TypeError:
+            pass
+        return key
+
+    def translate(self, interpreter, source: str, translate: Optional[Callable[[str], str]] = None) -> str:
+        """
+        Traduz o código usando o cache.
+
+        Args:
+            interpreter: Interpretador que define o dialeto
+            source: Código binário
+            translate: Função de tradução (padrão: interpreter.traduzir_binario)
+
+        Returns:
+            Código Python traduzido
+        """
+        key = "t" + self._content_key(self.dialect_key(interpreter), source)
+
+        python_code = self._get(key)
+        if python_code is None:
+            python_code = self._load_disk(key)
+            if python_code is not None:
+                python_code = python_code.decode("utf-8", "surrogatepass")
+                self._put(key, python_code, len(python_code))
+
+        if python_code is not None:
+            self._count("translation_hits")
+            return python_code
+
+        self._count("translation_misses")
+        python_code = (translate or interpreter.traduzir_binario)(source)
+        self._put(key, python_code, len(python_code))
+        self._store_disk(key, python_code.encode("utf-8", "surrogatepass"))
+        return python_code
+
+    def compile(self, python_code: str, filename: str = DEFAULT_FILENAME):
+        """
+        Compila o código Python usando o cache.
+
+        Args:
+            python_code: Código Python
+            filename: Nome de arquivo registrado no objeto de código
+
+        Returns:
+            Objeto de código
+
+        Raises:
+            SyntaxError: Se o código não for válido (erros não são armazenados)
+        """
+        # O formato do bytecode muda entre versões do Python
+        prefix = importlib.util.MAGIC_NUMBER + filename.encode("utf-8", "surrogatepass")
+        key = "c" + self._content_key(prefix, python_code)
+        return self._cached_code(key, lambda: compile(python_code, filename, "exec"))
+
+    def compile_binary(self, interpreter, source: str, filename: str = DEFAULT_FILENAME):
+        """
+        Compila código binário usando o cache. Interpretadores com compile_binary
+        (dialeto "parser") compilam direto para a árvore sintática, com as posições
+        do código binário; os demais passam pela tradução em texto.
+
+        Args:
+            interpreter: Interpretador que define o dialeto
+            source: Código binário
+            filename: Nome de arquivo registrado no objeto de código
+
+        Returns:
+            Objeto de código
+
+        Raises:
+            SyntaxError: Se o código não for válido (erros não são armazenados)
+        """
+        compile_binary = getattr(interpreter, "compile_binary", None)
+        if compile_binary is None:
+            return self.compile(self.translate(interpreter, source), filename)
+
+        prefix = (importlib.util.MAGIC_NUMBER + self.dialect_key(interpreter)
+                  + filename.encode("utf-8", "surrogatepass"))
+        key = "a" + self._content_key(prefix, source)
+        return self._cached_code(key, lambda: compile_binary(source, filename))
+
+    def hit_rate(self) -> float:
+        """Retorna a fração de consultas (tradução e compilação) atendidas pelo cache."""
+        with self._lock:
+            stats = dict(self.stats)
+        hits = stats["translation_hits"] + stats["compile_hits"]
+        total = hits + stats["translation_misses"] + stats["compile_misses"]
+        return hits / total if total else 0.0
+
+    def get_stats(self) -> Dict:
+        """
+        Retorna os contadores do cache.
+
+        Returns:
+            Dicionário com acertos, falhas, remoções e ocupação
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self.current_bytes
+        stats["disk_bytes"] = self._disk_bytes
+        stats["hit_rate"] = self.hit_rate()
+        return stats
+
+    def clear(self):
+        """Esvazia o cache em memória (o cache em disco é mantido)."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def _count(self, name: str):
+        """Incrementa um contador (o cache é usado por várias threads)."""
+        with self._lock:
+            self.stats[name] += 1
+
+    def _content_key(self, prefix: bytes, text: str) -> str:
+        """
+        Calcula a chave de conteúdo.
+
+        Args:
+            prefix: Identificação do dialeto ou da versão do bytecode
+            text: Texto de origem
+
+        Returns:
+            Hash hexadecimal
+        """
+        digest = hashlib.sha256(prefix)
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def _cached_code(self, key: str, build: Callable[[], object]):
+        """
+        Busca um objeto de código na memória e no disco, compilando-o com build se faltar.
+
+        Args:
+            key: Chave da entrada
+            build: Função que compila o código
+
+        Returns:
+            Objeto de código
+        """
+        code = self._get(key)
+        if code is None:
+            data = self._load_disk(key)
+            if data is not None:
+                try:
+                    code = marshal.loads(data)
+                    self._put(key, code, len(data))
+                except (EOFError, ValueError, TypeError):
+                    code = None
+
+        if code is not None:
+            self._count("compile_hits")
+            return code
+
+        self._count("compile_misses")
+        code = build()
+        data = marshal.dumps(code)
+        self._put(key, code, len(data))
+        self._store_disk(key, data)
+        return code
+
+    def _get(self, key: str):
+        """Busca uma entrada na memória, marcando-a como usada recentemente."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def _put(self, key: str, value, size: int):
+        """Armazena uma entrada na memória, removendo as menos usadas se necessário."""
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                _, (_, old_size) = self._entries.popitem(last=False)
+                self.current_bytes -= old_size
+                self.stats["evictions"] += 1
+
+    def _disk_path(self, key: str) -> str:
+        """Retorna o caminho de uma entrada no cache em disco."""
+        return os.path.join(self.cache_dir, key[1:3], key)
+
+    def _load_disk(self, key: str) -> Optional[bytes]:
+        """Lê uma entrada do cache em disco."""
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            # A data de modificação marca o último uso (ordem da limpeza)
+            os.utime(path)
+        except OSError:
+            pass
+        self._count("disk_hits")
+        return data
+
+    def _store_disk(self, key: str, data: bytes):
+        """Grava uma entrada no cache em disco de forma atômica."""
+        if not self.cache_dir:
+            return
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            # O cache em disco é apenas uma otimização
+            try:
+                os.unlink(temp_path)
+            except (OSError, UnboundLocalError):
+                pass
+            return
+
+        with self._disk_lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+            else:
+                self._disk_bytes += len(data)
+            if self._disk_bytes > self.disk_max_bytes:
+                self._prune_disk()
+
+    def _disk_entries(self):
+        """Lista (último uso, tamanho, caminho) das entradas do cache em disco."""
+        entries = []
+        try:
+            directories = [entry.path for entry in os.scandir(self.cache_dir) if entry.is_dir()]
+        except OSError:
+            return entries
+        for directory in directories:
+            try:
+                with os.scandir(directory) as files:
+                    for entry in files:
+                        try:
+                            info = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((info.st_mtime, info.st_size, entry.path))
+            except OSError:
+                continue
+        return entries
+
+    def _prune_disk(self):
+        """
+        Remove as entradas menos usadas até o cache em disco ocupar DISK_PRUNE_TARGET do limite.
+        A ocupação é medida de novo: outros processos (daemon, interface) usam o mesmo diretório.
+        """
+        entries = sorted(self._disk_entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.disk_max_bytes * DISK_PRUNE_TARGET
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        self._disk_bytes = total
+        with self._lock:
+            self.stats["disk_evictions"] += removed
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> TranslationCache:
+    """
+    Retorna o cache compartilhado da aplicação (memória + disco).
+
+    Returns:
+        Instância única de TranslationCache
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = TranslationCache(cache_dir=default_cache_dir())
+    return _default_cache
@@ -0,0 +1,177 @@
+"""
+Módulo de validação em segundo plano de um documento do editor.
+As alterações do QTextDocument são registradas na thread da interface (apenas
+as linhas tocadas) e, após um pequeno intervalo sem edições, entregues a uma
+thread de trabalho que mantém um IncrementalValidator. Os diagnósticos voltam
+pelo sinal diagnostics_ready, já na thread da interface.
+"""
+
+import queue
+import threading
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+try:
+    from ui.binary_syntax_parser import BinarySyntaxParser
+    from ui.binary_validator import IncrementalValidator, MAX_DIAGNOSTICS
+except ImportError:
+    from binary_syntax_parser import BinarySyntaxParser
+    from binary_validator import IncrementalValidator, MAX_DIAGNOSTICS
+
+
+class ValidationService(QObject):
+    """
+    Validação incremental de um QTextDocument em uma thread de trabalho.
+    """
+
+    # Lista de Diagnostic do documento
+    diagnostics_ready = pyqtSignal(object)
+
+    # Resultado interno da thread de trabalho (geração, diagnósticos)
+    _finished = pyqtSignal(int, object)
+
+    def __init__(self, document=None, keywords=None, delay=500, parent=None):
+        """
+        Inicializa o serviço e a thread de trabalho.
+
+        Args:
+            document: QTextDocument a validar (opcional)
+            keywords: Palavras de 8 bits conhecidas (padrão: as do BinarySyntaxParser)
+            delay: Intervalo sem edições, em ms, antes de validar
+            parent: Objeto pai
+        """
+        super().__init__(parent)
+        self.delay = delay
+        self.diagnostics = []
+        self.validator = IncrementalValidator(keywords or BinarySyntaxParser().binary_keywords)
+
+        self._document = None
+        self._line_count = 0
+        self._revision = -1
+        self._pending = []
+        self._generation = 0
+        self._jobs = queue.Queue()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._submit)
+        self._finished.connect(self._on_finished)
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+        self.set_document(document)
+
+    def set_document(self, document):
+        """
+        Passa a validar outro documento (ou nenhum, com None).
+
+        Args:
+            document: QTextDocument a validar
+        """
+        if self._document is not None:
+            try:
+                self._document.contentsChange.disconnect(self._on_contents_change)
+            except (TypeError, RuntimeError):
+                pass
+
+        self._document = document
+        if document is None:
+            self._pending = [(None, 0, [])]
+            self._line_count = 0
+        else:
+            document.contentsChange.connect(self._on_contents_change)
+            self._reset()
+        self._timer.start(0)
+
+    def schedule(self):
+        """Agenda uma validação após o intervalo sem edições."""
+        self._timer.start(self.delay)
+
+    def stop(self):
+        """Encerra a thread de trabalho."""
+        self.set_document(None)
+        self._timer.stop()
+        self._jobs.put(None)
+
+    def _reset(self):
+        """Registra o documento inteiro como alterado."""
+        document = self._document
+        self._pending = [(None, 0, document.toPlainText().split("\n"))]
+        self._line_count = document.blockCount()
+        self._revision = document.revision()
+
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """
+        Registra as linhas tocadas por uma alteração do documento.
+
+        Args:
+            position: Posição da alteração
+            chars_removed: Caracteres removidos
+            chars_added: Caracteres inseridos
+        """
+        document = self._document
+        if document.revision() == self._revision:
+            # Só formatação (markContentsDirty do realce): o texto não mudou
+            return
+        self._revision = document.revision()
+
+        block_count = document.blockCount()
+        first = document.findBlock(position).blockNumber()
+        last_block = document.findBlock(position + chars_added)
+        last = last_block.blockNumber() if last_block.isValid() else block_count - 1
+
+        removed = (last - first + 1) - (block_count - self._line_count)
+        if first < 0 or removed < 0 or first + removed > self._line_count:
+            # Alteração que não corresponde ao estado conhecido: revalida tudo
+            self._reset()
+        else:
+            new_lines = []
+            block = document.findBlockByNumber(first)
+            while block.isValid() and block.blockNumber() <= last:
+                new_lines.append(block.text())
+                block = block.next()
+            self._pending.append((first, removed, new_lines))
+            self._line_count = block_count
+
+        self.schedule()
+
+    def _submit(self):
+        """Entrega as alterações acumuladas à thread de trabalho."""
+        if not self._pending:
+            return
+        self._generation += 1
+        self._jobs.put((self._generation, self._pending))
+        self._pending = []
+
+    def _run(self):
+        """Laço da thread de trabalho."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+
+            generation, edits = job
+            for first, removed, new_lines in edits:
+                if first is None:
+                    self.validator.set_lines(new_lines)
+                else:
+                    self.validator.replace_lines(first, removed, new_lines)
+
+            if not self._jobs.empty():
+                # Há alterações mais novas: o resultado seria descartado
+                continue
+
+            diagnostics = self.validator.diagnostics(MAX_DIAGNOSTICS)
+            try:
+                self._finished.emit(generation, diagnostics)
+            except RuntimeError:
+                # O serviço foi destruído junto com o documento
+                break
+
+    def _on_finished(self, generation, diagnostics):
+        """Publica o resultado da validação mais recente."""
+        if generation != self._generation:
+            return
+        self.diagnostics = diagnostics
+        self.diagnostics_ready.emit(diagnostics)
@@ -5,18 +5,36 @@ Versão v7 com logging detalhado e correção de inicialização.
 
 import os
 import sys
+import time
+import codecs
 import subprocess
 import io
 import traceback
-import logging
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPlainTextEdit,
     QLineEdit, QPushButton, QLabel, QSplitter, QApplication
 )
-from PyQt5.QtGui import QFont, QTextCursor, QIcon
+from PyQt5.QtGui import QFont, QFontMetrics, QTextCursor, QIcon
 from PyQt5.QtCore import Qt, QProcess, pyqtSignal, QTimer, QProcessEnvironment
 from datetime import datetime
 
+try:
+    from ui.output_ring_buffer import DEFAULT_MAX_LINES, FRAME_INTERVAL, OutputRingBuffer
+except ImportError:
+    from output_ring_buffer import DEFAULT_MAX_LINES, FRAME_INTERVAL, OutputRingBuffer
+
+try:
+    from ui.app_logging import get_logger, setup_logging
+    from ui.pty_session import END_OF_FILE, PTY_AVAILABLE, PtySession
+except ImportError:
+    from app_logging import get_logger, setup_logging
+    from pty_session import END_OF_FILE, PTY_AVAILABLE, PtySession
+
+logger = get_logger("terminal")
+# Eventos de teclado e blocos de saída: chamados a cada tecla/leitura, com nível próprio
+input_logger = get_logger("terminal.input")
+output_logger = get_logger("terminal.output")
+
 # Definição da classe StringCapture
 class StringCapture(io.StringIO):
     def __init__(self, *args, **kwargs):
@@ -31,67 +49,76 @@ class StringCapture(io.StringIO):
 class WindowsStyleTerminalSimplified(QDialog):
     """
     Terminal estilo Windows com I/O interativo (v7 - Logging Corrigido).
+    No Linux o shell roda em um pseudoterminal (PtySession); nas demais plataformas, via QProcess.
     """
 
-    def __init__(self, parent=None):
-        logging.info("WindowsStyleTerminalSimplified: __init__ chamado")
+    # Emitidos pela thread de leitura do pty (entregues na thread da interface)
+    _pty_output = pyqtSignal()
+    _pty_finished = pyqtSignal(int)
+
+    def __init__(self, parent=None, max_lines=DEFAULT_MAX_LINES):
+        logger.info("WindowsStyleTerminalSimplified: __init__ chamado")
         super().__init__(parent)
 
         self.command_history = []
         self.history_index = 0
         self.is_python_mode = False
         self.process = None
+        self.session = None
         self.partial_output_buffer = ""
 
+        # Saída do processo: acumulada no buffer circular e exibida uma vez por quadro
+        self.max_lines = max_lines
+        self.output_buffer = OutputRingBuffer(max_lines, encoding=self._output_encoding())
+        self._output_timer = QTimer(self)
+        self._output_timer.setSingleShot(True)
+        self._output_timer.setInterval(FRAME_INTERVAL)
+        self._output_timer.timeout.connect(self._flush_output)
+        # Bytes do pty já exibidos (ou descartados) e confirmados à sessão
+        self._acknowledged_bytes = 0
+        self._pty_output.connect(self._schedule_flush)
+        self._pty_finished.connect(self._handle_pty_finished)
+
         self._setup_ui()
-        logging.info("WindowsStyleTerminalSimplified: UI configurada")
+        logger.info("WindowsStyleTerminalSimplified: UI configurada")
         self._start_process()
-        logging.info("WindowsStyleTerminalSimplified: Processo do terminal iniciado")
-        self._setup_logging()
+        logger.info("WindowsStyleTerminalSimplified: Processo do terminal iniciado")
 
-        logging.info("Inicializando Terminal v7 (Logging Corrigido)")
+        logger.info("Inicializando Terminal v7 (Logging Corrigido)")
         self.setWindowTitle("Terminal")
         self.setGeometry(100, 100, 800, 500)
         self.setModal(False)
 
-    def _setup_logging(self):
-        """Configura o logging para o arquivo."""
-        log_filename = "terminal_raw_output.log"
-        # Remove handlers existentes para evitar duplicação se a classe for instanciada múltiplas vezes
-        for handler in logging.root.handlers[:]:
-            logging.root.removeHandler(handler)
-
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format="%(asctime)s [%(levelname)s] %(message)s",
-            handlers=[
-                logging.FileHandler(log_filename, mode="w", encoding="utf-8"),
-                # logging.StreamHandler() # Descomente para ver logs no console também
-            ]
-        )
-        logging.info("Logging configurado.")
-
     def showEvent(self, event):
-        logging.info("WindowsStyleTerminalSimplified: showEvent chamado (tela aberta)")
+        logger.info("WindowsStyleTerminalSimplified: showEvent chamado (tela aberta)")
         super().showEvent(event)
+        self._update_window_size()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_window_size()
 
     def closeEvent(self, event):
-        logging.info("WindowsStyleTerminalSimplified: closeEvent chamado (tela fechada)")
+        logger.info("WindowsStyleTerminalSimplified: closeEvent chamado (tela fechada)")
         if self.process and self.process.state() == QProcess.Running:
-            logging.debug("Matando processo do terminal...")
+            logger.debug("Matando processo do terminal...")
             self.process.kill()
             self.process.waitForFinished(1000)
-            logging.debug("Processo do terminal finalizado.")
+            logger.debug("Processo do terminal finalizado.")
+        if self.session is not None:
+            self.session.terminate()
         event.accept()
 
     def _setup_ui(self):
-        logging.debug("Configurando UI do terminal")
+        logger.debug("Configurando UI do terminal")
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(5)
 
         self.output_area = QPlainTextEdit()
         self.output_area.setReadOnly(True)
+        # O documento guarda só as linhas mais recentes
+        self.output_area.setMaximumBlockCount(self.max_lines)
         self.output_area.setStyleSheet("""
             QPlainTextEdit {
                 background-color: #181a20;
@@ -131,12 +158,14 @@ class WindowsStyleTerminalSimplified(QDialog):
         layout.addLayout(input_layout)
         self.input_field.installEventFilter(self)
         self.setStyleSheet("QDialog { background-color: #23272e; color: #e6e6e6; border-radius: 14px; }")
-        logging.debug("UI do terminal configurada")
+        logger.debug("UI do terminal configurada")
 
     def _start_process(self):
-        logging.info("Tentando iniciar processo do terminal...")
-        if self.process and self.process.state() == QProcess.Running:
-            logging.warning("Processo já estava em execução.")
+        logger.info("Tentando iniciar processo do terminal...")
+        if self._process_running():
+            logger.warning("Processo já estava em execução.")
+            return
+        if PTY_AVAILABLE and self._start_pty_session():
             return
 
         try:
@@ -147,7 +176,7 @@ class WindowsStyleTerminalSimplified(QDialog):
 
             env = QProcessEnvironment.systemEnvironment()
             self.process.setProcessEnvironment(env)
-            logging.debug(f"Ambiente do processo definido.")
+            logger.debug("Ambiente do processo definido.")
 
             if sys.platform == "win32":
                 executable = "cmd.exe"
@@ -162,27 +191,82 @@ class WindowsStyleTerminalSimplified(QDialog):
                     executable = "/bin/sh"
                     self.process.start(executable)
                     prompt = "Terminal Shell iniciado."
-            logging.info(f"Executável do terminal: {executable}")
+            logger.info("Executável do terminal: %s", executable)
 
             if not self.process.waitForStarted(3000):
                 error_msg = self.process.errorString()
-                logging.error(f"Erro ao iniciar o terminal: {error_msg}")
+                logger.error("Erro ao iniciar o terminal: %s", error_msg)
                 self.output_area.appendPlainText(f"Erro ao iniciar o terminal: {error_msg}\n")
                 self._fallback_to_python_mode()
             else:
-                logging.info("Processo do terminal iniciado com sucesso.")
+                logger.info("Processo do terminal iniciado com sucesso.")
                 self.output_area.appendPlainText(prompt + "\n")
                 self.is_python_mode = False
                 self.prompt_label.setText(">")
                 self._append_prompt()
 
         except Exception as e:
-            logging.exception("Exceção ao iniciar o terminal")
+            logger.exception("Exceção ao iniciar o terminal")
             self.output_area.appendPlainText(f"Exceção ao iniciar o terminal: {str(e)}\n")
             self._fallback_to_python_mode()
 
+    def _start_pty_session(self):
+        """
+        Inicia o shell em um pseudoterminal.
+
+        Returns:
+            True se o shell foi iniciado
+        """
+        if os.path.exists("/bin/bash"):
+            executable = "/bin/bash"
+            argv = [executable, "--norc", "--noprofile", "--noediting", "-i"]
+        else:
+            executable = "/bin/sh"
+            argv = [executable, "-i"]
+        # A tela não interpreta sequências de escape; o prompt segue o da interface
+        env = dict(os.environ, TERM="dumb", PS1="> ", PS2="")
+        self._acknowledged_bytes = self.output_buffer.total_bytes
+        session = PtySession(argv, env=env, on_output=self._on_pty_output,
+                             on_exit=self._pty_finished.emit)
+        try:
+            session.start()
+        except OSError:
+            logger.exception("Erro ao iniciar o pseudoterminal, usando QProcess")
+            self.session = None
+            return False
+
+        self.session = session
+        self._update_window_size()
+        logger.info("Executável do terminal (pty): %s", executable)
+        self.output_area.appendPlainText(("Terminal Bash iniciado." if executable == "/bin/bash"
+                                          else "Terminal Shell iniciado.") + "\n")
+        self.is_python_mode = False
+        self.prompt_label.setText(">")
+        return True
+
+    def _process_running(self):
+        """Indica se o shell (pty ou QProcess) está ativo."""
+        if self.session is not None:
+            return self.session.is_running()
+        return bool(self.process) and self.process.state() == QProcess.Running
+
+    def _write_to_process(self, data):
+        """Envia bytes ao shell; retorna a quantidade escrita ou -1."""
+        if self.session is not None:
+            return self.session.write(data)
+        return self.process.write(data)
+
+    def _update_window_size(self):
+        """Informa ao pty quantas linhas e colunas cabem na área de saída."""
+        if self.session is None:
+            return
+        metrics = QFontMetrics(self.output_area.font())
+        viewport = self.output_area.viewport()
+        self.session.resize(viewport.height() // max(1, metrics.lineSpacing()),
+                            viewport.width() // max(1, metrics.width("0")))
+
     def _fallback_to_python_mode(self):
-        logging.warning("Falha ao iniciar terminal, usando modo Python interativo.")
+        logger.warning("Falha ao iniciar terminal, usando modo Python interativo.")
         self.output_area.appendPlainText("Usando Python interativo como fallback.\n")
         self.output_area.appendPlainText(f"Python {sys.version}\n")
         self.output_area.appendPlainText("Digite comandos Python diretamente.\n")
@@ -191,9 +275,9 @@ class WindowsStyleTerminalSimplified(QDialog):
         self._append_prompt()
 
     def _send_command(self):
-        logging.info("WindowsStyleTerminalSimplified: _send_command chamado")
+        logger.info("WindowsStyleTerminalSimplified: _send_command chamado")
         command = self.input_field.text().strip()
-        logging.info(f"Comando recebido do usuário: {repr(command)}")
+        logger.info("Comando recebido do usuário: %r", command)
         if not command:
             return
 
@@ -205,7 +289,7 @@ class WindowsStyleTerminalSimplified(QDialog):
         self.input_field.clear()
 
         if self.is_python_mode:
-            logging.debug("Executando comando no modo Python interativo")
+            logger.debug("Executando comando no modo Python interativo")
             self.output_area.appendPlainText(f"{prompt} {command}")
             self.output_area.appendPlainText("")
             QApplication.processEvents()
@@ -216,24 +300,23 @@ class WindowsStyleTerminalSimplified(QDialog):
             else:
                 self._execute_python_command(command)
         else:
-            logging.debug("Enviando comando para o processo do terminal")
-            if self.process and self.process.state() == QProcess.Running:
+            logger.debug("Enviando comando para o processo do terminal")
+            if self._process_running():
                 try:
                     encoding = sys.getdefaultencoding() or "utf-8"
                     encoded_command = (command + "\n").encode(encoding, errors="replace")
-                    logging.debug(f"Enviando bytes: {repr(encoded_command)}")
-                    self.process.write(encoded_command)
-                    self.process.write((command + "\n").encode(encoding, errors="replace"))
+                    logger.debug("Enviando bytes: %r", encoded_command)
+                    self._write_to_process(encoded_command)
                 except Exception as e:
-                    logging.exception("Erro ao enviar comando para o terminal")
+                    logger.exception("Erro ao enviar comando para o terminal")
                     self.output_area.appendPlainText(f"Erro ao enviar comando para o terminal: {str(e)}")
             else:
-                logging.error("Tentativa de enviar comando, mas processo não está em execução.")
+                logger.error("Tentativa de enviar comando, mas processo não está em execução.")
                 self.output_area.appendPlainText("Erro: Processo do terminal não está em execução.")
                 self._start_process()
 
     def _run_pip_install(self, command):
-        logging.info(f"Executando pip install: {command}")
+        logger.info("Executando pip install: %s", command)
         self.output_area.appendPlainText(f"Executando: {command}")
         self.output_area.appendPlainText("")
         self.output_area.moveCursor(QTextCursor.End)
@@ -242,9 +325,9 @@ class WindowsStyleTerminalSimplified(QDialog):
         try:
             pip_command = [sys.executable, "-m"] + command.split()
             result = subprocess.run(pip_command, capture_output=True, text=True, check=False, encoding="utf-8", errors="replace")
-            logging.debug(f"Resultado pip (stdout): {result.stdout}")
-            logging.debug(f"Resultado pip (stderr): {result.stderr}")
-            logging.debug(f"Resultado pip (returncode): {result.returncode}")
+            logger.debug("Resultado pip (stdout): %s", result.stdout)
+            logger.debug("Resultado pip (stderr): %s", result.stderr)
+            logger.debug("Resultado pip (returncode): %s", result.returncode)
 
             if result.stdout:
                 self.output_area.appendPlainText(result.stdout.strip())
@@ -258,18 +341,18 @@ class WindowsStyleTerminalSimplified(QDialog):
                 self.output_area.appendPlainText("")
 
         except FileNotFoundError:
-             logging.error(f"Erro pip: Executável Python '{sys.executable}' ou 'pip' não encontrado.")
+             logger.error("Erro pip: Executável Python '%s' ou 'pip' não encontrado.", sys.executable)
              self.output_area.appendPlainText(f"Erro: O executável Python '{sys.executable}' ou o módulo 'pip' não foi encontrado.")
              self.output_area.appendPlainText("")
         except Exception as e:
-            logging.exception("Erro ao executar pip install")
+            logger.exception("Erro ao executar pip install")
             self.output_area.appendPlainText(f"Erro ao executar pip install: {str(e)}")
             self.output_area.appendPlainText("")
         finally:
             self._append_prompt()
 
     def _execute_python_command(self, command):
-        logging.info(f"Executando comando Python interativo: {command}")
+        logger.info("Executando comando Python interativo: %s", command)
         old_stdout, old_stderr = sys.stdout, sys.stderr
         redirected_stdout, redirected_stderr = StringCapture(), StringCapture()
         sys.stdout, sys.stderr = redirected_stdout, redirected_stderr
@@ -286,8 +369,8 @@ class WindowsStyleTerminalSimplified(QDialog):
         finally:
             sys.stdout, sys.stderr = old_stdout, old_stderr
             output, error = redirected_stdout.getvalue(), redirected_stderr.getvalue()
-            logging.debug(f"Python stdout: {repr(output)}")
-            logging.debug(f"Python stderr: {repr(error)}")
+            logger.debug("Python stdout: %r", output)
+            logger.debug("Python stderr: %r", error)
             if output:
                 self.output_area.appendPlainText(output.rstrip())
                 self.output_area.appendPlainText("")
@@ -296,54 +379,106 @@ class WindowsStyleTerminalSimplified(QDialog):
                 self.output_area.appendPlainText("")
             self._append_prompt()
 
+    @staticmethod
+    def _output_encoding():
+        """Codificação da saída do processo (a do sistema, ou utf-8 se for desconhecida)."""
+        encoding = sys.getfilesystemencoding() or "utf-8"
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = "utf-8"
+        return encoding
+
+    def set_max_lines(self, max_lines):
+        """Altera a quantidade de linhas mantidas na tela."""
+        self.max_lines = max_lines
+        self.output_buffer.max_lines = max(1, max_lines)
+        self.output_area.setMaximumBlockCount(max_lines)
+
     def _process_output_data(self, data_bytes, source="stdout"):
-        logging.debug(f"_process_output_data chamado para {source}")
-        """Decodifica e LOGA dados brutos, depois tenta exibir de forma simples."""
+        """Acumula os dados recebidos; a exibição fica para o próximo quadro."""
         if not data_bytes:
             return
 
+        data = data_bytes.data()
+        output_logger.debug("RAW %s: %r", source, data)
         try:
-            # Tenta decodificar com o encoding do sistema, fallback para utf-8
-            try:
-                locale_encoding = sys.getfilesystemencoding() or "utf-8"
-                data = data_bytes.data().decode(locale_encoding, errors="replace")
-            except Exception:
-                data = data_bytes.data().decode("utf-8", errors="replace")
-
-            # *** LOGGING DA SAÍDA BRUTA ***
-            logging.debug(f"RAW {source.upper()}: {repr(data)}")
-
-            # Exibição simples: apenas adiciona o que foi recebido
-            self.output_area.insertPlainText(data)
-            self.output_area.moveCursor(QTextCursor.End)
-            QApplication.processEvents()
+            self.output_buffer.feed(data, source)
+        except Exception:
+            logger.exception("Erro ao processar dados de %s", source)
+            return
+        self._schedule_flush()
+
+    def _on_pty_output(self, data):
+        """Recebe um bloco do pty (thread de leitura) e agenda a exibição."""
+        output_logger.debug("RAW pty: %r", data)
+        self.output_buffer.feed(data, "pty")
+        self._pty_output.emit()
+
+    def _schedule_flush(self):
+        if not self._output_timer.isActive():
+            self._output_timer.start()
+
+    def _flush_output(self):
+        """Exibe a saída acumulada desde o último quadro."""
+        start = time.perf_counter()
+        total_bytes = self.output_buffer.total_bytes
+        replace, text = self.output_buffer.take()
+        if self.session is not None:
+            # Libera a leitura do pty: o que foi retirado já está na tela ou foi descartado
+            self.session.acknowledge(total_bytes - self._acknowledged_bytes)
+            self._acknowledged_bytes = total_bytes
+        if replace:
+            self.output_area.setPlainText(text)
+        elif text:
+            cursor = QTextCursor(self.output_area.document())
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text)
+        else:
+            return
+        self.output_area.moveCursor(QTextCursor.End)
 
-        except Exception as e:
-            logging.exception(f"Erro ao processar dados de {source}")
+        # Se atualizar o widget ficou caro, os quadros se espaçam e a interface continua respondendo
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._output_timer.setInterval(max(FRAME_INTERVAL, int(elapsed_ms * 2)))
 
     def _handle_stdout(self):
-        logging.debug("Recebido readyReadStandardOutput")
+        output_logger.debug("Recebido readyReadStandardOutput")
         if not self.process: return
         data_bytes = self.process.readAllStandardOutput()
         self._process_output_data(data_bytes, source="stdout")
 
     def _handle_stderr(self):
-        logging.debug("Recebido readyReadStandardError")
+        output_logger.debug("Recebido readyReadStandardError")
         if not self.process: return
         data_bytes = self.process.readAllStandardError()
         self._process_output_data(data_bytes, source="stderr")
 
+    def _handle_pty_finished(self, returncode):
+        # Código negativo: o shell terminou por um sinal
+        if returncode < 0:
+            self._handle_process_finished(-returncode, QProcess.CrashExit)
+        else:
+            self._handle_process_finished(returncode, QProcess.NormalExit)
+
     def _handle_process_finished(self, exit_code, exit_status):
-        logging.info(f"Processo do terminal finalizado. Código: {exit_code}, Status: {exit_status}")
+        logger.info("Processo do terminal finalizado. Código: %s, Status: %s", exit_code, exit_status)
+        self._flush_output()
         status_map = {QProcess.NormalExit: "normalmente", QProcess.CrashExit: "com erro"}
         status_text = status_map.get(exit_status, "inesperadamente")
         self.output_area.appendPlainText(f"\nProcesso do terminal finalizado {status_text} (código: {exit_code}).")
         self._append_prompt()
 
     def _append_prompt(self):
-        logging.debug("Adicionando prompt ao final")
-        current_text = self.output_area.toPlainText()
-        if current_text and not current_text.endswith("\n"):
+        logger.debug("Adicionando prompt ao final")
+        # A saída pendente vem antes do prompt
+        self._flush_output()
+        if self.session is not None and self.session.is_running():
+            # O shell do pty exibe o próprio prompt
+            self.input_field.setFocus()
+            return
+        # Só a última linha importa (o texto inteiro pode ter milhares de linhas)
+        if self.output_area.document().lastBlock().text():
             self.output_area.appendPlainText("")
 
         prompt = (">>> " if self.is_python_mode else "> ")
@@ -352,9 +487,17 @@ class WindowsStyleTerminalSimplified(QDialog):
         self.input_field.setFocus()
 
     def eventFilter(self, obj, event):
-        logging.debug(f"eventFilter chamado: obj={obj}, event={event}")
+        input_logger.debug("eventFilter chamado: obj=%s, event=%s", obj, event)
         if obj is self.input_field and event.type() == event.KeyPress:
             key = event.key()
+            if self.session is not None and event.modifiers() & Qt.ControlModifier:
+                # Ctrl+C sem seleção e Ctrl+D com a linha vazia vão para a disciplina de linha do pty
+                if key == Qt.Key_C and not self.input_field.hasSelectedText():
+                    self.session.interrupt()
+                    return True
+                if key == Qt.Key_D and not self.input_field.text():
+                    self.session.write(END_OF_FILE)
+                    return True
             if key == Qt.Key_Up:
                 if self.command_history and self.history_index > 0:
                     self.history_index -= 1
@@ -373,7 +516,8 @@ class WindowsStyleTerminalSimplified(QDialog):
         return super().eventFilter(obj, event)
 
     def clear_terminal(self):
-        logging.info("Limpando terminal")
+        logger.info("Limpando terminal")
+        self.output_buffer.clear()
         self.output_area.clear()
         if self.is_python_mode:
             self.output_area.appendPlainText(f"Terminal limpo. Python {sys.version}\n")
@@ -383,27 +527,27 @@ class WindowsStyleTerminalSimplified(QDialog):
         self._append_prompt()
 
     def execute_python_script(self, script_path):
-        logging.info(f"Executando script Python: {script_path}")
+        logger.info("Executando script Python: %s", script_path)
         self.clear_terminal()
 
-        if not self.process or self.process.state() != QProcess.Running:
-            logging.warning("Processo do terminal não ativo ao tentar executar script. Tentando iniciar...")
+        if not self._process_running():
+            logger.warning("Processo do terminal não ativo ao tentar executar script. Tentando iniciar...")
             self.output_area.appendPlainText("Erro: Processo do terminal não está ativo. Tentando iniciar...")
             self.output_area.appendPlainText("")
             self._start_process()
-            if not self.process or not self.process.waitForStarted(1500):
-                logging.error("Falha ao iniciar processo do terminal para execução do script.")
+            if not self._process_running() or (self.session is None and not self.process.waitForStarted(1500)):
+                logger.error("Falha ao iniciar processo do terminal para execução do script.")
                 self.output_area.appendPlainText("Falha ao iniciar o processo do terminal para execução do script.")
                 self.output_area.appendPlainText("")
                 self._append_prompt()
                 return
-            logging.info("Processo do terminal iniciado para execução do script.")
+            logger.info("Processo do terminal iniciado para execução do script.")
             self.output_area.appendPlainText("Processo do terminal iniciado. Executando script...")
             self.output_area.appendPlainText("")
 
         python_executable = sys.executable
         if not python_executable:
-             logging.error("Não foi possível determinar o caminho do executável Python.")
+             logger.error("Não foi possível determinar o caminho do executável Python.")
              self.output_area.appendPlainText("Erro: Não foi possível determinar o caminho do executável Python.")
              self.output_area.appendPlainText("")
              self._append_prompt()
@@ -411,7 +555,7 @@ class WindowsStyleTerminalSimplified(QDialog):
 
         normalized_script_path = os.path.normpath(script_path)
         command_to_run = f'"{python_executable}" -u "{normalized_script_path}"'
-        logging.info(f"Comando de execução a ser enviado: {command_to_run}")
+        logger.info("Comando de execução a ser enviado: %s", command_to_run)
         self.output_area.appendPlainText(f"> Executando: {command_to_run}")
         self.output_area.appendPlainText("") # Linha em branco após "Executando"
         self.output_area.moveCursor(QTextCursor.End)
@@ -420,27 +564,27 @@ class WindowsStyleTerminalSimplified(QDialog):
         try:
             encoding = sys.getdefaultencoding() or "utf-8"
             encoded_command = (command_to_run + "\n").encode(encoding, errors="replace")
-            logging.debug(f"Enviando bytes para execução: {repr(encoded_command)}")
-            bytes_written = self.process.write(encoded_command)
-            bytes_written = self.process.write((command_to_run + "\n").encode(encoding, errors="replace"))
+            logger.debug("Enviando bytes para execução: %r", encoded_command)
+            bytes_written = self._write_to_process(encoded_command)
             if bytes_written == -1:
-                logging.error("Falha ao escrever comando de execução no processo do terminal.")
+                logger.error("Falha ao escrever comando de execução no processo do terminal.")
                 self.output_area.appendPlainText("Erro: Falha ao escrever comando no processo do terminal.")
                 self.output_area.appendPlainText("")
                 self._append_prompt()
                 return
-            logging.debug(f"Bytes escritos para execução: {bytes_written}")
+            logger.debug("Bytes escritos para execução: %s", bytes_written)
         except Exception as e:
-            logging.exception("Erro ao enviar comando de execução para o terminal")
+            logger.exception("Erro ao enviar comando de execução para o terminal")
             self.output_area.appendPlainText(f"Erro ao enviar comando de execução para o terminal: {str(e)}")
             self.output_area.appendPlainText("")
             self._append_prompt()
 
 if __name__ == "__main__":
-    logging.info("Iniciando QApplication principal do terminal")
+    setup_logging()
+    logger.info("Iniciando QApplication principal do terminal")
     app = QApplication(sys.argv)
     terminal = WindowsStyleTerminalSimplified()
     terminal.show()
-    logging.info("Terminal principal exibido")
+    logger.info("Terminal principal exibido")
     sys.exit(app.exec_())
 